@@ -0,0 +1,56 @@
+"""
+Application serializers module.
+Provides validation for admin batch matching requests.
+"""
+
+from rest_framework import serializers
+
+from applications.services.batch_matching import MAX_BATCH_SIZE
+from candidates.models import CandidateProfile
+
+
+class CandidateSearchSerializer(serializers.Serializer):
+    """
+    Candidate search criteria used to select candidates for batch matching.
+
+    Mirrors the filters of the admin candidate list.
+    """
+
+    search = serializers.CharField(required=False, allow_blank=True, max_length=200)
+    status = serializers.ChoiceField(choices=CandidateProfile.STATUS_CHOICES, required=False)
+    current_position = serializers.ChoiceField(
+        choices=CandidateProfile.POSITION_CHOICES, required=False
+    )
+    min_years_of_experience = serializers.IntegerField(required=False, min_value=0)
+
+
+class BatchMatchSerializer(serializers.Serializer):
+    """
+    Serializer for batch "match candidates to job" requests.
+
+    Either candidate_ids or filters must be provided.
+    """
+
+    job_id = serializers.UUIDField(help_text="Vaga para o match")
+    candidate_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        allow_empty=False,
+        max_length=MAX_BATCH_SIZE,
+        help_text="IDs dos perfis de candidato",
+    )
+    filters = CandidateSearchSerializer(
+        required=False, help_text="Busca de candidatos (alternativa a candidate_ids)"
+    )
+    admin_notes = serializers.CharField(required=False, allow_blank=True, default="")
+    notify = serializers.BooleanField(required=False, default=True)
+
+    def validate(self, data):
+        """Require exactly one way of selecting candidates."""
+        has_ids = "candidate_ids" in data
+        has_filters = "filters" in data
+
+        if has_ids == has_filters:
+            raise serializers.ValidationError("Informe candidate_ids ou filters (apenas um)")
+
+        return data
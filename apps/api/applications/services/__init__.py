@@ -0,0 +1,5 @@
+"""Applications services module."""
+
+from .batch_matching import BatchMatchingService
+
+__all__ = ["BatchMatchingService"]
@@ -0,0 +1,176 @@
+"""
+Batch matching service.
+
+Lets admins match many candidates to a job in one operation: applications are
+created or upgraded to "matched" with a single INSERT ... ON CONFLICT statement
+instead of one unique_together round trip per candidate.
+"""
+
+import logging
+from typing import Any, Optional
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from applications.models import Application
+from authentication.models import User
+from candidates.models import CandidateProfile
+from jobs.models import JobPosting
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 1000
+
+
+class BatchMatchingService:
+    """Service for admin batch matching of candidates to jobs."""
+
+    @staticmethod
+    def resolve_candidate_ids(filters: dict[str, Any]) -> list:
+        """
+        Resolve a candidate search into candidate ids.
+
+        Args:
+            filters: Search criteria, any of:
+                - search: Text matched against name, email or city
+                - status: Candidate availability status
+                - current_position: Sales position (SDR/BDR, AE/Closer, CSM)
+                - min_years_of_experience: Minimum years in sales
+
+        Returns:
+            list: Ids of active candidates matching every criterion
+        """
+        queryset = CandidateProfile.objects.filter(is_active=True)
+
+        search = (filters.get("search") or "").strip()
+        if search:
+            queryset = queryset.filter(
+                Q(full_name__icontains=search)
+                | Q(user__email__icontains=search)
+                | Q(city__icontains=search)
+            )
+        if filters.get("status"):
+            queryset = queryset.filter(status=filters["status"])
+        if filters.get("current_position"):
+            queryset = queryset.filter(current_position=filters["current_position"])
+        if filters.get("min_years_of_experience") is not None:
+            queryset = queryset.filter(years_of_experience__gte=filters["min_years_of_experience"])
+
+        return list(queryset.values_list("id", flat=True)[: MAX_BATCH_SIZE + 1])
+
+    @staticmethod
+    def match_candidates(
+        job: JobPosting,
+        admin_user: User,
+        candidate_ids: Optional[list] = None,
+        filters: Optional[dict[str, Any]] = None,
+        admin_notes: str = "",
+        notify: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Create or upgrade "matched" applications for many candidates at once.
+
+        Existing applications for the job are upgraded in place (status,
+        matched_by_admin, matched_at); missing ones are inserted. Applications
+        that are already matched are left untouched and not notified again,
+        so re-running a batch is harmless. Candidate notifications are
+        enqueued as a single batched task after commit.
+
+        Args:
+            job: Job posting to match candidates to
+            admin_user: Admin performing the match
+            candidate_ids: Explicit candidate ids
+            filters: Candidate search (see resolve_candidate_ids), used when
+                candidate_ids is not given
+            admin_notes: Optional internal notes stored on every application
+            notify: Whether to email matched candidates
+
+        Returns:
+            dict: {
+                'matched': Total applications now matched,
+                'created': New applications,
+                'upgraded': Existing applications upgraded to matched,
+                'already_matched': Applications that were matched before,
+                'invalid_candidate_ids': Ids not found or inactive
+            }
+
+        Raises:
+            ValueError: If job is inactive, no candidates were selected or the
+                batch exceeds MAX_BATCH_SIZE
+        """
+        if not job.is_active:
+            raise ValueError("Vaga inativa não pode receber matches")
+
+        if candidate_ids is None:
+            candidate_ids = BatchMatchingService.resolve_candidate_ids(filters or {})
+
+        requested = {str(candidate_id) for candidate_id in candidate_ids}
+        if not requested:
+            raise ValueError("Nenhum candidato selecionado")
+        if len(requested) > MAX_BATCH_SIZE:
+            raise ValueError(f"Máximo de {MAX_BATCH_SIZE} candidatos por operação")
+
+        valid_ids = {
+            str(candidate_id)
+            for candidate_id in CandidateProfile.objects.filter(
+                id__in=requested, is_active=True
+            ).values_list("id", flat=True)
+        }
+        update_fields = ["status", "matched_by_admin", "matched_at", "updated_at"]
+        if admin_notes:
+            update_fields.append("admin_notes")
+
+        with transaction.atomic():
+            # Locked so a concurrent batch cannot match them between this read and the upsert
+            existing = {
+                str(candidate_id): application_status
+                for candidate_id, application_status in Application.objects.select_for_update()
+                .filter(job=job, candidate_id__in=valid_ids)
+                .values_list("candidate_id", "status")
+            }
+            already_matched_ids = {
+                candidate_id
+                for candidate_id, application_status in existing.items()
+                if application_status == "matched"
+            }
+            new_match_ids = sorted(valid_ids - already_matched_ids)
+
+            matched_at = timezone.now()
+            Application.objects.bulk_create(
+                [
+                    Application(
+                        job=job,
+                        candidate_id=candidate_id,
+                        status="matched",
+                        matched_by_admin=admin_user,
+                        matched_at=matched_at,
+                        admin_notes=admin_notes,
+                    )
+                    for candidate_id in new_match_ids
+                ],
+                update_conflicts=True,
+                unique_fields=["job", "candidate"],
+                update_fields=update_fields,
+            )
+
+            if notify and new_match_ids:
+                from applications.tasks import notify_candidates_matched
+
+                transaction.on_commit(
+                    lambda: notify_candidates_matched.delay(str(job.id), new_match_ids)
+                )
+
+        result = {
+            "matched": len(valid_ids),
+            "created": len(valid_ids - existing.keys()),
+            "upgraded": len(existing.keys() - already_matched_ids),
+            "already_matched": len(already_matched_ids),
+            "invalid_candidate_ids": sorted(requested - valid_ids),
+        }
+
+        logger.info(
+            f"Admin {admin_user.id} batch-matched {result['matched']} candidates to job {job.id}",
+            extra={"job_id": str(job.id), "admin_id": str(admin_user.id)},
+        )
+        return result
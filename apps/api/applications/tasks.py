@@ -0,0 +1,65 @@
+"""
+Celery tasks for application operations.
+
+Batch matching notifications: one task per batch instead of one per candidate,
+sent over a single pooled SMTP connection.
+"""
+
+from celery import shared_task
+from celery.utils.log import get_task_logger
+from django.conf import settings
+
+from candidates.models import CandidateProfile
+from core.utils.mail import send_email_batch
+from jobs.models import JobPosting
+
+logger = get_task_logger(__name__)
+
+
+@shared_task(bind=True, max_retries=3)
+def notify_candidates_matched(self, job_id: str, candidate_ids: list[str]) -> dict[str, int]:
+    """
+    Email every candidate of a batch match about the job.
+
+    Loads the job and all candidates in two queries and sends the emails from
+    this single task over one SMTP connection. A failure for one candidate
+    does not stop the rest of the batch; it is retried on its own.
+
+    Args:
+        job_id: UUID of the matched job
+        candidate_ids: UUIDs of the matched candidates
+
+    Returns:
+        dict: {'sent': int, 'failed': int}
+    """
+    try:
+        job = JobPosting.objects.select_related("company").get(id=job_id)
+    except JobPosting.DoesNotExist:
+        logger.error(f"Job not found for match notifications: {job_id}")
+        return {"sent": 0, "failed": len(candidate_ids)}
+
+    candidates = CandidateProfile.objects.filter(id__in=candidate_ids).select_related("user")
+    dashboard_url = f"{settings.FRONTEND_URL}/candidate/applications"
+
+    result = send_email_batch(
+        [
+            {
+                "template_name": "candidate_matched",
+                "context": {
+                    "candidate_name": candidate.full_name,
+                    "job_title": job.title,
+                    "company_name": job.company.company_name,
+                    "dashboard_url": dashboard_url,
+                },
+                "recipient_email": candidate.user.email,
+                "subject": f"Você foi selecionado para a vaga {job.title} - TalentBase",
+            }
+            for candidate in candidates
+        ],
+        task_id=self.request.id,
+    )
+
+    logger.info(
+        f"Match notifications for job {job_id}: {result['sent']} sent, {result['failed']} failed"
+    )
+    return result
@@ -0,0 +1,271 @@
+"""Tests for admin batch matching of candidates to jobs."""
+
+from unittest.mock import patch
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from applications.models import Application
+from applications.services.batch_matching import BatchMatchingService
+from applications.tasks import notify_candidates_matched
+from authentication.models import User
+from candidates.models import CandidateProfile
+from companies.models import CompanyProfile
+from jobs.models import JobPosting
+
+
+@pytest.fixture
+def admin_user(db):
+    """Create an admin user."""
+    return User.objects.create_user(email="admin@test.com", password="pass", role="admin")
+
+
+@pytest.fixture
+def job(db):
+    """Create an active job posting."""
+    company = CompanyProfile.objects.create(
+        company_name="Tech Company",
+        cnpj="12345678000190",
+        website="https://techcompany.com",
+        industry="SaaS",
+        size="11-50",
+        contact_person_name="John Doe",
+        contact_person_email="john@techcompany.com",
+        contact_person_phone="11988888888",
+    )
+    return JobPosting.objects.create(
+        company=company,
+        title="SDR Position",
+        position_type="SDR/BDR",
+        seniority="junior",
+        description="Sales Development Representative role",
+        responsibilities="Cold calling",
+        location="São Paulo",
+    )
+
+
+@pytest.fixture
+def candidates(db):
+    """Create four candidates (three SDRs, one AE)."""
+    profiles = []
+    for index, position in enumerate(["SDR/BDR", "SDR/BDR", "SDR/BDR", "AE/Closer"]):
+        user = User.objects.create_user(
+            email=f"candidate{index}@test.com", password="pass", role="candidate"
+        )
+        profiles.append(
+            CandidateProfile.objects.create(
+                user=user,
+                full_name=f"Candidate {index}",
+                phone="11999999999",
+                current_position=position,
+                years_of_experience=index + 1,
+            )
+        )
+    return profiles
+
+
+@pytest.mark.django_db
+class TestBatchMatchingService:
+    """Tests for BatchMatchingService.match_candidates."""
+
+    def test_creates_matched_applications(self, job, candidates, admin_user):
+        """Test all selected candidates get a matched application."""
+        result = BatchMatchingService.match_candidates(
+            job, admin_user, candidate_ids=[c.id for c in candidates], notify=False
+        )
+
+        assert result == {
+            "matched": 4,
+            "created": 4,
+            "upgraded": 0,
+            "already_matched": 0,
+            "invalid_candidate_ids": [],
+        }
+        applications = Application.objects.filter(job=job)
+        assert applications.count() == 4
+        assert all(a.status == "matched" for a in applications)
+        assert all(a.matched_by_admin == admin_user for a in applications)
+        assert all(a.matched_at is not None for a in applications)
+
+    def test_upgrades_existing_applications(self, job, candidates, admin_user):
+        """Test existing pending applications are upgraded instead of duplicated."""
+        existing = Application.objects.create(job=job, candidate=candidates[0], admin_notes="old")
+
+        result = BatchMatchingService.match_candidates(
+            job, admin_user, candidate_ids=[candidates[0].id, candidates[1].id], notify=False
+        )
+
+        assert result["created"] == 1
+        assert result["upgraded"] == 1
+        existing.refresh_from_db()
+        assert existing.status == "matched"
+        assert existing.matched_by_admin == admin_user
+        assert existing.admin_notes == "old"
+        assert Application.objects.filter(job=job).count() == 2
+
+    def test_single_bulk_statement(
+        self, job, candidates, admin_user, django_assert_max_num_queries
+    ):
+        """Test the batch does not issue one query per candidate."""
+        with django_assert_max_num_queries(6):
+            BatchMatchingService.match_candidates(
+                job, admin_user, candidate_ids=[c.id for c in candidates], notify=False
+            )
+
+    def test_reports_invalid_candidates(self, job, candidates, admin_user):
+        """Test unknown and inactive candidates are skipped and reported."""
+        candidates[1].is_active = False
+        candidates[1].save()
+        unknown_id = "00000000-0000-0000-0000-000000000000"
+
+        result = BatchMatchingService.match_candidates(
+            job,
+            admin_user,
+            candidate_ids=[candidates[0].id, candidates[1].id, unknown_id],
+            notify=False,
+        )
+
+        assert result["matched"] == 1
+        assert result["invalid_candidate_ids"] == sorted([str(candidates[1].id), unknown_id])
+
+    def test_match_by_filters(self, job, candidates, admin_user):
+        """Test candidates can be selected by a search instead of ids."""
+        result = BatchMatchingService.match_candidates(
+            job,
+            admin_user,
+            filters={"current_position": "SDR/BDR", "min_years_of_experience": 2},
+            notify=False,
+        )
+
+        assert result["matched"] == 2
+        matched = set(Application.objects.filter(job=job).values_list("candidate_id", flat=True))
+        assert matched == {candidates[1].id, candidates[2].id}
+
+    def test_inactive_job_rejected(self, job, candidates, admin_user):
+        """Test matching to an inactive job raises ValueError."""
+        job.is_active = False
+        job.save()
+
+        with pytest.raises(ValueError):
+            BatchMatchingService.match_candidates(job, admin_user, candidate_ids=[candidates[0].id])
+
+    def test_empty_selection_rejected(self, job, admin_user):
+        """Test an empty selection raises ValueError."""
+        with pytest.raises(ValueError):
+            BatchMatchingService.match_candidates(job, admin_user, filters={"search": "nobody"})
+
+    def test_notifications_enqueued_once(
+        self, job, candidates, admin_user, django_capture_on_commit_callbacks
+    ):
+        """Test one batched notification task is enqueued after commit."""
+        with patch("applications.tasks.notify_candidates_matched.delay") as mock_delay:
+            with django_capture_on_commit_callbacks(execute=True):
+                BatchMatchingService.match_candidates(
+                    job, admin_user, candidate_ids=[c.id for c in candidates]
+                )
+
+        mock_delay.assert_called_once()
+        job_id, candidate_ids = mock_delay.call_args.args
+        assert job_id == str(job.id)
+        assert sorted(candidate_ids) == sorted(str(c.id) for c in candidates)
+
+    def test_rerun_leaves_matched_applications_alone(
+        self, job, candidates, admin_user, django_capture_on_commit_callbacks
+    ):
+        """Test running the same batch twice notifies once and keeps matched_at."""
+        candidate_ids = [candidates[0].id, candidates[1].id]
+        with patch("applications.tasks.notify_candidates_matched.delay") as mock_delay:
+            with django_capture_on_commit_callbacks(execute=True):
+                BatchMatchingService.match_candidates(job, admin_user, candidate_ids=candidate_ids)
+            matched_at = dict(Application.objects.values_list("candidate_id", "matched_at"))
+            with django_capture_on_commit_callbacks(execute=True):
+                result = BatchMatchingService.match_candidates(
+                    job, admin_user, candidate_ids=candidate_ids
+                )
+
+        mock_delay.assert_called_once()
+        assert result["created"] == 0
+        assert result["upgraded"] == 0
+        assert result["already_matched"] == 2
+        assert result["matched"] == 2
+        assert dict(Application.objects.values_list("candidate_id", "matched_at")) == matched_at
+
+
+@pytest.mark.django_db
+class TestNotifyCandidatesMatchedTask:
+    """Tests for the batched match notification task."""
+
+    def test_sends_one_email_per_candidate(self, job, candidates, mailoutbox):
+        """Test every candidate of the batch is emailed."""
+        result = notify_candidates_matched(str(job.id), [str(c.id) for c in candidates[:2]])
+
+        assert result == {"sent": 2, "failed": 0}
+        assert sorted(m.to[0] for m in mailoutbox) == [
+            "candidate0@test.com",
+            "candidate1@test.com",
+        ]
+        assert "SDR Position" in mailoutbox[0].body
+
+
+@pytest.mark.django_db
+class TestBatchMatchEndpoint:
+    """Tests for POST /api/v1/applications/admin/batch-match"""
+
+    url = "/api/v1/applications/admin/batch-match"
+
+    def test_batch_match_success(self, job, candidates, admin_user):
+        """Test admin can batch match candidates."""
+        client = APIClient()
+        client.force_authenticate(user=admin_user)
+
+        response = client.post(
+            self.url,
+            {
+                "job_id": str(job.id),
+                "candidate_ids": [str(c.id) for c in candidates],
+                "notify": False,
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["matched"] == 4
+
+    def test_requires_ids_or_filters(self, job, admin_user):
+        """Test request without a candidate selection is rejected."""
+        client = APIClient()
+        client.force_authenticate(user=admin_user)
+
+        response = client.post(self.url, {"job_id": str(job.id)}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_unknown_job(self, candidates, admin_user):
+        """Test unknown job returns 404."""
+        client = APIClient()
+        client.force_authenticate(user=admin_user)
+
+        response = client.post(
+            self.url,
+            {
+                "job_id": "00000000-0000-0000-0000-000000000000",
+                "candidate_ids": [str(candidates[0].id)],
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_requires_admin(self, job, candidates):
+        """Test non-admin users cannot batch match."""
+        client = APIClient()
+        client.force_authenticate(user=candidates[0].user)
+
+        response = client.post(
+            self.url,
+            {"job_id": str(job.id), "candidate_ids": [str(candidates[0].id)]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,14 @@
+"""
+URL configuration for applications app.
+Admin job matching endpoints.
+"""
+
+from django.urls import path
+
+from . import views
+
+app_name = "applications"
+
+urlpatterns = [
+    path("admin/batch-match", views.batch_match, name="batch-match"),
+]
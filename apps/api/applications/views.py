@@ -1 +1,71 @@
-# Create your views here.
+"""
+Application views module.
+API endpoints for admin job matching.
+"""
+
+import logging
+
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+
+from applications.serializers import BatchMatchSerializer
+from applications.services.batch_matching import BatchMatchingService
+from core.permissions import IsAdmin
+from jobs.models import JobPosting
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(["POST"])
+@permission_classes([IsAdmin])
+def batch_match(request):
+    """
+    Match many candidates to a job in one operation (admin only).
+
+    Body: {
+        'job_id': 'uuid',
+        'candidate_ids': ['uuid', ...],          # or
+        'filters': { 'status': 'available', 'current_position': 'SDR/BDR', ... },
+        'admin_notes': 'optional',
+        'notify': true
+    }
+
+    Returns:
+        200: {
+            'matched': int,
+            'created': int,
+            'upgraded': int,
+            'already_matched': int,
+            'invalid_candidate_ids': [...]
+        }
+        400: { 'error': 'message' } or validation errors
+        404: { 'error': 'Job not found' }
+
+    Example:
+        POST /api/v1/applications/admin/batch-match
+    """
+    serializer = BatchMatchSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    data = serializer.validated_data
+
+    try:
+        job = JobPosting.objects.get(id=data["job_id"])
+    except JobPosting.DoesNotExist:
+        return Response({"error": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    try:
+        result = BatchMatchingService.match_candidates(
+            job=job,
+            admin_user=request.user,
+            candidate_ids=data.get("candidate_ids"),
+            filters=data.get("filters"),
+            admin_notes=data["admin_notes"],
+            notify=data["notify"],
+        )
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response(result, status=status.HTTP_200_OK)
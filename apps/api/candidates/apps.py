@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CandidatesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "candidates"
+
+    def ready(self):
+        """Register signal handlers."""
+        from candidates import signals  # noqa: F401
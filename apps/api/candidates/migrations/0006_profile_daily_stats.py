@@ -0,0 +1,83 @@
+# Generated by Django 5.0.14 on 2026-10-19 01:24
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("candidates", "0005_add_csv_import_fields"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProfileDailyStats",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        help_text="Identificador único UUID",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, help_text="Data/hora de criação"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, help_text="Data/hora da última atualização"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(
+                        db_index=True, default=True, help_text="Soft delete: False = deletado"
+                    ),
+                ),
+                ("date", models.DateField(help_text="Dia (UTC)")),
+                (
+                    "views",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Visualizações do perfil público"
+                    ),
+                ),
+                (
+                    "unique_views",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Visitantes únicos (estimativa HyperLogLog)"
+                    ),
+                ),
+                (
+                    "contacts",
+                    models.PositiveIntegerField(default=0, help_text="Pedidos de contato"),
+                ),
+                (
+                    "candidate",
+                    models.ForeignKey(
+                        help_text="Candidato do perfil público",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to="candidates.candidateprofile",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Estatística Diária de Perfil",
+                "verbose_name_plural": "Estatísticas Diárias de Perfis",
+                "db_table": "profile_daily_stats",
+                "ordering": ["-date"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="profiledailystats",
+            constraint=models.UniqueConstraint(
+                fields=("candidate", "date"), name="unique_profile_daily_stats"
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.14 on 2026-10-19 01:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("candidates", "0006_profile_daily_stats"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="candidateprofile",
+            index=models.Index(
+                condition=models.Q(("is_active", True), ("public_sharing_enabled", True)),
+                fields=["public_token"],
+                name="candidate_public_token_live",
+            ),
+        ),
+    ]
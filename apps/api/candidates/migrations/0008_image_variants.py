@@ -0,0 +1,30 @@
+# Generated by Django 5.0.14 on 2026-10-19 01:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("candidates", "0007_public_token_partial_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="candidateprofile",
+            name="profile_photo_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Miniaturas da foto: {source, webp: {largura: url}, jpeg: {largura: url}}",
+            ),
+        ),
+        migrations.AddField(
+            model_name="experience",
+            name="company_logo_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Miniaturas do logo: {source, webp: {largura: url}, jpeg: {largura: url}}",
+            ),
+        ),
+    ]
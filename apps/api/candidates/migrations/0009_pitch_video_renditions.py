@@ -0,0 +1,21 @@
+# Generated by Django 5.0.14 on 2026-10-19 01:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("candidates", "0008_image_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="candidateprofile",
+            name="pitch_video_renditions",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Versões do vídeo pitch: {source, mp4, poster, duration, width, height}",
+            ),
+        ),
+    ]
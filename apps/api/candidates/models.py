@@ -88,6 +88,11 @@ class CandidateProfile(BaseModel):
     profile_photo_url = models.URLField(
         blank=True, null=True, help_text="URL da foto de perfil (S3)"
     )
+    profile_photo_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Miniaturas da foto: {source, webp: {largura: url}, jpeg: {largura: url}}",
+    )
     # Pitch video (MANDATORY for profile completion - Story 3.1)
     pitch_video_url = models.URLField(
         blank=True,
@@ -100,6 +105,11 @@ class CandidateProfile(BaseModel):
         default="",
         help_text="Tipo de vídeo: upload direto (S3) ou YouTube",
     )
+    pitch_video_renditions = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Versões do vídeo pitch: {source, mp4, poster, duration, width, height}",
+    )
     # DEPRECATED: Use pitch_video_url instead
     video_url = models.URLField(
         blank=True,
@@ -319,6 +329,12 @@ class CandidateProfile(BaseModel):
         indexes = [
             models.Index(fields=["current_position", "status"]),
             models.Index(fields=["status", "-created_at"]),
+            # Public profile lookups only ever match live, shared profiles
+            models.Index(
+                fields=["public_token"],
+                name="candidate_public_token_live",
+                condition=models.Q(public_sharing_enabled=True, is_active=True),
+            ),
         ]
 
     def __str__(self) -> str:
@@ -351,6 +367,11 @@ class Experience(BaseModel):
     company_logo_url = models.URLField(
         blank=True, null=True, help_text="URL do logo da empresa (S3)"
     )
+    company_logo_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Miniaturas do logo: {source, webp: {largura: url}, jpeg: {largura: url}}",
+    )
     position = models.CharField(max_length=200, help_text="Cargo ocupado")
     start_date = models.DateField(help_text="Data de início")
     end_date = models.DateField(
@@ -370,3 +391,46 @@ class Experience(BaseModel):
     def __str__(self) -> str:
         """Return string representation of experience."""
         return f"{self.candidate.full_name} - {self.company_name} ({self.position})"
+
+
+class ProfileDailyStats(BaseModel):
+    """
+    Daily public profile analytics per candidate.
+
+    Counted in Redis on the public endpoints and flushed here in batches
+    (see ProfileAnalyticsService); values are absolute per day, so flushes
+    are idempotent.
+
+    Attributes:
+        candidate: ForeignKey to CandidateProfile
+        date: Day the counts refer to (UTC)
+        views: Public profile views
+        unique_views: Distinct visitors (HyperLogLog estimate)
+        contacts: Contact requests sent through the public profile
+    """
+
+    candidate = models.ForeignKey(
+        CandidateProfile,
+        on_delete=models.CASCADE,
+        related_name="daily_stats",
+        help_text="Candidato do perfil público",
+    )
+    date = models.DateField(help_text="Dia (UTC)")
+    views = models.PositiveIntegerField(default=0, help_text="Visualizações do perfil público")
+    unique_views = models.PositiveIntegerField(
+        default=0, help_text="Visitantes únicos (estimativa HyperLogLog)"
+    )
+    contacts = models.PositiveIntegerField(default=0, help_text="Pedidos de contato")
+
+    class Meta:
+        db_table = "profile_daily_stats"
+        verbose_name = "Estatística Diária de Perfil"
+        verbose_name_plural = "Estatísticas Diárias de Perfis"
+        ordering = ["-date"]
+        constraints = [
+            models.UniqueConstraint(fields=["candidate", "date"], name="unique_profile_daily_stats")
+        ]
+
+    def __str__(self) -> str:
+        """Return string representation of daily stats."""
+        return f"{self.candidate_id} {self.date}: {self.views} views"
@@ -12,9 +12,11 @@ import bleach
 from django.conf import settings
 from rest_framework import serializers
 
-from core.utils.s3 import delete_s3_object, get_s3_file_size, validate_s3_url
+from core.utils.read_urls import sign_media_payload, unsign_media_fields
+from core.utils.s3 import get_s3_file_size, schedule_s3_deletion, validate_s3_url
 
 from .models import CandidateProfile, Experience
+from .services.media_processing import responsive_variants, video_renditions
 
 
 class ExperienceSerializer(serializers.ModelSerializer):
@@ -24,13 +26,18 @@ class ExperienceSerializer(serializers.ModelSerializer):
     Validates:
     - start_date < end_date (if end_date provided)
     - company_name and position are required
+    - company logo URL is from our S3 bucket (signed URLs are stored unsigned)
     """
 
+    company_logo_variants = serializers.SerializerMethodField()
+
     class Meta:
         model = Experience
         fields = [
             "id",
             "company_name",
+            "company_logo_url",
+            "company_logo_variants",
             "position",
             "start_date",
             "end_date",
@@ -40,6 +47,15 @@ class ExperienceSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
 
+    def to_internal_value(self, data):
+        return super().to_internal_value(unsign_media_fields(data, ["company_logo_url"]))
+
+    def validate_company_logo_url(self, value: str) -> str:
+        """Validate logo URL is from our S3 bucket."""
+        if value and not validate_s3_url(value):
+            raise serializers.ValidationError("URL do logo deve ser do bucket S3 do TalentBase")
+        return value
+
     def validate(self, data):
         """Validate that start_date is before end_date."""
         start_date = data.get("start_date")
@@ -50,8 +66,33 @@ class ExperienceSerializer(serializers.ModelSerializer):
 
         return data
 
+    def get_company_logo_variants(self, obj: Experience) -> dict:
+        """Responsive logo variants: {'webp': {width: url}, 'jpeg': {width: url}}."""
+        return responsive_variants(obj.company_logo_url, obj.company_logo_variants)
+
 
-class CandidateProfileSerializer(serializers.ModelSerializer):
+class SignedMediaMixin:
+    """
+    Serve media URLs as signed, cached read URLs (see core.utils.read_urls).
+
+    All URLs of a profile, nested experiences included, are signed in one
+    batch. Pass context={'sign_media': False} for canonical URLs. Signed
+    URLs sent back by clients are stored unsigned (media_input_fields).
+    """
+
+    media_input_fields = ("profile_photo_url", "pitch_video_url")
+
+    def to_internal_value(self, data):
+        return super().to_internal_value(unsign_media_fields(data, self.media_input_fields))
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if not self.context.get("sign_media", True):
+            return data
+        return sign_media_payload(data)
+
+
+class CandidateProfileSerializer(SignedMediaMixin, serializers.ModelSerializer):
     """
     Complete serializer for CandidateProfile with validation.
 
@@ -65,6 +106,8 @@ class CandidateProfileSerializer(serializers.ModelSerializer):
     """
 
     experiences = ExperienceSerializer(many=True, required=False)
+    profile_photo_variants = serializers.SerializerMethodField()
+    pitch_video_renditions = serializers.SerializerMethodField()
 
     class Meta:
         model = CandidateProfile
@@ -77,8 +120,10 @@ class CandidateProfileSerializer(serializers.ModelSerializer):
             "cpf",
             "linkedin",
             "profile_photo_url",
+            "profile_photo_variants",
             "pitch_video_url",
             "pitch_video_type",
+            "pitch_video_renditions",
             "current_position",
             "years_of_experience",
             "sales_type",
@@ -98,6 +143,14 @@ class CandidateProfileSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "user", "public_token", "created_at", "updated_at"]
 
+    def get_profile_photo_variants(self, obj: CandidateProfile) -> dict:
+        """Responsive photo variants: {'webp': {width: url}, 'jpeg': {width: url}}."""
+        return responsive_variants(obj.profile_photo_url, obj.profile_photo_variants)
+
+    def get_pitch_video_renditions(self, obj: CandidateProfile) -> dict:
+        """Streaming renditions: {'mp4': url, 'poster': url, 'duration', 'width', 'height'}."""
+        return video_renditions(obj.pitch_video_url, obj.pitch_video_renditions)
+
     def validate_profile_photo_url(self, value: str) -> str:
         """
         Validate photo URL is from our S3 bucket.
@@ -264,7 +317,9 @@ class CandidateProfileSerializer(serializers.ModelSerializer):
         """
         Update CandidateProfile and handle old file deletion.
 
-        If photo or video is updated, deletes old file from S3.
+        If photo or video is updated, queues the old file for deletion from S3
+        (see drain_s3_deletions) once the profile is saved. Experiences are
+        replaced; logo variants carry over to experiences with the same logo.
 
         Args:
             instance: Existing profile
@@ -273,17 +328,19 @@ class CandidateProfileSerializer(serializers.ModelSerializer):
         Returns:
             CandidateProfile: Updated profile
         """
+        replaced_files = []
+
         # Handle profile photo update (delete old)
         new_photo = validated_data.get("profile_photo_url")
         if new_photo and instance.profile_photo_url and new_photo != instance.profile_photo_url:
-            delete_s3_object(instance.profile_photo_url)
+            replaced_files.append(instance.profile_photo_url)
 
         # Handle pitch video update (delete old if S3)
         new_video = validated_data.get("pitch_video_url")
         if new_video and instance.pitch_video_url and new_video != instance.pitch_video_url:
             # Only delete if old video was S3 (not YouTube)
             if instance.pitch_video_type == "s3":
-                delete_s3_object(instance.pitch_video_url)
+                replaced_files.append(instance.pitch_video_url)
 
         # Handle experiences update
         experiences_data = validated_data.pop("experiences", None)
@@ -292,13 +349,28 @@ class CandidateProfileSerializer(serializers.ModelSerializer):
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         instance.save()
+        schedule_s3_deletion(*replaced_files)
 
         # Update experiences if provided
         if experiences_data is not None:
-            # Delete old experiences and create new ones
+            # Delete old experiences and create new ones, keeping the logo variants
+            # (or recorded failure) of unchanged logos so they are not processed again
+            logo_variants = {
+                url: variants
+                for url, variants in instance.experiences.values_list(
+                    "company_logo_url", "company_logo_variants"
+                )
+                if url
+            }
             instance.experiences.all().delete()
             for experience_data in experiences_data:
-                Experience.objects.create(candidate=instance, **experience_data)
+                Experience.objects.create(
+                    candidate=instance,
+                    company_logo_variants=logo_variants.get(
+                        experience_data.get("company_logo_url"), {}
+                    ),
+                    **experience_data,
+                )
 
         return instance
 
@@ -332,20 +404,27 @@ class PublicExperienceSerializer(serializers.ModelSerializer):
     Story 3.2: Public profile page - shows only company, position, dates, logo.
     """
 
+    company_logo_variants = serializers.SerializerMethodField()
+
     class Meta:
         model = Experience
         fields = [
             "id",
             "company_name",
             "company_logo_url",
+            "company_logo_variants",
             "position",
             "start_date",
             "end_date",
         ]
         read_only_fields = fields
 
+    def get_company_logo_variants(self, obj: Experience) -> dict:
+        """Responsive logo variants: {'webp': {width: url}, 'jpeg': {width: url}}."""
+        return responsive_variants(obj.company_logo_url, obj.company_logo_variants)
+
 
-class PublicCandidateProfileSerializer(serializers.ModelSerializer):
+class PublicCandidateProfileSerializer(SignedMediaMixin, serializers.ModelSerializer):
     """
     Public serializer for candidate profiles (shareable link).
 
@@ -366,6 +445,8 @@ class PublicCandidateProfileSerializer(serializers.ModelSerializer):
     """
 
     experiences = PublicExperienceSerializer(many=True, read_only=True)
+    profile_photo_variants = serializers.SerializerMethodField()
+    pitch_video_renditions = serializers.SerializerMethodField()
 
     class Meta:
         model = CandidateProfile
@@ -374,6 +455,7 @@ class PublicCandidateProfileSerializer(serializers.ModelSerializer):
             "id",
             "full_name",
             "profile_photo_url",
+            "profile_photo_variants",
             "city",
             "current_position",
             "years_of_experience",
@@ -391,6 +473,7 @@ class PublicCandidateProfileSerializer(serializers.ModelSerializer):
             # Video (public)
             "pitch_video_url",
             "pitch_video_type",
+            "pitch_video_renditions",
             # Work history (public - basic)
             "experiences",
             # Story 3.2: Additional public info
@@ -407,6 +490,14 @@ class PublicCandidateProfileSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
+    def get_profile_photo_variants(self, obj: CandidateProfile) -> dict:
+        """Responsive photo variants: {'webp': {width: url}, 'jpeg': {width: url}}."""
+        return responsive_variants(obj.profile_photo_url, obj.profile_photo_variants)
+
+    def get_pitch_video_renditions(self, obj: CandidateProfile) -> dict:
+        """Streaming renditions: {'mp4': url, 'poster': url, 'duration', 'width', 'height'}."""
+        return video_renditions(obj.pitch_video_url, obj.pitch_video_renditions)
+
 
 class ContactCandidateSerializer(serializers.Serializer):
     """
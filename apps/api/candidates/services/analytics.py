@@ -0,0 +1,187 @@
+"""
+Public profile analytics.
+
+Views and contact requests on public profiles are counted in Redis so the
+hot read path never writes to Postgres:
+
+    analytics:profile:<candidate_id>:<day>:views      INCR
+    analytics:profile:<candidate_id>:<day>:visitors   PFADD (HyperLogLog)
+    analytics:profile:<candidate_id>:<day>:contacts   INCR
+    analytics:profile:dirty                           SET of '<candidate_id>|<day>'
+
+A periodic task (flush_profile_analytics) claims dirty entries with SPOP and
+upserts their absolute daily values into ProfileDailyStats in batches.
+Because values are absolute, a flush can be retried or overlap with new
+counts safely; counters expire a few days after their day ends.
+"""
+
+import logging
+from datetime import date, timedelta
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+from redis.exceptions import RedisError
+
+from candidates.models import CandidateProfile, ProfileDailyStats
+from core.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+COUNTER_KEY = "analytics:profile:{candidate_id}:{day}:{metric}"
+DIRTY_KEY = "analytics:profile:dirty"
+COUNTER_TTL = 3 * 24 * 3600
+FLUSH_BATCH_SIZE = 1000
+
+
+def _key(candidate_id, day: str, metric: str) -> str:
+    return COUNTER_KEY.format(candidate_id=candidate_id, day=day, metric=metric)
+
+
+class ProfileAnalyticsService:
+    """Buffered view/contact counters for public profiles."""
+
+    @staticmethod
+    def record_view(candidate_id, visitor_id: str) -> None:
+        """
+        Count a public profile view (never raises).
+
+        Args:
+            candidate_id: Viewed candidate
+            visitor_id: Anonymous visitor fingerprint for unique counts
+        """
+        day = timezone.now().date().isoformat()
+        views_key = _key(candidate_id, day, "views")
+        visitors_key = _key(candidate_id, day, "visitors")
+        try:
+            pipe = get_redis_client().pipeline(transaction=False)
+            pipe.incr(views_key)
+            pipe.pfadd(visitors_key, visitor_id)
+            pipe.expire(views_key, COUNTER_TTL)
+            pipe.expire(visitors_key, COUNTER_TTL)
+            pipe.sadd(DIRTY_KEY, f"{candidate_id}|{day}")
+            pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Profile view not counted: {e}")
+
+    @staticmethod
+    def record_contact(candidate_id) -> None:
+        """Count a contact request sent through a public profile (never raises)."""
+        day = timezone.now().date().isoformat()
+        contacts_key = _key(candidate_id, day, "contacts")
+        try:
+            pipe = get_redis_client().pipeline(transaction=False)
+            pipe.incr(contacts_key)
+            pipe.expire(contacts_key, COUNTER_TTL)
+            pipe.sadd(DIRTY_KEY, f"{candidate_id}|{day}")
+            pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Profile contact not counted: {e}")
+
+    @staticmethod
+    def flush(batch_size: int = FLUSH_BATCH_SIZE) -> int:
+        """
+        Upsert buffered counters into ProfileDailyStats.
+
+        Dirty entries are claimed with SPOP, so concurrent flushes never
+        process the same entry; on a database error they are put back.
+
+        Returns:
+            int: Number of (candidate, day) rows written
+        """
+        client = get_redis_client()
+        written = 0
+
+        while True:
+            members = client.spop(DIRTY_KEY, batch_size)
+            if not members:
+                return written
+
+            try:
+                written += ProfileAnalyticsService._flush_batch(members)
+            except Exception:
+                client.sadd(DIRTY_KEY, *members)
+                raise
+
+    @staticmethod
+    def _flush_batch(members: list[str]) -> int:
+        """Read the counters of a batch of dirty entries and upsert them."""
+        entries = [member.split("|", 1) for member in members]
+
+        pipe = get_redis_client().pipeline(transaction=False)
+        for candidate_id, day in entries:
+            pipe.get(_key(candidate_id, day, "views"))
+            pipe.pfcount(_key(candidate_id, day, "visitors"))
+            pipe.get(_key(candidate_id, day, "contacts"))
+        values = pipe.execute()
+
+        existing = {
+            str(candidate_id)
+            for candidate_id in CandidateProfile.objects.filter(
+                id__in={candidate_id for candidate_id, _ in entries}
+            ).values_list("id", flat=True)
+        }
+
+        now = timezone.now()
+        rows = []
+        for index, (candidate_id, day) in enumerate(entries):
+            if candidate_id not in existing:
+                continue
+            views, unique_views, contacts = values[index * 3 : index * 3 + 3]
+            rows.append(
+                ProfileDailyStats(
+                    candidate_id=candidate_id,
+                    date=date.fromisoformat(day),
+                    views=int(views or 0),
+                    unique_views=int(unique_views or 0),
+                    contacts=int(contacts or 0),
+                    updated_at=now,
+                )
+            )
+
+        with transaction.atomic():
+            ProfileDailyStats.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["candidate", "date"],
+                update_fields=["views", "unique_views", "contacts", "updated_at"],
+            )
+        return len(rows)
+
+    @staticmethod
+    def get_stats(candidate: CandidateProfile, days: int = 30) -> dict[str, Any]:
+        """
+        Get a candidate's daily public profile stats (as of the last flush).
+
+        Args:
+            candidate: Candidate profile
+            days: Number of days back from today (UTC)
+
+        Returns:
+            dict: {
+                'days': [{'date', 'views', 'unique_views', 'contacts'}, ...] (newest first),
+                'totals': {'views', 'contacts'}
+            }
+        """
+        since = timezone.now().date() - timedelta(days=days - 1)
+        stats = ProfileDailyStats.objects.filter(candidate=candidate, date__gte=since)
+        totals = stats.aggregate(views=Sum("views"), contacts=Sum("contacts"))
+
+        return {
+            "days": [
+                {
+                    "date": row["date"].isoformat(),
+                    "views": row["views"],
+                    "unique_views": row["unique_views"],
+                    "contacts": row["contacts"],
+                }
+                for row in stats.order_by("-date").values(
+                    "date", "views", "unique_views", "contacts"
+                )
+            ],
+            "totals": {
+                "views": totals["views"] or 0,
+                "contacts": totals["contacts"] or 0,
+            },
+        }
@@ -0,0 +1,221 @@
+"""
+Abuse protection for public profile contact requests.
+
+The contact endpoint is anonymous and every request turns into an admin
+e-mail, so submissions go through, in order:
+
+1. A per-IP token bucket and a per-profile token bucket (hard limits, 429).
+2. Duplicate suppression: the same sender and message for the same profile
+   within PUBLIC_CONTACT_DEDUPE_TTL is accepted but not sent again.
+3. A per-profile "immediate" bucket: the first few requests in a burst are
+   e-mailed right away; the rest are queued in Redis and delivered as one
+   digest e-mail (send_contact_digest task) after PUBLIC_CONTACT_DIGEST_DELAY.
+
+If Redis is unavailable the request is sent immediately (fail open).
+"""
+
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.utils import timezone
+from redis.exceptions import RedisError
+
+from candidates.models import CandidateProfile
+from candidates.services.sharing import SharingService
+from core.tasks import send_email_task
+from core.utils.rate_limit import consume_token
+from core.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_PERIOD = 3600
+IP_BUCKET_KEY = "ratelimit:contact:ip:{ip}"
+PROFILE_BUCKET_KEY = "ratelimit:contact:profile:{candidate_id}"
+IMMEDIATE_BUCKET_KEY = "ratelimit:contact:immediate:{candidate_id}"
+DEDUPE_KEY = "candidates:contact:seen:{digest}"
+DIGEST_KEY = "candidates:contact:digest:{candidate_id}"
+DIGEST_SCHEDULED_KEY = "candidates:contact:digest:{candidate_id}:scheduled"
+
+SENT = "sent"
+QUEUED = "queued"
+DUPLICATE = "duplicate"
+
+
+class ContactRateLimited(Exception):
+    """Raised when a contact request exceeds a rate limit."""
+
+    def __init__(self, retry_after: float):
+        self.retry_after = max(1, int(retry_after + 0.999))
+        super().__init__(f"Rate limited, retry after {self.retry_after}s")
+
+
+class ContactRequestService:
+    """Throttle, de-duplicate and batch public contact requests."""
+
+    @staticmethod
+    def check_ip(client_ip: str) -> None:
+        """
+        Apply the per-IP limit (call before any database work).
+
+        Raises:
+            ContactRateLimited: If the IP exceeded PUBLIC_CONTACT_IP_LIMIT per hour
+        """
+        try:
+            wait = consume_token(
+                IP_BUCKET_KEY.format(ip=client_ip or "unknown"),
+                settings.PUBLIC_CONTACT_IP_LIMIT,
+                RATE_LIMIT_PERIOD,
+            )
+        except RedisError as e:
+            logger.warning(f"Contact IP rate limit skipped: {e}")
+            return
+        if wait:
+            raise ContactRateLimited(wait)
+
+    @staticmethod
+    def submit(
+        candidate: CandidateProfile, contact_name: str, contact_email: str, message: str
+    ) -> str:
+        """
+        Deliver a validated contact request, immediately or via the digest.
+
+        Args:
+            candidate: Contacted (publicly shared) profile
+            contact_name: Name of person making contact
+            contact_email: Email of person making contact
+            message: Contact message
+
+        Returns:
+            str: SENT, QUEUED (digest) or DUPLICATE (not delivered again)
+
+        Raises:
+            ContactRateLimited: If the profile exceeded PUBLIC_CONTACT_PROFILE_LIMIT per hour
+        """
+        try:
+            wait = consume_token(
+                PROFILE_BUCKET_KEY.format(candidate_id=candidate.id),
+                settings.PUBLIC_CONTACT_PROFILE_LIMIT,
+                RATE_LIMIT_PERIOD,
+            )
+            if wait:
+                raise ContactRateLimited(wait)
+
+            if ContactRequestService._is_duplicate(candidate, contact_email, message):
+                return DUPLICATE
+
+            immediate = not consume_token(
+                IMMEDIATE_BUCKET_KEY.format(candidate_id=candidate.id),
+                settings.PUBLIC_CONTACT_IMMEDIATE_LIMIT,
+                RATE_LIMIT_PERIOD,
+            )
+            if not immediate:
+                ContactRequestService._queue_for_digest(
+                    candidate, contact_name, contact_email, message
+                )
+                return QUEUED
+        except RedisError as e:
+            logger.warning(f"Contact throttling skipped, sending immediately: {e}")
+
+        SharingService.send_contact_request(
+            candidate=candidate,
+            contact_name=contact_name,
+            contact_email=contact_email,
+            message=message,
+        )
+        return SENT
+
+    @staticmethod
+    def _is_duplicate(candidate: CandidateProfile, contact_email: str, message: str) -> bool:
+        """Remember a (profile, sender, message) triple; True if it was already seen."""
+        normalized = " ".join(message.lower().split())
+        digest = hashlib.sha256(
+            f"{candidate.id}|{contact_email.lower()}|{normalized}".encode()
+        ).hexdigest()
+        first = get_redis_client().set(
+            DEDUPE_KEY.format(digest=digest), 1, nx=True, ex=settings.PUBLIC_CONTACT_DEDUPE_TTL
+        )
+        return not first
+
+    @staticmethod
+    def _queue_for_digest(
+        candidate: CandidateProfile, contact_name: str, contact_email: str, message: str
+    ) -> None:
+        """Append a request to the profile's digest; schedule delivery once per batch."""
+        entry = json.dumps(
+            {
+                "contact_name": contact_name,
+                "contact_email": contact_email,
+                "message": message,
+                "received_at": timezone.now().isoformat(),
+            }
+        )
+        client = get_redis_client()
+        delay = settings.PUBLIC_CONTACT_DIGEST_DELAY
+        digest_key = DIGEST_KEY.format(candidate_id=candidate.id)
+
+        pipe = client.pipeline()
+        pipe.rpush(digest_key, entry)
+        # Entries outlive a lost digest task for a while, but not forever
+        pipe.expire(digest_key, delay * 10)
+        pipe.execute()
+
+        ContactRequestService._schedule_digest(str(candidate.id))
+
+    @staticmethod
+    def _schedule_digest(candidate_id: str) -> None:
+        """Schedule the profile's digest unless one is already scheduled."""
+        from candidates.tasks import send_contact_digest
+
+        delay = settings.PUBLIC_CONTACT_DIGEST_DELAY
+        scheduled = get_redis_client().set(
+            DIGEST_SCHEDULED_KEY.format(candidate_id=candidate_id), 1, nx=True, ex=delay * 2
+        )
+        if scheduled:
+            send_contact_digest.apply_async(args=[candidate_id], countdown=delay)
+
+    @staticmethod
+    def send_digest(candidate_id: str) -> int:
+        """
+        Send all queued contact requests of a profile as one admin e-mail.
+
+        Requests are removed from the queue only once the e-mail is enqueued,
+        so a failure leaves them for the task's retry. Requests queued in the
+        meantime stay for the next digest, which is scheduled right away.
+
+        Args:
+            candidate_id: CandidateProfile id
+
+        Returns:
+            int: Number of requests included
+        """
+        client = get_redis_client()
+        digest_key = DIGEST_KEY.format(candidate_id=candidate_id)
+        scheduled_key = DIGEST_SCHEDULED_KEY.format(candidate_id=candidate_id)
+        entries = [json.loads(entry) for entry in client.lrange(digest_key, 0, -1)]
+
+        candidate = CandidateProfile.objects.filter(id=candidate_id).first()
+        if not entries or candidate is None:
+            client.delete(digest_key, scheduled_key)
+            return 0
+
+        send_email_task.delay(
+            template_name="candidate_contact_digest",
+            context={
+                "candidate_name": candidate.full_name,
+                "candidate_position": candidate.current_position,
+                "requests": entries,
+                "profile_admin_url": f"{settings.BASE_URL}/admin/candidate/{candidate.id}",
+            },
+            recipient_email=settings.ADMIN_EMAIL,
+            subject=f"{len(entries)} contatos via Perfil Público: {candidate.full_name}",
+        )
+
+        pipe = client.pipeline()
+        pipe.ltrim(digest_key, len(entries), -1)
+        pipe.delete(scheduled_key)
+        pipe.llen(digest_key)
+        if pipe.execute()[2]:
+            ContactRequestService._schedule_digest(candidate_id)
+        return len(entries)
@@ -0,0 +1,123 @@
+"""
+Garbage collection of orphaned candidate uploads.
+
+generate_presigned_url hands out candidate-photos/ and pitch-videos/ keys
+before anything is saved, so abandoned forms and replaced-but-unsaved files
+leave objects nobody references. OrphanedMediaCollector pages through those
+prefixes with ListObjectsV2, checks each page against profiles and
+experience logos with one set-based query, and queues unreferenced objects
+older than a grace period on the PendingS3Deletion outbox (deleted in
+batches by drain_s3_deletions).
+Image variants (see media_processing) live and die with their original.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import CharField, Q, Value
+from django.utils import timezone
+
+from candidates.models import CandidateProfile, Experience
+from candidates.services.media_processing import source_key
+from core.models import PendingS3Deletion
+from core.utils.s3 import get_s3_client, get_s3_key
+
+logger = logging.getLogger(__name__)
+
+MEDIA_PREFIXES = ("candidate-photos/", "pitch-videos/")
+
+
+def _bucket_urls(key: str) -> list[str]:
+    """Every URL form under which a key may be stored (see validate_s3_url)."""
+    bucket = settings.AWS_STORAGE_BUCKET_NAME
+    region = settings.AWS_S3_REGION_NAME
+    return [
+        f"https://{bucket}.s3.amazonaws.com/{key}",
+        f"https://{bucket}.s3.{region}.amazonaws.com/{key}",
+        f"https://s3.{region}.amazonaws.com/{bucket}/{key}",
+    ]
+
+
+class OrphanedMediaCollector:
+    """Find and queue deletion of uploads no profile references."""
+
+    @staticmethod
+    def referenced_keys(keys: list[str]) -> set[str]:
+        """
+        Keys among `keys` referenced by any profile (active or not) or experience logo.
+
+        A variant counts as referenced while its original is.
+
+        Args:
+            keys: Object keys
+
+        Returns:
+            set: Referenced keys
+        """
+        sources = {source_key(key) for key in keys}
+        urls = [url for key in sources for url in _bucket_urls(key)]
+        profiles = (
+            CandidateProfile.objects.filter(
+                Q(profile_photo_url__in=urls) | Q(pitch_video_url__in=urls)
+            )
+            .order_by()
+            .values_list("profile_photo_url", "pitch_video_url")
+        )
+        logos = (
+            Experience.objects.filter(company_logo_url__in=urls)
+            .annotate(unused=Value(None, output_field=CharField()))
+            .order_by()
+            .values_list("company_logo_url", "unused")
+        )
+        rows = profiles.union(logos, all=True)
+        live = {get_s3_key(url) for row in rows for url in row if url}
+        return {key for key in keys if source_key(key) in live}
+
+    @staticmethod
+    def collect(grace_period: Optional[timedelta] = None, dry_run: bool = False) -> dict:
+        """
+        Queue unreferenced uploads older than the grace period for deletion.
+
+        Args:
+            grace_period: Minimum object age (default MEDIA_ORPHAN_GRACE_HOURS),
+                so uploads whose form is still being filled in are kept
+            dry_run: Only count, queue nothing
+
+        Returns:
+            dict: {'scanned': int, 'orphaned': int}
+        """
+        if grace_period is None:
+            grace_period = timedelta(hours=settings.MEDIA_ORPHAN_GRACE_HOURS)
+        cutoff: datetime = timezone.now() - grace_period
+
+        paginator = get_s3_client().get_paginator("list_objects_v2")
+        scanned = orphaned = 0
+
+        for prefix in MEDIA_PREFIXES:
+            pages = paginator.paginate(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                Prefix=prefix,
+                PaginationConfig={"PageSize": 1000},
+            )
+            for page in pages:
+                objects = page.get("Contents", [])
+                scanned += len(objects)
+                old_keys = [obj["Key"] for obj in objects if obj["LastModified"] < cutoff]
+                if not old_keys:
+                    continue
+
+                referenced = OrphanedMediaCollector.referenced_keys(old_keys)
+                orphans = [key for key in old_keys if key not in referenced]
+                orphaned += len(orphans)
+                if orphans and not dry_run:
+                    PendingS3Deletion.objects.bulk_create(
+                        [PendingS3Deletion(key=key) for key in orphans], ignore_conflicts=True
+                    )
+
+        logger.info(
+            f"Orphaned media scan: {scanned} objects, {orphaned} orphaned"
+            + (" (dry run)" if dry_run else "")
+        )
+        return {"scanned": scanned, "orphaned": orphaned}
@@ -0,0 +1,303 @@
+"""
+Post-upload processing of profile photos, company logos and pitch videos.
+
+After a profile photo or company logo (in our bucket) is saved, a Celery
+task downloads the original and stores fixed-width WebP and JPEG variants
+next to it:
+
+    candidate-photos/<uuid>.jpg              original
+    candidate-photos/<uuid>.jpg@256.webp     variant (width 256)
+
+The variant URLs are recorded on the model as
+{'source': <original url>, 'webp': {'256': url, ...}, 'jpeg': {...}}.
+'source' ties them to the original they were rendered from, so a replaced
+photo never shows stale variants; serializers expose them through
+responsive_variants(). An original that cannot be rendered (not an image,
+too large) is recorded as {'source': <original url>, 'failed': True}, so
+later saves do not queue it again. Variants of replaced originals are
+removed by the orphaned media collector.
+
+Uploaded pitch videos get the same treatment where the worker has ffmpeg:
+a faststart MP4 (<key>@stream.mp4) and a poster frame (<key>@poster.jpg),
+recorded in pitch_video_renditions and exposed by video_renditions().
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from PIL import UnidentifiedImageError
+
+from candidates.models import CandidateProfile, Experience
+from core.utils.images import FORMATS, render_image_variants
+from core.utils.s3 import get_s3_client, get_s3_key, validate_s3_url
+from core.utils.video import (
+    extract_poster,
+    ffmpeg_available,
+    probe_video,
+    transcode_faststart,
+)
+
+logger = logging.getLogger(__name__)
+
+VARIANT_SEPARATOR = "@"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Rendering errors retrying cannot fix
+UNRENDERABLE_ERRORS = (UnidentifiedImageError, ValueError)
+
+
+def variant_key(key: str, width: int, fmt: str) -> str:
+    """Object key of a variant, stored next to the original."""
+    extension = "jpg" if fmt == "jpeg" else fmt
+    return f"{key}{VARIANT_SEPARATOR}{width}.{extension}"
+
+
+def source_key(key: str) -> str:
+    """Object key of the original a variant was rendered from (identity for originals)."""
+    return key.split(VARIANT_SEPARATOR, 1)[0]
+
+
+def responsive_variants(url: Optional[str], variants: Optional[dict]) -> dict:
+    """
+    Variants of an image for serializers, if they match its current URL.
+
+    Returns:
+        dict: {'webp': {width: url}, 'jpeg': {width: url}}, or {} if not rendered yet
+    """
+    if not url or not variants or variants.get("source") != url:
+        return {}
+    return {fmt: variants[fmt] for fmt in FORMATS if fmt in variants}
+
+
+def video_renditions(url: Optional[str], renditions: Optional[dict]) -> dict:
+    """
+    Streaming renditions of a pitch video for serializers, if they match its current URL.
+
+    Returns:
+        dict: {'mp4': url, 'poster': url, 'duration': float, 'width': int, 'height': int},
+            or {} if not rendered (YouTube videos, no ffmpeg, still processing)
+    """
+    if not url or not renditions or renditions.get("source") != url:
+        return {}
+    return {name: value for name, value in renditions.items() if name != "source"}
+
+
+def needs_processing(url: Optional[str], variants: Optional[dict]) -> bool:
+    """True if `url` is one of our uploads without variants rendered from it."""
+    return bool(url) and validate_s3_url(url) and (variants or {}).get("source") != url
+
+
+class ImageVariantService:
+    """Render and store responsive image variants."""
+
+    @staticmethod
+    def render_and_store(url: str) -> dict:
+        """
+        Render every variant of an uploaded image and upload it next to the original.
+
+        Args:
+            url: Original image URL in our bucket
+
+        Returns:
+            dict: {'source': url, 'webp': {width: url}, 'jpeg': {width: url}}
+
+        Raises:
+            ValueError: If the URL is not in our bucket or the object is too large
+            ClientError: If S3 fails
+        """
+        key = get_s3_key(url)
+        if key is None:
+            raise ValueError(f"Not an upload of this bucket: {url}")
+
+        bucket = settings.AWS_STORAGE_BUCKET_NAME
+        s3_client = get_s3_client()
+        original = s3_client.get_object(Bucket=bucket, Key=key)
+        if original["ContentLength"] > settings.MAX_UPLOAD_SIZE:
+            raise ValueError(f"Image too large to process: {key}")
+
+        rendered = render_image_variants(original["Body"].read(), settings.MEDIA_IMAGE_WIDTHS)
+
+        base_url = url[: -len(key)]
+        variants = {"source": url}
+        for (fmt, width), content in rendered.items():
+            name = variant_key(key, width, fmt)
+            s3_client.put_object(
+                Bucket=bucket,
+                Key=name,
+                Body=content,
+                ContentType=FORMATS[fmt][1],
+                CacheControl=IMMUTABLE_CACHE_CONTROL,
+                ServerSideEncryption=settings.AWS_S3_ENCRYPTION,
+            )
+            variants.setdefault(fmt, {})[str(width)] = f"{base_url}{name}"
+
+        logger.info(f"Rendered {len(rendered)} image variants for {key}")
+        return variants
+
+    @staticmethod
+    def process_profile_photo(candidate_id: str) -> bool:
+        """
+        Render the variants of a candidate's current profile photo.
+
+        Returns:
+            bool: True if variants were stored, False if there was nothing to do
+
+        Raises:
+            UnidentifiedImageError, ValueError: If the photo cannot be rendered
+                (recorded, so it is not queued again)
+        """
+        profile = CandidateProfile.objects.filter(id=candidate_id).first()
+        if profile is None or not needs_processing(
+            profile.profile_photo_url, profile.profile_photo_variants
+        ):
+            return False
+
+        url = profile.profile_photo_url
+        try:
+            variants = ImageVariantService.render_and_store(url)
+        except UNRENDERABLE_ERRORS:
+            CandidateProfile.objects.filter(id=candidate_id, profile_photo_url=url).update(
+                profile_photo_variants={"source": url, "failed": True}
+            )
+            raise
+
+        with transaction.atomic():
+            profile = CandidateProfile.objects.select_for_update().get(id=candidate_id)
+            if profile.profile_photo_url != url:
+                # Replaced while rendering; the new photo has its own task
+                return False
+            profile.profile_photo_variants = variants
+            profile.save(update_fields=["profile_photo_variants", "updated_at"])
+        return True
+
+    @staticmethod
+    def process_company_logo(experience_id: str) -> bool:
+        """
+        Render the variants of an experience's current company logo.
+
+        Returns:
+            bool: True if variants were stored, False if there was nothing to do
+
+        Raises:
+            UnidentifiedImageError, ValueError: If the logo cannot be rendered
+                (recorded, so it is not queued again)
+        """
+        experience = Experience.objects.filter(id=experience_id).first()
+        if experience is None or not needs_processing(
+            experience.company_logo_url, experience.company_logo_variants
+        ):
+            return False
+
+        url = experience.company_logo_url
+        try:
+            variants = ImageVariantService.render_and_store(url)
+        except UNRENDERABLE_ERRORS:
+            Experience.objects.filter(id=experience_id, company_logo_url=url).update(
+                company_logo_variants={"source": url, "failed": True}
+            )
+            raise
+
+        with transaction.atomic():
+            experience = Experience.objects.select_for_update().get(id=experience_id)
+            if experience.company_logo_url != url:
+                return False
+            experience.company_logo_variants = variants
+            experience.save(update_fields=["company_logo_variants", "updated_at"])
+        return True
+
+
+class PitchVideoService:
+    """Render streaming-ready renditions of uploaded pitch videos."""
+
+    @staticmethod
+    def render_and_store(url: str) -> dict:
+        """
+        Probe, transcode and extract a poster from an uploaded video.
+
+        Args:
+            url: Original video URL in our bucket
+
+        Returns:
+            dict: {'source': url, 'mp4': url, 'poster': url, 'duration', 'width', 'height'}
+
+        Raises:
+            ValueError: If the URL is not in our bucket or the object is too large
+            VideoProcessingError: If ffprobe/ffmpeg fail (not a usable video)
+            ClientError: If S3 fails
+        """
+        key = get_s3_key(url)
+        if key is None:
+            raise ValueError(f"Not an upload of this bucket: {url}")
+
+        bucket = settings.AWS_STORAGE_BUCKET_NAME
+        s3_client = get_s3_client()
+        original = s3_client.get_object(Bucket=bucket, Key=key)
+        if original["ContentLength"] > settings.MAX_VIDEO_SIZE:
+            raise ValueError(f"Video too large to process: {key}")
+
+        base_url = url[: -len(key)]
+        with tempfile.TemporaryDirectory(prefix="pitch-video-") as workdir:
+            source = os.path.join(workdir, "source")
+            with open(source, "wb") as f:
+                shutil.copyfileobj(original["Body"], f)
+
+            info = probe_video(source)
+            stream = os.path.join(workdir, "stream.mp4")
+            poster = os.path.join(workdir, "poster.jpg")
+            transcode_faststart(source, stream)
+            extract_poster(source, poster, at=min(1.0, info["duration"] / 2))
+
+            renditions = {"source": url, **info}
+            for name, path, content_type in (
+                ("mp4", stream, "video/mp4"),
+                ("poster", poster, "image/jpeg"),
+            ):
+                rendition = f"{key}{VARIANT_SEPARATOR}{os.path.basename(path)}"
+                with open(path, "rb") as body:
+                    s3_client.put_object(
+                        Bucket=bucket,
+                        Key=rendition,
+                        Body=body,
+                        ContentType=content_type,
+                        CacheControl=IMMUTABLE_CACHE_CONTROL,
+                        ServerSideEncryption=settings.AWS_S3_ENCRYPTION,
+                    )
+                renditions[name] = f"{base_url}{rendition}"
+
+        logger.info(f"Rendered streaming renditions for {key} ({info['duration']}s)")
+        return renditions
+
+    @staticmethod
+    def process_pitch_video(candidate_id: str) -> bool:
+        """
+        Render the renditions of a candidate's current uploaded pitch video.
+
+        Returns:
+            bool: True if renditions were stored, False if there was nothing to do
+                (YouTube video, already processed, or no ffmpeg on this worker)
+        """
+        profile = CandidateProfile.objects.filter(id=candidate_id).first()
+        if (
+            profile is None
+            or profile.pitch_video_type != "s3"
+            or not needs_processing(profile.pitch_video_url, profile.pitch_video_renditions)
+        ):
+            return False
+        if not ffmpeg_available():
+            logger.warning("ffmpeg not available; pitch video served as uploaded")
+            return False
+
+        url = profile.pitch_video_url
+        renditions = PitchVideoService.render_and_store(url)
+
+        with transaction.atomic():
+            profile = CandidateProfile.objects.select_for_update().get(id=candidate_id)
+            if profile.pitch_video_url != url:
+                return False
+            profile.pitch_video_renditions = renditions
+            profile.save(update_fields=["pitch_video_renditions", "updated_at"])
+        return True
@@ -0,0 +1,345 @@
+"""
+Pre-rendered public profile snapshots.
+
+A public profile is rendered to JSON when it is published (share token
+generated) and again after every profile or experience edit, and written as
+an immutable snapshot named by token and revision:
+
+    public-profiles/<token>/v<SNAPSHOT_FORMAT>-<revision>.json
+
+The revision is derived from the profile version (see ProfileVersionService),
+so the same content always maps to the same file. An edit drops the token's
+pointer as soon as it commits, then re-publishes in the background; views
+in between publish on demand. A small Redis pointer per token ({path, etag,
+last_modified, candidate_id}) tells the public endpoint which snapshot to
+stream; serving a profile costs one Redis read plus one storage read,
+however complex the profile is.
+
+Dropping a pointer also bumps the token's generation counter. Publishers
+read the generation before the profile version and write the pointer only
+if it is unchanged (WATCH/MULTI), so a publish that rendered a version
+older than the latest edit neither points the token at its snapshot nor
+removes the newer one.
+
+Snapshots live on local disk or in S3 (settings.PUBLIC_PROFILE_SNAPSHOT_STORAGE).
+The pointer is shared by every web host, so local storage only suits a single
+host (development); production defaults to S3.
+Publishing removes every other revision of the token; disabling sharing or
+regenerating the token removes the pointer and all of the token's snapshots.
+If the pointer is missing (Redis flushed, first view), the endpoint publishes
+on demand.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.db import transaction
+from redis.exceptions import RedisError, WatchError
+from rest_framework.renderers import JSONRenderer
+
+from candidates.models import CandidateProfile
+from candidates.serializers import PublicCandidateProfileSerializer
+from candidates.services.profile_version import ProfileVersion, ProfileVersionService
+from core.utils.redis_client import get_redis_client
+from core.utils.s3 import get_s3_client
+
+logger = logging.getLogger(__name__)
+
+# Bump when PublicCandidateProfileSerializer output changes
+SNAPSHOT_FORMAT = 3
+SNAPSHOT_PREFIX = "public-profiles"
+POINTER_KEY = "candidates:public_profile:{token}"
+GENERATION_KEY = "candidates:public_profile:{token}:generation"
+# Outlives any publish, so an expired counter cannot restart at a value a publisher read
+GENERATION_TTL = 30 * 86400
+
+
+class LocalSnapshotStorage:
+    """Snapshots on the local filesystem (settings.PUBLIC_PROFILE_SNAPSHOT_DIR)."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def save(self, name: str, content: bytes) -> None:
+        """Write a snapshot atomically (temp file + rename)."""
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(content)
+        os.replace(tmp_path, path)
+
+    def read(self, name: str) -> Optional[bytes]:
+        try:
+            return (self.root / name).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def delete_prefix(self, prefix: str, keep: Optional[str] = None) -> None:
+        """Delete every snapshot under a prefix except `keep`."""
+        directory = self.root / prefix
+        if not directory.is_dir():
+            return
+        if keep is None:
+            shutil.rmtree(directory, ignore_errors=True)
+            return
+        for entry in directory.iterdir():
+            # .tmp files belong to writes still in progress
+            if entry.suffix != ".tmp" and str(entry.relative_to(self.root)) != keep:
+                entry.unlink(missing_ok=True)
+
+
+class S3SnapshotStorage:
+    """Snapshots in the uploads bucket (settings.AWS_STORAGE_BUCKET_NAME)."""
+
+    def __init__(self, bucket: str):
+        self.bucket = bucket
+
+    def save(self, name: str, content: bytes) -> None:
+        get_s3_client().put_object(
+            Bucket=self.bucket,
+            Key=name,
+            Body=content,
+            ContentType="application/json",
+            CacheControl="public, max-age=31536000, immutable",
+            ServerSideEncryption=settings.AWS_S3_ENCRYPTION,
+        )
+
+    def read(self, name: str) -> Optional[bytes]:
+        try:
+            return get_s3_client().get_object(Bucket=self.bucket, Key=name)["Body"].read()
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise
+
+    def delete_prefix(self, prefix: str, keep: Optional[str] = None) -> None:
+        """Delete every snapshot under a prefix except `keep`."""
+        client = get_s3_client()
+        listing = client.list_objects_v2(Bucket=self.bucket, Prefix=f"{prefix}/")
+        keys = [obj["Key"] for obj in listing.get("Contents", []) if obj["Key"] != keep]
+        if keys:
+            client.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            )
+
+
+def get_snapshot_storage():
+    """Snapshot storage configured by settings.PUBLIC_PROFILE_SNAPSHOT_STORAGE."""
+    if settings.PUBLIC_PROFILE_SNAPSHOT_STORAGE == "s3":
+        return S3SnapshotStorage(settings.AWS_STORAGE_BUCKET_NAME)
+    return LocalSnapshotStorage(settings.PUBLIC_PROFILE_SNAPSHOT_DIR)
+
+
+class PublicProfileSnapshotService:
+    """Publish, look up and remove public profile snapshots."""
+
+    @staticmethod
+    def pointer_key(token) -> str:
+        """Redis key of a token's snapshot pointer."""
+        return POINTER_KEY.format(token=token)
+
+    @staticmethod
+    def generation_key(token) -> str:
+        """Redis key of a token's invalidation counter."""
+        return GENERATION_KEY.format(token=token)
+
+    @staticmethod
+    def get_generation(token) -> Optional[str]:
+        """
+        Current invalidation generation of a token, read before its profile version.
+
+        Returns:
+            str: Generation ("0" if never invalidated), or None if Redis is unavailable
+        """
+        try:
+            return get_redis_client().get(PublicProfileSnapshotService.generation_key(token)) or "0"
+        except RedisError as e:
+            logger.warning(f"Public profile generation read failed: {e}")
+            return None
+
+    @staticmethod
+    def snapshot_path(token, version: ProfileVersion) -> str:
+        """Immutable snapshot name for a token and profile version."""
+        revision = version["etag"].strip('"')
+        return f"{SNAPSHOT_PREFIX}/{token}/v{SNAPSHOT_FORMAT}-{revision}.json"
+
+    @staticmethod
+    def get_pointer(token) -> Optional[dict]:
+        """
+        Get the published snapshot of a token.
+
+        Returns:
+            dict: {'path': str, 'etag': str, 'last_modified': datetime,
+                'candidate_id': str}, or None if nothing is published or Redis
+                is unavailable
+        """
+        try:
+            pointer = get_redis_client().hgetall(PublicProfileSnapshotService.pointer_key(token))
+        except RedisError as e:
+            logger.warning(f"Public profile pointer read failed: {e}")
+            return None
+
+        if not pointer or "candidate_id" not in pointer:
+            return None
+        return {
+            "candidate_id": pointer["candidate_id"],
+            "path": pointer["path"],
+            "etag": pointer["etag"],
+            "last_modified": datetime.fromisoformat(pointer["last_modified"]),
+        }
+
+    @staticmethod
+    def read(path: str) -> Optional[bytes]:
+        """Read a snapshot body (None if it was removed)."""
+        return get_snapshot_storage().read(path)
+
+    @staticmethod
+    def publish(
+        token, version: Optional[ProfileVersion] = None, generation: Optional[str] = None
+    ) -> Optional[tuple[dict, bytes]]:
+        """
+        Render a token's public profile to a snapshot and point the token at it.
+
+        The pointer is written, and other revisions removed, only if the token
+        was not invalidated since `generation` was read.
+
+        Args:
+            token: public_token
+            version: Current profile version, if the caller already has it
+            generation: get_generation() read before `version` (required with it)
+
+        Returns:
+            tuple: (pointer, body), or None if the profile is not publicly shared
+        """
+        if version is None:
+            generation = PublicProfileSnapshotService.get_generation(token)
+            version = ProfileVersionService.get_version(
+                public_token=token, public_sharing_enabled=True, is_active=True
+            )
+        if version is None:
+            PublicProfileSnapshotService.unpublish(token)
+            return None
+
+        profile = CandidateProfile.objects.prefetch_related("experiences").get(id=version["id"])
+        # Canonical media URLs: signed read URLs expire, snapshots do not
+        data = PublicCandidateProfileSerializer(profile, context={"sign_media": False}).data
+        content = JSONRenderer().render(data)
+        path = PublicProfileSnapshotService.snapshot_path(token, version)
+
+        storage = get_snapshot_storage()
+        storage.save(path, content)
+
+        pointer = {
+            "candidate_id": version["id"],
+            "path": path,
+            "etag": version["etag"],
+            "last_modified": version["last_modified"],
+        }
+        if (
+            PublicProfileSnapshotService._write_pointer(token, pointer, generation)
+            # A newer publish that started since will clean up instead
+            and PublicProfileSnapshotService.get_generation(token) == generation
+        ):
+            storage.delete_prefix(f"{SNAPSHOT_PREFIX}/{token}", keep=path)
+        return pointer, content
+
+    @staticmethod
+    def _write_pointer(token, pointer: dict, generation: Optional[str]) -> bool:
+        """
+        Point a token at a snapshot unless it was invalidated since `generation`.
+
+        Returns:
+            bool: True if the pointer was written
+        """
+        if generation is None:
+            return False
+
+        key = PublicProfileSnapshotService.pointer_key(token)
+        generation_key = PublicProfileSnapshotService.generation_key(token)
+        try:
+            with get_redis_client().pipeline() as pipe:
+                pipe.watch(generation_key)
+                if (pipe.get(generation_key) or "0") != generation:
+                    return False
+                pipe.multi()
+                pipe.hset(
+                    key, mapping={**pointer, "last_modified": pointer["last_modified"].isoformat()}
+                )
+                pipe.expire(key, settings.PUBLIC_PROFILE_CACHE_TTL)
+                pipe.execute()
+                return True
+        except WatchError:
+            return False
+        except RedisError as e:
+            logger.warning(f"Public profile pointer write failed: {e}")
+            return False
+
+    @staticmethod
+    def _drop_pointers(*tokens) -> None:
+        """Delete pointers and bump their generations, failing publishes in flight."""
+        pipe = get_redis_client().pipeline()
+        for token in tokens:
+            generation_key = PublicProfileSnapshotService.generation_key(token)
+            pipe.delete(PublicProfileSnapshotService.pointer_key(token))
+            pipe.incr(generation_key)
+            pipe.expire(generation_key, GENERATION_TTL)
+        pipe.execute()
+
+    @staticmethod
+    def invalidate(token) -> None:
+        """Drop a token's pointer, so the next view publishes on demand."""
+        try:
+            PublicProfileSnapshotService._drop_pointers(token)
+        except RedisError as e:
+            logger.warning(f"Public profile pointer delete failed: {e}")
+
+    @staticmethod
+    def unpublish(*tokens) -> None:
+        """
+        Stop serving tokens right away: drop their pointers and snapshots.
+
+        Args:
+            tokens: public_token values (None entries are ignored)
+        """
+        tokens = [token for token in tokens if token]
+        if not tokens:
+            return
+
+        try:
+            PublicProfileSnapshotService._drop_pointers(*tokens)
+        except RedisError as e:
+            logger.warning(f"Public profile pointer delete failed: {e}")
+
+        storage = get_snapshot_storage()
+        for token in tokens:
+            storage.delete_prefix(f"{SNAPSHOT_PREFIX}/{token}")
+
+    @staticmethod
+    def schedule_publish(token) -> None:
+        """
+        Re-publish a token's snapshot once the current transaction commits.
+
+        The old pointer is dropped on commit, before the task is queued, so
+        the previous snapshot stops being served right away.
+        """
+        if not token:
+            return
+
+        from candidates.tasks import publish_public_profile_snapshot
+
+        token = str(token)
+
+        def invalidate_and_publish():
+            PublicProfileSnapshotService.invalidate(token)
+            publish_public_profile_snapshot.delay(token)
+
+        transaction.on_commit(invalidate_and_publish)
@@ -0,0 +1,61 @@
+"""
+Candidate profile versions for HTTP conditional requests.
+
+A profile's version combines its own updated_at with the newest
+updated_at and the count of its experiences, so any profile or work
+history change (including a deleted experience) yields a new ETag.
+One aggregate query, no serialization.
+"""
+
+from datetime import datetime
+from typing import Optional, TypedDict
+
+from django.db.models import Count, Max
+
+from candidates.models import CandidateProfile
+from core.utils.http_cache import make_etag
+
+
+class ProfileVersion(TypedDict):
+    id: str
+    etag: str
+    last_modified: datetime
+
+
+class ProfileVersionService:
+    """Compute profile ETags and Last-Modified times."""
+
+    @staticmethod
+    def get_version(**filters) -> Optional[ProfileVersion]:
+        """
+        Get the version of the profile matching the filters.
+
+        Args:
+            filters: CandidateProfile lookup (e.g. public_token=..., is_active=True)
+
+        Returns:
+            ProfileVersion or None if no profile matches
+        """
+        row = (
+            CandidateProfile.objects.filter(**filters)
+            .annotate(
+                experiences_updated=Max("experiences__updated_at"),
+                experiences_count=Count("experiences"),
+            )
+            .values("id", "updated_at", "experiences_updated", "experiences_count")
+            .first()
+        )
+        if row is None:
+            return None
+
+        last_modified = max(filter(None, [row["updated_at"], row["experiences_updated"]]))
+        return {
+            "id": str(row["id"]),
+            "etag": make_etag(
+                row["id"],
+                row["updated_at"].isoformat(),
+                row["experiences_updated"] and row["experiences_updated"].isoformat(),
+                row["experiences_count"],
+            ),
+            "last_modified": last_modified,
+        }
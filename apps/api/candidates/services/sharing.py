@@ -15,6 +15,8 @@ from django.db import transaction
 from django.utils import timezone
 
 from candidates.models import CandidateProfile
+from candidates.services.profile_snapshot import PublicProfileSnapshotService
+from candidates.services.token_filter import PublicTokenFilter
 from core.tasks import send_email_task
 
 
@@ -50,6 +52,7 @@ class SharingService:
             )
 
         # Generate new token (invalidates old one)
+        previous_token = candidate.public_token
         candidate.public_token = uuid.uuid4()
         candidate.public_sharing_enabled = True
         candidate.share_link_generated_at = timezone.now()
@@ -61,6 +64,11 @@ class SharingService:
                 "updated_at",
             ]
         )
+        # The old link must stop serving right away; the new snapshot is
+        # published on commit by the post_save signal
+        PublicProfileSnapshotService.unpublish(previous_token)
+        PublicTokenFilter.remember_missing(previous_token)
+        PublicTokenFilter.add(candidate.public_token)
 
         # Build share URL using environment variable
         base_url = settings.FRONTEND_URL or settings.BASE_URL
@@ -90,6 +98,12 @@ class SharingService:
         """
         candidate.public_sharing_enabled = enabled
         candidate.save(update_fields=["public_sharing_enabled", "updated_at"])
+        if enabled:
+            # Added before commit: a rollback only leaves a harmless false positive
+            PublicTokenFilter.add(candidate.public_token)
+        else:
+            PublicProfileSnapshotService.unpublish(candidate.public_token)
+            PublicTokenFilter.remember_missing(candidate.public_token)
 
         return candidate.public_sharing_enabled
 
@@ -98,7 +112,9 @@ class SharingService:
         """
         Retrieve public candidate profile by share token.
 
-        Returns None if token invalid or sharing disabled.
+        Returns None if token invalid or sharing disabled. Unknown and
+        recently disabled tokens are rejected by PublicTokenFilter without
+        a database query.
 
         Args:
             token: UUID share token
@@ -106,6 +122,9 @@ class SharingService:
         Returns:
             CandidateProfile or None
         """
+        if not PublicTokenFilter.may_exist(token):
+            return None
+
         try:
             candidate = (
                 CandidateProfile.objects.select_related("user")
@@ -113,8 +132,8 @@ class SharingService:
                 .get(public_token=token, public_sharing_enabled=True, is_active=True)
             )
             return candidate
-        except (CandidateProfile.DoesNotExist, ValueError, exceptions.ValidationError):
-            # ValueError/ValidationError is raised when token is not a valid UUID
+        except CandidateProfile.DoesNotExist:
+            PublicTokenFilter.remember_missing(token)
             return None
 
     @staticmethod
@@ -153,8 +172,8 @@ class SharingService:
 
         # Send email (async via Celery)
         send_email_task.delay(
-            to_email=admin_email,
-            subject=subject,
-            template_name="emails/candidate_contact_request.html",
+            template_name="candidate_contact_request",
             context=context,
+            recipient_email=admin_email,
+            subject=subject,
         )
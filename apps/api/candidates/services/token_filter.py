@@ -0,0 +1,185 @@
+"""
+Fast rejection of unknown public profile tokens.
+
+Most misses on the public profile endpoints come from scrapers and stale
+links. Two Redis structures let them be answered without a database query:
+
+- A Bloom filter (one bitmap, SETBIT/GETBIT) of every token that has been
+  shared. "Not in the filter" is definitive; "in the filter" may be a false
+  positive or a token that was disabled since, so the database decides.
+- A negative cache of tokens recently confirmed missing or disabled
+  (PUBLIC_TOKEN_MISS_TTL), for repeated hits on the same stale link.
+
+Bits cannot be removed, so the filter is rebuilt from the database daily
+(rebuild_public_token_filter task) and whenever it is missing from Redis.
+Until it exists, every token is treated as possibly valid.
+"""
+
+import hashlib
+import logging
+import uuid
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from redis.exceptions import RedisError
+
+from candidates.models import CandidateProfile
+from core.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+BLOOM_KEY = "candidates:public_tokens:bloom"
+BLOOM_BUILD_KEY = "candidates:public_tokens:bloom:build"
+BLOOM_REBUILD_LOCK_KEY = "candidates:public_tokens:bloom:rebuilding"
+MISS_KEY = "candidates:public_token:miss:{token}"
+HASH_COUNT = 7
+REBUILD_BATCH_SIZE = 5000
+
+
+def _parse_token(token) -> Optional[str]:
+    """Canonical string form of a token, or None if it is not a UUID."""
+    try:
+        return str(uuid.UUID(str(token)))
+    except ValueError:
+        return None
+
+
+def _bit_positions(token: str) -> list[int]:
+    """Bloom filter bit offsets of a token (double hashing over SHA-256)."""
+    digest = hashlib.sha256(token.encode()).digest()
+    h1 = int.from_bytes(digest[:8], "big")
+    h2 = int.from_bytes(digest[8:16], "big") | 1
+    size = settings.PUBLIC_TOKEN_BLOOM_BITS
+    return [(h1 + i * h2) % size for i in range(HASH_COUNT)]
+
+
+class PublicTokenFilter:
+    """Bloom filter and negative cache in front of public token lookups."""
+
+    @staticmethod
+    def may_exist(token) -> bool:
+        """
+        Check whether a token could belong to a shared profile, without the database.
+
+        Args:
+            token: public_token (UUID or string)
+
+        Returns:
+            bool: False if the token is certainly unknown, disabled recently or
+                malformed; True if the database must be asked
+        """
+        token = _parse_token(token)
+        if token is None:
+            return False
+
+        try:
+            pipe = get_redis_client().pipeline(transaction=False)
+            pipe.exists(MISS_KEY.format(token=token))
+            pipe.exists(BLOOM_KEY)
+            for offset in _bit_positions(token):
+                pipe.getbit(BLOOM_KEY, offset)
+            missing, bloom_exists, *bits = pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Public token filter unavailable: {e}")
+            return True
+
+        if missing:
+            return False
+        if not bloom_exists:
+            PublicTokenFilter.schedule_rebuild()
+            return True
+        return all(bits)
+
+    @staticmethod
+    def remember_missing(token) -> None:
+        """Cache that a token does not resolve to a shared profile."""
+        token = _parse_token(token)
+        if token is None:
+            return
+        try:
+            get_redis_client().set(
+                MISS_KEY.format(token=token), 1, ex=settings.PUBLIC_TOKEN_MISS_TTL
+            )
+        except RedisError as e:
+            logger.warning(f"Public token miss not cached: {e}")
+
+    @staticmethod
+    def add(token) -> None:
+        """
+        Register a newly shared token and clear any cached miss for it.
+
+        The filter is only updated if it already exists: creating it here
+        would make it look complete while holding a single token.
+        """
+        token = _parse_token(token)
+        if token is None:
+            return
+
+        def update(pipe):
+            exists = pipe.exists(BLOOM_KEY)
+            pipe.multi()
+            pipe.delete(MISS_KEY.format(token=token))
+            if exists:
+                for offset in _bit_positions(token):
+                    pipe.setbit(BLOOM_KEY, offset, 1)
+
+        try:
+            get_redis_client().transaction(update, BLOOM_KEY)
+        except RedisError as e:
+            logger.warning(f"Public token not added to filter: {e}")
+
+    @staticmethod
+    def rebuild() -> int:
+        """
+        Rebuild the filter from the database and swap it in atomically.
+
+        Tokens shared while the rebuild ran (or just before, in transactions
+        that committed late) are added again after the swap.
+
+        Returns:
+            int: Number of tokens in the filter
+        """
+        client = get_redis_client()
+        started = timezone.now()
+        shared = CandidateProfile.objects.filter(public_sharing_enabled=True, is_active=True)
+
+        client.delete(BLOOM_BUILD_KEY)
+        # Allocate the full bitmap up front so an empty filter still exists
+        client.setbit(BLOOM_BUILD_KEY, settings.PUBLIC_TOKEN_BLOOM_BITS - 1, 0)
+
+        count = 0
+        pipe = client.pipeline(transaction=False)
+        for token in shared.values_list("public_token", flat=True).iterator(
+            chunk_size=REBUILD_BATCH_SIZE
+        ):
+            for offset in _bit_positions(str(token)):
+                pipe.setbit(BLOOM_BUILD_KEY, offset, 1)
+            count += 1
+            if count % REBUILD_BATCH_SIZE == 0:
+                pipe.execute()
+        pipe.execute()
+
+        client.rename(BLOOM_BUILD_KEY, BLOOM_KEY)
+        recent = shared.filter(updated_at__gte=started - timedelta(minutes=5))
+        for token in recent.values_list("public_token", flat=True):
+            PublicTokenFilter.add(token)
+
+        client.delete(BLOOM_REBUILD_LOCK_KEY)
+        logger.info(f"Public token filter rebuilt with {count} tokens")
+        return count
+
+    @staticmethod
+    def schedule_rebuild() -> None:
+        """Queue a rebuild (after the current transaction) unless one is already queued."""
+        from candidates.tasks import rebuild_public_token_filter
+
+        try:
+            scheduled = get_redis_client().set(BLOOM_REBUILD_LOCK_KEY, 1, nx=True, ex=600)
+        except RedisError as e:
+            logger.warning(f"Public token filter rebuild not scheduled: {e}")
+            return
+        if scheduled:
+            transaction.on_commit(rebuild_public_token_filter.delay)
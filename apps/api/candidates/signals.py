@@ -0,0 +1,72 @@
+"""
+Candidate signal handlers.
+
+Keeps the pre-rendered public profile snapshots in sync with profile and
+experience writes (see PublicProfileSnapshotService), and queues image
+variant rendering for new profile photos and company logos and streaming
+renditions for new uploaded pitch videos.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from candidates.models import CandidateProfile, Experience
+from candidates.services.media_processing import needs_processing
+from candidates.services.profile_snapshot import PublicProfileSnapshotService
+
+
+@receiver(post_save, sender=CandidateProfile)
+def publish_snapshot_on_save(sender, instance: CandidateProfile, **kwargs) -> None:
+    """Re-publish the public profile snapshot of a saved candidate."""
+    PublicProfileSnapshotService.schedule_publish(instance.public_token)
+
+
+@receiver(post_delete, sender=CandidateProfile)
+def unpublish_snapshot_on_delete(sender, instance: CandidateProfile, **kwargs) -> None:
+    """Remove the public profile snapshot of a deleted candidate."""
+    PublicProfileSnapshotService.unpublish(instance.public_token)
+
+
+@receiver(post_save, sender=Experience)
+@receiver(post_delete, sender=Experience)
+def publish_snapshot_on_experience_change(sender, instance: Experience, **kwargs) -> None:
+    """Re-publish the public profile snapshot when its work history changes."""
+    token = (
+        CandidateProfile.objects.filter(id=instance.candidate_id)
+        .values_list("public_token", flat=True)
+        .first()
+    )
+    PublicProfileSnapshotService.schedule_publish(token)
+
+
+@receiver(post_save, sender=CandidateProfile)
+def process_photo_on_save(sender, instance: CandidateProfile, **kwargs) -> None:
+    """Render variants of a new profile photo once the save commits."""
+    if needs_processing(instance.profile_photo_url, instance.profile_photo_variants):
+        from candidates.tasks import process_profile_photo
+
+        candidate_id = str(instance.id)
+        transaction.on_commit(lambda: process_profile_photo.delay(candidate_id))
+
+
+@receiver(post_save, sender=CandidateProfile)
+def process_video_on_save(sender, instance: CandidateProfile, **kwargs) -> None:
+    """Render streaming renditions of a new uploaded pitch video once the save commits."""
+    if instance.pitch_video_type == "s3" and needs_processing(
+        instance.pitch_video_url, instance.pitch_video_renditions
+    ):
+        from candidates.tasks import process_pitch_video
+
+        candidate_id = str(instance.id)
+        transaction.on_commit(lambda: process_pitch_video.delay(candidate_id))
+
+
+@receiver(post_save, sender=Experience)
+def process_logo_on_save(sender, instance: Experience, **kwargs) -> None:
+    """Render variants of a new company logo once the save commits."""
+    if needs_processing(instance.company_logo_url, instance.company_logo_variants):
+        from candidates.tasks import process_company_logo
+
+        experience_id = str(instance.id)
+        transaction.on_commit(lambda: process_company_logo.delay(experience_id))
@@ -2,6 +2,13 @@
 Celery tasks for candidate operations - Story 3.3
 
 Async tasks for CSV import processing with progress tracking and error logging.
+Public profile snapshot publishing after profile edits.
+Periodic flush of buffered public profile analytics.
+Digest delivery of throttled public contact requests.
+Periodic rebuild of the public token Bloom filter.
+Periodic garbage collection of orphaned candidate uploads.
+Responsive variants of uploaded profile photos and company logos.
+Streaming renditions of uploaded pitch videos.
 """
 
 import csv
@@ -12,8 +19,16 @@ import pandas as pd
 from celery import shared_task
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from PIL import UnidentifiedImageError
 
+from candidates.services.analytics import ProfileAnalyticsService
+from candidates.services.contact_requests import ContactRequestService
 from candidates.services.csv_import import CSVImportService
+from candidates.services.media_gc import OrphanedMediaCollector
+from candidates.services.media_processing import ImageVariantService, PitchVideoService
+from candidates.services.profile_snapshot import PublicProfileSnapshotService
+from candidates.services.token_filter import PublicTokenFilter
+from core.utils.video import VideoProcessingError
 
 logger = get_task_logger(__name__)
 
@@ -159,3 +174,163 @@ def process_csv_import(
     except Exception as e:
         logger.error(f"Fatal error in CSV import task {self.request.id}: {str(e)}")
         raise self.retry(exc=e, countdown=60) from e  # Retry after 60 seconds
+
+
+@shared_task(bind=True, max_retries=3)
+def publish_public_profile_snapshot(self, token: str) -> bool:
+    """
+    Re-render and publish the public profile snapshot of a share token.
+
+    Unpublishes the token if the profile is no longer shared.
+
+    Args:
+        token: public_token
+
+    Returns:
+        bool: True if a snapshot is published for the token
+    """
+    try:
+        return PublicProfileSnapshotService.publish(token) is not None
+    except Exception as e:
+        logger.error(f"Publishing public profile snapshot failed: {e}")
+        raise self.retry(exc=e, countdown=60 * (2**self.request.retries)) from e
+
+
+@shared_task(bind=True, max_retries=3)
+def flush_profile_analytics(self) -> int:
+    """
+    Flush buffered public profile view/contact counters to ProfileDailyStats.
+
+    Scheduled by Celery beat (settings.CELERY_BEAT_SCHEDULE).
+
+    Returns:
+        int: Number of (candidate, day) rows written
+    """
+    try:
+        written = ProfileAnalyticsService.flush()
+    except Exception as e:
+        logger.error(f"Flushing profile analytics failed: {e}")
+        raise self.retry(exc=e, countdown=60 * (2**self.request.retries)) from e
+
+    if written:
+        logger.info(f"Flushed profile analytics for {written} candidate-days")
+    return written
+
+
+@shared_task(bind=True, max_retries=3)
+def send_contact_digest(self, candidate_id: str) -> int:
+    """
+    Deliver a profile's queued contact requests as one digest e-mail.
+
+    Args:
+        candidate_id: CandidateProfile id
+
+    Returns:
+        int: Number of contact requests in the digest
+    """
+    try:
+        return ContactRequestService.send_digest(candidate_id)
+    except Exception as e:
+        logger.error(f"Sending contact digest failed for {candidate_id}: {e}")
+        raise self.retry(exc=e, countdown=60 * (2**self.request.retries)) from e
+
+
+@shared_task(bind=True, max_retries=3)
+def rebuild_public_token_filter(self) -> int:
+    """
+    Rebuild the Bloom filter of shared public tokens from the database.
+
+    Runs daily (settings.CELERY_BEAT_SCHEDULE) to drop disabled and
+    regenerated tokens, and on demand when the filter is missing from Redis.
+
+    Returns:
+        int: Number of tokens in the filter
+    """
+    try:
+        return PublicTokenFilter.rebuild()
+    except Exception as e:
+        logger.error(f"Rebuilding public token filter failed: {e}")
+        raise self.retry(exc=e, countdown=60 * (2**self.request.retries)) from e
+
+
+@shared_task(bind=True, max_retries=3)
+def collect_orphaned_media(self, dry_run: bool = False) -> dict:
+    """
+    Queue candidate uploads no profile references for deletion.
+
+    Runs daily (settings.CELERY_BEAT_SCHEDULE).
+
+    Args:
+        dry_run: Only count orphans
+
+    Returns:
+        dict: {'scanned': int, 'orphaned': int}
+    """
+    try:
+        return OrphanedMediaCollector.collect(dry_run=dry_run)
+    except Exception as e:
+        logger.error(f"Orphaned media collection failed: {e}")
+        raise self.retry(exc=e, countdown=60 * (2**self.request.retries)) from e
+
+
+@shared_task(bind=True, max_retries=3)
+def process_profile_photo(self, candidate_id: str) -> bool:
+    """
+    Render WebP/JPEG variants of a candidate's profile photo.
+
+    Args:
+        candidate_id: CandidateProfile id
+
+    Returns:
+        bool: True if variants were stored
+    """
+    try:
+        return ImageVariantService.process_profile_photo(candidate_id)
+    except (UnidentifiedImageError, ValueError) as e:
+        logger.warning(f"Profile photo of {candidate_id} not processed: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Processing profile photo of {candidate_id} failed: {e}")
+        raise self.retry(exc=e, countdown=60 * (2**self.request.retries)) from e
+
+
+@shared_task(bind=True, max_retries=3)
+def process_company_logo(self, experience_id: str) -> bool:
+    """
+    Render WebP/JPEG variants of an experience's company logo.
+
+    Args:
+        experience_id: Experience id
+
+    Returns:
+        bool: True if variants were stored
+    """
+    try:
+        return ImageVariantService.process_company_logo(experience_id)
+    except (UnidentifiedImageError, ValueError) as e:
+        logger.warning(f"Company logo of {experience_id} not processed: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Processing company logo of {experience_id} failed: {e}")
+        raise self.retry(exc=e, countdown=60 * (2**self.request.retries)) from e
+
+
+@shared_task(bind=True, max_retries=3)
+def process_pitch_video(self, candidate_id: str) -> bool:
+    """
+    Render the faststart MP4 and poster of a candidate's uploaded pitch video.
+
+    Args:
+        candidate_id: CandidateProfile id
+
+    Returns:
+        bool: True if renditions were stored
+    """
+    try:
+        return PitchVideoService.process_pitch_video(candidate_id)
+    except (VideoProcessingError, ValueError) as e:
+        logger.warning(f"Pitch video of {candidate_id} not processed: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Processing pitch video of {candidate_id} failed: {e}")
+        raise self.retry(exc=e, countdown=60 * (2**self.request.retries)) from e
@@ -0,0 +1,185 @@
+"""
+Tests for buffered public profile analytics.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from candidates.models import CandidateProfile, ProfileDailyStats
+from candidates.services.analytics import DIRTY_KEY, ProfileAnalyticsService
+from candidates.services.sharing import SharingService
+
+
+@pytest.fixture
+def shared_profile(db, django_capture_on_commit_callbacks):
+    """Create a complete profile with public sharing enabled."""
+    user = User.objects.create_user(
+        email="candidate@test.com", password="testpass123", role="candidate"
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        profile = CandidateProfile.objects.create(
+            user=user,
+            full_name="João Silva",
+            phone="11999999999",
+            pitch_video_url="https://youtube.com/watch?v=test123",
+            pitch_video_type="youtube",
+        )
+        SharingService.generate_share_token(profile)
+    return profile
+
+
+def view_profile(profile, ip="203.0.113.1", **headers):
+    """GET the public profile anonymously from a given client IP."""
+    return APIClient().get(
+        f"/api/v1/candidates/public/{profile.public_token}", REMOTE_ADDR=ip, **headers
+    )
+
+
+@pytest.mark.django_db
+class TestProfileAnalyticsService:
+    """Tests for counting and flushing."""
+
+    def test_views_are_buffered_until_flush(self, shared_profile):
+        """Test views count in Redis only; flush writes one row per day."""
+        view_profile(shared_profile, ip="203.0.113.1")
+        view_profile(shared_profile, ip="203.0.113.1")
+        view_profile(shared_profile, ip="203.0.113.2")
+
+        assert not ProfileDailyStats.objects.exists()
+        assert ProfileAnalyticsService.flush() == 1
+
+        stats = ProfileDailyStats.objects.get(candidate=shared_profile)
+        assert stats.date == timezone.now().date()
+        assert (stats.views, stats.unique_views, stats.contacts) == (3, 2, 0)
+
+    def test_not_modified_counts_as_view(self, shared_profile):
+        """Test a 304 revalidation is still a view."""
+        etag = view_profile(shared_profile)["ETag"]
+
+        response = view_profile(shared_profile, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        ProfileAnalyticsService.flush()
+        assert ProfileDailyStats.objects.get(candidate=shared_profile).views == 2
+
+    def test_flush_is_idempotent_upsert(self, shared_profile):
+        """Test later flushes update the same row with absolute values."""
+        view_profile(shared_profile)
+        ProfileAnalyticsService.flush()
+        view_profile(shared_profile)
+        ProfileAnalyticsService.flush()
+
+        assert ProfileDailyStats.objects.get(candidate=shared_profile).views == 2
+        assert ProfileAnalyticsService.flush() == 0
+
+    def test_flush_skips_deleted_candidates(self, db):
+        """Test counters of deleted candidates are dropped."""
+        ProfileAnalyticsService.record_view("00000000-0000-0000-0000-000000000000", "visitor")
+
+        assert ProfileAnalyticsService.flush() == 0
+        assert not ProfileDailyStats.objects.exists()
+
+    def test_failed_flush_keeps_entries(self, shared_profile, fake_redis):
+        """Test dirty entries are put back if the database write fails."""
+        view_profile(shared_profile)
+
+        with patch.object(
+            ProfileDailyStats.objects, "bulk_create", side_effect=RuntimeError("db down")
+        ):
+            with pytest.raises(RuntimeError):
+                ProfileAnalyticsService.flush()
+
+        assert fake_redis.scard(DIRTY_KEY) == 1
+        assert ProfileAnalyticsService.flush() == 1
+
+    @patch("candidates.services.sharing.SharingService.send_contact_request")
+    def test_contact_is_counted(self, mock_send, shared_profile):
+        """Test successful contact requests are counted."""
+        response = APIClient().post(
+            f"/api/v1/candidates/public/{shared_profile.public_token}/contact",
+            {"name": "Recrutador", "email": "rh@empresa.com", "message": "Olá, tudo bem?"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        ProfileAnalyticsService.flush()
+        assert ProfileDailyStats.objects.get(candidate=shared_profile).contacts == 1
+
+
+@pytest.mark.django_db
+class TestAnalyticsEndpoints:
+    """Tests for GET /me/analytics and the admin analytics endpoint."""
+
+    @pytest.fixture
+    def history(self, shared_profile):
+        today = timezone.now().date()
+        ProfileDailyStats.objects.bulk_create(
+            [
+                ProfileDailyStats(
+                    candidate=shared_profile, date=today, views=5, unique_views=3, contacts=1
+                ),
+                ProfileDailyStats(
+                    candidate=shared_profile,
+                    date=today - timedelta(days=1),
+                    views=2,
+                    unique_views=2,
+                    contacts=0,
+                ),
+                ProfileDailyStats(
+                    candidate=shared_profile,
+                    date=today - timedelta(days=40),
+                    views=100,
+                    unique_views=50,
+                    contacts=9,
+                ),
+            ]
+        )
+        return shared_profile
+
+    def test_candidate_sees_own_analytics(self, history):
+        """Test the candidate gets a daily series and totals for the window."""
+        client = APIClient()
+        client.force_authenticate(user=history.user)
+
+        response = client.get("/api/v1/candidates/me/analytics")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [day["views"] for day in response.data["days"]] == [5, 2]
+        assert response.data["totals"] == {"views": 7, "contacts": 1}
+
+    def test_days_parameter(self, history):
+        """Test ?days= narrows the window."""
+        client = APIClient()
+        client.force_authenticate(user=history.user)
+
+        response = client.get("/api/v1/candidates/me/analytics?days=1")
+
+        assert response.data["totals"] == {"views": 5, "contacts": 1}
+
+    def test_admin_sees_candidate_analytics(self, history):
+        """Test admins can read any candidate's analytics."""
+        admin = User.objects.create_user(
+            email="admin@test.com", password="testpass123", role="admin"
+        )
+        client = APIClient()
+        client.force_authenticate(user=admin)
+
+        response = client.get(f"/api/v1/candidates/admin/candidates/{history.id}/analytics")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["totals"]["views"] == 7
+
+    def test_admin_endpoint_requires_admin(self, history):
+        """Test candidates cannot use the admin endpoint."""
+        client = APIClient()
+        client.force_authenticate(user=history.user)
+
+        response = client.get(f"/api/v1/candidates/admin/candidates/{history.id}/analytics")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
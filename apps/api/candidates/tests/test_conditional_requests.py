@@ -0,0 +1,151 @@
+"""
+Tests for ETag / conditional GET support on profile endpoints.
+"""
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from candidates.models import CandidateProfile, Experience
+from candidates.services.sharing import SharingService
+
+
+@pytest.fixture
+def profile(db, django_capture_on_commit_callbacks):
+    """Create a complete, publicly shared profile with one experience."""
+    user = User.objects.create_user(
+        email="candidate@test.com", password="testpass123", role="candidate"
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        profile = CandidateProfile.objects.create(
+            user=user,
+            full_name="João Silva",
+            phone="11999999999",
+            pitch_video_url="https://youtube.com/watch?v=test123",
+            pitch_video_type="youtube",
+        )
+        Experience.objects.create(
+            candidate=profile, company_name="Company A", position="SDR", start_date="2020-01-01"
+        )
+        SharingService.generate_share_token(profile)
+    return profile
+
+
+def public_url(profile) -> str:
+    return f"/api/v1/candidates/public/{profile.public_token}"
+
+
+@pytest.mark.django_db
+class TestPublicProfileConditionalGet:
+    """Tests for conditional GET /api/v1/candidates/public/:token"""
+
+    def test_emits_validators_and_cdn_headers(self, profile, settings):
+        """Test 200 carries a strong ETag, Last-Modified and CDN Cache-Control."""
+        settings.PUBLIC_PROFILE_CDN_MAX_AGE = 120
+
+        response = APIClient().get(public_url(profile))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"].startswith('"') and not response["ETag"].startswith("W/")
+        assert "Last-Modified" in response
+        cache_control = response["Cache-Control"]
+        assert "public" in cache_control
+        assert "s-maxage=120" in cache_control
+        assert "max-age=0" in cache_control
+
+    def test_if_none_match_returns_304(self, profile):
+        """Test a matching ETag returns 304 with an empty body."""
+        etag = APIClient().get(public_url(profile))["ETag"]
+
+        response = APIClient().get(public_url(profile), HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response["ETag"] == etag
+
+    def test_304_without_cache_skips_serialization(
+        self, profile, fake_redis, django_assert_num_queries
+    ):
+        """Test a revalidation on a cold cache costs only the version query."""
+        etag = APIClient().get(public_url(profile))["ETag"]
+        fake_redis.flushall()
+
+        with django_assert_num_queries(1):
+            response = APIClient().get(public_url(profile), HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_if_modified_since_returns_304(self, profile):
+        """Test If-Modified-Since with the current Last-Modified returns 304."""
+        last_modified = APIClient().get(public_url(profile))["Last-Modified"]
+
+        response = APIClient().get(public_url(profile), HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_experience_change_changes_etag(self, profile, django_capture_on_commit_callbacks):
+        """Test editing work history produces a new ETag and a full response."""
+        etag = APIClient().get(public_url(profile))["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            profile.experiences.first().delete()
+
+        response = APIClient().get(public_url(profile), HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+        assert response.data["experiences"] == []
+
+
+@pytest.mark.django_db
+class TestMyProfileEndpoint:
+    """Tests for GET /api/v1/candidates/me"""
+
+    url = "/api/v1/candidates/me"
+
+    def test_returns_own_profile_with_private_validators(self, profile):
+        """Test candidate gets their full profile with private caching headers."""
+        client = APIClient()
+        client.force_authenticate(user=profile.user)
+
+        response = client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["full_name"] == "João Silva"
+        assert response.data["phone"] == "11999999999"
+        assert "private" in response["Cache-Control"]
+        assert "no-cache" in response["Cache-Control"]
+        assert "Authorization" in response["Vary"]
+        assert "ETag" in response
+
+    def test_unchanged_profile_returns_304(self, profile):
+        """Test revalidating an unchanged profile returns 304."""
+        client = APIClient()
+        client.force_authenticate(user=profile.user)
+        etag = client.get(self.url)["ETag"]
+
+        response = client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_profile_edit_changes_etag(self, profile):
+        """Test a profile save invalidates the previous ETag."""
+        client = APIClient()
+        client.force_authenticate(user=profile.user)
+        etag = client.get(self.url)["ETag"]
+
+        profile.bio = "Nova bio"
+        profile.save()
+        response = client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["bio"] == "Nova bio"
+
+    def test_without_profile(self, db):
+        """Test candidate without profile gets 404."""
+        user = User.objects.create_user(email="new@test.com", password="pass", role="candidate")
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        assert client.get(self.url).status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,200 @@
+"""
+Tests for rate limiting, de-duplication and digests on the public contact endpoint.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from django.template.loader import render_to_string
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from candidates.models import CandidateProfile
+from candidates.services.contact_requests import DIGEST_KEY, ContactRequestService
+from candidates.services.sharing import SharingService
+from core.utils.rate_limit import consume_token
+
+
+@pytest.fixture
+def shared_profile(db, django_capture_on_commit_callbacks):
+    """Create a complete profile with public sharing enabled."""
+    user = User.objects.create_user(
+        email="candidate@test.com", password="testpass123", role="candidate"
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        profile = CandidateProfile.objects.create(
+            user=user,
+            full_name="João Silva",
+            phone="11999999999",
+            current_position="SDR",
+            pitch_video_url="https://youtube.com/watch?v=test123",
+            pitch_video_type="youtube",
+        )
+        SharingService.generate_share_token(profile)
+    return profile
+
+
+@pytest.fixture
+def email_task():
+    with patch("candidates.services.sharing.send_email_task") as task:
+        yield task
+
+
+def contact(profile, message="Gostaria de conversar.", email="rh@empresa.com", ip="203.0.113.1"):
+    """POST a contact request from a given client IP."""
+    return APIClient().post(
+        f"/api/v1/candidates/public/{profile.public_token}/contact",
+        {"name": "Recrutador", "email": email, "message": message},
+        format="json",
+        REMOTE_ADDR=ip,
+    )
+
+
+class TestTokenBucket:
+    """Tests for consume_token."""
+
+    def test_allows_burst_then_waits(self):
+        """Test a full bucket allows `capacity` takes, then reports the wait."""
+        waits = [consume_token("bucket", capacity=3, period=3600) for _ in range(4)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert 0 < waits[3] <= 1200
+
+    def test_refills_over_time(self):
+        """Test tokens come back at capacity / period per second."""
+        with patch("core.utils.rate_limit.time.time", return_value=1000.0):
+            consume_token("bucket", capacity=2, period=60)
+            consume_token("bucket", capacity=2, period=60)
+            assert consume_token("bucket", capacity=2, period=60) > 0
+
+        with patch("core.utils.rate_limit.time.time", return_value=1030.0):
+            assert consume_token("bucket", capacity=2, period=60) == 0.0
+
+
+@pytest.mark.django_db
+class TestContactThrottling:
+    """Tests for POST /api/v1/candidates/public/:token/contact abuse protection."""
+
+    def test_per_ip_limit(self, shared_profile, email_task, settings):
+        """Test an IP over its limit gets 429 with Retry-After, before any lookup."""
+        settings.PUBLIC_CONTACT_IP_LIMIT = 2
+
+        contact(shared_profile, message="Mensagem 1")
+        contact(shared_profile, message="Mensagem 2")
+        response = contact(shared_profile, message="Mensagem 3")
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response["Retry-After"]) > 0
+        assert contact(shared_profile, message="Mensagem 3", ip="203.0.113.2").status_code == 200
+
+    def test_per_profile_limit(self, shared_profile, email_task, settings):
+        """Test many IPs cannot flood a single profile."""
+        settings.PUBLIC_CONTACT_PROFILE_LIMIT = 2
+
+        for i in range(2):
+            assert (
+                contact(shared_profile, message=f"Msg {i}", ip=f"203.0.113.{i}").status_code == 200
+            )
+        response = contact(shared_profile, message="Msg 3", ip="203.0.113.9")
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_duplicate_is_collapsed(self, shared_profile, email_task):
+        """Test the same sender and message is accepted but sent once."""
+        first = contact(shared_profile, message="Olá,  tudo bem?")
+        second = contact(shared_profile, message="olá, tudo bem?", email="RH@empresa.com")
+
+        assert first.status_code == second.status_code == status.HTTP_200_OK
+        email_task.delay.assert_called_once()
+
+    def test_burst_goes_to_digest(self, shared_profile, email_task, settings, fake_redis):
+        """Test requests beyond the immediate allowance are queued, scheduled once."""
+        settings.PUBLIC_CONTACT_IMMEDIATE_LIMIT = 1
+
+        with patch("candidates.tasks.send_contact_digest") as digest_task:
+            responses = [
+                contact(shared_profile, message=f"Msg {i}", ip=f"203.0.113.{i}") for i in range(3)
+            ]
+
+        assert all(r.status_code == status.HTTP_200_OK for r in responses)
+        assert email_task.delay.call_count == 1
+        assert fake_redis.llen(DIGEST_KEY.format(candidate_id=shared_profile.id)) == 2
+        digest_task.apply_async.assert_called_once()
+
+    def test_send_digest(self, shared_profile, email_task, settings):
+        """Test the digest sends one e-mail with every queued request and drains the queue."""
+        settings.PUBLIC_CONTACT_IMMEDIATE_LIMIT = 1
+
+        with patch("candidates.tasks.send_contact_digest"):
+            for i in range(3):
+                contact(shared_profile, message=f"Msg {i}", ip=f"203.0.113.{i}")
+
+        with patch("candidates.services.contact_requests.send_email_task") as digest_email:
+            assert ContactRequestService.send_digest(str(shared_profile.id)) == 2
+
+        kwargs = digest_email.delay.call_args.kwargs
+        assert kwargs["template_name"] == "candidate_contact_digest"
+        assert [r["message"] for r in kwargs["context"]["requests"]] == ["Msg 1", "Msg 2"]
+        assert ContactRequestService.send_digest(str(shared_profile.id)) == 0
+
+    def test_digest_kept_when_enqueue_fails(self, shared_profile, email_task, settings, fake_redis):
+        """Test queued requests survive a failure to enqueue the digest e-mail."""
+        settings.PUBLIC_CONTACT_IMMEDIATE_LIMIT = 1
+        with patch("candidates.tasks.send_contact_digest"):
+            for i in range(3):
+                contact(shared_profile, message=f"Msg {i}", ip=f"203.0.113.{i}")
+
+        with patch("candidates.services.contact_requests.send_email_task") as digest_email:
+            digest_email.delay.side_effect = ConnectionError("broker down")
+            with pytest.raises(ConnectionError):
+                ContactRequestService.send_digest(str(shared_profile.id))
+
+        assert fake_redis.llen(DIGEST_KEY.format(candidate_id=shared_profile.id)) == 2
+        with patch("candidates.services.contact_requests.send_email_task"):
+            assert ContactRequestService.send_digest(str(shared_profile.id)) == 2
+
+    def test_request_queued_while_sending_waits_for_next_digest(
+        self, shared_profile, email_task, settings, fake_redis
+    ):
+        """Test a request queued while the digest is sent is kept and scheduled."""
+        settings.PUBLIC_CONTACT_IMMEDIATE_LIMIT = 1
+        with patch("candidates.tasks.send_contact_digest"):
+            for i in range(2):
+                contact(shared_profile, message=f"Msg {i}", ip=f"203.0.113.{i}")
+
+        with (
+            patch("candidates.tasks.send_contact_digest") as digest_task,
+            patch("candidates.services.contact_requests.send_email_task") as digest_email,
+        ):
+            digest_email.delay.side_effect = lambda **kwargs: contact(
+                shared_profile, message="Msg late", ip="203.0.113.9"
+            )
+            assert ContactRequestService.send_digest(str(shared_profile.id)) == 1
+
+        digest_task.apply_async.assert_called_once()
+        remaining = fake_redis.lrange(DIGEST_KEY.format(candidate_id=shared_profile.id), 0, -1)
+        assert [json.loads(entry)["message"] for entry in remaining] == ["Msg late"]
+
+    def test_contact_email_uses_task_signature(self, shared_profile, email_task):
+        """Test the immediate e-mail is queued with send_email_task's arguments."""
+        contact(shared_profile)
+
+        kwargs = email_task.delay.call_args.kwargs
+        assert kwargs["template_name"] == "candidate_contact_request"
+        assert kwargs["recipient_email"]
+        render_to_string("emails/candidate_contact_request.txt", kwargs["context"])
+
+
+def test_digest_templates_render():
+    """Test the digest templates render a list of requests."""
+    context = {
+        "candidate_name": "João",
+        "candidate_position": "SDR",
+        "requests": [{"contact_name": "Ana", "contact_email": "a@x.com", "message": "Oi"}],
+        "profile_admin_url": "http://localhost/admin",
+    }
+
+    assert "Ana" in render_to_string("emails/candidate_contact_digest.html", context)
+    assert "a@x.com" in render_to_string("emails/candidate_contact_digest.txt", context)
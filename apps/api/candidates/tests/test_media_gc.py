@@ -0,0 +1,129 @@
+"""
+Tests for garbage collection of orphaned candidate uploads.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from botocore.stub import Stubber
+from django.utils import timezone
+
+from authentication.models import User
+from candidates.models import CandidateProfile, Experience
+from candidates.services.media_gc import OrphanedMediaCollector
+from core.models import PendingS3Deletion
+from core.utils.s3 import get_s3_client
+
+BUCKET = "talentbase-test-uploads"
+
+
+@pytest.fixture
+def s3_stub(s3_settings):
+    """Stub the shared S3 client; every expected call must be made."""
+    with Stubber(get_s3_client()) as stubber:
+        yield stubber
+        stubber.assert_no_pending_responses()
+
+
+def expect_listing(stubber, prefix, pages):
+    """Queue ListObjectsV2 pages of (key, age) tuples for a prefix."""
+    now = timezone.now()
+    for index, objects in enumerate(pages):
+        params = {"Bucket": BUCKET, "Prefix": prefix, "MaxKeys": 1000}
+        response = {
+            "Contents": [{"Key": key, "LastModified": now - age} for key, age in objects],
+            "IsTruncated": index < len(pages) - 1,
+        }
+        if index > 0:
+            params["ContinuationToken"] = f"page-{index}"
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = f"page-{index + 1}"
+        stubber.add_response("list_objects_v2", response, params)
+
+
+@pytest.fixture
+def profile(db):
+    user = User.objects.create_user(
+        email="candidate@test.com", password="testpass123", role="candidate"
+    )
+    return CandidateProfile.objects.create(
+        user=user,
+        full_name="João Silva",
+        phone="11999999999",
+        profile_photo_url=f"https://{BUCKET}.s3.amazonaws.com/candidate-photos/used.jpg",
+        pitch_video_url=f"https://s3.us-east-1.amazonaws.com/{BUCKET}/pitch-videos/used.mp4",
+        pitch_video_type="s3",
+    )
+
+
+@pytest.mark.django_db
+class TestOrphanedMediaCollector:
+    """Tests for OrphanedMediaCollector.collect."""
+
+    def test_queues_only_old_unreferenced_objects(self, s3_stub, profile):
+        """Test referenced and recent uploads are kept, across pages and prefixes."""
+        old, new = timedelta(days=3), timedelta(minutes=10)
+        expect_listing(
+            s3_stub,
+            "candidate-photos/",
+            [
+                [("candidate-photos/used.jpg", old), ("candidate-photos/orphan.jpg", old)],
+                [("candidate-photos/uploading.jpg", new)],
+            ],
+        )
+        expect_listing(
+            s3_stub,
+            "pitch-videos/",
+            [[("pitch-videos/used.mp4", old), ("pitch-videos/orphan.mp4", old)]],
+        )
+
+        result = OrphanedMediaCollector.collect()
+
+        assert result == {"scanned": 5, "orphaned": 2}
+        assert set(PendingS3Deletion.objects.values_list("key", flat=True)) == {
+            "candidate-photos/orphan.jpg",
+            "pitch-videos/orphan.mp4",
+        }
+
+    def test_dry_run_queues_nothing(self, s3_stub, profile):
+        """Test a dry run only counts."""
+        expect_listing(
+            s3_stub, "candidate-photos/", [[("candidate-photos/orphan.jpg", timedelta(days=3))]]
+        )
+        expect_listing(s3_stub, "pitch-videos/", [[]])
+
+        assert OrphanedMediaCollector.collect(dry_run=True)["orphaned"] == 1
+        assert not PendingS3Deletion.objects.exists()
+
+    def test_referenced_company_logo_is_kept(self, s3_stub, profile):
+        """Test company logos (uploaded under candidate-photos/) are never collected."""
+        Experience.objects.create(
+            candidate=profile,
+            company_name="Acme",
+            company_logo_url=f"https://{BUCKET}.s3.amazonaws.com/candidate-photos/logo.png",
+            position="Dev",
+            start_date=date(2020, 1, 1),
+        )
+        old = timedelta(days=3)
+        expect_listing(
+            s3_stub,
+            "candidate-photos/",
+            [[("candidate-photos/logo.png", old), ("candidate-photos/orphan.png", old)]],
+        )
+        expect_listing(s3_stub, "pitch-videos/", [[]])
+
+        assert OrphanedMediaCollector.collect()["orphaned"] == 1
+        assert list(PendingS3Deletion.objects.values_list("key", flat=True)) == [
+            "candidate-photos/orphan.png"
+        ]
+
+    def test_referenced_keys_single_query(self, s3_settings, profile, django_assert_num_queries):
+        """Test a page of keys is checked with one query."""
+        keys = ["candidate-photos/used.jpg", "pitch-videos/used.mp4"] + [
+            f"candidate-photos/{i}.jpg" for i in range(500)
+        ]
+
+        with django_assert_num_queries(1):
+            referenced = OrphanedMediaCollector.referenced_keys(keys)
+
+        assert referenced == {"candidate-photos/used.jpg", "pitch-videos/used.mp4"}
@@ -0,0 +1,341 @@
+"""
+Tests for responsive image variants and pitch video renditions.
+"""
+
+import io
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from botocore.response import StreamingBody
+from botocore.stub import ANY, Stubber
+from PIL import Image, UnidentifiedImageError
+
+from authentication.models import User
+from candidates.models import CandidateProfile, Experience
+from candidates.serializers import (
+    CandidateProfileDraftSerializer,
+    PublicCandidateProfileSerializer,
+)
+from candidates.services.media_gc import OrphanedMediaCollector
+from candidates.services.media_processing import (
+    ImageVariantService,
+    PitchVideoService,
+    variant_key,
+)
+from core.utils.images import render_image_variants
+from core.utils.s3 import get_s3_client
+
+BUCKET = "talentbase-test-uploads"
+PHOTO_KEY = "candidate-photos/photo.png"
+PHOTO_URL = f"https://{BUCKET}.s3.amazonaws.com/{PHOTO_KEY}"
+LOGO_KEY = "candidate-photos/logo.png"
+LOGO_URL = f"https://{BUCKET}.s3.amazonaws.com/{LOGO_KEY}"
+WIDTHS = (96, 256)
+
+
+def make_image(width=400, height=300, mode="RGBA") -> bytes:
+    """Encode an in-memory PNG."""
+    buffer = io.BytesIO()
+    Image.new(mode, (width, height), (200, 30, 30, 128)[: len(mode)]).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def s3_stub(s3_settings):
+    """Stub the shared S3 client; every expected call must be made."""
+    with Stubber(get_s3_client()) as stubber:
+        yield stubber
+        stubber.assert_no_pending_responses()
+
+
+def expect_rendering(stubber, key, data):
+    """Queue the download of an original and the upload of each variant."""
+    stubber.add_response(
+        "get_object",
+        {"Body": StreamingBody(io.BytesIO(data), len(data)), "ContentLength": len(data)},
+        {"Bucket": BUCKET, "Key": key},
+    )
+    for width in WIDTHS:
+        for fmt, content_type in (("webp", "image/webp"), ("jpeg", "image/jpeg")):
+            stubber.add_response(
+                "put_object",
+                {},
+                {
+                    "Bucket": BUCKET,
+                    "Key": variant_key(key, width, fmt),
+                    "Body": ANY,
+                    "ContentType": content_type,
+                    "CacheControl": ANY,
+                    "ServerSideEncryption": "AES256",
+                },
+            )
+
+
+@pytest.fixture
+def widths(settings):
+    """Render two widths only."""
+    settings.MEDIA_IMAGE_WIDTHS = WIDTHS
+
+
+@pytest.fixture
+def profile(db, s3_settings):
+    user = User.objects.create_user(
+        email="candidate@test.com", password="testpass123", role="candidate"
+    )
+    return CandidateProfile.objects.create(
+        user=user,
+        full_name="João Silva",
+        phone="11999999999",
+        profile_photo_url=PHOTO_URL,
+    )
+
+
+class TestRenderImageVariants:
+    """Tests for core.utils.images.render_image_variants."""
+
+    def test_renders_every_width_and_format(self):
+        """Test variants are resized to each width and encoded as WebP and JPEG."""
+        variants = render_image_variants(make_image(), WIDTHS)
+
+        assert set(variants) == {(fmt, w) for w in WIDTHS for fmt in ("webp", "jpeg")}
+        with Image.open(io.BytesIO(variants[("webp", 96)])) as image:
+            assert image.format == "WEBP"
+            assert image.size == (96, 72)
+        with Image.open(io.BytesIO(variants[("jpeg", 256)])) as image:
+            assert image.format == "JPEG"
+            assert image.mode == "RGB"
+
+    def test_never_upscales(self):
+        """Test a source narrower than a width keeps its own size."""
+        variants = render_image_variants(make_image(80, 40, mode="RGB"), WIDTHS)
+
+        with Image.open(io.BytesIO(variants[("jpeg", 256)])) as image:
+            assert image.size == (80, 40)
+
+
+@pytest.mark.django_db
+class TestImageVariantService:
+    """Tests for ImageVariantService."""
+
+    def test_process_profile_photo(self, s3_stub, widths, profile):
+        """Test variants are uploaded next to the original and recorded on the profile."""
+        expect_rendering(s3_stub, PHOTO_KEY, make_image())
+
+        assert ImageVariantService.process_profile_photo(str(profile.id)) is True
+
+        profile.refresh_from_db()
+        assert profile.profile_photo_variants["source"] == PHOTO_URL
+        assert profile.profile_photo_variants["webp"]["256"] == f"{PHOTO_URL}@256.webp"
+        assert profile.profile_photo_variants["jpeg"]["96"] == f"{PHOTO_URL}@96.jpg"
+
+    def test_already_processed_is_skipped(self, s3_stub, profile):
+        """Test a photo with matching variants is not downloaded again."""
+        profile.profile_photo_variants = {"source": PHOTO_URL, "webp": {}, "jpeg": {}}
+        profile.save()
+
+        assert ImageVariantService.process_profile_photo(str(profile.id)) is False
+
+    def test_process_company_logo(self, s3_stub, widths, profile):
+        """Test company logos get the same treatment."""
+        logo_key = "candidate-photos/logo.png"
+        logo_url = f"https://{BUCKET}.s3.amazonaws.com/{logo_key}"
+        experience = Experience.objects.create(
+            candidate=profile,
+            company_name="Acme",
+            company_logo_url=logo_url,
+            position="Dev",
+            start_date=date(2020, 1, 1),
+        )
+        expect_rendering(s3_stub, logo_key, make_image())
+
+        assert ImageVariantService.process_company_logo(str(experience.id)) is True
+
+        experience.refresh_from_db()
+        assert experience.company_logo_variants["webp"]["96"] == f"{logo_url}@96.webp"
+
+    def test_unrenderable_logo_is_not_queued_again(
+        self, s3_stub, profile, django_capture_on_commit_callbacks
+    ):
+        """Test a logo that is not an image is recorded as failed instead of retried."""
+        experience = Experience.objects.create(
+            candidate=profile,
+            company_name="Acme",
+            company_logo_url=LOGO_URL,
+            position="Dev",
+            start_date=date(2020, 1, 1),
+        )
+        s3_stub.add_response(
+            "get_object",
+            {"Body": StreamingBody(io.BytesIO(b"not an image"), 12), "ContentLength": 12},
+            {"Bucket": BUCKET, "Key": LOGO_KEY},
+        )
+
+        with pytest.raises(UnidentifiedImageError):
+            ImageVariantService.process_company_logo(str(experience.id))
+
+        experience.refresh_from_db()
+        assert experience.company_logo_variants == {"source": LOGO_URL, "failed": True}
+        with patch("candidates.tasks.process_company_logo.delay") as delay:
+            with django_capture_on_commit_callbacks(execute=True):
+                experience.position = "Tech Lead"
+                experience.save()
+        delay.assert_not_called()
+
+    def test_profile_update_keeps_logo_variants(self, profile, django_capture_on_commit_callbacks):
+        """Test re-saving experiences keeps the variants of unchanged logos."""
+        variants = {"source": LOGO_URL, "webp": {"96": f"{LOGO_URL}@96.webp"}, "jpeg": {}}
+        Experience.objects.create(
+            candidate=profile,
+            company_name="Acme",
+            company_logo_url=LOGO_URL,
+            company_logo_variants=variants,
+            position="Dev",
+            start_date=date(2020, 1, 1),
+        )
+        new_logo = f"https://{BUCKET}.s3.amazonaws.com/candidate-photos/new-logo.png"
+        experiences = [
+            {
+                "company_name": "Acme",
+                "company_logo_url": LOGO_URL,
+                "position": "Tech Lead",
+                "start_date": "2020-01-01",
+            },
+            {
+                "company_name": "Beta",
+                "company_logo_url": new_logo,
+                "position": "Dev",
+                "start_date": "2018-01-01",
+            },
+        ]
+        serializer = CandidateProfileDraftSerializer(
+            profile, data={"experiences": experiences}, partial=True
+        )
+        assert serializer.is_valid(), serializer.errors
+
+        with (
+            patch("candidates.tasks.process_company_logo.delay") as delay,
+            patch("candidates.tasks.process_profile_photo.delay"),
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            serializer.save()
+
+        kept = profile.experiences.get(company_name="Acme")
+        assert kept.position == "Tech Lead"
+        assert kept.company_logo_variants == variants
+        delay.assert_called_once_with(str(profile.experiences.get(company_name="Beta").id))
+
+    def test_upload_queues_processing_on_commit(
+        self, s3_settings, profile, django_capture_on_commit_callbacks
+    ):
+        """Test saving a new photo queues the task once the transaction commits."""
+        with patch("candidates.tasks.process_profile_photo.delay") as delay:
+            with django_capture_on_commit_callbacks(execute=True):
+                profile.profile_photo_url = (
+                    f"https://{BUCKET}.s3.amazonaws.com/candidate-photos/new.png"
+                )
+                profile.save()
+
+        delay.assert_called_once_with(str(profile.id))
+
+
+@pytest.mark.django_db
+class TestResponsiveVariantsExposure:
+    """Tests for variants in API payloads and garbage collection."""
+
+    def test_serializer_hides_stale_variants(self, profile):
+        """Test variants of a replaced photo are not exposed."""
+        profile.profile_photo_variants = {
+            "source": PHOTO_URL,
+            "webp": {"96": f"{PHOTO_URL}@96.webp"},
+            "jpeg": {"96": f"{PHOTO_URL}@96.jpg"},
+        }
+        data = PublicCandidateProfileSerializer(profile).data
+        assert data["profile_photo_variants"]["webp"] == {"96": f"{PHOTO_URL}@96.webp"}
+
+        profile.profile_photo_url = f"https://{BUCKET}.s3.amazonaws.com/candidate-photos/new.png"
+        assert PublicCandidateProfileSerializer(profile).data["profile_photo_variants"] == {}
+
+    def test_gc_keeps_variants_of_referenced_images(self, profile):
+        """Test variants live as long as their original, including company logos."""
+        Experience.objects.create(
+            candidate=profile,
+            company_name="Acme",
+            company_logo_url=f"https://{BUCKET}.s3.amazonaws.com/candidate-photos/logo.png",
+            position="Dev",
+            start_date=date(2020, 1, 1),
+        )
+        keys = [
+            variant_key(PHOTO_KEY, 96, "webp"),
+            "candidate-photos/logo.png",
+            variant_key("candidate-photos/logo.png", 256, "jpeg"),
+            variant_key("candidate-photos/old.png", 96, "webp"),
+        ]
+
+        assert OrphanedMediaCollector.referenced_keys(keys) == set(keys[:3])
+
+
+@pytest.mark.django_db
+class TestPitchVideoService:
+    """Tests for PitchVideoService."""
+
+    VIDEO_URL = f"https://{BUCKET}.s3.amazonaws.com/pitch-videos/pitch.mov"
+
+    @pytest.fixture
+    def video_profile(self, profile):
+        profile.pitch_video_url = self.VIDEO_URL
+        profile.pitch_video_type = "s3"
+        profile.save()
+        return profile
+
+    def test_without_ffmpeg_video_is_left_alone(self, s3_stub, video_profile):
+        """Test workers without ffmpeg skip processing without touching S3."""
+        with patch("candidates.services.media_processing.ffmpeg_available", return_value=False):
+            assert PitchVideoService.process_pitch_video(str(video_profile.id)) is False
+
+        video_profile.refresh_from_db()
+        assert video_profile.pitch_video_renditions == {}
+
+    def test_youtube_video_is_skipped(self, s3_stub, video_profile):
+        """Test only uploaded videos are processed."""
+        video_profile.pitch_video_url = "https://youtube.com/watch?v=abc123"
+        video_profile.pitch_video_type = "youtube"
+        video_profile.save()
+
+        with patch("candidates.services.media_processing.ffmpeg_available", return_value=True):
+            assert PitchVideoService.process_pitch_video(str(video_profile.id)) is False
+
+    def test_renditions_exposed_only_for_current_video(self, video_profile):
+        """Test stale renditions of a replaced video are hidden."""
+        video_profile.pitch_video_renditions = {
+            "source": self.VIDEO_URL,
+            "mp4": f"{self.VIDEO_URL}@stream.mp4",
+            "poster": f"{self.VIDEO_URL}@poster.jpg",
+            "duration": 30.0,
+            "width": 1280,
+            "height": 720,
+            "has_audio": True,
+        }
+        data = PublicCandidateProfileSerializer(video_profile).data
+        assert data["pitch_video_renditions"]["mp4"] == f"{self.VIDEO_URL}@stream.mp4"
+        assert "source" not in data["pitch_video_renditions"]
+
+        video_profile.pitch_video_url = "https://youtube.com/watch?v=abc123"
+        assert PublicCandidateProfileSerializer(video_profile).data["pitch_video_renditions"] == {}
+
+    def test_upload_queues_processing_on_commit(self, profile, django_capture_on_commit_callbacks):
+        """Test saving an uploaded video queues the task; a YouTube link does not."""
+        profile.profile_photo_variants = {"source": PHOTO_URL}
+        with patch("candidates.tasks.process_pitch_video.delay") as delay:
+            with django_capture_on_commit_callbacks(execute=True):
+                profile.pitch_video_url = "https://youtube.com/watch?v=abc123"
+                profile.pitch_video_type = "youtube"
+                profile.save()
+            delay.assert_not_called()
+
+            with django_capture_on_commit_callbacks(execute=True):
+                profile.pitch_video_url = self.VIDEO_URL
+                profile.pitch_video_type = "s3"
+                profile.save()
+
+        delay.assert_called_once_with(str(profile.id))
@@ -0,0 +1,227 @@
+"""
+Tests for resumable multipart uploads and batch presigned URLs.
+"""
+
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from botocore.stub import ANY, Stubber
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from core.utils.s3 import get_s3_client
+
+BUCKET = "talentbase-test-uploads"
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def s3_stub(s3_settings):
+    """Stub the shared S3 client; every expected call must be made."""
+    with Stubber(get_s3_client()) as stubber:
+        yield stubber
+        stubber.assert_no_pending_responses()
+
+
+def make_client(email):
+    user = User.objects.create_user(email=email, password="testpass123", role="candidate")
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def candidate_client(db):
+    return make_client("candidate@test.com")
+
+
+def start_upload(client, stubber):
+    """Initiate a video upload, returning the response data."""
+    stubber.add_response(
+        "create_multipart_upload",
+        {"UploadId": "upload-1"},
+        {
+            "Bucket": BUCKET,
+            "Key": ANY,
+            "ContentType": "video/quicktime",
+            "ServerSideEncryption": "AES256",
+        },
+    )
+    response = client.post(
+        "/api/v1/candidates/upload-multipart",
+        {"filename": "pitch.mov", "content_type": "video/quicktime"},
+        format="json",
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    return response.data
+
+
+def expect_parts(stubber, key, sizes):
+    stubber.add_response(
+        "list_parts",
+        {
+            "Parts": [
+                {"PartNumber": n, "ETag": f'"etag-{n}"', "Size": size}
+                for n, size in enumerate(sizes, start=1)
+            ],
+            "IsTruncated": False,
+        },
+        {"Bucket": BUCKET, "Key": key, "UploadId": "upload-1"},
+    )
+
+
+def object_key(file_url):
+    return urlparse(file_url).path.lstrip("/")
+
+
+@pytest.mark.django_db
+class TestMultipartUpload:
+    """Tests for the multipart upload endpoints."""
+
+    def test_start_and_presign_parts(self, s3_stub, candidate_client):
+        """Test initiation returns part geometry and parts are presigned locally."""
+        upload = start_upload(candidate_client, s3_stub)
+
+        assert upload["file_url"].startswith(f"https://{BUCKET}.s3.")
+        assert object_key(upload["file_url"]).startswith("pitch-videos/")
+        assert upload["part_size"] == 8 * MB
+        assert upload["max_parts"] == 7  # 50MB in 8MB parts
+
+        response = candidate_client.post(
+            "/api/v1/candidates/upload-multipart/parts",
+            {"upload_token": upload["upload_token"], "part_numbers": [2, 1]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data["urls"]) == {1, 2}
+        query = parse_qs(urlparse(response.data["urls"][2]).query)
+        assert query["partNumber"] == ["2"]
+        assert query["uploadId"] == ["upload-1"]
+
+    def test_part_numbers_are_bounded(self, s3_stub, candidate_client):
+        """Test part numbers beyond the size limit are refused."""
+        upload = start_upload(candidate_client, s3_stub)
+
+        response = candidate_client.post(
+            "/api/v1/candidates/upload-multipart/parts",
+            {"upload_token": upload["upload_token"], "part_numbers": [8]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_resume_lists_uploaded_parts(self, s3_stub, candidate_client):
+        """Test a resumed upload learns which parts S3 already has."""
+        upload = start_upload(candidate_client, s3_stub)
+        expect_parts(s3_stub, object_key(upload["file_url"]), [8 * MB, 8 * MB])
+
+        response = candidate_client.get(
+            "/api/v1/candidates/upload-multipart/parts",
+            {"upload_token": upload["upload_token"]},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [part["part_number"] for part in response.data["parts"]] == [1, 2]
+
+    def test_complete_uses_parts_from_s3(self, s3_stub, candidate_client):
+        """Test completion assembles the parts S3 reports, ETags included."""
+        upload = start_upload(candidate_client, s3_stub)
+        key = object_key(upload["file_url"])
+        expect_parts(s3_stub, key, [8 * MB, 3 * MB])
+        s3_stub.add_response(
+            "complete_multipart_upload",
+            {},
+            {
+                "Bucket": BUCKET,
+                "Key": key,
+                "UploadId": "upload-1",
+                "MultipartUpload": {
+                    "Parts": [
+                        {"PartNumber": 1, "ETag": '"etag-1"'},
+                        {"PartNumber": 2, "ETag": '"etag-2"'},
+                    ]
+                },
+            },
+        )
+
+        response = candidate_client.post(
+            "/api/v1/candidates/upload-multipart/complete",
+            {"upload_token": upload["upload_token"]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["file_url"] == upload["file_url"]
+
+    def test_oversized_upload_is_aborted(self, s3_stub, candidate_client):
+        """Test an upload over MAX_VIDEO_SIZE is aborted instead of completed."""
+        upload = start_upload(candidate_client, s3_stub)
+        key = object_key(upload["file_url"])
+        expect_parts(s3_stub, key, [8 * MB] * 7)
+        s3_stub.add_response(
+            "abort_multipart_upload", {}, {"Bucket": BUCKET, "Key": key, "UploadId": "upload-1"}
+        )
+
+        response = candidate_client.post(
+            "/api/v1/candidates/upload-multipart/complete",
+            {"upload_token": upload["upload_token"]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_token_is_bound_to_user(self, s3_stub, candidate_client):
+        """Test another candidate cannot complete or abort someone else's upload."""
+        upload = start_upload(candidate_client, s3_stub)
+        other = make_client("other@test.com")
+
+        for action in ("complete", "abort"):
+            response = other.post(
+                f"/api/v1/candidates/upload-multipart/{action}",
+                {"upload_token": upload["upload_token"]},
+                format="json",
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_disallowed_content_type(self, s3_settings, candidate_client):
+        """Test content types are validated like single-request uploads."""
+        response = candidate_client.post(
+            "/api/v1/candidates/upload-multipart",
+            {"filename": "pitch.exe", "content_type": "application/x-msdownload"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestBatchUploadUrls:
+    """Tests for the batch presigned URL endpoint."""
+
+    def test_batch(self, s3_settings, candidate_client):
+        """Test the wizard gets every upload URL in one round trip."""
+        files = [
+            {"filename": "me.jpg", "content_type": "image/jpeg", "type": "photo"},
+            {"filename": "pitch.mp4", "content_type": "video/mp4", "type": "video"},
+            {"filename": "logo.png", "content_type": "image/png", "type": "photo"},
+        ]
+
+        response = candidate_client.post(
+            "/api/v1/candidates/upload-urls", {"files": files}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["uploads"]) == 3
+        assert response.data["uploads"][1]["fields"]["Content-Type"] == "video/mp4"
+
+    def test_batch_size_is_limited(self, s3_settings, candidate_client):
+        """Test oversized batches are refused."""
+        files = [{"filename": "me.jpg", "content_type": "image/jpeg"}] * 21
+
+        response = candidate_client.post(
+            "/api/v1/candidates/upload-urls", {"files": files}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
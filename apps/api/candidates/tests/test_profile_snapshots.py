@@ -0,0 +1,218 @@
+"""
+Tests for pre-rendered public profile snapshots.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from candidates.models import CandidateProfile, Experience
+from candidates.services.profile_snapshot import (
+    SNAPSHOT_PREFIX,
+    LocalSnapshotStorage,
+    PublicProfileSnapshotService,
+)
+from candidates.services.sharing import SharingService
+
+
+@pytest.fixture
+def shared_profile(db, django_capture_on_commit_callbacks):
+    """Create a complete profile with public sharing enabled (snapshot published)."""
+    user = User.objects.create_user(
+        email="candidate@test.com", password="testpass123", role="candidate"
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        profile = CandidateProfile.objects.create(
+            user=user,
+            full_name="João Silva",
+            phone="11999999999",
+            city="São Paulo",
+            pitch_video_url="https://youtube.com/watch?v=test123",
+            pitch_video_type="youtube",
+            bio="Experienced sales professional",
+        )
+        SharingService.generate_share_token(profile)
+    return profile
+
+
+def get_profile(token):
+    """GET the public profile endpoint anonymously."""
+    return APIClient().get(f"/api/v1/candidates/public/{token}")
+
+
+def snapshot_files(snapshot_dir, token) -> list:
+    """Snapshot file names stored for a token."""
+    directory = snapshot_dir / SNAPSHOT_PREFIX / str(token)
+    return sorted(p.name for p in directory.iterdir()) if directory.is_dir() else []
+
+
+@pytest.mark.django_db
+class TestPublicProfileSnapshots:
+    """Tests for publishing and serving snapshots."""
+
+    def test_generate_share_token_publishes_snapshot(self, shared_profile, snapshot_dir):
+        """Test publishing writes one immutable snapshot and a pointer."""
+        pointer = PublicProfileSnapshotService.get_pointer(shared_profile.public_token)
+
+        assert pointer is not None
+        assert snapshot_files(snapshot_dir, shared_profile.public_token) == [
+            pointer["path"].rsplit("/", 1)[1]
+        ]
+        body = json.loads((snapshot_dir / pointer["path"]).read_bytes())
+        assert body["full_name"] == "João Silva"
+
+    def test_served_without_database(self, shared_profile, django_assert_num_queries):
+        """Test a published profile is streamed from its snapshot without queries."""
+        with django_assert_num_queries(0):
+            response = get_profile(shared_profile.public_token)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/json"
+        assert response["ETag"] == (
+            PublicProfileSnapshotService.get_pointer(shared_profile.public_token)["etag"]
+        )
+        assert response.data["full_name"] == "João Silva"
+
+    def test_profile_edit_publishes_new_revision(
+        self, shared_profile, snapshot_dir, django_capture_on_commit_callbacks
+    ):
+        """Test an edit writes a new revision and removes the old one."""
+        old_path = PublicProfileSnapshotService.get_pointer(shared_profile.public_token)["path"]
+
+        shared_profile.bio = "Nova bio"
+        with django_capture_on_commit_callbacks(execute=True):
+            shared_profile.save()
+
+        pointer = PublicProfileSnapshotService.get_pointer(shared_profile.public_token)
+        assert pointer["path"] != old_path
+        assert len(snapshot_files(snapshot_dir, shared_profile.public_token)) == 1
+        assert get_profile(shared_profile.public_token).data["bio"] == "Nova bio"
+
+    def test_edit_stops_serving_old_snapshot_before_publish(
+        self, shared_profile, django_capture_on_commit_callbacks
+    ):
+        """Test the old snapshot is not served while the re-publish task is queued."""
+        shared_profile.bio = "Nova bio"
+        with patch("candidates.tasks.publish_public_profile_snapshot.delay") as publish:
+            with django_capture_on_commit_callbacks(execute=True):
+                shared_profile.save()
+
+        publish.assert_called_once_with(str(shared_profile.public_token))
+        assert PublicProfileSnapshotService.get_pointer(shared_profile.public_token) is None
+        assert get_profile(shared_profile.public_token).data["bio"] == "Nova bio"
+
+    def test_experience_change_publishes(self, shared_profile, django_capture_on_commit_callbacks):
+        """Test adding and removing experiences re-publishes the work history."""
+        with django_capture_on_commit_callbacks(execute=True):
+            experience = Experience.objects.create(
+                candidate=shared_profile,
+                company_name="Company A",
+                position="SDR",
+                start_date="2020-01-01",
+            )
+        assert len(get_profile(shared_profile.public_token).data["experiences"]) == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            experience.delete()
+        assert get_profile(shared_profile.public_token).data["experiences"] == []
+
+    def test_disable_sharing_unpublishes(self, shared_profile, snapshot_dir):
+        """Test disabling sharing removes the snapshot immediately."""
+        SharingService.toggle_sharing(shared_profile, False)
+
+        assert PublicProfileSnapshotService.get_pointer(shared_profile.public_token) is None
+        assert snapshot_files(snapshot_dir, shared_profile.public_token) == []
+        assert get_profile(shared_profile.public_token).status_code == 404
+
+    def test_regenerated_token_drops_old_link(
+        self, shared_profile, snapshot_dir, django_capture_on_commit_callbacks
+    ):
+        """Test the old token's snapshot is removed and the new one published."""
+        old_token = shared_profile.public_token
+
+        with django_capture_on_commit_callbacks(execute=True):
+            SharingService.generate_share_token(shared_profile)
+
+        assert snapshot_files(snapshot_dir, old_token) == []
+        assert get_profile(old_token).status_code == status.HTTP_404_NOT_FOUND
+        assert get_profile(shared_profile.public_token).status_code == status.HTTP_200_OK
+
+    def test_lost_pointer_publishes_on_demand(self, shared_profile, fake_redis):
+        """Test a missing pointer (e.g. Redis flush) is rebuilt on the next view."""
+        fake_redis.flushall()
+
+        response = get_profile(shared_profile.public_token)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert PublicProfileSnapshotService.get_pointer(shared_profile.public_token) is not None
+
+    def test_missing_snapshot_file_publishes_on_demand(self, shared_profile, snapshot_dir):
+        """Test a pointer to a removed snapshot falls back to publishing."""
+        pointer = PublicProfileSnapshotService.get_pointer(shared_profile.public_token)
+        (snapshot_dir / pointer["path"]).unlink()
+
+        response = get_profile(shared_profile.public_token)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert (snapshot_dir / pointer["path"]).exists()
+
+    def test_edit_during_on_demand_publish_wins(
+        self, shared_profile, snapshot_dir, fake_redis, django_capture_on_commit_callbacks
+    ):
+        """Test an edit committed between render and pointer write keeps its snapshot."""
+        token = shared_profile.public_token
+        PublicProfileSnapshotService.invalidate(token)
+        save = LocalSnapshotStorage.save
+        edited = []
+
+        def save_then_edit(storage, name, content):
+            save(storage, name, content)
+            if not edited:
+                edited.append(name)
+                shared_profile.bio = "Nova bio"
+                with django_capture_on_commit_callbacks(execute=True):
+                    shared_profile.save()
+
+        with patch.object(LocalSnapshotStorage, "save", autospec=True, side_effect=save_then_edit):
+            stale = get_profile(token)
+
+        assert stale.status_code == status.HTTP_200_OK
+        pointer = PublicProfileSnapshotService.get_pointer(token)
+        assert pointer["path"] != edited[0]
+        assert (snapshot_dir / pointer["path"]).exists()
+        assert get_profile(token).data["bio"] == "Nova bio"
+
+    def test_not_found_is_not_published(self, db, snapshot_dir):
+        """Test unknown tokens publish nothing."""
+        token = "00000000-0000-0000-0000-000000000000"
+
+        assert get_profile(token).status_code == status.HTTP_404_NOT_FOUND
+        assert PublicProfileSnapshotService.get_pointer(token) is None
+
+
+@pytest.mark.django_db
+class TestSignedMediaInSnapshots:
+    """Tests for signed read URLs on pre-rendered profiles."""
+
+    PHOTO = "https://talentbase-test-uploads.s3.amazonaws.com/candidate-photos/a.jpg"
+
+    def test_snapshot_keeps_canonical_urls(self, shared_profile, s3_settings, snapshot_dir):
+        """Test snapshots store plain URLs and responses carry signed ones."""
+        s3_settings.AWS_S3_SIGNED_READS = True
+        shared_profile.profile_photo_url = self.PHOTO
+        shared_profile.profile_photo_variants = {"source": self.PHOTO}
+        shared_profile.save()
+        PublicProfileSnapshotService.publish(shared_profile.public_token)
+
+        pointer = PublicProfileSnapshotService.get_pointer(shared_profile.public_token)
+        stored = json.loads(PublicProfileSnapshotService.read(pointer["path"]))
+        response = get_profile(shared_profile.public_token)
+
+        assert stored["profile_photo_url"] == self.PHOTO
+        assert response.status_code == status.HTTP_200_OK
+        assert "X-Amz-Signature=" in response.json()["profile_photo_url"]
+        assert response["ETag"] != pointer["etag"]
@@ -6,6 +6,7 @@ from unittest.mock import patch
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from rest_framework.test import APIClient
 
 from candidates.models import CandidateProfile, Experience
 from candidates.serializers import (
@@ -13,6 +14,8 @@ from candidates.serializers import (
     CandidateProfileSerializer,
     ExperienceSerializer,
 )
+from core.models import PendingS3Deletion
+from core.utils import read_urls
 
 User = get_user_model()
 
@@ -339,3 +342,113 @@ class TestCandidateProfileDraftSerializer:
 
         assert serializer.is_valid(), serializer.errors
         assert len(serializer.validated_data["experiences"]) == 1
+
+
+BUCKET_URL = "https://talentbase-test-uploads.s3.amazonaws.com"
+
+
+@pytest.mark.django_db
+class TestSignedMediaRoundTrip:
+    """Tests for signed media URLs sent back by clients."""
+
+    @pytest.fixture
+    def signed_profile(self, s3_settings, candidate_user):
+        """Profile with S3 media, served with signed read URLs."""
+        s3_settings.AWS_S3_SIGNED_READS = True
+        read_urls.clear_local_cache()
+        profile = CandidateProfile.objects.create(
+            user=candidate_user,
+            full_name="João Silva",
+            phone="11999999999",
+            current_position="SDR/BDR",
+            years_of_experience=3,
+            profile_photo_url=f"{BUCKET_URL}/candidate-photos/a.jpg",
+            pitch_video_url=f"{BUCKET_URL}/pitch-videos/a.mp4",
+            pitch_video_type="s3",
+        )
+        Experience.objects.create(
+            candidate=profile,
+            company_name="Tech Corp",
+            company_logo_url=f"{BUCKET_URL}/candidate-photos/logo.png",
+            position="SDR",
+            start_date=date(2020, 1, 1),
+        )
+        yield profile
+        read_urls.clear_local_cache()
+
+    @pytest.fixture
+    def client(self, candidate_user):
+        client = APIClient()
+        client.force_authenticate(user=candidate_user)
+        return client
+
+    @patch("candidates.serializers.get_s3_file_size", return_value=None)
+    def test_get_then_patch_keeps_canonical_urls(self, mock_file_size, signed_profile, client):
+        """Test a GET payload PATCHed back as is stores the unsigned URLs."""
+        payload = client.get("/api/v1/candidates/me").json()
+        assert "X-Amz-Signature=" in payload["profile_photo_url"]
+        assert len(payload["profile_photo_url"]) > 200
+
+        fields = ["profile_photo_url", "pitch_video_url", "pitch_video_type", "experiences"]
+        response = client.patch(
+            f"/api/v1/candidates/{signed_profile.id}/draft",
+            {name: payload[name] for name in fields},
+            format="json",
+        )
+
+        assert response.status_code == 200, response.json()
+        signed_profile.refresh_from_db()
+        assert signed_profile.profile_photo_url == f"{BUCKET_URL}/candidate-photos/a.jpg"
+        assert signed_profile.pitch_video_url == f"{BUCKET_URL}/pitch-videos/a.mp4"
+        assert (
+            signed_profile.experiences.get().company_logo_url
+            == f"{BUCKET_URL}/candidate-photos/logo.png"
+        )
+        assert not PendingS3Deletion.objects.exists()
+
+    def test_put_signed_photo_keeps_current_photo(self, signed_profile, client):
+        """Test PUT /photo with the served signed URL neither stores it nor deletes the photo."""
+        signed = client.get("/api/v1/candidates/me").json()["profile_photo_url"]
+
+        response = client.put(
+            f"/api/v1/candidates/{signed_profile.id}/photo",
+            {"profile_photo_url": signed},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        signed_profile.refresh_from_db()
+        assert signed_profile.profile_photo_url == f"{BUCKET_URL}/candidate-photos/a.jpg"
+        assert not PendingS3Deletion.objects.exists()
+
+    def test_put_new_signed_photo_replaces_old(self, signed_profile, client):
+        """Test a new photo sent signed is stored unsigned and the old one is deleted."""
+        signed = read_urls.sign_read_url(f"{BUCKET_URL}/candidate-photos/b.jpg")
+
+        response = client.put(
+            f"/api/v1/candidates/{signed_profile.id}/photo",
+            {"profile_photo_url": signed},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        signed_profile.refresh_from_db()
+        assert signed_profile.profile_photo_url == f"{BUCKET_URL}/candidate-photos/b.jpg"
+        assert list(PendingS3Deletion.objects.values_list("key", flat=True)) == [
+            "candidate-photos/a.jpg"
+        ]
+
+    def test_put_signed_video_keeps_current_video(self, signed_profile, client):
+        """Test PUT /video with the served signed URL neither stores it nor deletes the video."""
+        signed = client.get("/api/v1/candidates/me").json()["pitch_video_url"]
+
+        response = client.put(
+            f"/api/v1/candidates/{signed_profile.id}/video",
+            {"pitch_video_url": signed, "pitch_video_type": "s3"},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        signed_profile.refresh_from_db()
+        assert signed_profile.pitch_video_url == f"{BUCKET_URL}/pitch-videos/a.mp4"
+        assert not PendingS3Deletion.objects.exists()
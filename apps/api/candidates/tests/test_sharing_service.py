@@ -257,9 +257,9 @@ class TestSharingServiceSendContactRequest:
         call_args = mock_send_email.delay.call_args
 
         # Verify email parameters
-        assert call_args.kwargs["to_email"] == "admin@talentbase.com"
+        assert call_args.kwargs["recipient_email"] == "admin@talentbase.com"
         assert "João Silva" in call_args.kwargs["subject"]
-        assert call_args.kwargs["template_name"] == "emails/candidate_contact_request.html"
+        assert call_args.kwargs["template_name"] == "candidate_contact_request"
 
     @patch("candidates.services.sharing.send_email_task")
     def test_send_contact_request_includes_context(
@@ -0,0 +1,111 @@
+"""
+Tests for the public token Bloom filter and negative cache.
+"""
+
+import uuid
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from candidates.models import CandidateProfile
+from candidates.services.sharing import SharingService
+from candidates.services.token_filter import BLOOM_KEY, PublicTokenFilter
+
+
+@pytest.fixture
+def shared_profile(db, django_capture_on_commit_callbacks):
+    """Create a complete profile with public sharing enabled."""
+    user = User.objects.create_user(
+        email="candidate@test.com", password="testpass123", role="candidate"
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        profile = CandidateProfile.objects.create(
+            user=user,
+            full_name="João Silva",
+            phone="11999999999",
+            pitch_video_url="https://youtube.com/watch?v=test123",
+            pitch_video_type="youtube",
+        )
+        SharingService.generate_share_token(profile)
+    return profile
+
+
+@pytest.mark.django_db
+class TestPublicTokenFilter:
+    """Tests for PublicTokenFilter."""
+
+    def test_rebuild_contains_shared_tokens(self, shared_profile):
+        """Test a rebuilt filter admits shared tokens and rejects unknown ones."""
+        assert PublicTokenFilter.rebuild() == 1
+
+        assert PublicTokenFilter.may_exist(shared_profile.public_token)
+        assert not PublicTokenFilter.may_exist(uuid.uuid4())
+
+    def test_missing_filter_admits_everything_and_rebuilds(
+        self, shared_profile, fake_redis, django_capture_on_commit_callbacks
+    ):
+        """Test that without a filter tokens go to the database and a rebuild is triggered."""
+        fake_redis.delete(BLOOM_KEY)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            assert PublicTokenFilter.may_exist(uuid.uuid4())
+            assert PublicTokenFilter.may_exist(uuid.uuid4())
+
+        assert fake_redis.exists(BLOOM_KEY)
+        assert not PublicTokenFilter.may_exist(uuid.uuid4())
+
+    def test_malformed_token_rejected(self):
+        """Test non-UUID tokens never reach Redis or the database."""
+        assert not PublicTokenFilter.may_exist("not-a-uuid")
+
+    def test_regenerated_token(self, shared_profile):
+        """Test regenerating a token admits the new one and caches the old one as missing."""
+        PublicTokenFilter.rebuild()
+        old_token = shared_profile.public_token
+
+        SharingService.generate_share_token(shared_profile)
+
+        assert PublicTokenFilter.may_exist(shared_profile.public_token)
+        assert not PublicTokenFilter.may_exist(old_token)
+
+    def test_reenabled_token_clears_negative_cache(self, shared_profile):
+        """Test re-enabling sharing makes a recently disabled token valid again."""
+        SharingService.toggle_sharing(shared_profile, False)
+        assert not PublicTokenFilter.may_exist(shared_profile.public_token)
+
+        SharingService.toggle_sharing(shared_profile, True)
+
+        assert PublicTokenFilter.may_exist(shared_profile.public_token)
+
+
+@pytest.mark.django_db
+class TestPublicLookupsWithoutDatabase:
+    """Tests that unknown and disabled tokens are answered without queries."""
+
+    def test_unknown_token_public_profile(self, shared_profile, django_assert_num_queries):
+        """Test an unknown token gets 404 from the filter alone."""
+        PublicTokenFilter.rebuild()
+
+        with django_assert_num_queries(0):
+            response = APIClient().get(f"/api/v1/candidates/public/{uuid.uuid4()}")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_disabled_token_contact(self, shared_profile, django_assert_num_queries):
+        """Test a stale link is rejected from the negative cache."""
+        PublicTokenFilter.rebuild()
+        SharingService.toggle_sharing(shared_profile, False)
+
+        with django_assert_num_queries(0):
+            assert SharingService.get_public_profile(shared_profile.public_token) is None
+
+    def test_repeated_miss_is_cached(self, db, django_assert_num_queries):
+        """Test a token that passes the filter but misses the database is cached."""
+        token = uuid.uuid4()
+        PublicTokenFilter.add(token)  # no filter yet: only clears the miss cache
+
+        assert SharingService.get_public_profile(token) is None
+        with django_assert_num_queries(0):
+            assert SharingService.get_public_profile(token) is None
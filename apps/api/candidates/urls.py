@@ -14,8 +14,20 @@ app_name = "candidates"
 urlpatterns = [
     # S3 Upload presigned URL
     path("upload-url", views.get_upload_url, name="upload-url"),
+    path("upload-urls", views.get_upload_urls, name="upload-urls"),
+    # S3 multipart (resumable) uploads
+    path("upload-multipart", views.start_multipart_upload, name="upload-multipart"),
+    path("upload-multipart/parts", views.multipart_upload_parts, name="upload-multipart-parts"),
+    path(
+        "upload-multipart/complete",
+        views.finish_multipart_upload,
+        name="upload-multipart-complete",
+    ),
+    path("upload-multipart/abort", views.cancel_multipart_upload, name="upload-multipart-abort"),
     # Profile CRUD
     path("", views.create_candidate_profile, name="create-profile"),
+    path("me", views.get_my_profile, name="my-profile"),
+    path("me/analytics", views.get_my_analytics, name="my-analytics"),
     path("<uuid:pk>/draft", views.save_draft, name="save-draft"),
     path("<uuid:pk>/photo", views.update_profile_photo, name="update-photo"),
     path("<uuid:pk>/video", views.update_pitch_video, name="update-video"),
@@ -37,4 +49,9 @@ urlpatterns = [
     path("admin/candidates", views.list_candidates, name="list-candidates"),
     # Story 3.3.5: Admin manual candidate creation
     path("admin/candidates/create", views.admin_create_candidate, name="admin-create-candidate"),
+    path(
+        "admin/candidates/<uuid:pk>/analytics",
+        views.admin_candidate_analytics,
+        name="admin-candidate-analytics",
+    ),
 ]
@@ -6,27 +6,57 @@ Story 3.2: Public shareable profile with token-based access.
 Story 3.3: CSV bulk import for admin users (Notion migration).
 """
 
+import json
 import logging
+from typing import Optional
 
 from django.conf import settings
+from django.core import signing
 from django.core.exceptions import ValidationError
+from django.utils.cache import patch_vary_headers
 from rest_framework import status
 from rest_framework.decorators import api_view, parser_classes, permission_classes
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
-from core.permissions import IsCandidate
-from core.utils.s3 import delete_s3_object, generate_presigned_url, validate_s3_url
+from core.permissions import IsAdmin, IsCandidate
+from core.utils.http_cache import apply_validators, conditional_response
+from core.utils.read_urls import (
+    media_etag,
+    sign_media_payload,
+    signing_enabled,
+    unsign_read_url,
+)
+from core.utils.request import get_client_ip, get_visitor_id
+from core.utils.responses import PrerenderedJSONResponse
+from core.utils.s3 import (
+    abort_multipart_upload,
+    complete_multipart_upload,
+    create_multipart_upload,
+    generate_presigned_url,
+    generate_presigned_urls,
+    list_uploaded_parts,
+    multipart_part_count,
+    presign_upload_parts,
+    schedule_s3_deletion,
+    validate_s3_url,
+)
 
 from .models import CandidateProfile
 from .serializers import (
     CandidateProfileDraftSerializer,
     CandidateProfileSerializer,
     ContactCandidateSerializer,
-    PublicCandidateProfileSerializer,
 )
+from .services.analytics import ProfileAnalyticsService
+from .services.contact_requests import QUEUED, SENT, ContactRateLimited, ContactRequestService
+from .services.media_processing import responsive_variants
+from .services.profile_snapshot import PublicProfileSnapshotService
+from .services.profile_version import ProfileVersionService
 from .services.sharing import SharingService
+from .services.token_filter import PublicTokenFilter
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +146,249 @@ def get_upload_url(request):
         )
 
 
+@api_view(["POST"])
+@permission_classes([IsAuthenticated, IsCandidate])
+def get_upload_urls(request):
+    """
+    Generate presigned POSTs for several files in one request.
+
+    Lets the profile wizard request the photo, the pitch video and every
+    company logo upload URL at once instead of one call per file.
+
+    Body:
+        files (list): [{'filename': str, 'content_type': str, 'type': 'photo' | 'video'}]
+
+    Returns:
+        200: {
+            'uploads': [{'url', 'fields', 'file_url', 'expires_in'}, ...] (same order)
+        }
+        400: { 'error': 'message' } (nothing is signed if any file is invalid)
+
+    Example:
+        POST /api/v1/candidates/upload-urls
+        { "files": [{"filename": "me.jpg", "content_type": "image/jpeg", "type": "photo"}] }
+    """
+    files = request.data.get("files")
+    max_files = settings.PRESIGNED_BATCH_MAX_FILES
+    if not isinstance(files, list) or not files or not all(isinstance(f, dict) for f in files):
+        return Response(
+            {"error": "files must be a non-empty list"}, status=status.HTTP_400_BAD_REQUEST
+        )
+    if len(files) > max_files:
+        return Response(
+            {"error": f"At most {max_files} files per request"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    try:
+        uploads = generate_presigned_urls(files)
+    except ValueError as e:
+        logger.warning(f"Invalid batch upload request: {e}", extra={"user": request.user.id})
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        logger.error(f"Error generating presigned URLs: {e}", extra={"user": request.user.id})
+        return Response(
+            {"error": "Internal server error"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+    return Response({"uploads": uploads}, status=status.HTTP_200_OK)
+
+
+MULTIPART_TOKEN_SALT = "candidates.multipart-upload"
+
+
+def _read_upload_token(request) -> Optional[dict]:
+    """
+    Decode the signed multipart upload token sent by the browser.
+
+    The token pins the key, upload id and size limit chosen at initiation to
+    the user who started the upload, so they cannot be swapped client-side.
+    """
+    token = request.data.get("upload_token") or request.query_params.get("upload_token")
+    if not token:
+        return None
+    try:
+        upload = signing.loads(
+            token, salt=MULTIPART_TOKEN_SALT, max_age=settings.S3_MULTIPART_MAX_AGE
+        )
+    except signing.BadSignature:
+        return None
+    return upload if upload.get("user") == str(request.user.id) else None
+
+
+def _invalid_upload_token() -> Response:
+    return Response(
+        {"error": "upload_token inválido ou expirado"}, status=status.HTTP_400_BAD_REQUEST
+    )
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated, IsCandidate])
+def start_multipart_upload(request):
+    """
+    Start a resumable multipart upload (pitch videos).
+
+    Body:
+        filename (str): Original filename
+        content_type (str): MIME type (video/mp4, video/quicktime, ...)
+        type (str): Upload type - 'video' (default) or 'photo'
+
+    Returns:
+        201: {
+            'upload_token': Signed token for the parts/complete/abort calls,
+            'file_url': Final URL of the file once completed,
+            'part_size': Bytes per part (all but the last),
+            'max_parts': Highest part number accepted,
+            'expires_in': Seconds the upload can be resumed
+        }
+        400: { 'error': 'message' }
+
+    Example:
+        POST /api/v1/candidates/upload-multipart
+        { "filename": "pitch.mov", "content_type": "video/quicktime" }
+    """
+    filename = request.data.get("filename")
+    content_type = request.data.get("content_type")
+    upload_type = request.data.get("type", "video")
+
+    if not filename or not content_type:
+        return Response(
+            {"error": "filename and content_type are required"}, status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        upload = create_multipart_upload(filename, content_type, upload_type)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        logger.error(f"Error starting multipart upload: {e}", extra={"user": request.user.id})
+        return Response(
+            {"error": "Internal server error"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+    max_size = settings.MAX_VIDEO_SIZE if upload_type == "video" else settings.MAX_UPLOAD_SIZE
+    token = signing.dumps(
+        {
+            "key": upload["key"],
+            "upload_id": upload["upload_id"],
+            "max_size": max_size,
+            "user": str(request.user.id),
+        },
+        salt=MULTIPART_TOKEN_SALT,
+    )
+    return Response(
+        {
+            "upload_token": token,
+            "file_url": upload["file_url"],
+            "part_size": upload["part_size"],
+            "max_parts": upload["max_parts"],
+            "expires_in": settings.S3_MULTIPART_MAX_AGE,
+        },
+        status=status.HTTP_201_CREATED,
+    )
+
+
+@api_view(["GET", "POST"])
+@permission_classes([IsAuthenticated, IsCandidate])
+def multipart_upload_parts(request):
+    """
+    Presign part URLs (POST) or list parts already received (GET, to resume).
+
+    POST body: { 'upload_token': str, 'part_numbers': [1, 2, ...] }
+    GET query: ?upload_token=...
+
+    Returns:
+        200 (POST): { 'urls': {part_number: PUT url}, 'expires_in': int }
+        200 (GET): { 'parts': [{'part_number': int, 'size': int}] }
+        400: { 'error': 'message' }
+    """
+    upload = _read_upload_token(request)
+    if upload is None:
+        return _invalid_upload_token()
+
+    if request.method == "GET":
+        try:
+            parts = list_uploaded_parts(upload["key"], upload["upload_id"])
+        except Exception as e:
+            logger.error(f"Error listing multipart upload parts: {e}")
+            return Response({"error": "Upload não encontrado"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(
+            {"parts": [{"part_number": p["PartNumber"], "size": p["Size"]} for p in parts]}
+        )
+
+    max_parts = multipart_part_count(upload["max_size"])
+    part_numbers = request.data.get("part_numbers")
+    if (
+        not isinstance(part_numbers, list)
+        or not part_numbers
+        or not all(isinstance(n, int) and 1 <= n <= max_parts for n in part_numbers)
+    ):
+        return Response(
+            {"error": f"part_numbers deve ser uma lista de inteiros entre 1 e {max_parts}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    expiry = settings.VIDEO_PRESIGNED_EXPIRY
+    urls = presign_upload_parts(
+        upload["key"], upload["upload_id"], sorted(set(part_numbers)), expiry
+    )
+    return Response({"urls": urls, "expires_in": expiry})
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated, IsCandidate])
+def finish_multipart_upload(request):
+    """
+    Complete a multipart upload once every part is uploaded.
+
+    Body: { 'upload_token': str }
+
+    Returns:
+        200: { 'file_url': Final URL of the uploaded file }
+        400: { 'error': 'message' } (invalid token, no parts, file too large)
+    """
+    upload = _read_upload_token(request)
+    if upload is None:
+        return _invalid_upload_token()
+
+    try:
+        file_url = complete_multipart_upload(upload["key"], upload["upload_id"], upload["max_size"])
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        logger.error(f"Error completing multipart upload: {e}", extra={"user": request.user.id})
+        return Response(
+            {"error": "Internal server error"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+    return Response({"file_url": file_url}, status=status.HTTP_200_OK)
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated, IsCandidate])
+def cancel_multipart_upload(request):
+    """
+    Abort a multipart upload and discard its parts.
+
+    Body: { 'upload_token': str }
+
+    Returns:
+        204: Aborted (or already gone)
+        400: { 'error': 'message' }
+    """
+    upload = _read_upload_token(request)
+    if upload is None:
+        return _invalid_upload_token()
+
+    try:
+        abort_multipart_upload(upload["key"], upload["upload_id"])
+    except Exception as e:
+        # Already completed/aborted: nothing left to clean up
+        logger.warning(f"Error aborting multipart upload: {e}")
+
+    return Response(status=status.HTTP_204_NO_CONTENT)
+
+
 @api_view(["POST"])
 @permission_classes([IsAuthenticated, IsCandidate])
 def create_candidate_profile(request):
@@ -236,7 +509,7 @@ def update_profile_photo(request, pk):
     Auth: Required (candidate role, owner only)
     Body: { 'profile_photo_url': 'https://...' }
 
-    Side effect: Deletes previous photo from S3
+    Side effect: Queues previous photo for deletion from S3 (async, batched)
 
     Returns:
         200: { ...updated profile data }
@@ -261,7 +534,8 @@ def update_profile_photo(request, pk):
             {"error": "You can only edit your own profile"}, status=status.HTTP_403_FORBIDDEN
         )
 
-    new_photo_url = request.data.get("profile_photo_url")
+    # Clients may send back the signed read URL they were served
+    new_photo_url = unsign_read_url(request.data.get("profile_photo_url"))
 
     if not new_photo_url:
         return Response(
@@ -275,15 +549,17 @@ def update_profile_photo(request, pk):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    # Delete old photo if exists
-    if profile.profile_photo_url and profile.profile_photo_url != new_photo_url:
-        delete_s3_object(profile.profile_photo_url)
-        logger.info(f"Deleted old photo for profile {pk}")
+    old_photo_url = unsign_read_url(profile.profile_photo_url)
 
     # Update photo URL
     profile.profile_photo_url = new_photo_url
     profile.save()
 
+    # Queue old photo for deletion (drained in batches by drain_s3_deletions)
+    if old_photo_url and old_photo_url != new_photo_url:
+        schedule_s3_deletion(old_photo_url)
+        logger.info(f"Queued old photo for deletion for profile {pk}")
+
     logger.info(
         f"Updated photo for profile {pk}", extra={"profile_id": pk, "user_id": request.user.id}
     )
@@ -303,7 +579,7 @@ def update_pitch_video(request, pk):
         'pitch_video_type': 's3' or 'youtube'
     }
 
-    Side effect: If old video was S3, deletes it from S3
+    Side effect: If old video was S3, queues it for deletion from S3 (async, batched)
 
     Returns:
         200: { ...updated profile data }
@@ -329,7 +605,8 @@ def update_pitch_video(request, pk):
             {"error": "You can only edit your own profile"}, status=status.HTTP_403_FORBIDDEN
         )
 
-    new_video_url = request.data.get("pitch_video_url")
+    # Clients may send back the signed read URL they were served
+    new_video_url = unsign_read_url(request.data.get("pitch_video_url"))
     new_video_type = request.data.get("pitch_video_type")
 
     if not new_video_url or not new_video_type:
@@ -355,20 +632,20 @@ def update_pitch_video(request, pk):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    # Delete old video if it was S3
-    if (
-        profile.pitch_video_url
-        and profile.pitch_video_type == "s3"
-        and profile.pitch_video_url != new_video_url
-    ):
-        delete_s3_object(profile.pitch_video_url)
-        logger.info(f"Deleted old S3 video for profile {pk}")
+    old_video_url = (
+        unsign_read_url(profile.pitch_video_url) if profile.pitch_video_type == "s3" else None
+    )
 
     # Update video
     profile.pitch_video_url = new_video_url
     profile.pitch_video_type = new_video_type
     profile.save()
 
+    # Queue old video for deletion if it was S3 (drained by drain_s3_deletions)
+    if old_video_url and old_video_url != new_video_url:
+        schedule_s3_deletion(old_video_url)
+        logger.info(f"Queued old S3 video for deletion for profile {pk}")
+
     logger.info(
         f"Updated pitch video for profile {pk}",
         extra={"profile_id": pk, "user_id": request.user.id, "video_type": new_video_type},
@@ -377,6 +654,106 @@ def update_pitch_video(request, pk):
     return Response(CandidateProfileSerializer(profile).data, status=status.HTTP_200_OK)
 
 
+@api_view(["GET"])
+@permission_classes([IsAuthenticated, IsCandidate])
+def get_my_profile(request):
+    """
+    Get the authenticated candidate's own profile.
+
+    Supports conditional GET: the ETag/Last-Modified come from the profile
+    and experience versions, so an unchanged profile costs one aggregate
+    query and a 304, without serialization.
+
+    Auth: Required (candidate role)
+
+    Returns:
+        200: Full profile data with experiences
+        304: Not modified (empty body)
+        404: { 'error': 'Profile not found' }
+
+    Example:
+        GET /api/v1/candidates/me
+        If-None-Match: "3f2a..."
+    """
+    cache_control = {"private": True, "no_cache": True}
+
+    version = ProfileVersionService.get_version(user=request.user, is_active=True)
+    if version is None:
+        return Response({"error": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    etag = media_etag(version["etag"])
+    not_modified = conditional_response(request, etag, version["last_modified"], **cache_control)
+    if not_modified is not None:
+        patch_vary_headers(not_modified, ["Authorization"])
+        return not_modified
+
+    profile = CandidateProfile.objects.prefetch_related("experiences").get(id=version["id"])
+    response = Response(CandidateProfileSerializer(profile).data, status=status.HTTP_200_OK)
+    apply_validators(response, etag, version["last_modified"], **cache_control)
+    patch_vary_headers(response, ["Authorization"])
+    return response
+
+
+def _analytics_days(request) -> int:
+    """Parse ?days= for analytics endpoints (1-90, default 30)."""
+    try:
+        days = int(request.query_params.get("days", 30))
+    except ValueError:
+        days = 30
+    return min(max(days, 1), 90)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated, IsCandidate])
+def get_my_analytics(request):
+    """
+    Get the authenticated candidate's public profile analytics.
+
+    Counts are buffered in Redis and flushed every few minutes, so today's
+    numbers may lag slightly.
+
+    Auth: Required (candidate role)
+
+    Query params:
+        days: Number of days (1-90, default 30)
+
+    Returns:
+        200: { 'days': [{date, views, unique_views, contacts}], 'totals': {views, contacts} }
+        404: { 'error': 'Profile not found' }
+    """
+    profile = CandidateProfile.objects.filter(user=request.user, is_active=True).first()
+    if profile is None:
+        return Response({"error": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    return Response(
+        ProfileAnalyticsService.get_stats(profile, days=_analytics_days(request)),
+        status=status.HTTP_200_OK,
+    )
+
+
+@api_view(["GET"])
+@permission_classes([IsAdmin])
+def admin_candidate_analytics(request, pk):
+    """
+    Get a candidate's public profile analytics (admin only).
+
+    Query params:
+        days: Number of days (1-90, default 30)
+
+    Returns:
+        200: { 'days': [...], 'totals': {...} }
+        404: { 'error': 'Profile not found' }
+    """
+    profile = CandidateProfile.objects.filter(id=pk).first()
+    if profile is None:
+        return Response({"error": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    return Response(
+        ProfileAnalyticsService.get_stats(profile, days=_analytics_days(request)),
+        status=status.HTTP_200_OK,
+    )
+
+
 # Story 3.2: Public sharing endpoints
 
 
@@ -490,6 +867,29 @@ def toggle_sharing(request, pk):
     return Response({"public_sharing_enabled": new_status}, status=status.HTTP_200_OK)
 
 
+def _signed_snapshot(content: bytes) -> bytes:
+    """Sign the media URLs of a pre-rendered snapshot when reads are signed."""
+    if not signing_enabled():
+        return content
+    return JSONRenderer().render(sign_media_payload(json.loads(content)))
+
+
+def _public_cache_control() -> dict:
+    """
+    Cache-Control for public profiles.
+
+    Browsers always revalidate (cheap 304); shared caches/CDNs may serve a copy
+    for PUBLIC_PROFILE_CDN_MAX_AGE seconds, which bounds how long a disabled
+    link stays visible there.
+    """
+    return {
+        "public": True,
+        "max_age": 0,
+        "s_maxage": settings.PUBLIC_PROFILE_CDN_MAX_AGE,
+        "must_revalidate": True,
+    }
+
+
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def get_public_profile(request, token):
@@ -497,26 +897,91 @@ def get_public_profile(request, token):
     Get public candidate profile by share token.
 
     No authentication required - public endpoint.
+    Served from a pre-rendered snapshot (see PublicProfileSnapshotService):
+    one pointer lookup and one storage read, no serialization. Supports
+    conditional GET: If-None-Match / If-Modified-Since are checked against
+    the snapshot's validators before the body is read. Views (200 and 304)
+    are counted in Redis by ProfileAnalyticsService. With signed reads, the
+    snapshot's canonical media URLs are signed on the way out.
 
     Returns:
         200: Public profile data (excludes CPF, phone, email, etc.)
+        304: Not modified (empty body)
         404: { 'error': 'Profile not found or sharing is disabled' }
 
     Example:
         GET /api/v1/public/candidates/550e8400-e29b-41d4-a716-446655440000
     """
-    profile = SharingService.get_public_profile(token)
+    cache_control = _public_cache_control()
 
-    if not profile:
+    pointer = PublicProfileSnapshotService.get_pointer(token)
+    if pointer is not None:
+        etag = media_etag(pointer["etag"])
+        not_modified = conditional_response(
+            request, etag, pointer["last_modified"], **cache_control
+        )
+        if not_modified is not None:
+            ProfileAnalyticsService.record_view(pointer["candidate_id"], get_visitor_id(request))
+            return not_modified
+        content = PublicProfileSnapshotService.read(pointer["path"])
+        if content is not None:
+            ProfileAnalyticsService.record_view(pointer["candidate_id"], get_visitor_id(request))
+            return apply_validators(
+                PrerenderedJSONResponse(_signed_snapshot(content)),
+                etag,
+                pointer["last_modified"],
+                **cache_control,
+            )
+
+    # Not published yet (or pointer lost): check the version, then publish on demand.
+    # Unknown and recently disabled tokens stop here without a query.
+    version = generation = None
+    if PublicTokenFilter.may_exist(token):
+        # Read before the version, so an edit committed meanwhile fails the pointer write
+        generation = PublicProfileSnapshotService.get_generation(token)
+        version = ProfileVersionService.get_version(
+            public_token=token, public_sharing_enabled=True, is_active=True
+        )
+        if version is None:
+            PublicTokenFilter.remember_missing(token)
+    if version is not None:
+        not_modified = conditional_response(
+            request, media_etag(version["etag"]), version["last_modified"], **cache_control
+        )
+        if not_modified is not None:
+            ProfileAnalyticsService.record_view(version["id"], get_visitor_id(request))
+            return not_modified
+
+    published = (
+        PublicProfileSnapshotService.publish(token, version, generation) if version else None
+    )
+
+    if not published:
         logger.warning(f"Public profile not found for token: {token}")
         return Response(
             {"error": "Profile not found or sharing is disabled"}, status=status.HTTP_404_NOT_FOUND
         )
 
-    logger.info("Public profile accessed", extra={"profile_id": profile.id, "token": token})
+    logger.info("Public profile published on demand", extra={"profile_id": version["id"]})
+    ProfileAnalyticsService.record_view(version["id"], get_visitor_id(request))
+
+    pointer, content = published
+    return apply_validators(
+        PrerenderedJSONResponse(_signed_snapshot(content)),
+        media_etag(pointer["etag"]),
+        pointer["last_modified"],
+        **cache_control,
+    )
+
 
-    serializer = PublicCandidateProfileSerializer(profile)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+def _contact_rate_limited(error: ContactRateLimited) -> Response:
+    """429 response for a throttled contact request."""
+    response = Response(
+        {"error": "Muitas solicitações de contato. Tente novamente mais tarde."},
+        status=status.HTTP_429_TOO_MANY_REQUESTS,
+    )
+    response["Retry-After"] = str(error.retry_after)
+    return response
 
 
 @api_view(["POST"])
@@ -533,12 +998,16 @@ def contact_candidate(request, token):
         'message': 'Mensagem de contato'
     }
 
-    Sends email to admin with contact details.
+    Sends email to admin with contact details. Throttled per client IP and
+    per profile (see ContactRequestService): repeated identical messages are
+    not sent again, and bursts are delivered as one digest e-mail. Both are
+    answered like a normal send.
 
     Returns:
         200: { 'message': 'Contact request sent successfully' }
         404: { 'error': 'Profile not found or sharing is disabled' }
         400: { 'error': { field: ['message'] } }
+        429: { 'error': '...' } with Retry-After header
 
     Example:
         POST /api/v1/public/candidates/550e8400-e29b-41d4-a716-446655440000/contact
@@ -548,6 +1017,11 @@ def contact_candidate(request, token):
             "message": "Gostaria de conversar sobre uma oportunidade..."
         }
     """
+    try:
+        ContactRequestService.check_ip(get_client_ip(request))
+    except ContactRateLimited as e:
+        return _contact_rate_limited(e)
+
     profile = SharingService.get_public_profile(token)
 
     if not profile:
@@ -561,20 +1035,25 @@ def contact_candidate(request, token):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     try:
-        SharingService.send_contact_request(
+        outcome = ContactRequestService.submit(
             candidate=profile,
             contact_name=serializer.validated_data["name"],
             contact_email=serializer.validated_data["email"],
             message=serializer.validated_data["message"],
         )
+        if outcome in (SENT, QUEUED):
+            ProfileAnalyticsService.record_contact(profile.id)
 
         logger.info(
-            f"Contact request sent for profile {profile.id}",
+            f"Contact request {outcome} for profile {profile.id}",
             extra={"profile_id": profile.id, "contact_email": serializer.validated_data["email"]},
         )
 
         return Response({"message": "Contact request sent successfully"}, status=status.HTTP_200_OK)
 
+    except ContactRateLimited as e:
+        return _contact_rate_limited(e)
+
     except Exception as e:
         logger.error(f"Error sending contact request: {e}", extra={"profile_id": profile.id})
         return Response(
@@ -999,6 +1478,9 @@ def list_candidates(request):
                     "years_of_experience": candidate.years_of_experience,
                     "status": candidate.status,
                     "profile_photo_url": candidate.profile_photo_url,
+                    "profile_photo_variants": responsive_variants(
+                        candidate.profile_photo_url, candidate.profile_photo_variants
+                    ),
                     "created_at": candidate.created_at.isoformat(),
                     "import_source": getattr(candidate, "import_source", None),
                 }
@@ -1018,7 +1500,8 @@ def list_candidates(request):
                 if page_obj.has_previous()
                 else None
             ),
-            "results": results,
+            # Photos of the whole page are signed in one cached batch
+            "results": sign_media_payload(results),
         }
 
         logger.info(
@@ -0,0 +1,50 @@
+"""
+Shared pytest fixtures.
+
+Redis-backed features (leaderboards, counters) run against an in-memory
+fakeredis server so the suite needs no external Redis. The matching text
+index and public profile snapshots are written to per-test temporary directories.
+S3 calls are checked with botocore's Stubber on the shared client (s3_settings).
+"""
+
+import fakeredis
+import pytest
+
+from core.utils import redis_client
+
+
+@pytest.fixture(autouse=True)
+def fake_redis(monkeypatch):
+    """Replace the shared Redis client with a fresh in-memory fake per test."""
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis_client, "_client", client)
+    yield client
+    client.flushall()
+
+
+@pytest.fixture(autouse=True)
+def text_index_dir(settings, tmp_path):
+    """Keep the on-disk matching text index out of the source tree."""
+    settings.MATCHING_TEXT_INDEX_DIR = str(tmp_path / "text_index")
+    return tmp_path / "text_index"
+
+
+@pytest.fixture(autouse=True)
+def snapshot_dir(settings, tmp_path):
+    """Write public profile snapshots to a per-test local directory."""
+    settings.PUBLIC_PROFILE_SNAPSHOT_STORAGE = "local"
+    settings.PUBLIC_PROFILE_SNAPSHOT_DIR = str(tmp_path / "profile_snapshots")
+    return tmp_path / "profile_snapshots"
+
+
+@pytest.fixture
+def s3_settings(settings):
+    """Fake AWS credentials and bucket, with a fresh shared S3 client."""
+    from core.utils import s3
+
+    settings.AWS_ACCESS_KEY_ID = "testing"
+    settings.AWS_SECRET_ACCESS_KEY = "testing"
+    settings.AWS_STORAGE_BUCKET_NAME = "talentbase-test-uploads"
+    s3.reset_s3_client()
+    yield settings
+    s3.reset_s3_client()
@@ -0,0 +1,67 @@
+# Generated by Django 5.0.14 on 2026-10-19 01:39
+
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0002_emaillog_task_id_nullable"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingS3Deletion",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        help_text="Identificador único UUID",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, help_text="Data/hora de criação"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, help_text="Data/hora da última atualização"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(
+                        db_index=True, default=True, help_text="Soft delete: False = deletado"
+                    ),
+                ),
+                ("key", models.CharField(help_text="S3 object key", max_length=1024, unique=True)),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, help_text="Failed deletion attempts"),
+                ),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        help_text="Earliest time of the next attempt",
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(blank=True, help_text="Error of the last failed attempt"),
+                ),
+            ],
+            options={
+                "verbose_name": "Pending S3 Deletion",
+                "verbose_name_plural": "Pending S3 Deletions",
+                "ordering": ["next_attempt_at"],
+            },
+        ),
+    ]
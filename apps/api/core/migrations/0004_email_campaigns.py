@@ -0,0 +1,100 @@
+# Generated by Django 5.0.14 on 2026-10-19 01:57
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0003_pending_s3_deletion"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EmailCampaign",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        help_text="Identificador único UUID",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, help_text="Data/hora de criação"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, help_text="Data/hora da última atualização"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(
+                        db_index=True, default=True, help_text="Soft delete: False = deletado"
+                    ),
+                ),
+                ("name", models.CharField(help_text="Nome interno da campanha", max_length=200)),
+                ("template_name", models.CharField(help_text="Template de email", max_length=100)),
+                ("subject", models.CharField(help_text="Assunto do email", max_length=200)),
+                (
+                    "context",
+                    models.JSONField(blank=True, default=dict, help_text="Variáveis do template"),
+                ),
+                ("audience", models.JSONField(default=dict, help_text="Filtro de destinatários")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "Queued"),
+                            ("sending", "Sending"),
+                            ("completed", "Completed"),
+                        ],
+                        db_index=True,
+                        default="queued",
+                        max_length=20,
+                    ),
+                ),
+                ("total_recipients", models.PositiveIntegerField(default=0)),
+                ("sent_count", models.PositiveIntegerField(default=0)),
+                ("failed_count", models.PositiveIntegerField(default=0)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="email_campaigns",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Email Campaign",
+                "verbose_name_plural": "Email Campaigns",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.AddField(
+            model_name="emaillog",
+            name="campaign",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Campanha que enviou o email (envios em massa)",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="email_logs",
+                to="core.emailcampaign",
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.0.14 on 2026-10-19 02:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+from core.utils.partitions import partition_table, unpartition_table
+
+
+def partition_email_log(apps, schema_editor):
+    """Range-partition core_emaillog by month of created_at (PostgreSQL only)."""
+    partition_table(
+        schema_editor.connection,
+        "core_emaillog",
+        "created_at",
+        months_ahead=settings.EMAIL_LOG_PARTITIONS_AHEAD,
+    )
+
+
+def unpartition_email_log(apps, schema_editor):
+    """Turn core_emaillog back into a regular table (PostgreSQL only)."""
+    unpartition_table(schema_editor.connection, "core_emaillog")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0004_email_campaigns"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="emaillog",
+            name="recipient",
+            field=models.EmailField(help_text="Recipient email address", max_length=255),
+        ),
+        migrations.AlterField(
+            model_name="emaillog",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("sent", "Sent"),
+                    ("failed", "Failed"),
+                    ("skipped", "Skipped"),
+                ],
+                default="pending",
+                help_text="Email sending status",
+                max_length=20,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="emaillog",
+            name="template_name",
+            field=models.CharField(help_text="Template name used", max_length=100),
+        ),
+        migrations.RunPython(partition_email_log, unpartition_email_log),
+    ]
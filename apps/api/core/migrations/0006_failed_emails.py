@@ -0,0 +1,86 @@
+# Generated by Django 5.0.14 on 2026-10-19 02:06
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0005_partition_email_log"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FailedEmail",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        help_text="Identificador único UUID",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, help_text="Data/hora de criação"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, help_text="Data/hora da última atualização"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(
+                        db_index=True, default=True, help_text="Soft delete: False = deletado"
+                    ),
+                ),
+                (
+                    "recipient",
+                    models.EmailField(help_text="Recipient email address", max_length=255),
+                ),
+                ("subject", models.CharField(help_text="Email subject line", max_length=200)),
+                ("template_name", models.CharField(help_text="Template name used", max_length=100)),
+                (
+                    "context",
+                    models.JSONField(blank=True, default=dict, help_text="Variáveis do template"),
+                ),
+                (
+                    "error_message",
+                    models.TextField(blank=True, help_text="Erro da última tentativa"),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=1, help_text="Tentativas de envio"),
+                ),
+                ("task_id", models.CharField(blank=True, max_length=100, null=True)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("dead", "Dead"), ("requeued", "Requeued")],
+                        default="dead",
+                        max_length=20,
+                    ),
+                ),
+                ("requeued_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Failed Email",
+                "verbose_name_plural": "Failed Emails",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "-created_at"], name="core_failed_status_59d5c0_idx"
+                    ),
+                    models.Index(
+                        fields=["status", "template_name", "-created_at"],
+                        name="core_failed_status_f0055a_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
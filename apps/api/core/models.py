@@ -4,11 +4,17 @@ Provides abstract base model for all application models.
 
 Story 2.7: Email Notification System
 - EmailLog model for email monitoring and audit trail
+
+PendingS3Deletion: outbox of S3 objects to delete asynchronously
+EmailCampaign: bulk emails to an audience, sent in chunks
+FailedEmail: dead letters of emails that exhausted their retries
 """
 
 import uuid
 
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class BaseModel(models.Model):
@@ -58,6 +64,13 @@ class EmailLog(BaseModel):
     Tracks all email sending attempts with status, errors, and metadata.
     Allows admins to review failures and retry if needed.
 
+    On PostgreSQL the table is range-partitioned by month on created_at
+    (migration 0005, core.utils.partitions) and months older than
+    EMAIL_LOG_RETENTION_MONTHS are dropped by prune_email_logs. Lookups by
+    recipient, template and status go through the composite indexes, which
+    lead with those columns or created_at, so there are no single-column
+    indexes to maintain on insert.
+
     Attributes:
         recipient: Email address of recipient
         subject: Email subject line
@@ -75,16 +88,13 @@ class EmailLog(BaseModel):
         ("skipped", "Skipped"),
     ]
 
-    recipient = models.EmailField(
-        max_length=255, db_index=True, help_text="Recipient email address"
-    )
+    recipient = models.EmailField(max_length=255, help_text="Recipient email address")
     subject = models.CharField(max_length=200, help_text="Email subject line")
-    template_name = models.CharField(max_length=100, db_index=True, help_text="Template name used")
+    template_name = models.CharField(max_length=100, help_text="Template name used")
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
         default="pending",
-        db_index=True,
         help_text="Email sending status",
     )
     error_message = models.TextField(blank=True, help_text="Error message if sending failed")
@@ -96,6 +106,14 @@ class EmailLog(BaseModel):
         db_index=True,
         help_text="Celery task ID (null in EAGER mode)",
     )
+    campaign = models.ForeignKey(
+        "EmailCampaign",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="email_logs",
+        help_text="Campanha que enviou o email (envios em massa)",
+    )
 
     class Meta:
         ordering = ["-created_at"]
@@ -109,3 +127,145 @@ class EmailLog(BaseModel):
 
     def __str__(self) -> str:
         return f"{self.template_name} to {self.recipient} ({self.status})"
+
+
+class PendingS3Deletion(BaseModel):
+    """
+    S3 object waiting to be deleted (outbox for drain_s3_deletions).
+
+    Rows are written in the same transaction as the change that orphaned the
+    object and removed once S3 confirms the deletion. Failed keys are retried
+    with exponential backoff up to S3_DELETION_MAX_ATTEMPTS, then kept for
+    admin review.
+
+    Attributes:
+        key: Object key in settings.AWS_STORAGE_BUCKET_NAME
+        attempts: Failed deletion attempts so far
+        next_attempt_at: Earliest time of the next attempt
+        last_error: Error of the last failed attempt
+    """
+
+    key = models.CharField(max_length=1024, unique=True, help_text="S3 object key")
+    attempts = models.PositiveIntegerField(default=0, help_text="Failed deletion attempts")
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now, db_index=True, help_text="Earliest time of the next attempt"
+    )
+    last_error = models.TextField(blank=True, help_text="Error of the last failed attempt")
+
+    class Meta:
+        ordering = ["next_attempt_at"]
+        verbose_name = "Pending S3 Deletion"
+        verbose_name_plural = "Pending S3 Deletions"
+
+    def __str__(self) -> str:
+        return f"{self.key} ({self.attempts} attempts)"
+
+
+class EmailCampaign(BaseModel):
+    """
+    Bulk email sent to an audience of users.
+
+    The audience is a JSON description resolved to users when the campaign
+    starts (see CampaignService), so it can travel through Celery. Recipients
+    are fanned out in chunks of EMAIL_CAMPAIGN_CHUNK_SIZE per task; every
+    chunk is sent over one SMTP connection, throttled by the provider token
+    bucket, and logged with one bulk insert.
+
+    Attributes:
+        name: Internal campaign name
+        template_name: Email template (emails/<name>.html/.txt)
+        subject: Email subject line
+        context: Template variables shared by every recipient
+        audience: {'role', 'status', 'search'} user filters or {'job_id', 'application_status'}
+        status: queued, sending, completed
+        total_recipients: Recipients resolved at fan-out
+        sent_count: Emails sent
+        failed_count: Emails that failed in bulk and were handed to individual retry
+        created_by: Admin who created the campaign
+        started_at: Fan-out time
+        completed_at: Time the last chunk finished
+    """
+
+    STATUS_CHOICES = [
+        ("queued", "Queued"),
+        ("sending", "Sending"),
+        ("completed", "Completed"),
+    ]
+
+    name = models.CharField(max_length=200, help_text="Nome interno da campanha")
+    template_name = models.CharField(max_length=100, help_text="Template de email")
+    subject = models.CharField(max_length=200, help_text="Assunto do email")
+    context = models.JSONField(default=dict, blank=True, help_text="Variáveis do template")
+    audience = models.JSONField(default=dict, help_text="Filtro de destinatários")
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default="queued", db_index=True
+    )
+    total_recipients = models.PositiveIntegerField(default=0)
+    sent_count = models.PositiveIntegerField(default=0)
+    failed_count = models.PositiveIntegerField(default=0)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="email_campaigns",
+    )
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Email Campaign"
+        verbose_name_plural = "Email Campaigns"
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.status})"
+
+
+class FailedEmail(BaseModel):
+    """
+    Dead letter of an email that failed after all of send_email_task's retries.
+
+    Keeps the full payload (template and context), which EmailLog does not,
+    so admins can re-enqueue failures in bulk once the cause is fixed (see
+    DeadLetterService). A requeued letter is not requeued again; if the
+    resend fails for good, a new dead letter is written.
+
+    Attributes:
+        recipient: Email address of recipient
+        subject: Email subject line
+        template_name: Email template (emails/<name>.html/.txt)
+        context: Template variables
+        error_message: Error of the last attempt
+        attempts: Send attempts made (1 + retries)
+        task_id: Celery task id of the last attempt
+        status: dead (waiting for review) or requeued
+        requeued_at: Time it was re-enqueued
+    """
+
+    STATUS_CHOICES = [
+        ("dead", "Dead"),
+        ("requeued", "Requeued"),
+    ]
+
+    recipient = models.EmailField(max_length=255, help_text="Recipient email address")
+    subject = models.CharField(max_length=200, help_text="Email subject line")
+    template_name = models.CharField(max_length=100, help_text="Template name used")
+    context = models.JSONField(default=dict, blank=True, help_text="Variáveis do template")
+    error_message = models.TextField(blank=True, help_text="Erro da última tentativa")
+    attempts = models.PositiveIntegerField(default=1, help_text="Tentativas de envio")
+    task_id = models.CharField(max_length=100, blank=True, null=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="dead")
+    requeued_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Failed Email"
+        verbose_name_plural = "Failed Emails"
+        indexes = [
+            models.Index(fields=["status", "-created_at"]),
+            models.Index(fields=["status", "template_name", "-created_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.template_name} to {self.recipient} ({self.status})"
@@ -5,19 +5,54 @@ Story 2.7: Email Notification System
 - Enhanced send_email_task with HTML template support
 - Retry logic with exponential backoff
 - EmailLog integration for monitoring
+
+Batched deletion of S3 objects queued in the PendingS3Deletion outbox.
+
+Emails go over one pooled SMTP connection per worker (core.utils.mail);
+flush_email_outbox sends queued bulk emails in batches. Each send attempt
+is logged with a single EmailLog write (core.utils.email_log), and
+prune_email_logs applies the EmailLog retention policy. Emails that
+exhaust their retries are kept as FailedEmail dead letters, which
+resend_dead_letters sends again when an admin requeues them.
 """
 
+import json
 import logging
+from datetime import timedelta
+from typing import Optional
 
+from botocore.exceptions import ClientError
 from celery import shared_task
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
+from django.db import transaction
 from django.utils import timezone
 
+from core.utils.email_log import apply_email_log_retention, dead_letter_email, log_email
+from core.utils.mail import (
+    FLUSH_LOCK_KEY,
+    FLUSH_LOCK_TTL,
+    FLUSH_SCHEDULED_KEY,
+    ack_outbox,
+    build_email,
+    claim_outbox,
+    requeue_unacked,
+    send_email_batch,
+    send_message,
+    throttle_sending,
+)
+from core.utils.redis_client import get_redis_client
+
 logger = logging.getLogger(__name__)
 
 
+def _record_campaign_result(campaign_id: Optional[str], sent: bool) -> None:
+    """Count a retried campaign email as sent or failed once it is settled."""
+    if campaign_id:
+        from user_management.services.campaigns import CampaignService
+
+        CampaignService.record_chunk(campaign_id, int(sent), int(not sent))
+
+
 @shared_task(bind=True, max_retries=3)
 def send_email_task(
     self,
@@ -25,6 +60,7 @@ def send_email_task(
     context: dict,
     recipient_email: str,
     subject: str,
+    campaign_id: Optional[str] = None,
 ) -> str:
     """
     Send HTML email asynchronously via Celery with retry logic.
@@ -36,7 +72,8 @@ def send_email_task(
     - Supports HTML + plain text multipart emails
 
     In development: Emails are captured by MailHog (localhost:1025 SMTP, :8025 Web UI)
-    In production: Emails are sent via SendGrid/AWS SES
+    In production: Emails are sent via SendGrid/AWS SES, over the worker's
+    pooled SMTP connection (no TLS handshake per email)
 
     Args:
         template_name: Name of the email template (without .html/.txt extension)
@@ -45,6 +82,9 @@ def send_email_task(
                  Common vars: candidate_name, company_name, email, dashboard_url, etc.
         recipient_email: Single recipient email address
         subject: Email subject line
+        campaign_id: EmailCampaign the email belongs to (retries of campaign
+                     chunks); its counters are updated once the email is
+                     sent or has failed for good
 
     Returns:
         str: Success message with recipient
@@ -65,82 +105,78 @@ def send_email_task(
         )
     """
     task_id = self.request.id
-    log_entry = None
 
     try:
-        # Import here to avoid circular dependency
-        from core.models import EmailLog
-
-        # Create email log entry
-        log_entry = EmailLog.objects.create(
-            recipient=recipient_email,
-            subject=subject,
-            template_name=template_name,
-            status="pending",
-            task_id=task_id,
-        )
-
-        # Render HTML and text versions from templates
-        html_content = render_to_string(f"emails/{template_name}.html", context)
-        text_content = render_to_string(f"emails/{template_name}.txt", context)
-
-        # Create multipart email (HTML + plain text fallback)
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=text_content,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[recipient_email],
-        )
-        email.attach_alternative(html_content, "text/html")
-        email.send(fail_silently=False)
-
-        # Update log entry as sent
-        log_entry.status = "sent"
-        log_entry.sent_at = timezone.now()
-        log_entry.save()
-
-        logger.info(
-            f"Email sent successfully: {template_name} to {recipient_email} (task_id: {task_id})"
-        )
-        return f"Email sent to {recipient_email}"
-
+        # Render multipart email (HTML + plain text fallback) and send it,
+        # sharing the provider rate limit with batched sends
+        throttle_sending(1)
+        send_message(build_email(template_name, context, recipient_email, subject))
     except Exception as e:
         error_message = str(e)
         logger.error(
             f"Email send failed: {template_name} to {recipient_email} - {error_message} (task_id: {task_id}, retry: {self.request.retries})"
         )
 
-        # Update log entry with error
-        if log_entry:
-            log_entry.status = "failed"
-            log_entry.error_message = error_message
-            log_entry.save()
-
         # In development, if MailHog is not available, log and skip retry
         if settings.DEBUG:
             logger.warning(
                 f"Email not sent (development mode, MailHog unavailable): {recipient_email}"
             )
-            if log_entry:
-                log_entry.status = "skipped"
-                log_entry.error_message = "Development mode - MailHog unavailable"
-                log_entry.save()
+            log_email(
+                recipient_email,
+                subject,
+                template_name,
+                "skipped",
+                task_id=task_id,
+                error_message="Development mode - MailHog unavailable",
+                campaign_id=campaign_id,
+            )
+            _record_campaign_result(campaign_id, sent=False)
             return f"Email skipped (dev mode): {recipient_email}"
 
-        # In production, retry with exponential backoff
-        # Retry delays: 60s, 120s, 240s (1min, 2min, 4min)
-        try:
-            raise self.retry(countdown=60 * (2**self.request.retries), exc=e)
-        except self.MaxRetriesExceededError:
-            # Max retries exceeded - final failure
+        # Celery re-raises the original exception once retries are exhausted
+        # (no MaxRetriesExceededError when exc is given), so detect the last
+        # attempt up front and log it as the final failure in the same write
+        final_attempt = self.request.retries >= self.max_retries
+        if final_attempt:
+            error_message = f"{error_message} (failed after {self.max_retries} retries)"
+        log_email(
+            recipient_email,
+            subject,
+            template_name,
+            "failed",
+            task_id=task_id,
+            error_message=error_message,
+            campaign_id=campaign_id,
+        )
+
+        if final_attempt:
             logger.error(f"Email send failed after {self.max_retries} retries: {recipient_email}")
-            if log_entry:
-                log_entry.error_message = (
-                    f"{error_message} (failed after {self.max_retries} retries)"
-                )
-                log_entry.save()
+            dead_letter_email(
+                template_name,
+                context,
+                recipient_email,
+                subject,
+                str(e),
+                attempts=self.request.retries + 1,
+                task_id=task_id,
+            )
+            _record_campaign_result(campaign_id, sent=False)
             raise
 
+        # In production, retry with exponential backoff
+        # Retry delays: 60s, 120s, 240s (1min, 2min, 4min)
+        raise self.retry(countdown=60 * (2**self.request.retries), exc=e) from e
+
+    log_email(
+        recipient_email, subject, template_name, "sent", task_id=task_id, campaign_id=campaign_id
+    )
+    _record_campaign_result(campaign_id, sent=True)
+    logger.info(
+        f"Email sent successfully: {template_name} to {recipient_email} (task_id: {task_id})"
+    )
+    return f"Email sent to {recipient_email}"
+
 
 # Story 3.3.5: Admin Manual Candidate Creation
 
@@ -221,3 +257,159 @@ def send_admin_created_candidate_welcome_email(self, user_id: str) -> str:
             # In dev mode, log and skip
             logger.warning(f"Welcome email skipped (dev mode): {user_id}")
             return f"Email skipped (dev mode): {user_id}"
+
+
+@shared_task(bind=True, max_retries=3)
+def drain_s3_deletions(self, batch_size: int = 1000) -> int:
+    """
+    Delete S3 objects queued in the PendingS3Deletion outbox.
+
+    Runs every minute (settings.CELERY_BEAT_SCHEDULE). Due rows are claimed
+    with SELECT ... FOR UPDATE SKIP LOCKED, so overlapping runs split the
+    work, and deleted with one DeleteObjects request per batch (max 1000).
+    Keys S3 fails to delete are retried with exponential backoff.
+
+    Args:
+        batch_size: Keys per DeleteObjects request (max 1000)
+
+    Returns:
+        int: Number of objects deleted
+    """
+    from core.models import PendingS3Deletion
+    from core.utils.s3 import delete_s3_keys
+
+    batch_size = min(batch_size, 1000)
+    max_attempts = settings.S3_DELETION_MAX_ATTEMPTS
+    deleted = 0
+
+    while True:
+        with transaction.atomic():
+            now = timezone.now()
+            batch = list(
+                PendingS3Deletion.objects.select_for_update(skip_locked=True)
+                .filter(next_attempt_at__lte=now, attempts__lt=max_attempts)
+                .order_by("next_attempt_at")[:batch_size]
+            )
+            if not batch:
+                break
+
+            try:
+                errors = delete_s3_keys([row.key for row in batch])
+            except ClientError as e:
+                logger.error(f"S3 batch deletion failed: {e}")
+                raise self.retry(exc=e, countdown=60 * (2**self.request.retries)) from e
+
+            failed = [row for row in batch if row.key in errors]
+            PendingS3Deletion.objects.filter(
+                id__in=[row.id for row in batch if row.key not in errors]
+            ).delete()
+            for row in failed:
+                row.attempts += 1
+                row.last_error = errors[row.key]
+                row.next_attempt_at = now + timedelta(seconds=60 * 2**row.attempts)
+                if row.attempts >= max_attempts:
+                    logger.error(f"Giving up deleting S3 object {row.key}: {row.last_error}")
+            PendingS3Deletion.objects.bulk_update(
+                failed, ["attempts", "last_error", "next_attempt_at", "updated_at"]
+            )
+            deleted += len(batch) - len(failed)
+
+        if len(batch) < batch_size:
+            break
+
+    if deleted:
+        logger.info(f"Drained {deleted} pending S3 deletions")
+    return deleted
+
+
+@shared_task(bind=True)
+def flush_email_outbox(self) -> dict:
+    """
+    Send the emails queued with core.utils.mail.queue_email.
+
+    Scheduled EMAIL_BATCH_DELAY seconds after the first queued message, so
+    a burst of notifications is sent together: EMAIL_BATCH_SIZE messages
+    per batch over the pooled connection, failures retried one by one by
+    send_email_task.
+
+    One flush runs at a time (FLUSH_LOCK_KEY). Each batch stays in the
+    processing list until it has been sent, and messages a dead flush
+    left there are sent first, so a crash can repeat a batch but never
+    drop it.
+
+    Returns:
+        dict: {'sent': int, 'failed': int}
+    """
+    redis = get_redis_client()
+    totals = {"sent": 0, "failed": 0}
+    if not redis.set(FLUSH_LOCK_KEY, self.request.id or "flush", nx=True, ex=FLUSH_LOCK_TTL):
+        logger.info("Email outbox flush already running")
+        return totals
+
+    try:
+        # Clear the flag first: messages queued while draining schedule a new flush
+        redis.delete(FLUSH_SCHEDULED_KEY)
+        requeued = requeue_unacked()
+        if requeued:
+            logger.warning(f"Requeued {requeued} emails left unsent by a previous flush")
+
+        while batch := claim_outbox(settings.EMAIL_BATCH_SIZE):
+            result = send_email_batch([json.loads(item) for item in batch], task_id=self.request.id)
+            ack_outbox(batch)
+            redis.expire(FLUSH_LOCK_KEY, FLUSH_LOCK_TTL)
+            totals["sent"] += result["sent"]
+            totals["failed"] += result["failed"]
+    finally:
+        redis.delete(FLUSH_LOCK_KEY)
+    return totals
+
+
+@shared_task
+def prune_email_logs() -> dict:
+    """
+    Apply the EmailLog retention policy (daily, settings.CELERY_BEAT_SCHEDULE).
+
+    Creates the upcoming monthly partitions and drops the ones older than
+    EMAIL_LOG_RETENTION_MONTHS (see core.utils.email_log).
+
+    Returns:
+        dict: {'created': [partitions], 'dropped': [partitions], 'deleted': int}
+    """
+    result = apply_email_log_retention()
+    logger.info(
+        f"EmailLog retention: {len(result['created'])} partitions created, "
+        f"{len(result['dropped'])} dropped, {result['deleted']} rows deleted"
+    )
+    return result
+
+
+@shared_task(bind=True)
+def resend_dead_letters(self, failed_email_ids: list[str]) -> dict:
+    """
+    Send a batch of requeued dead letters again (see DeadLetterService.requeue).
+
+    Goes through send_email_batch, so the batch shares the pooled connection
+    and the provider rate limit; messages that fail again are retried by
+    send_email_task and end up as new dead letters if they keep failing.
+
+    Args:
+        failed_email_ids: UUIDs of FailedEmail rows marked requeued
+
+    Returns:
+        dict: {'sent': int, 'failed': int}
+    """
+    from core.models import FailedEmail
+
+    letters = FailedEmail.objects.filter(id__in=failed_email_ids, status="requeued")
+    return send_email_batch(
+        [
+            {
+                "template_name": letter.template_name,
+                "context": letter.context,
+                "recipient_email": letter.recipient,
+                "subject": letter.subject,
+            }
+            for letter in letters
+        ],
+        task_id=self.request.id,
+    )
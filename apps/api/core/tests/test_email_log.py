@@ -0,0 +1,65 @@
+"""
+Tests for lean EmailLog writes.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from core.models import EmailLog, FailedEmail
+from core.tasks import send_email_task
+from core.utils import mail
+
+MESSAGE = {
+    "template_name": "candidate_registration",
+    "context": {"candidate_name": "João", "email": "joao@example.com"},
+    "recipient_email": "joao@example.com",
+    "subject": "Bem-vindo ao TalentBase!",
+}
+
+
+@pytest.fixture(autouse=True)
+def locmem_email(settings):
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    mail.reset_mail_connection()
+    yield
+    mail.reset_mail_connection()
+
+
+@pytest.mark.django_db
+class TestEmailLogWrites:
+    """Tests for the number of EmailLog writes per email."""
+
+    def test_sent_email_is_logged_with_one_insert(self, django_assert_num_queries, mailoutbox):
+        """Test a successful send writes its log row once, already marked sent."""
+        with django_assert_num_queries(1):
+            send_email_task.apply(kwargs=MESSAGE)
+
+        log = EmailLog.objects.get()
+        assert log.status == "sent"
+        assert log.sent_at is not None
+        assert len(mailoutbox) == 1
+
+    def test_final_failure_logged_once(self, django_assert_num_queries):
+        """Test the last failed attempt is logged as final and dead-lettered."""
+        with (
+            patch("django.core.mail.EmailMultiAlternatives.send", side_effect=Exception("down")),
+            patch.object(send_email_task, "max_retries", 0),
+            django_assert_num_queries(2),
+            pytest.raises(Exception, match="down"),
+        ):
+            send_email_task.apply(kwargs=MESSAGE)
+
+        log = EmailLog.objects.get()
+        assert log.status == "failed"
+        assert log.error_message == "down (failed after 0 retries)"
+        letter = FailedEmail.objects.get()
+        assert letter.context == MESSAGE["context"]
+        assert (letter.error_message, letter.attempts) == ("down", 1)
+
+    def test_batch_logged_with_one_insert(self, django_assert_num_queries):
+        """Test a batch of sent emails is logged with a single bulk INSERT."""
+        with django_assert_num_queries(1):
+            mail.send_email_batch([MESSAGE, {**MESSAGE, "recipient_email": "ana@example.com"}])
+
+        assert EmailLog.objects.filter(status="sent").count() == 2
@@ -0,0 +1,68 @@
+"""
+Tests for the precompiled email template registry.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.template import engines
+from django.template.loader import render_to_string
+
+from core.utils import email_templates
+from core.utils.email_templates import (
+    clear_email_templates,
+    email_template_exists,
+    load_email_templates,
+    render_email,
+)
+
+CONTEXT = {
+    "candidate_name": "João Silva",
+    "email": "joao@example.com",
+    "dashboard_url": "https://app.talentbase.com/candidate",
+}
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    clear_email_templates()
+    yield
+    clear_email_templates()
+
+
+class TestEmailTemplateRegistry:
+    """Tests for load_email_templates and render_email."""
+
+    def test_load_compiles_every_email_template(self):
+        """Test every .html/.txt under templates/emails is compiled up front."""
+        count = load_email_templates()
+
+        assert count == len(email_templates.email_template_names())
+        assert "emails/base.html" in email_templates._registry
+        assert "emails/candidate_registration.txt" in email_templates._registry
+
+    def test_render_uses_registry_without_loaders(self):
+        """Test rendering a loaded template does not go back to the engine."""
+        load_email_templates()
+
+        with patch.object(engines["django"], "get_template") as get_template:
+            html, text = render_email("candidate_registration", CONTEXT)
+
+        get_template.assert_not_called()
+        assert html == render_to_string("emails/candidate_registration.html", CONTEXT)
+        assert text == render_to_string("emails/candidate_registration.txt", CONTEXT)
+        assert "João Silva" in text
+
+    def test_debug_bypasses_registry(self, settings):
+        """Test edited templates are picked up in development."""
+        settings.DEBUG = True
+
+        assert load_email_templates() == 0
+        render_email("candidate_registration", CONTEXT)
+        assert email_templates._registry == {}
+
+    def test_template_exists(self):
+        """Test both versions of a template are required."""
+        assert email_template_exists("campaign")
+        assert not email_template_exists("base")
+        assert not email_template_exists("missing")
@@ -0,0 +1,165 @@
+"""
+Tests for the pooled email connection and batched sending.
+"""
+
+import smtplib
+from unittest.mock import patch
+
+import pytest
+from redis.exceptions import RedisError
+
+from core.models import EmailLog
+from core.tasks import flush_email_outbox
+from core.utils import mail
+from core.utils.mail import FLUSH_LOCK_KEY, FLUSH_SCHEDULED_KEY, OUTBOX_KEY, PROCESSING_KEY
+
+
+@pytest.fixture(autouse=True)
+def pooled_connection(settings):
+    """Fresh pooled connection on the in-memory backend."""
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    mail.reset_mail_connection()
+    yield
+    mail.reset_mail_connection()
+
+
+def registration(recipient: str) -> dict:
+    return {
+        "template_name": "candidate_registration",
+        "context": {"candidate_name": "João", "email": recipient, "dashboard_url": "https://x"},
+        "recipient_email": recipient,
+        "subject": "Bem-vindo ao TalentBase!",
+    }
+
+
+class TestPooledConnection:
+    """Tests for get_mail_connection and send_message."""
+
+    def test_connection_is_reused(self):
+        """Test messages share one open connection."""
+        assert mail.get_mail_connection() is mail.get_mail_connection()
+
+    def test_connection_rebuilt_when_idle_or_backend_changes(self, settings):
+        """Test stale connections are replaced instead of reused."""
+        first = mail.get_mail_connection()
+
+        settings.EMAIL_CONNECTION_MAX_IDLE = -1
+        assert mail.get_mail_connection() is not first
+
+        settings.EMAIL_CONNECTION_MAX_IDLE = 30
+        current = mail.get_mail_connection()
+        settings.EMAIL_BACKEND = "django.core.mail.backends.dummy.EmailBackend"
+        assert mail.get_mail_connection() is not current
+
+    def test_reconnects_once_after_disconnect(self, db, mailoutbox):
+        """Test a connection dropped by the server is reopened and the send retried."""
+        email = mail.build_email(**registration("joao@example.com"))
+        original = type(email).send
+        calls = []
+
+        def flaky_send(self, fail_silently=False):
+            calls.append(self.connection)
+            if len(calls) == 1:
+                raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+            return original(self, fail_silently)
+
+        with patch.object(type(email), "send", flaky_send):
+            mail.send_message(email)
+
+        assert len(calls) == 2
+        assert calls[0] is not calls[1]
+        assert len(mailoutbox) == 1
+
+
+@pytest.mark.django_db
+class TestBatchedSending:
+    """Tests for queue_email and flush_email_outbox."""
+
+    def test_queued_emails_flushed_together(self, fake_redis, mailoutbox):
+        """Test a burst is scheduled once and sent in one flush."""
+        with patch("core.tasks.flush_email_outbox.apply_async") as schedule:
+            for i in range(3):
+                mail.queue_email(**registration(f"user{i}@example.com"))
+
+        schedule.assert_called_once()
+        assert fake_redis.llen(OUTBOX_KEY) == 3
+
+        assert flush_email_outbox() == {"sent": 3, "failed": 0}
+
+        assert sorted(m.to[0] for m in mailoutbox) == [f"user{i}@example.com" for i in range(3)]
+        assert EmailLog.objects.filter(status="sent").count() == 3
+        assert not fake_redis.exists(OUTBOX_KEY)
+        assert not fake_redis.exists(PROCESSING_KEY)
+        assert not fake_redis.exists(FLUSH_SCHEDULED_KEY)
+
+    def test_crashed_flush_loses_nothing(self, fake_redis, mailoutbox):
+        """Test a batch claimed by a flush that dies is sent by the next flush."""
+        with patch("core.tasks.flush_email_outbox.apply_async"):
+            for i in range(2):
+                mail.queue_email(**registration(f"user{i}@example.com"))
+
+        with patch("core.tasks.send_email_batch", side_effect=RuntimeError("worker lost")):
+            with pytest.raises(RuntimeError):
+                flush_email_outbox()
+
+        assert fake_redis.llen(PROCESSING_KEY) == 2
+        assert not fake_redis.exists(FLUSH_LOCK_KEY)
+
+        assert flush_email_outbox() == {"sent": 2, "failed": 0}
+        assert len(mailoutbox) == 2
+        assert not fake_redis.exists(PROCESSING_KEY)
+
+    def test_one_flush_at_a_time(self, fake_redis, mailoutbox):
+        """Test a flush leaves the outbox alone while another one is draining it."""
+        with patch("core.tasks.flush_email_outbox.apply_async"):
+            mail.queue_email(**registration("joao@example.com"))
+        fake_redis.set(FLUSH_LOCK_KEY, "other-task")
+
+        assert flush_email_outbox() == {"sent": 0, "failed": 0}
+        assert fake_redis.llen(OUTBOX_KEY) == 1
+        assert mailoutbox == []
+
+    def test_failed_message_retried_alone(self, mailoutbox):
+        """Test one failing message is handed to send_email_task; the rest go out."""
+        messages = [registration("ok@example.com"), registration("bad@example.com")]
+        original = mail.send_message
+
+        def send(email):
+            if email.to == ["bad@example.com"]:
+                raise smtplib.SMTPRecipientsRefused({})
+            original(email)
+
+        with (
+            patch("core.utils.mail.send_message", side_effect=send),
+            patch("core.tasks.send_email_task.apply_async") as retry,
+        ):
+            result = mail.send_email_batch(messages)
+
+        assert result == {"sent": 1, "failed": 1}
+        assert [m.to[0] for m in mailoutbox] == ["ok@example.com"]
+        assert retry.call_args.kwargs["kwargs"]["recipient_email"] == "bad@example.com"
+
+
+@pytest.mark.django_db
+class TestProviderRateLimit:
+    """Tests for the provider token bucket in send_email_batch."""
+
+    def test_batch_waits_for_tokens(self, settings, mailoutbox):
+        """Test a batch larger than the per-second rate waits for the bucket to refill."""
+        settings.EMAIL_RATE_LIMIT_PER_SECOND = 2
+        messages = [registration(f"user{i}@example.com") for i in range(5)]
+
+        with patch("core.utils.mail.time.sleep") as sleep:
+            with patch("core.utils.mail.consume_token", side_effect=[0, 0.5, 0, 0]) as bucket:
+                assert mail.send_email_batch(messages)["sent"] == 5
+
+        assert [c.kwargs["cost"] for c in bucket.call_args_list] == [2, 2, 2, 1]
+        sleep.assert_called_once_with(0.5)
+        assert len(mailoutbox) == 5
+
+    def test_sends_unthrottled_without_redis(self, mailoutbox):
+        """Test sending fails open when the bucket is unavailable."""
+        with patch("core.utils.mail.consume_token", side_effect=RedisError("down")):
+            assert mail.send_email_batch([registration("joao@example.com")])["sent"] == 1
+
+        assert len(mailoutbox) == 1
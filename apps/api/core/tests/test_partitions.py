@@ -0,0 +1,173 @@
+"""
+Tests for monthly EmailLog partitions and the retention policy.
+
+PostgreSQL statements are checked on an unconnected PostgreSQL connection
+whose cursor records the SQL; the suite itself runs on SQLite, where the
+retention policy falls back to batched deletes.
+"""
+
+from datetime import UTC, date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.db import connection
+from django.db.backends.postgresql.base import DatabaseWrapper
+
+from core.models import EmailLog
+from core.utils import partitions
+from core.utils.email_log import apply_email_log_retention, log_email
+from core.utils.partitions import (
+    add_months,
+    create_default_partition_sql,
+    create_partition_sql,
+    drop_partitions_before,
+    ensure_partitions,
+    month_start,
+    partition_month,
+    partition_table,
+    unpartition_table,
+)
+
+TABLE = "core_emaillog"
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def pg():
+    """PostgreSQL connection that records executed SQL instead of connecting."""
+    wrapper = DatabaseWrapper(
+        {**connection.settings_dict, "ENGINE": "django.db.backends.postgresql", "NAME": "x"},
+        alias="pg",
+    )
+    cursor = MagicMock()
+    cursor.fetchone.return_value = None
+    wrapper.cursor = MagicMock()
+    wrapper.cursor.return_value.__enter__.return_value = cursor
+    wrapper.executed = lambda: [c.args[0] for c in cursor.execute.call_args_list]
+    return wrapper
+
+
+class TestMonthlyPartitions:
+    """Tests for core.utils.partitions."""
+
+    def test_month_arithmetic(self):
+        """Test months roll over years in both directions, in UTC."""
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -13) == date(2024, 12, 1)
+        assert month_start(datetime(2026, 10, 31, 23, 30, tzinfo=UTC)) == date(2026, 10, 1)
+        assert partition_month(TABLE, "core_emaillog_p2026_10") == date(2026, 10, 1)
+        assert partition_month(TABLE, "core_emaillog_default") is None
+
+    def test_create_partition_sql(self, pg):
+        """Test a partition covers exactly one UTC month."""
+        assert create_partition_sql(pg, TABLE, date(2026, 12, 1)) == (
+            'CREATE TABLE IF NOT EXISTS "core_emaillog_p2026_12" PARTITION OF "core_emaillog" '
+            "FOR VALUES FROM ('2026-12-01 00:00:00+00') TO ('2027-01-01 00:00:00+00')"
+        )
+
+    def test_create_default_partition_sql(self, pg):
+        """Test rows no month covers have a DEFAULT partition to go to."""
+        assert create_default_partition_sql(pg, TABLE) == (
+            'CREATE TABLE IF NOT EXISTS "core_emaillog_default" '
+            'PARTITION OF "core_emaillog" DEFAULT'
+        )
+
+    def test_ensure_partitions_creates_missing_months(self, pg):
+        """Test only the missing months up to the horizon are created."""
+        existing = ["core_emaillog_default", "core_emaillog_p2026_10"]
+        with (
+            patch.object(partitions, "is_partitioned", return_value=True),
+            patch.object(partitions, "list_partitions", return_value=existing),
+            patch.object(partitions, "partition_column", return_value="created_at"),
+            patch("django.utils.timezone.now", return_value=NOW),
+        ):
+            created = ensure_partitions(pg, TABLE, months_ahead=2)
+
+        assert created == ["core_emaillog_p2026_11", "core_emaillog_p2026_12"]
+        assert [sql.split()[0] for sql in pg.executed()] == ["SELECT", "CREATE", "SELECT", "CREATE"]
+
+    def test_ensure_partitions_creates_default(self, pg):
+        """Test a missing DEFAULT partition is created first."""
+        with (
+            patch.object(partitions, "is_partitioned", return_value=True),
+            patch.object(partitions, "list_partitions", return_value=[]),
+            patch("django.utils.timezone.now", return_value=NOW),
+        ):
+            created = ensure_partitions(pg, TABLE, months_ahead=0)
+
+        assert created == ["core_emaillog_default", "core_emaillog_p2026_10"]
+        assert pg.executed()[0] == create_default_partition_sql(pg, TABLE)
+
+    def test_ensure_partitions_moves_rows_out_of_default(self, pg):
+        """Test rows that landed in DEFAULT while a month was missing move to it."""
+        pg.cursor.return_value.__enter__.return_value.fetchone.return_value = (1,)
+        with (
+            patch.object(partitions, "is_partitioned", return_value=True),
+            patch.object(partitions, "list_partitions", return_value=["core_emaillog_default"]),
+            patch.object(partitions, "partition_column", return_value="created_at"),
+            patch.object(partitions.transaction, "atomic") as atomic,
+            patch("django.utils.timezone.now", return_value=NOW),
+        ):
+            created = ensure_partitions(pg, TABLE, months_ahead=0)
+
+        assert created == ["core_emaillog_p2026_10"]
+        atomic.assert_called_once_with(using="pg")
+        month = (
+            "\"created_at\" >= '2026-10-01 00:00:00+00' "
+            "AND \"created_at\" < '2026-11-01 00:00:00+00'"
+        )
+        assert pg.executed() == [
+            f'SELECT 1 FROM "core_emaillog_default" WHERE {month} LIMIT 1',
+            'ALTER TABLE "core_emaillog" DETACH PARTITION "core_emaillog_default"',
+            create_partition_sql(pg, TABLE, date(2026, 10, 1)),
+            f'INSERT INTO "core_emaillog" SELECT * FROM "core_emaillog_default" WHERE {month}',
+            f'DELETE FROM "core_emaillog_default" WHERE {month}',
+            'ALTER TABLE "core_emaillog" ATTACH PARTITION "core_emaillog_default" DEFAULT',
+        ]
+
+    def test_drop_partitions_before_cutoff(self, pg):
+        """Test expired months are detached and dropped; others are kept."""
+        existing = [
+            "core_emaillog_default",
+            "core_emaillog_p2025_09",
+            "core_emaillog_p2025_10",
+            "core_emaillog_p2026_10",
+        ]
+        with (
+            patch.object(partitions, "is_partitioned", return_value=True),
+            patch.object(partitions, "list_partitions", return_value=existing),
+            patch.object(partitions, "partition_column", return_value="created_at"),
+        ):
+            dropped = drop_partitions_before(pg, TABLE, date(2025, 10, 1))
+
+        assert dropped == ["core_emaillog_p2025_09"]
+        assert pg.executed() == [
+            'ALTER TABLE "core_emaillog" DETACH PARTITION "core_emaillog_p2025_09"',
+            'DROP TABLE "core_emaillog_p2025_09"',
+            'DELETE FROM "core_emaillog_default" WHERE "created_at" < \'2025-10-01 00:00:00+00\'',
+        ]
+
+    def test_partition_table_is_noop_on_sqlite(self):
+        """Test the migration helpers leave non-PostgreSQL databases alone."""
+        assert partition_table(connection, TABLE, "created_at", months_ahead=3) is False
+        assert unpartition_table(connection, TABLE) is False
+
+
+@pytest.mark.django_db
+class TestEmailLogRetention:
+    """Tests for apply_email_log_retention without partitions."""
+
+    def test_deletes_rows_older_than_retention(self, settings):
+        """Test the current month plus the retention window are kept."""
+        settings.EMAIL_LOG_RETENTION_MONTHS = 1
+        for created_at in (datetime(2026, 8, 31, tzinfo=UTC), NOW.replace(day=1)):
+            log = log_email("joao@example.com", "Assunto", "campaign", "sent")
+            EmailLog.objects.filter(id=log.id).update(created_at=created_at)
+        kept = log_email("ana@example.com", "Assunto", "campaign", "sent")
+        EmailLog.objects.filter(id=kept.id).update(created_at=datetime(2026, 9, 1, tzinfo=UTC))
+
+        with patch("django.utils.timezone.now", return_value=NOW):
+            result = apply_email_log_retention()
+
+        assert result == {"created": [], "dropped": [], "deleted": 1}
+        assert EmailLog.objects.count() == 2
@@ -0,0 +1,233 @@
+"""
+Tests for EmailLog partitioning against a real PostgreSQL database.
+
+The partition helpers and migration 0005 rewrite tables with PostgreSQL-only
+DDL, which the SQLite suite cannot execute. These tests run on the optional
+"postgres" test database (settings.test, enabled by TEST_POSTGRES_DB, as in
+CI) and are skipped without it.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.conf import settings
+from django.db import IntegrityError, connections, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.utils import timezone
+
+from core.utils.partitions import (
+    add_months,
+    default_partition_name,
+    ensure_partitions,
+    is_partitioned,
+    list_partitions,
+    month_start,
+    partition_name,
+    partition_table,
+    unpartition_table,
+)
+
+pytestmark = [
+    pytest.mark.skipif(
+        "postgres" not in settings.DATABASES, reason="TEST_POSTGRES_DB is not configured"
+    ),
+    pytest.mark.django_db(databases=["postgres"], transaction=True),
+]
+
+TABLE = "core_emaillog"
+BEFORE = ("core", "0004_email_campaigns")
+AFTER = ("core", "0005_partition_email_log")
+
+
+@pytest.fixture
+def pg():
+    return connections["postgres"]
+
+
+@pytest.fixture
+def migrate(pg):
+    """Migrate the postgres test database; it is migrated back to the latest state afterwards."""
+    executor = MigrationExecutor(pg)
+
+    def run(target):
+        executor.loader.build_graph()
+        executor.migrate([target])
+        executor.loader.build_graph()
+        return executor.loader.project_state(target).apps
+
+    yield run
+    executor.loader.build_graph()
+    executor.migrate(executor.loader.graph.leaf_nodes())
+
+
+def rows(pg, table):
+    with pg.cursor() as cursor:
+        cursor.execute(f"SELECT * FROM {table} ORDER BY 1")
+        return cursor.fetchall()
+
+
+def primary_key(pg, table):
+    with pg.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = to_regclass(%s) AND contype = 'p'",
+            [table],
+        )
+        return cursor.fetchone()[0]
+
+
+def constraint_names(pg, table):
+    with pg.cursor() as cursor:
+        cursor.execute(
+            "SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+            [table],
+        )
+        foreign_keys = {row[0] for row in cursor.fetchall()}
+        cursor.execute(
+            "SELECT indexrelid::regclass::text FROM pg_index "
+            "WHERE indrelid = to_regclass(%s) AND NOT indisprimary",
+            [table],
+        )
+        return foreign_keys, {row[0] for row in cursor.fetchall()}
+
+
+class TestEmailLogMigration:
+    """Tests for migration 0005 on a table holding rows."""
+
+    def test_migrates_rows_both_ways(self, pg, migrate):
+        """Test rows, indexes and foreign keys survive partitioning and its reversal."""
+        apps = migrate(BEFORE)
+        EmailCampaign = apps.get_model("core", "EmailCampaign")
+        EmailLog = apps.get_model("core", "EmailLog")
+        campaign = EmailCampaign.objects.using("postgres").create(
+            name="Boas-vindas", template_name="welcome", subject="Olá"
+        )
+        now = timezone.now()
+        for months_ago in (14, 2, 0):
+            log = EmailLog.objects.using("postgres").create(
+                recipient=f"joao{months_ago}@example.com",
+                subject="Olá",
+                template_name="welcome",
+                status="sent",
+                campaign=campaign,
+            )
+            EmailLog.objects.using("postgres").filter(id=log.id).update(
+                created_at=now - timedelta(days=31 * months_ago)
+            )
+        before = rows(pg, TABLE)
+        foreign_keys, indexes = constraint_names(pg, TABLE)
+
+        apps = migrate(AFTER)
+
+        assert is_partitioned(pg, TABLE)
+        assert rows(pg, TABLE) == before
+        assert primary_key(pg, TABLE) == "PRIMARY KEY (id, created_at)"
+        EmailLog = apps.get_model("core", "EmailLog")
+        assert constraint_names(pg, TABLE)[0] == foreign_keys
+        assert {index.name for index in EmailLog._meta.indexes} <= constraint_names(pg, TABLE)[1]
+        oldest = month_start(now - timedelta(days=31 * 14))
+        last = add_months(month_start(now), settings.EMAIL_LOG_PARTITIONS_AHEAD)
+        partitions = list_partitions(pg, TABLE)
+        assert default_partition_name(TABLE) in partitions
+        assert partition_name(TABLE, oldest) in partitions
+        assert partition_name(TABLE, last) in partitions
+        EmailLog.objects.using("postgres").create(
+            recipient="ana@example.com", subject="Olá", template_name="welcome"
+        )
+        with pytest.raises(IntegrityError), transaction.atomic(using="postgres"):
+            EmailLog.objects.using("postgres").create(
+                recipient="ana@example.com",
+                subject="Olá",
+                template_name="welcome",
+                campaign_id="00000000-0000-0000-0000-000000000000",
+            )
+
+        migrate(BEFORE)
+
+        assert not is_partitioned(pg, TABLE)
+        assert len(rows(pg, TABLE)) == len(before) + 1
+        assert primary_key(pg, TABLE) == "PRIMARY KEY (id)"
+        assert constraint_names(pg, TABLE) == (foreign_keys, indexes)
+
+    def test_next_month_partition_takes_rows_from_default(self, pg, migrate):
+        """Test a month past the horizon lands in DEFAULT and moves to its partition later."""
+        apps = migrate(AFTER)
+        EmailLog = apps.get_model("core", "EmailLog")
+        ahead = settings.EMAIL_LOG_PARTITIONS_AHEAD
+        month = add_months(month_start(timezone.now()), ahead + 1)
+        log = EmailLog.objects.using("postgres").create(
+            recipient="joao@example.com", subject="Olá", template_name="welcome"
+        )
+        EmailLog.objects.using("postgres").filter(id=log.id).update(
+            created_at=timezone.now().replace(year=month.year, month=month.month, day=15)
+        )
+
+        def holder():
+            with pg.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT tableoid::regclass::text FROM {TABLE} WHERE id = %s", [log.id]
+                )
+                return cursor.fetchone()[0]
+
+        assert holder() == default_partition_name(TABLE)
+
+        with transaction.atomic(using="postgres"):
+            created = ensure_partitions(pg, TABLE, months_ahead=ahead + 1)
+
+        assert created == [partition_name(TABLE, month)]
+        assert holder() == partition_name(TABLE, month)
+        assert EmailLog.objects.using("postgres").filter(id=log.id).exists()
+
+
+@pytest.fixture
+def events(pg):
+    """Scratch tables for id column layouts EmailLog does not use."""
+    yield "partition_test_events"
+    with pg.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS partition_test_refs, partition_test_events")
+
+
+class TestIdSequences:
+    """Tests for tables whose ids come from a sequence."""
+
+    @pytest.mark.parametrize("id_column", ["bigserial", "bigint GENERATED BY DEFAULT AS IDENTITY"])
+    def test_ids_continue_after_rebuild(self, pg, events, id_column):
+        """Test new rows keep getting fresh ids after partitioning and its reversal."""
+        with pg.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE {events} (id {id_column} PRIMARY KEY, "
+                "created_at timestamptz NOT NULL DEFAULT now())"
+            )
+            cursor.execute(f"INSERT INTO {events} DEFAULT VALUES")
+            cursor.execute(f"INSERT INTO {events} DEFAULT VALUES")
+
+        def insert():
+            with pg.cursor() as cursor:
+                cursor.execute(f"INSERT INTO {events} DEFAULT VALUES RETURNING id")
+                return cursor.fetchone()[0]
+
+        with transaction.atomic(using="postgres"):
+            assert partition_table(pg, events, "created_at", months_ahead=1)
+        assert insert() == 3
+
+        with transaction.atomic(using="postgres"):
+            assert unpartition_table(pg, events)
+        assert insert() == 4
+        assert [row[0] for row in rows(pg, events)] == [1, 2, 3, 4]
+
+    def test_refuses_referenced_table(self, pg, events):
+        """Test a table other tables reference is left as it is."""
+        with pg.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE {events} (id bigserial PRIMARY KEY, "
+                "created_at timestamptz NOT NULL DEFAULT now())"
+            )
+            cursor.execute(
+                f"CREATE TABLE partition_test_refs (event_id bigint REFERENCES {events} (id))"
+            )
+
+        with pytest.raises(ValueError, match="partition_test_refs"):
+            with transaction.atomic(using="postgres"):
+                partition_table(pg, events, "created_at", months_ahead=1)
+
+        assert not is_partitioned(pg, events)
@@ -0,0 +1,88 @@
+"""
+Tests for signed, cached read URLs.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from core.utils import read_urls
+
+BUCKET = "talentbase-test-uploads"
+PHOTO = f"https://{BUCKET}.s3.amazonaws.com/candidate-photos/a.jpg"
+LOGO = f"https://{BUCKET}.s3.amazonaws.com/candidate-photos/logo.png"
+
+
+@pytest.fixture
+def signed_reads(s3_settings):
+    """Enable signed reads with an empty per-process cache."""
+    s3_settings.AWS_S3_SIGNED_READS = True
+    read_urls.clear_local_cache()
+    yield s3_settings
+    read_urls.clear_local_cache()
+
+
+def count_signatures():
+    """Patch the shared client's presigner, counting calls."""
+    client = read_urls.get_s3_client()
+    return patch.object(client, "generate_presigned_url", wraps=client.generate_presigned_url)
+
+
+def test_disabled_is_pass_through(s3_settings):
+    """Test URLs are untouched while signed reads are off."""
+    payload = {"profile_photo_url": PHOTO}
+
+    assert read_urls.sign_media_payload(payload) is payload
+    assert read_urls.media_etag('"abc"') == '"abc"'
+
+
+def test_signs_only_our_media(signed_reads):
+    """Test bucket URLs get a presigned GET; foreign URLs stay as they are."""
+    youtube = "https://youtube.com/watch?v=abc123"
+
+    signed = read_urls.sign_read_urls([PHOTO, youtube, None])
+
+    assert signed[PHOTO].startswith(f"https://{BUCKET}.s3.amazonaws.com/candidate-photos/a.jpg?")
+    assert "X-Amz-Signature=" in signed[PHOTO]
+    assert "X-Amz-Expires=7200" in signed[PHOTO]
+    assert signed[youtube] == youtube
+
+
+def test_signatures_cached_per_window(signed_reads, fake_redis):
+    """Test each object is signed once per window, shared through Redis."""
+    with count_signatures() as presign:
+        first = read_urls.sign_read_url(PHOTO)
+        assert read_urls.sign_read_url(PHOTO) == first  # local LRU
+
+        read_urls.clear_local_cache()  # another process
+        assert read_urls.sign_read_url(PHOTO) == first  # Redis
+        assert presign.call_count == 1
+
+        with patch.object(read_urls, "current_window", return_value=10**9):
+            read_urls.sign_read_url(PHOTO)
+        assert presign.call_count == 2
+
+
+def test_payload_signed_in_one_batch(signed_reads, fake_redis):
+    """Test nested media URLs are all signed with one Redis round trip."""
+    payload = {
+        "profile_photo_url": PHOTO,
+        "profile_photo_variants": {"webp": {"96": f"{PHOTO}@96.webp"}},
+        "experiences": [{"company_logo_url": LOGO}],
+        "bio": "https://not-a-bucket.example.com",
+    }
+
+    with patch.object(fake_redis, "mget", wraps=fake_redis.mget) as mget:
+        signed = read_urls.sign_media_payload(payload)
+
+    assert mget.call_count == 1
+    assert "X-Amz-Signature=" in signed["profile_photo_url"]
+    assert "X-Amz-Signature=" in signed["profile_photo_variants"]["webp"]["96"]
+    assert "X-Amz-Signature=" in signed["experiences"][0]["company_logo_url"]
+    assert signed["bio"] == payload["bio"]
+
+
+def test_media_etag_rolls_with_window(signed_reads):
+    """Test validators change when signed URLs roll over."""
+    with patch.object(read_urls, "current_window", return_value=5):
+        assert read_urls.media_etag('"abc"') == '"abc-5"'
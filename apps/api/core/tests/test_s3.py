@@ -0,0 +1,106 @@
+"""
+Tests for the shared S3 client.
+"""
+
+import threading
+import time
+
+import pytest
+
+from core.utils import s3
+
+
+def test_client_is_reused(s3_settings):
+    """Test the client is built once per process."""
+    assert s3.get_s3_client() is s3.get_s3_client()
+
+
+def test_client_pool_configuration(s3_settings):
+    """Test the pooled client uses the configured pool size and keep-alive."""
+    config = s3.get_s3_client().meta.config
+
+    assert config.max_pool_connections == s3_settings.AWS_S3_MAX_POOL_CONNECTIONS
+    assert config.tcp_keepalive is True
+    assert config.signature_version == "s3v4"
+
+
+def test_client_rebuilt_in_forked_child(s3_settings, monkeypatch):
+    """Test a process with a different PID gets its own client."""
+    parent_client = s3.get_s3_client()
+
+    monkeypatch.setattr(s3.os, "getpid", lambda: -1)
+
+    assert s3.get_s3_client() is not parent_client
+
+
+def test_concurrent_first_use_builds_one_client(s3_settings):
+    """Test threads racing on first use share a single client."""
+    clients = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        clients.append(s3.get_s3_client())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client in clients}) == 1
+
+
+def test_presigned_url_is_fast_once_warm(s3_settings):
+    """Test presigning reuses the warm client instead of rebuilding one."""
+    s3.generate_presigned_url("photo.jpg", "image/jpeg", "photo")
+
+    started = time.perf_counter()
+    for _ in range(20):
+        result = s3.generate_presigned_url("photo.jpg", "image/jpeg", "photo")
+    per_call = (time.perf_counter() - started) / 20
+
+    assert result["file_url"].startswith("https://talentbase-test-uploads.s3.")
+    assert per_call < 0.01
+
+
+def test_get_s3_key_keeps_folder(s3_settings):
+    """Test keys are extracted with their folder for every bucket URL format."""
+    for url in [
+        "https://talentbase-test-uploads.s3.amazonaws.com/candidate-photos/a.jpg",
+        "https://talentbase-test-uploads.s3.us-east-1.amazonaws.com/candidate-photos/a.jpg",
+        "https://s3.us-east-1.amazonaws.com/talentbase-test-uploads/candidate-photos/a.jpg",
+    ]:
+        assert s3.get_s3_key(url) == "candidate-photos/a.jpg"
+
+    assert s3.get_s3_key("https://evil.com/candidate-photos/a.jpg") is None
+
+
+def test_batch_presigned_urls(s3_settings):
+    """Test a batch signs every file, in order, with per-type limits."""
+    results = s3.generate_presigned_urls(
+        [
+            {"filename": "me.jpg", "content_type": "image/jpeg", "type": "photo"},
+            {"filename": "pitch.mp4", "content_type": "video/mp4", "type": "video"},
+            {"filename": "logo.png", "content_type": "image/png"},
+        ]
+    )
+
+    assert [r["fields"]["key"].split("/")[0] for r in results] == [
+        "candidate-photos",
+        "pitch-videos",
+        "candidate-photos",
+    ]
+    assert results[1]["expires_in"] == s3_settings.VIDEO_PRESIGNED_EXPIRY
+    assert len({r["file_url"] for r in results}) == 3
+
+
+def test_batch_presigned_urls_all_or_nothing(s3_settings):
+    """Test one invalid file fails the whole batch, naming its index."""
+    with pytest.raises(ValueError, match=r"files\[1\]"):
+        s3.generate_presigned_urls(
+            [
+                {"filename": "me.jpg", "content_type": "image/jpeg", "type": "photo"},
+                {"filename": "pitch.mp4", "content_type": "video/mp4", "type": "photo"},
+            ]
+        )
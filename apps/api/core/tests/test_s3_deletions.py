@@ -0,0 +1,104 @@
+"""
+Tests for the deferred, batched S3 deletion outbox.
+"""
+
+from datetime import timedelta
+
+import pytest
+from botocore.stub import Stubber
+from django.utils import timezone
+
+from core.models import PendingS3Deletion
+from core.tasks import drain_s3_deletions
+from core.utils.s3 import get_s3_client, schedule_s3_deletion
+
+BUCKET_URL = "https://talentbase-test-uploads.s3.amazonaws.com"
+
+
+@pytest.fixture
+def s3_stub(s3_settings):
+    """Stub the shared S3 client; every expected call must be made."""
+    with Stubber(get_s3_client()) as stubber:
+        yield stubber
+        stubber.assert_no_pending_responses()
+
+
+def expect_delete(stubber, keys, errors=()):
+    stubber.add_response(
+        "delete_objects",
+        {"Errors": [{"Key": key, "Code": "InternalError", "Message": "boom"} for key in errors]},
+        {
+            "Bucket": "talentbase-test-uploads",
+            "Delete": {"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        },
+    )
+
+
+@pytest.mark.django_db
+class TestScheduleS3Deletion:
+    """Tests for schedule_s3_deletion."""
+
+    def test_queues_keys_of_our_bucket_only(self, s3_settings):
+        """Test foreign URLs and empty values are ignored; duplicates collapse."""
+        queued = schedule_s3_deletion(
+            f"{BUCKET_URL}/candidate-photos/a.jpg",
+            f"{BUCKET_URL}/candidate-photos/a.jpg",
+            "https://evil.com/candidate-photos/b.jpg",
+            None,
+        )
+
+        assert queued == 1
+        assert list(PendingS3Deletion.objects.values_list("key", flat=True)) == [
+            "candidate-photos/a.jpg"
+        ]
+
+    def test_requeue_is_ignored(self, s3_settings):
+        """Test queueing a key twice keeps one row."""
+        schedule_s3_deletion(f"{BUCKET_URL}/pitch-videos/v.mp4")
+        schedule_s3_deletion(f"{BUCKET_URL}/pitch-videos/v.mp4")
+
+        assert PendingS3Deletion.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestDrainS3Deletions:
+    """Tests for the drain_s3_deletions task."""
+
+    def test_deletes_in_batches(self, s3_stub):
+        """Test due keys are deleted with one DeleteObjects call per batch."""
+        keys = [f"candidate-photos/{i}.jpg" for i in range(5)]
+        PendingS3Deletion.objects.bulk_create([PendingS3Deletion(key=key) for key in keys])
+        ordered = list(PendingS3Deletion.objects.values_list("key", flat=True))
+        expect_delete(s3_stub, ordered[:3])
+        expect_delete(s3_stub, ordered[3:])
+
+        assert drain_s3_deletions(batch_size=3) == 5
+        assert not PendingS3Deletion.objects.exists()
+
+    def test_failed_keys_backoff(self, s3_stub):
+        """Test keys S3 could not delete stay queued with backoff."""
+        PendingS3Deletion.objects.create(key="candidate-photos/ok.jpg")
+        PendingS3Deletion.objects.create(key="candidate-photos/bad.jpg")
+        expect_delete(
+            s3_stub,
+            list(PendingS3Deletion.objects.values_list("key", flat=True)),
+            errors=["candidate-photos/bad.jpg"],
+        )
+
+        assert drain_s3_deletions() == 1
+
+        row = PendingS3Deletion.objects.get()
+        assert row.key == "candidate-photos/bad.jpg"
+        assert row.attempts == 1
+        assert "InternalError" in row.last_error
+        assert row.next_attempt_at > timezone.now()
+
+    def test_skips_rows_not_due_or_given_up(self, s3_stub, settings):
+        """Test backed-off and exhausted rows are not retried."""
+        PendingS3Deletion.objects.create(
+            key="later.jpg", next_attempt_at=timezone.now() + timedelta(minutes=5)
+        )
+        PendingS3Deletion.objects.create(key="dead.jpg", attempts=settings.S3_DELETION_MAX_ATTEMPTS)
+
+        assert drain_s3_deletions() == 0
+        assert PendingS3Deletion.objects.count() == 2
@@ -177,7 +177,9 @@ class EmailTaskTests(TestCase):
         Story 2.7 - AC5
         """
         # Arrange - Mock email send to raise exception
-        with patch("core.tasks.EmailMultiAlternatives.send", side_effect=Exception("SMTP error")):
+        with patch(
+            "django.core.mail.EmailMultiAlternatives.send", side_effect=Exception("SMTP error")
+        ):
             # Act - Expect exception in test mode
             with self.assertRaises(Exception):
                 send_email_task.delay(
@@ -270,7 +272,9 @@ class EmailTaskTests(TestCase):
         self.assertEqual(content_type, "text/html")
 
     @override_settings(DEBUG=True)
-    @patch("core.tasks.EmailMultiAlternatives.send", side_effect=Exception("Connection refused"))
+    @patch(
+        "django.core.mail.EmailMultiAlternatives.send", side_effect=Exception("Connection refused")
+    )
     def test_email_failure_in_development_mode(self, mock_send):
         """
         Test email failures in development mode are logged but don't crash.
@@ -0,0 +1,44 @@
+"""
+Tests for video probing helpers.
+"""
+
+import json
+
+import pytest
+
+from core.utils.video import VideoProcessingError, parse_probe
+
+
+class TestParseProbe:
+    """Tests for parse_probe."""
+
+    def test_extracts_duration_and_dimensions(self):
+        """Test duration, size and audio presence are read from ffprobe JSON."""
+        output = json.dumps(
+            {
+                "streams": [
+                    {"codec_type": "video", "width": 1920, "height": 1080},
+                    {"codec_type": "audio"},
+                ],
+                "format": {"duration": "42.123456"},
+            }
+        )
+
+        assert parse_probe(output) == {
+            "duration": 42.12,
+            "width": 1920,
+            "height": 1080,
+            "has_audio": True,
+        }
+
+    def test_audio_only_is_rejected(self):
+        """Test a file without a video stream is not a pitch video."""
+        output = json.dumps({"streams": [{"codec_type": "audio"}], "format": {}})
+
+        with pytest.raises(VideoProcessingError):
+            parse_probe(output)
+
+    def test_garbage_is_rejected(self):
+        """Test unreadable probe output raises VideoProcessingError."""
+        with pytest.raises(VideoProcessingError):
+            parse_probe("not json")
@@ -0,0 +1,151 @@
+"""
+Lean EmailLog writes.
+
+Email sending used to insert a 'pending' row and then save() every column
+again for each status change, i.e. two or three full-row writes per email.
+The helpers here write each attempt once, already in its final state
+(sent, failed or skipped), and batch the rows of bulk sends into one
+INSERT.
+
+Emails that exhaust their retries also get a dead letter (FailedEmail)
+carrying the template context, so they can be re-enqueued later.
+
+apply_email_log_retention() keeps the table bounded: on PostgreSQL, where
+it is partitioned by month (core.utils.partitions), expired months are
+dropped whole; elsewhere old rows are deleted in batches.
+"""
+
+from datetime import UTC, datetime
+from typing import Optional
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from core.utils.partitions import (
+    add_months,
+    drop_partitions_before,
+    ensure_partitions,
+    is_partitioned,
+    month_start,
+)
+
+RETENTION_DELETE_BATCH = 5000
+
+
+def email_log_entry(
+    recipient: str,
+    subject: str,
+    template_name: str,
+    status: str,
+    task_id: Optional[str] = None,
+    error_message: str = "",
+    campaign_id: Optional[str] = None,
+):
+    """
+    Unsaved EmailLog for one send attempt (see log_email / log_emails).
+
+    Args:
+        recipient: Recipient email address
+        subject: Email subject line
+        template_name: Template used
+        status: Final status of the attempt: sent, failed or skipped
+        task_id: Celery task id
+        error_message: Error details for failed/skipped attempts
+        campaign_id: EmailCampaign that sent the email
+    """
+    from core.models import EmailLog
+
+    return EmailLog(
+        recipient=recipient,
+        subject=subject,
+        template_name=template_name,
+        status=status,
+        error_message=error_message,
+        sent_at=timezone.now() if status == "sent" else None,
+        task_id=task_id,
+        campaign_id=campaign_id,
+    )
+
+
+def log_email(*args, **kwargs):
+    """
+    Record one send attempt with a single INSERT.
+
+    Takes the arguments of email_log_entry.
+
+    Returns:
+        EmailLog: The saved row
+    """
+    entry = email_log_entry(*args, **kwargs)
+    entry.save(force_insert=True)
+    return entry
+
+
+def log_emails(entries: list) -> None:
+    """Record the attempts of a batch with one bulk INSERT."""
+    from core.models import EmailLog
+
+    if entries:
+        EmailLog.objects.bulk_create(entries)
+
+
+def dead_letter_email(
+    template_name: str,
+    context: dict,
+    recipient_email: str,
+    subject: str,
+    error_message: str,
+    attempts: int,
+    task_id: Optional[str] = None,
+):
+    """
+    Keep the payload of an email that exhausted its retries (FailedEmail).
+
+    Returns:
+        FailedEmail: The dead letter, ready for review and requeue
+    """
+    from core.models import FailedEmail
+
+    return FailedEmail.objects.create(
+        recipient=recipient_email,
+        subject=subject,
+        template_name=template_name,
+        context=context,
+        error_message=error_message,
+        attempts=attempts,
+        task_id=task_id,
+    )
+
+
+def apply_email_log_retention() -> dict:
+    """
+    Enforce EMAIL_LOG_RETENTION_MONTHS and keep partitions ahead of time.
+
+    Keeps the current month plus EMAIL_LOG_RETENTION_MONTHS full months
+    before it. On a partitioned table the next EMAIL_LOG_PARTITIONS_AHEAD
+    months are created and older months dropped; otherwise older rows are
+    deleted in batches of RETENTION_DELETE_BATCH.
+
+    Returns:
+        dict: {'created': [partitions], 'dropped': [partitions], 'deleted': int}
+    """
+    from core.models import EmailLog
+
+    table = EmailLog._meta.db_table
+    cutoff = add_months(month_start(timezone.now()), -settings.EMAIL_LOG_RETENTION_MONTHS)
+
+    if is_partitioned(connection, table):
+        return {
+            "created": ensure_partitions(connection, table, settings.EMAIL_LOG_PARTITIONS_AHEAD),
+            "dropped": drop_partitions_before(connection, table, cutoff),
+            "deleted": 0,
+        }
+
+    expired = EmailLog.objects.filter(
+        created_at__lt=datetime(cutoff.year, cutoff.month, 1, tzinfo=UTC)
+    )
+    deleted = 0
+    while ids := list(expired.values_list("id", flat=True)[:RETENTION_DELETE_BATCH]):
+        deleted += EmailLog.objects.filter(id__in=ids).delete()[0]
+    return {"created": [], "dropped": [], "deleted": deleted}
@@ -0,0 +1,117 @@
+"""
+Precompiled email templates.
+
+Every email renders two templates (.html and .txt) that extend
+emails/base.html. Instead of resolving and parsing them through the
+template loaders on first use in each worker, load_email_templates()
+compiles everything under templates/emails once when a Celery worker
+process starts (see talentbase.celery), and rendering an email is then a
+dictionary lookup plus context substitution.
+
+With DEBUG on the registry is bypassed so edited templates are picked up
+by the development server.
+"""
+
+import logging
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.template import TemplateDoesNotExist, engines
+
+logger = logging.getLogger(__name__)
+
+EMAIL_TEMPLATE_DIR = "emails"
+EMAIL_TEMPLATE_SUFFIXES = (".html", ".txt")
+
+_registry: dict = {}
+_registry_lock = threading.Lock()
+
+
+def _engine():
+    return engines["django"]
+
+
+def email_template_names() -> list[str]:
+    """Names ('emails/<name>.<ext>') of every email template on disk."""
+    names = set()
+    for directory in _engine().engine.dirs:
+        root = Path(directory) / EMAIL_TEMPLATE_DIR
+        if root.is_dir():
+            names.update(
+                f"{EMAIL_TEMPLATE_DIR}/{path.name}"
+                for path in root.iterdir()
+                if path.suffix in EMAIL_TEMPLATE_SUFFIXES
+            )
+    return sorted(names)
+
+
+def get_email_template(name: str):
+    """
+    Compiled email template, from the registry when possible.
+
+    Args:
+        name: Template path, e.g. 'emails/candidate_registration.html'
+
+    Raises:
+        TemplateDoesNotExist: If there is no such template
+    """
+    template = _registry.get(name)
+    if template is None:
+        template = _engine().get_template(name)
+        if not settings.DEBUG:
+            with _registry_lock:
+                _registry[name] = template
+    return template
+
+
+def load_email_templates() -> int:
+    """
+    Compile every email template into the registry.
+
+    Parent templates (emails/base.html) are compiled too, and stay cached in
+    the engine's loader, so {% extends %} is resolved without reparsing.
+
+    Returns:
+        int: Number of templates compiled
+    """
+    if settings.DEBUG:
+        return 0
+    names = email_template_names()
+    compiled = {name: _engine().get_template(name) for name in names}
+    with _registry_lock:
+        _registry.update(compiled)
+    logger.info(f"Compiled {len(compiled)} email templates")
+    return len(compiled)
+
+
+def clear_email_templates() -> None:
+    """Empty the registry (tests)."""
+    with _registry_lock:
+        _registry.clear()
+
+
+def email_template_exists(template_name: str) -> bool:
+    """True if both the .html and .txt versions of an email template exist."""
+    try:
+        for suffix in EMAIL_TEMPLATE_SUFFIXES:
+            get_email_template(f"{EMAIL_TEMPLATE_DIR}/{template_name}{suffix}")
+    except TemplateDoesNotExist:
+        return False
+    return True
+
+
+def render_email(template_name: str, context: dict) -> tuple[str, str]:
+    """
+    Render an email template.
+
+    Args:
+        template_name: Name without extension, e.g. 'candidate_registration'
+        context: Template variables
+
+    Returns:
+        tuple: (html, text)
+    """
+    html = get_email_template(f"{EMAIL_TEMPLATE_DIR}/{template_name}.html").render(context)
+    text = get_email_template(f"{EMAIL_TEMPLATE_DIR}/{template_name}.txt").render(context)
+    return html, text
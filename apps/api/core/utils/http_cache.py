@@ -0,0 +1,70 @@
+"""
+HTTP caching helpers.
+
+Strong ETags, conditional GET (If-None-Match / If-Modified-Since) and
+Cache-Control headers, so views can answer 304 before running serializers.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a strong ETag from version parts (timestamps, counts, ids).
+
+    Returns:
+        str: Quoted ETag, e.g. '"3f2a..."'
+    """
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def apply_validators(
+    response: HttpResponse, etag: str, last_modified: datetime, **cache_control
+) -> HttpResponse:
+    """
+    Set ETag, Last-Modified and Cache-Control on a response.
+
+    Args:
+        response: Response (200 or 304)
+        etag: Quoted ETag
+        last_modified: Last modification time
+        cache_control: Cache-Control directives (e.g. public=True, s_maxage=60)
+
+    Returns:
+        HttpResponse: The same response
+    """
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified.timestamp())
+    if cache_control:
+        patch_cache_control(response, **cache_control)
+    return response
+
+
+def conditional_response(
+    request, etag: str, last_modified: datetime, **cache_control
+) -> Optional[HttpResponse]:
+    """
+    Answer a conditional GET without rendering the body.
+
+    Args:
+        request: Django or DRF request
+        etag: Current quoted ETag of the resource
+        last_modified: Current last modification time
+        cache_control: Cache-Control directives for the 304
+
+    Returns:
+        HttpResponse: 304 Not Modified if the client copy is current, else None
+    """
+    response = get_conditional_response(
+        request, etag=etag, last_modified=int(last_modified.timestamp())
+    )
+    if response is None:
+        return None
+    return apply_validators(response, etag, last_modified, **cache_control)
@@ -0,0 +1,72 @@
+"""
+Image variant rendering with Pillow.
+
+Turns an uploaded image into fixed-width WebP and JPEG variants for
+responsive <img srcset>. Pillow releases the GIL while decoding, resizing
+and encoding, so variants are encoded concurrently on a small thread pool
+(the Celery prefork pool already spreads images across processes; its
+daemonic workers cannot start process pools of their own).
+"""
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from PIL import Image, ImageOps
+
+FORMATS = {
+    "webp": ("WEBP", "image/webp", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", "image/jpeg", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+
+def _encode(image: Image.Image, width: int, fmt: str) -> bytes:
+    """Resize (never upscale) and encode one variant."""
+    pil_format, _, options = FORMATS[fmt]
+    variant = image.copy()
+    if variant.width > width:
+        height = max(1, round(variant.height * width / variant.width))
+        variant = variant.resize((width, height), Image.Resampling.LANCZOS)
+
+    if fmt == "jpeg" and variant.mode != "RGB":
+        # JPEG has no alpha: flatten transparent images onto white
+        background = Image.new("RGB", variant.size, "white")
+        background.paste(variant, mask=variant.getchannel("A") if "A" in variant.mode else None)
+        variant = background
+
+    buffer = io.BytesIO()
+    variant.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+def render_image_variants(data: bytes, widths: tuple[int, ...]) -> dict[tuple[str, int], bytes]:
+    """
+    Render WebP and JPEG variants of an image at fixed widths.
+
+    EXIF orientation is applied and metadata dropped. Widths larger than the
+    source are rendered at the source width.
+
+    Args:
+        data: Source image bytes (JPEG/PNG/WebP)
+        widths: Target widths in pixels
+
+    Returns:
+        dict: {(format, width): encoded bytes} for format in FORMATS
+
+    Raises:
+        PIL.UnidentifiedImageError: If data is not an image
+        PIL.Image.DecompressionBombError: If the image is absurdly large
+
+    Example:
+        >>> variants = render_image_variants(photo_bytes, (96, 256))
+        >>> variants[("webp", 96)][:4]
+        b'RIFF'
+    """
+    with Image.open(io.BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+    jobs = [(width, fmt) for width in widths for fmt in FORMATS]
+    with ThreadPoolExecutor(max_workers=settings.MEDIA_PROCESSING_THREADS) as pool:
+        encoded = pool.map(lambda job: _encode(image, *job), jobs)
+        return {(fmt, width): content for (width, fmt), content in zip(jobs, encoded, strict=True)}
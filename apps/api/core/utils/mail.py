@@ -0,0 +1,281 @@
+"""
+Pooled SMTP connection and batched email sending.
+
+Opening an SMTP connection to SendGrid/SES means TCP + STARTTLS + AUTH,
+which dominates the cost of sending one message. Each worker process keeps
+one connection open (get_mail_connection) and every email task sends over
+it, reconnecting when the server has dropped it.
+
+Notifications that come in bursts (e.g. admins approving companies) go
+one step further: queue_email() appends messages to a Redis outbox and
+schedules flush_email_outbox a moment later, which drains the outbox in
+batches of EMAIL_BATCH_SIZE over that single connection. Claimed batches
+are moved to a processing list and removed only once sent, so a flush
+that dies mid-batch loses nothing: the next flush puts them back.
+Messages that fail in a batch are handed to send_email_task, which retries
+them individually with backoff. Batches share a token bucket sized to the
+provider's sending rate (EMAIL_RATE_LIMIT_PER_SECOND) across all workers.
+"""
+
+import json
+import logging
+import os
+import smtplib
+import threading
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import DatabaseError
+from redis.exceptions import RedisError
+
+from core.utils.email_log import email_log_entry, log_emails
+from core.utils.email_templates import render_email
+from core.utils.rate_limit import consume_token
+from core.utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_KEY = "email:outbox"
+PROCESSING_KEY = "email:outbox:processing"
+RATE_LIMIT_KEY = "ratelimit:email:provider"
+FLUSH_SCHEDULED_KEY = "email:outbox:scheduled"
+FLUSH_LOCK_KEY = "email:outbox:flushing"
+# Seconds a flush may go without finishing a batch before another takes over
+FLUSH_LOCK_TTL = 300
+
+_connection = None
+_connection_owner: Optional[tuple[int, str]] = None
+_connection_used_at = 0.0
+_connection_lock = threading.RLock()
+
+
+def get_mail_connection():
+    """
+    Get the process-wide email connection, opened once and kept open.
+
+    The connection is rebuilt in forked children, when EMAIL_BACKEND
+    changes, and after EMAIL_CONNECTION_MAX_IDLE seconds without use
+    (servers close idle sessions; reconnecting up front is cheaper than
+    failing the next send).
+
+    Returns:
+        BaseEmailBackend: Open connection for EmailMessage(connection=...)
+    """
+    global _connection, _connection_owner, _connection_used_at
+
+    owner = (os.getpid(), settings.EMAIL_BACKEND)
+    now = time.monotonic()
+    with _connection_lock:
+        if _connection is not None and (
+            _connection_owner != owner
+            or now - _connection_used_at > settings.EMAIL_CONNECTION_MAX_IDLE
+        ):
+            _close_connection()
+        if _connection is None:
+            _connection = get_connection(fail_silently=False)
+            _connection.open()
+            _connection_owner = owner
+        _connection_used_at = now
+        return _connection
+
+
+def _close_connection() -> None:
+    global _connection, _connection_owner
+    if _connection is not None and _connection_owner and _connection_owner[0] == os.getpid():
+        try:
+            _connection.close()
+        except Exception:
+            pass  # Closing a dead connection
+    _connection = None
+    _connection_owner = None
+
+
+def reset_mail_connection() -> None:
+    """Close and drop the pooled connection."""
+    with _connection_lock:
+        _close_connection()
+
+
+def send_message(message: EmailMultiAlternatives) -> None:
+    """
+    Send one message over the pooled connection.
+
+    Reconnects and retries once if the server dropped the connection.
+
+    Raises:
+        Exception: If sending fails (after one reconnect)
+    """
+    with _connection_lock:
+        message.connection = get_mail_connection()
+        try:
+            message.send(fail_silently=False)
+        except smtplib.SMTPServerDisconnected:
+            reset_mail_connection()
+            message.connection = get_mail_connection()
+            message.send(fail_silently=False)
+
+
+def build_email(
+    template_name: str, context: dict, recipient_email: str, subject: str
+) -> EmailMultiAlternatives:
+    """Render a templated HTML + plain text email (see core.utils.email_templates)."""
+    html_content, text_content = render_email(template_name, context)
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body=text_content,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[recipient_email],
+    )
+    email.attach_alternative(html_content, "text/html")
+    return email
+
+
+def queue_email(template_name: str, context: dict, recipient_email: str, subject: str) -> None:
+    """
+    Queue a templated email for batched sending.
+
+    Same arguments as send_email_task. Falls back to send_email_task if
+    Redis is unavailable. Context must be JSON-serializable.
+    """
+    from core.tasks import flush_email_outbox, send_email_task
+
+    message = {
+        "template_name": template_name,
+        "context": context,
+        "recipient_email": recipient_email,
+        "subject": subject,
+    }
+    try:
+        redis = get_redis_client()
+        redis.rpush(OUTBOX_KEY, json.dumps(message))
+        scheduled = redis.set(FLUSH_SCHEDULED_KEY, 1, nx=True, ex=settings.EMAIL_BATCH_DELAY + 60)
+    except RedisError as e:
+        logger.warning(f"Email outbox unavailable, sending directly: {e}")
+        send_email_task.delay(**message)
+        return
+
+    if scheduled:
+        flush_email_outbox.apply_async(countdown=settings.EMAIL_BATCH_DELAY)
+
+
+def claim_outbox(count: int) -> list[str]:
+    """
+    Move up to `count` queued messages to the processing list.
+
+    Returns:
+        list: Raw (JSON) messages, to pass to ack_outbox once sent
+    """
+    pipe = get_redis_client().pipeline(transaction=False)
+    for _ in range(count):
+        pipe.lmove(OUTBOX_KEY, PROCESSING_KEY, "LEFT", "RIGHT")
+    return [item for item in pipe.execute() if item is not None]
+
+
+def ack_outbox(items: list[str]) -> None:
+    """Drop sent messages (as returned by claim_outbox) from the processing list."""
+    pipe = get_redis_client().pipeline(transaction=False)
+    for item in items:
+        pipe.lrem(PROCESSING_KEY, 1, item)
+    pipe.execute()
+
+
+def requeue_unacked() -> int:
+    """
+    Put messages left in the processing list by a dead flush back on the outbox.
+
+    Only safe while holding FLUSH_LOCK_KEY (no other flush is sending them).
+
+    Returns:
+        int: Number of messages put back
+    """
+    redis = get_redis_client()
+    count = 0
+    while redis.lmove(PROCESSING_KEY, OUTBOX_KEY, "RIGHT", "LEFT") is not None:
+        count += 1
+    return count
+
+
+def throttle_sending(count: int) -> None:
+    """
+    Wait until the provider token bucket allows `count` more emails.
+
+    The bucket holds one second of sending (EMAIL_RATE_LIMIT_PER_SECOND)
+    and is shared by every worker; if Redis is down sending is not throttled.
+    """
+    capacity = settings.EMAIL_RATE_LIMIT_PER_SECOND
+    while count > 0:
+        cost = min(count, capacity)
+        try:
+            wait = consume_token(RATE_LIMIT_KEY, capacity, 1, cost=cost)
+        except RedisError as e:
+            logger.warning(f"Email rate limit skipped: {e}")
+            return
+        if wait:
+            time.sleep(wait)
+            continue
+        count -= cost
+
+
+def send_email_batch(
+    messages: list[dict], task_id: Optional[str] = None, campaign_id: Optional[str] = None
+) -> dict:
+    """
+    Send templated emails over the pooled connection, logging them in bulk.
+
+    Sending is throttled to the provider rate (see throttle_sending). A
+    failed message does not stop the batch: it is handed to send_email_task
+    (with the campaign), which retries it on its own with backoff and logs it.
+
+    Args:
+        messages: [{'template_name', 'context', 'recipient_email', 'subject'}]
+        task_id: Celery task id recorded on the EmailLog rows
+        campaign_id: EmailCampaign recorded on the EmailLog rows
+
+    Returns:
+        dict: {'sent': int, 'failed': int (handed to send_email_task)}
+    """
+    from core.tasks import send_email_task
+
+    logs = []
+    failed = 0
+    for index, message in enumerate(messages):
+        if index % settings.EMAIL_RATE_LIMIT_PER_SECOND == 0:
+            throttle_sending(min(settings.EMAIL_RATE_LIMIT_PER_SECOND, len(messages) - index))
+        try:
+            send_message(
+                build_email(
+                    message["template_name"],
+                    message["context"],
+                    message["recipient_email"],
+                    message["subject"],
+                )
+            )
+        except Exception as e:
+            failed += 1
+            logger.warning(
+                f"Batched email to {message['recipient_email']} failed, retrying alone: {e}"
+            )
+            send_email_task.apply_async(
+                kwargs={**message, "campaign_id": campaign_id}, countdown=60
+            )
+            continue
+        logs.append(
+            email_log_entry(
+                message["recipient_email"],
+                message["subject"],
+                message["template_name"],
+                "sent",
+                task_id=task_id,
+                campaign_id=campaign_id,
+            )
+        )
+
+    try:
+        log_emails(logs)
+    except DatabaseError:
+        # The emails went out: resending them would be worse than a missing log
+        logger.exception(f"Could not log {len(logs)} sent emails")
+    logger.info(f"Email batch: {len(logs)} sent, {failed} handed to retry")
+    return {"sent": len(logs), "failed": failed}
@@ -0,0 +1,355 @@
+"""
+Monthly range partitions for append-only tables (PostgreSQL).
+
+A partitioned table is split into one child table per calendar month of
+its timestamp column (named <table>_pYYYY_MM, bounds in UTC). Queries
+filtered or ordered by that column only touch the months they need, each
+partition has small indexes, and retention is a metadata operation: old
+months are detached and dropped instead of deleted row by row.
+
+Partitions should exist before rows arrive, so ensure_partitions() creates
+a few months ahead and runs periodically. If that lapses, rows land in the
+DEFAULT partition (<table>_default) instead of failing to insert, and are
+moved to their month when its partition is created. On other databases
+(SQLite in tests) every helper is a no-op and callers fall back to plain
+deletes.
+"""
+
+import re
+from datetime import UTC, date, datetime
+from typing import Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+
+def month_start(value: datetime | date) -> date:
+    """First day of the month of a date or (UTC) datetime."""
+    if isinstance(value, datetime):
+        value = value.astimezone(UTC) if timezone.is_aware(value) else value
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month `months` after (or before, if negative) `month`."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Name of the partition holding `month`, e.g. core_emaillog_p2026_10."""
+    return f"{table}_p{month:%Y_%m}"
+
+
+def partition_month(table: str, name: str) -> Optional[date]:
+    """Month held by a partition named by partition_name (None for others)."""
+    match = re.fullmatch(re.escape(table) + r"_p(\d{4})_(\d{2})", name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def default_partition_name(table: str) -> str:
+    """Name of the DEFAULT partition, holding rows no monthly partition covers."""
+    return f"{table}_default"
+
+
+def supports_partitioning(connection) -> bool:
+    """True on PostgreSQL (declarative partitioning, PostgreSQL 11+)."""
+    return connection.vendor == "postgresql"
+
+
+def is_partitioned(connection, table: str) -> bool:
+    """True if `table` is a partitioned table."""
+    if not supports_partitioning(connection):
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)", [table]
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions(connection, table: str) -> list[str]:
+    """Names of the partitions of `table`."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(%s) ORDER BY child.relname",
+            [table],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def partition_column(connection, table: str) -> str:
+    """Column `table` is partitioned on."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT attribute.attname FROM pg_partitioned_table partitioned "
+            "JOIN pg_attribute attribute ON attribute.attrelid = partitioned.partrelid "
+            "AND attribute.attnum = partitioned.partattrs[0] "
+            "WHERE partitioned.partrelid = to_regclass(%s)",
+            [table],
+        )
+        return cursor.fetchone()[0]
+
+
+def create_partition_sql(connection, table: str, month: date) -> str:
+    """CREATE TABLE statement for the partition holding `month`."""
+    qn = connection.ops.quote_name
+    return (
+        f"CREATE TABLE IF NOT EXISTS {qn(partition_name(table, month))} "
+        f"PARTITION OF {qn(table)} "
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+        f"TO ('{add_months(month, 1).isoformat()} 00:00:00+00')"
+    )
+
+
+def create_default_partition_sql(connection, table: str) -> str:
+    """CREATE TABLE statement for the DEFAULT partition."""
+    qn = connection.ops.quote_name
+    return (
+        f"CREATE TABLE IF NOT EXISTS {qn(default_partition_name(table))} "
+        f"PARTITION OF {qn(table)} DEFAULT"
+    )
+
+
+def _month_condition(connection, column: str, month: date) -> str:
+    qn = connection.ops.quote_name
+    return (
+        f"{qn(column)} >= '{month.isoformat()} 00:00:00+00' "
+        f"AND {qn(column)} < '{add_months(month, 1).isoformat()} 00:00:00+00'"
+    )
+
+
+def _create_partition(connection, cursor, table: str, month: date, column: str) -> None:
+    """
+    Create a monthly partition, moving its rows out of the DEFAULT partition.
+
+    PostgreSQL refuses to create a partition for rows the DEFAULT partition
+    already holds, so those are moved with the DEFAULT partition detached
+    (the parent stays locked until the transaction ends).
+    """
+    qn = connection.ops.quote_name
+    default = qn(default_partition_name(table))
+    condition = _month_condition(connection, column, month)
+
+    cursor.execute(f"SELECT 1 FROM {default} WHERE {condition} LIMIT 1")
+    if cursor.fetchone() is None:
+        cursor.execute(create_partition_sql(connection, table, month))
+        return
+
+    with transaction.atomic(using=connection.alias):
+        cursor.execute(f"ALTER TABLE {qn(table)} DETACH PARTITION {default}")
+        cursor.execute(create_partition_sql(connection, table, month))
+        cursor.execute(f"INSERT INTO {qn(table)} SELECT * FROM {default} WHERE {condition}")
+        cursor.execute(f"DELETE FROM {default} WHERE {condition}")
+        cursor.execute(f"ALTER TABLE {qn(table)} ATTACH PARTITION {default} DEFAULT")
+
+
+def ensure_partitions(
+    connection, table: str, months_ahead: int, start: Optional[date] = None
+) -> list[str]:
+    """
+    Create the partitions from `start` (default: this month) to `months_ahead` months ahead.
+
+    Also creates the DEFAULT partition if it is missing.
+
+    Returns:
+        list: Names of the partitions created
+    """
+    if not is_partitioned(connection, table):
+        return []
+
+    existing = set(list_partitions(connection, table))
+    default = default_partition_name(table)
+    column = partition_column(connection, table) if default in existing else None
+    month = month_start(start or timezone.now())
+    last = add_months(month_start(timezone.now()), months_ahead)
+    created = []
+    with connection.cursor() as cursor:
+        if default not in existing:
+            cursor.execute(create_default_partition_sql(connection, table))
+            created.append(default)
+        while month <= last:
+            name = partition_name(table, month)
+            if name not in existing:
+                if column:
+                    _create_partition(connection, cursor, table, month, column)
+                else:
+                    # A DEFAULT partition created just now is still empty
+                    cursor.execute(create_partition_sql(connection, table, month))
+                created.append(name)
+            month = add_months(month, 1)
+    return created
+
+
+def drop_partitions_before(connection, table: str, cutoff: date) -> list[str]:
+    """
+    Detach and drop the partitions of months before `cutoff`.
+
+    Expired rows in the DEFAULT partition are deleted.
+
+    Returns:
+        list: Names of the partitions dropped
+    """
+    if not is_partitioned(connection, table):
+        return []
+
+    qn = connection.ops.quote_name
+    default = default_partition_name(table)
+    dropped = []
+    partitions = list_partitions(connection, table)
+    with connection.cursor() as cursor:
+        for name in partitions:
+            month = partition_month(table, name)
+            if month is not None and month < cutoff:
+                cursor.execute(f"ALTER TABLE {qn(table)} DETACH PARTITION {qn(name)}")
+                cursor.execute(f"DROP TABLE {qn(name)}")
+                dropped.append(name)
+        if default in partitions:
+            column = partition_column(connection, table)
+            cursor.execute(
+                f"DELETE FROM {qn(default)} "
+                f"WHERE {qn(column)} < '{cutoff.isoformat()} 00:00:00+00'"
+            )
+    return dropped
+
+
+def _referencing_constraints(cursor, table: str) -> list[tuple[str, str]]:
+    """Foreign keys of other tables pointing at `table`, as (name, table) pairs."""
+    cursor.execute(
+        "SELECT conname, conrelid::regclass::text FROM pg_constraint "
+        "WHERE confrelid = to_regclass(%s) AND contype = 'f' AND conrelid <> confrelid",
+        [table],
+    )
+    return cursor.fetchall()
+
+
+def _table_definition(cursor, table: str) -> tuple[list[str], list[tuple[str, str]]]:
+    """CREATE INDEX statements (primary key excepted) and foreign keys of `table`."""
+    cursor.execute(
+        "SELECT pg_get_indexdef(indexrelid) FROM pg_index "
+        "WHERE indrelid = to_regclass(%s) AND NOT indisprimary",
+        [table],
+    )
+    indexes = [row[0] for row in cursor.fetchall()]
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+        [table],
+    )
+    return indexes, cursor.fetchall()
+
+
+def _id_sequence(cursor, table: str) -> tuple[Optional[str], bool]:
+    """Sequence generating `table`.id (None for e.g. UUIDs) and whether id is an identity."""
+    cursor.execute(
+        "SELECT pg_get_serial_sequence(%s, 'id'), attidentity <> '' FROM pg_attribute "
+        "WHERE attrelid = to_regclass(%s) AND attname = 'id'",
+        [table, table],
+    )
+    return cursor.fetchone()
+
+
+def _rebuild_table(connection, table: str, partition_by: Optional[str], months_ahead: int) -> None:
+    """
+    Recreate `table` with its rows, partitioned on `partition_by` or as a regular table.
+
+    Indexes and foreign keys are recreated with their original names, and ids
+    keep counting from where they were: a serial sequence is handed over to
+    the new table, an identity is copied and restarted after the highest id.
+    """
+    qn = connection.ops.quote_name
+    old = f"{table}_{'unpartitioned' if partition_by else 'partitioned'}"
+    with connection.cursor() as cursor:
+        referencing = _referencing_constraints(cursor, table)
+        if referencing:
+            # A partitioned table can only be referenced on (id, partition column)
+            raise ValueError(
+                f"{table} is referenced by "
+                + ", ".join(f"{name} ({source})" for name, source in referencing)
+            )
+        indexes, foreign_keys = _table_definition(cursor, table)
+        sequence, identity = _id_sequence(cursor, table)
+        if partition_by:
+            cursor.execute(f"SELECT min({qn(partition_by)}) FROM {qn(table)}")
+            oldest = cursor.fetchone()[0]
+
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(old)}")
+        cursor.execute(
+            f"CREATE TABLE {qn(table)} (LIKE {qn(old)} "
+            "INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING IDENTITY)"
+            + (f" PARTITION BY RANGE ({qn(partition_by)})" if partition_by else "")
+        )
+
+    if partition_by:
+        ensure_partitions(connection, table, months_ahead, start=oldest)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {qn(table)} SELECT * FROM {qn(old)}")
+        if identity:
+            cursor.execute(
+                f"SELECT setval(pg_get_serial_sequence(%s, 'id'), max({qn('id')})) "
+                f"FROM {qn(table)}",
+                [table],
+            )
+        elif sequence:
+            # The copied default still uses the sequence owned by (and dropped with) `old`
+            cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY {qn(table)}.{qn('id')}")
+        # Dropping the old table frees the index and constraint names
+        cursor.execute(f"DROP TABLE {qn(old)}")
+        key = [qn("id")] + ([qn(partition_by)] if partition_by else [])
+        cursor.execute(
+            f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(table + '_pkey')} "
+            f"PRIMARY KEY ({', '.join(key)})"
+        )
+        # Definitions were read before the rename, so they name `table`; indexes
+        # of a partitioned table read "ON ONLY", which a regular table rejects
+        for definition in indexes:
+            cursor.execute(definition.replace(" ON ONLY ", " ON ", 1))
+        for name, definition in foreign_keys:
+            cursor.execute(f"ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(name)} {definition}")
+
+
+def partition_table(connection, table: str, column: str, months_ahead: int) -> bool:
+    """
+    Convert a regular table into one range-partitioned by month on `column`.
+
+    Rows are copied into monthly partitions covering the oldest row up to
+    `months_ahead` months ahead (later rows go to the DEFAULT partition).
+    The primary key becomes (id, column), as PostgreSQL requires the
+    partition key in unique constraints, so tables referenced by foreign
+    keys of other tables are refused.
+    Meant to run inside a migration (one transaction, table locked).
+
+    Returns:
+        bool: False if nothing was done (not PostgreSQL, or already partitioned)
+
+    Raises:
+        ValueError: If other tables have foreign keys to `table`
+    """
+    if not supports_partitioning(connection) or is_partitioned(connection, table):
+        return False
+    _rebuild_table(connection, table, column, months_ahead)
+    return True
+
+
+def unpartition_table(connection, table: str) -> bool:
+    """
+    Convert a partitioned table back into a regular one (reverses partition_table).
+
+    Rows are copied out of all partitions and the primary key is id again.
+    Meant to run inside a migration (one transaction, table locked).
+
+    Returns:
+        bool: False if nothing was done (not PostgreSQL, or not partitioned)
+
+    Raises:
+        ValueError: If other tables have foreign keys to `table`
+    """
+    if not is_partitioned(connection, table):
+        return False
+    _rebuild_table(connection, table, None, months_ahead=0)
+    return True
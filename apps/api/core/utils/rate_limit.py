@@ -0,0 +1,56 @@
+"""
+Redis token buckets.
+
+A bucket holds up to `capacity` tokens and refills continuously at
+capacity / period tokens per second, so it allows short bursts while
+enforcing an average rate. State is a small Redis hash ({tokens, ts})
+updated under WATCH/MULTI, so concurrent workers never double-spend.
+"""
+
+import math
+import time
+
+from core.utils.redis_client import get_redis_client
+
+
+def consume_token(key: str, capacity: int, period: int, cost: int = 1) -> float:
+    """
+    Take tokens from a bucket.
+
+    Args:
+        key: Redis key of the bucket
+        capacity: Maximum burst size
+        period: Seconds to refill an empty bucket
+        cost: Tokens to take
+
+    Returns:
+        float: 0 if the tokens were taken, otherwise seconds until they are available
+
+    Raises:
+        RedisError: If Redis is unavailable (callers decide whether to fail open)
+
+    Example:
+        >>> consume_token("ratelimit:contact:ip:203.0.113.1", capacity=5, period=3600)
+        0.0
+    """
+    rate = capacity / period
+
+    def attempt(pipe) -> float:
+        now = time.time()
+        state = pipe.hgetall(key)
+        tokens = float(state.get("tokens", capacity))
+        updated = float(state.get("ts", now))
+        tokens = min(capacity, tokens + max(0.0, now - updated) * rate)
+
+        wait = 0.0
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            wait = (cost - tokens) / rate
+
+        pipe.multi()
+        pipe.hset(key, mapping={"tokens": tokens, "ts": now})
+        pipe.expire(key, math.ceil(period))
+        return wait
+
+    return get_redis_client().transaction(attempt, key, value_from_callable=True)
@@ -0,0 +1,244 @@
+"""
+Signed, cached read URLs for private media.
+
+With AWS_S3_SIGNED_READS enabled, media URLs of our bucket are replaced by
+presigned GETs before they leave the API, so objects can be private. A
+presigned URL is pure local signing but still costs an HMAC chain per
+object, which adds up on list pages; signatures are therefore cached per
+object and expiry window:
+
+- time is cut into windows of AWS_S3_READ_URL_TTL seconds;
+- a URL is signed once per window, valid for two windows, so a cached URL
+  always has at least one full window left;
+- signatures are kept in a small per-process LRU and in Redis (shared by
+  every web process), keyed by window and object key.
+
+Since signed URLs roll over every window, conditional-GET validators of
+responses carrying them include the window (see media_etag).
+
+With signing disabled (the default) every helper is a pass-through.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from django.conf import settings
+from redis.exceptions import RedisError
+
+from core.utils.redis_client import get_redis_client
+from core.utils.s3 import get_s3_client, get_s3_key, validate_s3_url
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "s3:read_url:{window}:{key}"
+
+_local_cache: "OrderedDict[tuple[int, str], str]" = OrderedDict()
+_local_lock = threading.Lock()
+
+
+def signing_enabled() -> bool:
+    """True if media URLs are served as presigned GETs."""
+    return settings.AWS_S3_SIGNED_READS
+
+
+def current_window() -> int:
+    """Index of the current expiry window."""
+    return int(time.time() // settings.AWS_S3_READ_URL_TTL)
+
+
+def media_etag(etag: str) -> str:
+    """
+    ETag of a response carrying signed media URLs.
+
+    Adds the signing window so clients refetch (rather than revalidate to
+    304) once the signed URLs in their copy have rolled over.
+    """
+    if not signing_enabled():
+        return etag
+    return f'"{etag.strip(chr(34))}-{current_window()}"'
+
+
+def _local_get(window: int, key: str) -> Optional[str]:
+    with _local_lock:
+        url = _local_cache.get((window, key))
+        if url is not None:
+            _local_cache.move_to_end((window, key))
+        return url
+
+
+def _local_set(window: int, key: str, url: str) -> None:
+    with _local_lock:
+        _local_cache[(window, key)] = url
+        _local_cache.move_to_end((window, key))
+        while len(_local_cache) > settings.AWS_S3_READ_URL_CACHE_SIZE:
+            _local_cache.popitem(last=False)
+
+
+def clear_local_cache() -> None:
+    """Drop the per-process cache (tests)."""
+    with _local_lock:
+        _local_cache.clear()
+
+
+def sign_read_urls(urls: Iterable[Optional[str]]) -> dict[str, str]:
+    """
+    Presigned GET URLs for media URLs, from cache where possible.
+
+    One Redis MGET for the local-cache misses and one pipelined write for
+    the signatures it had to compute, however many URLs are passed.
+
+    Args:
+        urls: Media URLs (None, empty, foreign and already signed URLs are left as is)
+
+    Returns:
+        dict: {url: signed url} for every non-empty input URL
+    """
+    urls = {url for url in urls if url}
+    if not signing_enabled():
+        return {url: url for url in urls}
+
+    keys = {}
+    for url in urls:
+        if "X-Amz-Signature=" not in url and validate_s3_url(url):
+            key = get_s3_key(url)
+            if key:
+                keys[url] = key
+    signed = {url: url for url in urls if url not in keys}
+    if not keys:
+        return signed
+
+    window = current_window()
+    missing = {}
+    for url, key in keys.items():
+        cached = _local_get(window, key)
+        if cached is None:
+            missing[url] = key
+        else:
+            signed[url] = cached
+
+    if missing:
+        redis = get_redis_client()
+        cache_keys = [CACHE_KEY.format(window=window, key=key) for key in missing.values()]
+        try:
+            cached_values = redis.mget(cache_keys)
+        except RedisError as e:
+            logger.warning(f"Read URL cache unavailable: {e}")
+            cached_values = [None] * len(cache_keys)
+
+        fresh = {}
+        s3_client = get_s3_client()
+        ttl = settings.AWS_S3_READ_URL_TTL
+        for (url, key), cache_key, cached in zip(
+            missing.items(), cache_keys, cached_values, strict=True
+        ):
+            if cached is None:
+                cached = s3_client.generate_presigned_url(
+                    "get_object",
+                    Params={"Bucket": settings.AWS_STORAGE_BUCKET_NAME, "Key": key},
+                    ExpiresIn=2 * ttl,
+                )
+                fresh[cache_key] = cached
+            elif isinstance(cached, bytes):
+                cached = cached.decode()
+            _local_set(window, key, cached)
+            signed[url] = cached
+
+        if fresh:
+            try:
+                pipe = redis.pipeline(transaction=False)
+                for cache_key, url in fresh.items():
+                    pipe.set(cache_key, url, ex=ttl)
+                pipe.execute()
+            except RedisError as e:
+                logger.warning(f"Read URL cache unavailable: {e}")
+
+    return signed
+
+
+def sign_read_url(url: Optional[str]) -> Optional[str]:
+    """Presigned GET URL for one media URL (see sign_read_urls)."""
+    if not url:
+        return url
+    return sign_read_urls([url])[url]
+
+
+def unsign_read_url(url: Optional[str]) -> Optional[str]:
+    """
+    Canonical URL of a media URL of ours sent back by a client.
+
+    Clients echo the signed URLs they were served; the query string (the
+    signature) must never be stored, or the URL would no longer name the
+    same object. Other URLs are returned as is.
+    """
+    if not url or not isinstance(url, str) or "?" not in url:
+        return url
+    base = url.split("?", 1)[0]
+    return base if validate_s3_url(base) else url
+
+
+def unsign_media_fields(data: Any, fields: Iterable[str]) -> Any:
+    """
+    Copy of request data with the given media URL fields unsigned.
+
+    Args:
+        data: Request data (dict or QueryDict); anything else is returned as is
+        fields: Names of the media URL fields
+
+    Returns:
+        Request data safe to validate against the model's URL fields
+    """
+    if not hasattr(data, "copy") or not any(field in data for field in fields):
+        return data
+    data = data.copy()
+    for field in fields:
+        if field in data:
+            data[field] = unsign_read_url(data[field])
+    return data
+
+
+def _collect_urls(data: Any, found: set) -> None:
+    if isinstance(data, str):
+        if data.startswith("https://"):
+            found.add(data)
+    elif isinstance(data, dict):
+        for value in data.values():
+            _collect_urls(value, found)
+    elif isinstance(data, list | tuple):
+        for value in data:
+            _collect_urls(value, found)
+
+
+def _replace_urls(data: Any, signed: dict) -> Any:
+    if isinstance(data, str):
+        return signed.get(data, data)
+    if isinstance(data, dict):
+        return {name: _replace_urls(value, signed) for name, value in data.items()}
+    if isinstance(data, list | tuple):
+        return [_replace_urls(value, signed) for value in data]
+    return data
+
+
+def sign_media_payload(data: Any) -> Any:
+    """
+    Sign every media URL of ours found anywhere in a response payload.
+
+    Covers nested structures (experiences, image variants, video renditions)
+    with a single batch of lookups.
+
+    Args:
+        data: Serializer output (dicts, lists, strings)
+
+    Returns:
+        Same structure with media URLs replaced by presigned GETs
+    """
+    if not signing_enabled():
+        return data
+    found = set()
+    _collect_urls(data, found)
+    if not found:
+        return data
+    return _replace_urls(data, sign_read_urls(found))
@@ -0,0 +1,39 @@
+"""
+Shared Redis client for raw data structures.
+
+Django's cache framework only exposes get/set semantics. Features that need
+native Redis types (sorted sets, counters, sets) use this process-wide client.
+"""
+
+import threading
+from typing import Optional
+
+import redis
+from django.conf import settings
+
+_client: Optional[redis.Redis] = None
+_client_lock = threading.Lock()
+
+
+def get_redis_client() -> redis.Redis:
+    """
+    Get the process-wide Redis client.
+
+    The client owns a connection pool, so it is created once per process and
+    reused by every caller. redis-py checks the owning PID on checkout, so the
+    pool is safe to inherit across gunicorn/Celery prefork workers.
+
+    Returns:
+        redis.Redis: Client connected to settings.REDIS_URL
+
+    Example:
+        >>> client = get_redis_client()
+        >>> client.zadd("leaderboard:overall", {"candidate-id": 9550})
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _client
@@ -0,0 +1,47 @@
+"""
+Request helpers.
+
+Client identification behind the load balancer, shared by rate limiting
+and analytics.
+"""
+
+import hashlib
+
+from django.conf import settings
+
+
+def get_client_ip(request) -> str:
+    """
+    Get the client IP address.
+
+    X-Forwarded-For is only trusted for the hops added by our own proxies
+    (settings.TRUSTED_PROXY_COUNT, e.g. 1 behind the ALB); entries further
+    left are client-supplied and could be spoofed.
+
+    Args:
+        request: Django or DRF request
+
+    Returns:
+        str: Client IP ('' if unknown)
+    """
+    remote_addr = request.META.get("REMOTE_ADDR", "")
+    forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    proxies = settings.TRUSTED_PROXY_COUNT
+
+    if not proxies or not forwarded_for:
+        return remote_addr
+
+    addresses = [address.strip() for address in forwarded_for.split(",") if address.strip()]
+    if not addresses:
+        return remote_addr
+    return addresses[-min(proxies, len(addresses))]
+
+
+def get_visitor_id(request) -> str:
+    """
+    Anonymous visitor fingerprint (hash of IP and user agent).
+
+    Used for unique-visitor counting; raw IPs are never stored.
+    """
+    user_agent = request.META.get("HTTP_USER_AGENT", "")
+    return hashlib.sha256(f"{get_client_ip(request)}|{user_agent}".encode()).hexdigest()[:32]
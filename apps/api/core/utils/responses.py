@@ -0,0 +1,28 @@
+"""
+HTTP response helpers.
+
+Responses for bodies that were rendered ahead of time (e.g. served from cache),
+so views can skip DRF serialization and rendering entirely.
+"""
+
+import json
+
+from django.http import HttpResponse
+from django.utils.functional import cached_property
+
+
+class PrerenderedJSONResponse(HttpResponse):
+    """
+    Response for an already-rendered JSON body.
+
+    Exposes `data` like a DRF Response, parsed lazily from the body, so
+    callers (and tests) can read it without the view paying for it.
+    """
+
+    def __init__(self, content, status: int = 200, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(content, status=status, **kwargs)
+
+    @cached_property
+    def data(self):
+        return json.loads(self.content)
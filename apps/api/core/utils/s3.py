@@ -3,23 +3,40 @@ AWS S3 utility functions for file uploads.
 
 Provides presigned URL generation, validation, and file deletion for S3 uploads.
 Story 3.1: Profile photo and pitch video uploads.
+Multipart uploads let large pitch videos upload in parallel parts and resume.
 """
 
 import logging
 import mimetypes
+import os
+import threading
 import uuid
 from typing import Dict, Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+_client = None
+_client_pid: Optional[int] = None
+_client_lock = threading.Lock()
+
 
 def get_s3_client():
     """
-    Get configured S3 client.
+    Get the process-wide S3 client.
+
+    Building a boto3 client loads service models and endpoint rules (tens of
+    ms), so one client is created per process and shared: boto3 clients are
+    thread-safe, and the connection pool (AWS_S3_MAX_POOL_CONNECTIONS, TCP
+    keep-alive) is reused across requests. Presigning then is pure local
+    signing with no I/O.
+
+    The client is rebuilt in forked children (gunicorn/Celery prefork): a
+    pool inherited from the parent would share sockets between processes.
 
     Returns:
         boto3.client: Configured S3 client
@@ -27,43 +44,60 @@ def get_s3_client():
     Note:
         Uses credentials from Django settings (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY)
     """
-    return boto3.client(
-        "s3",
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_S3_REGION_NAME,
-        config=boto3.session.Config(signature_version="s3v4"),
-    )
+    global _client, _client_pid
 
+    pid = os.getpid()
+    if _client is None or _client_pid != pid:
+        with _client_lock:
+            if _client is None or _client_pid != pid:
+                # Sessions are not thread-safe; give the shared client its own
+                session = boto3.session.Session()
+                _client = session.client(
+                    "s3",
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    region_name=settings.AWS_S3_REGION_NAME,
+                    config=Config(
+                        signature_version="s3v4",
+                        max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS,
+                        tcp_keepalive=True,
+                        retries={"max_attempts": 3, "mode": "standard"},
+                    ),
+                )
+                _client_pid = pid
+    return _client
 
-def generate_presigned_url(
-    filename: str, content_type: str, upload_type: str = "photo"
-) -> Dict[str, any]:
-    """
-    Generate presigned POST URL for direct browser upload to S3.
 
-    Args:
-        filename: Original filename from user
-        content_type: MIME type (must be allowed type for upload_type)
-        upload_type: Type of upload - 'photo' or 'video'
+def reset_s3_client() -> None:
+    """Drop the shared client (after fork, or when settings change in tests)."""
+    global _client, _client_pid
+
+    _client = None
+    _client_pid = None
+
+
+def _reset_after_fork() -> None:
+    global _client_lock
+
+    # The parent may have held the lock while forking
+    _client_lock = threading.Lock()
+    reset_s3_client()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _upload_target(filename: str, content_type: str, upload_type: str) -> tuple[str, int, int]:
+    """
+    Validate an upload request and pick a fresh object key for it.
 
     Returns:
-        dict: {
-            'url': S3 endpoint URL,
-            'fields': Form fields for POST request,
-            'file_url': Final URL of uploaded file
-        }
+        tuple: (key, max_size, expiry)
 
     Raises:
         ValueError: If content_type not allowed for upload_type
-        ClientError: If S3 operation fails
-
-    Example:
-        >>> result = generate_presigned_url('profile.jpg', 'image/jpeg', 'photo')
-        >>> # Frontend POSTs to result['url'] with result['fields'] + file
-        >>> # After upload, file is available at result['file_url']
     """
-    # Validate content type based on upload type
     if upload_type == "photo":
         if content_type not in settings.ALLOWED_IMAGE_TYPES:
             raise ValueError(
@@ -89,42 +123,45 @@ def generate_presigned_url(
     ext = mimetypes.guess_extension(content_type) or filename.split(".")[-1]
     if not ext.startswith("."):
         ext = f".{ext}"
-    unique_filename = f"{folder}/{uuid.uuid4()}{ext}"
+    return f"{folder}/{uuid.uuid4()}{ext}", max_size, expiry
 
-    # Get S3 client
-    s3_client = get_s3_client()
 
-    try:
-        # Generate presigned POST
-        response = s3_client.generate_presigned_post(
-            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-            Key=unique_filename,
-            Fields={
-                "Content-Type": content_type,
-                "x-amz-server-side-encryption": settings.AWS_S3_ENCRYPTION,
-            },
-            Conditions=[
-                {"Content-Type": content_type},
-                {"x-amz-server-side-encryption": settings.AWS_S3_ENCRYPTION},
-                ["content-length-range", 0, max_size],
-            ],
-            ExpiresIn=expiry,
-        )
+def _file_url(key: str) -> str:
+    """Public URL of an object in our bucket."""
+    return f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/{key}"
 
-        # Construct the final file URL
-        file_url = f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/{unique_filename}"
 
-        logger.info(
-            f"Generated presigned URL for {upload_type}: {unique_filename}",
-            extra={"upload_type": upload_type, "content_type": content_type},
-        )
+def generate_presigned_url(
+    filename: str, content_type: str, upload_type: str = "photo"
+) -> Dict[str, any]:
+    """
+    Generate presigned POST URL for direct browser upload to S3.
+
+    Args:
+        filename: Original filename from user
+        content_type: MIME type (must be allowed type for upload_type)
+        upload_type: Type of upload - 'photo' or 'video'
 
-        return {
-            "url": response["url"],
-            "fields": response["fields"],
-            "file_url": file_url,
+    Returns:
+        dict: {
+            'url': S3 endpoint URL,
+            'fields': Form fields for POST request,
+            'file_url': Final URL of uploaded file
         }
 
+    Raises:
+        ValueError: If content_type not allowed for upload_type
+        ClientError: If S3 operation fails
+
+    Example:
+        >>> result = generate_presigned_url('profile.jpg', 'image/jpeg', 'photo')
+        >>> # Frontend POSTs to result['url'] with result['fields'] + file
+        >>> # After upload, file is available at result['file_url']
+    """
+    unique_filename, max_size, expiry = _upload_target(filename, content_type, upload_type)
+
+    try:
+        result = _presigned_post(unique_filename, content_type, max_size, expiry)
     except ClientError as e:
         logger.error(
             f"Error generating presigned URL: {e}",
@@ -132,6 +169,238 @@ def generate_presigned_url(
         )
         raise
 
+    logger.info(
+        f"Generated presigned URL for {upload_type}: {unique_filename}",
+        extra={"upload_type": upload_type, "content_type": content_type},
+    )
+    return result
+
+
+def generate_presigned_urls(files: list[dict]) -> list[Dict[str, any]]:
+    """
+    Generate presigned POSTs for several files at once (profile wizard).
+
+    Every file is validated before anything is signed, so a batch either
+    succeeds as a whole or fails without issuing URLs. Signing is local to
+    the shared client: no S3 round trips.
+
+    Args:
+        files: [{'filename': str, 'content_type': str, 'type': 'photo' | 'video'}]
+
+    Returns:
+        list: One {'url', 'fields', 'file_url', 'expires_in'} per file, in order
+
+    Raises:
+        ValueError: If any file is invalid (message prefixed with its index)
+        ClientError: If S3 operation fails
+
+    Example:
+        >>> generate_presigned_urls([
+        ...     {'filename': 'me.jpg', 'content_type': 'image/jpeg', 'type': 'photo'},
+        ...     {'filename': 'pitch.mp4', 'content_type': 'video/mp4', 'type': 'video'},
+        ... ])
+    """
+    targets = []
+    for index, file in enumerate(files):
+        try:
+            if not file.get("filename") or not file.get("content_type"):
+                raise ValueError("filename and content_type are required")
+            targets.append(
+                (
+                    file["content_type"],
+                    *_upload_target(
+                        file["filename"], file["content_type"], file.get("type", "photo")
+                    ),
+                )
+            )
+        except ValueError as e:
+            raise ValueError(f"files[{index}]: {e}") from e
+
+    results = []
+    for content_type, key, max_size, expiry in targets:
+        result = _presigned_post(key, content_type, max_size, expiry)
+        result["expires_in"] = expiry
+        results.append(result)
+
+    logger.info(f"Generated {len(results)} presigned URLs in one batch")
+    return results
+
+
+def _presigned_post(key: str, content_type: str, max_size: int, expiry: int) -> Dict[str, any]:
+    """Sign a POST policy for one object (local signing, no I/O)."""
+    response = get_s3_client().generate_presigned_post(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Key=key,
+        Fields={
+            "Content-Type": content_type,
+            "x-amz-server-side-encryption": settings.AWS_S3_ENCRYPTION,
+        },
+        Conditions=[
+            {"Content-Type": content_type},
+            {"x-amz-server-side-encryption": settings.AWS_S3_ENCRYPTION},
+            ["content-length-range", 0, max_size],
+        ],
+        ExpiresIn=expiry,
+    )
+    return {"url": response["url"], "fields": response["fields"], "file_url": _file_url(key)}
+
+
+def multipart_part_count(max_size: int) -> int:
+    """Parts needed to upload `max_size` bytes at S3_MULTIPART_PART_SIZE."""
+    return -(-max_size // settings.S3_MULTIPART_PART_SIZE)
+
+
+def create_multipart_upload(
+    filename: str, content_type: str, upload_type: str = "video"
+) -> Dict[str, any]:
+    """
+    Start a multipart upload for resumable, parallel browser uploads.
+
+    The browser splits the file into S3_MULTIPART_PART_SIZE parts, PUTs each
+    to a URL from presign_upload_parts (in parallel, retrying failed parts
+    only), then calls complete_multipart_upload. Uploads that are never
+    completed or aborted should be expired by the bucket lifecycle rule
+    (AbortIncompleteMultipartUpload).
+
+    Args:
+        filename: Original filename from user
+        content_type: MIME type (must be allowed type for upload_type)
+        upload_type: Type of upload - 'photo' or 'video'
+
+    Returns:
+        dict: {
+            'key': Object key,
+            'upload_id': S3 multipart upload id,
+            'file_url': Final URL of uploaded file,
+            'part_size': Bytes per part (all but the last),
+            'max_parts': Highest part number accepted
+        }
+
+    Raises:
+        ValueError: If content_type not allowed for upload_type
+        ClientError: If S3 operation fails
+    """
+    key, max_size, _ = _upload_target(filename, content_type, upload_type)
+
+    response = get_s3_client().create_multipart_upload(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Key=key,
+        ContentType=content_type,
+        ServerSideEncryption=settings.AWS_S3_ENCRYPTION,
+    )
+    logger.info(
+        f"Started multipart upload for {upload_type}: {key}",
+        extra={"upload_type": upload_type, "content_type": content_type},
+    )
+    return {
+        "key": key,
+        "upload_id": response["UploadId"],
+        "file_url": _file_url(key),
+        "part_size": settings.S3_MULTIPART_PART_SIZE,
+        "max_parts": multipart_part_count(max_size),
+    }
+
+
+def presign_upload_parts(
+    key: str, upload_id: str, part_numbers: list[int], expires_in: int
+) -> Dict[int, str]:
+    """
+    Presign PUT URLs for parts of a multipart upload (local signing, no I/O).
+
+    Args:
+        key: Object key from create_multipart_upload
+        upload_id: Upload id from create_multipart_upload
+        part_numbers: Part numbers (1-based)
+        expires_in: URL lifetime in seconds
+
+    Returns:
+        dict: {part_number: url}
+    """
+    s3_client = get_s3_client()
+    return {
+        number: s3_client.generate_presigned_url(
+            "upload_part",
+            Params={
+                "Bucket": settings.AWS_STORAGE_BUCKET_NAME,
+                "Key": key,
+                "UploadId": upload_id,
+                "PartNumber": number,
+            },
+            ExpiresIn=expires_in,
+        )
+        for number in part_numbers
+    }
+
+
+def list_uploaded_parts(key: str, upload_id: str) -> list[dict]:
+    """
+    Parts S3 has received for a multipart upload, to resume after a failure.
+
+    Returns:
+        list: [{'PartNumber': int, 'ETag': str, 'Size': int}] in part order
+    """
+    paginator = get_s3_client().get_paginator("list_parts")
+    pages = paginator.paginate(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key, UploadId=upload_id)
+    return [
+        {"PartNumber": part["PartNumber"], "ETag": part["ETag"], "Size": part["Size"]}
+        for page in pages
+        for part in page.get("Parts", [])
+    ]
+
+
+def complete_multipart_upload(key: str, upload_id: str, max_size: int) -> str:
+    """
+    Assemble the uploaded parts into the final object.
+
+    The part list comes from S3 itself (ListParts), so the browser does not
+    need to read ETag headers. Uploads over `max_size` are aborted: unlike
+    presigned POSTs, presigned part URLs cannot enforce a size limit.
+
+    Args:
+        key: Object key from create_multipart_upload
+        upload_id: Upload id from create_multipart_upload
+        max_size: Maximum total size in bytes
+
+    Returns:
+        str: Final URL of the uploaded file
+
+    Raises:
+        ValueError: If no parts were uploaded or the total is too large
+        ClientError: If S3 operation fails
+    """
+    parts = list_uploaded_parts(key, upload_id)
+    if not parts:
+        raise ValueError("No parts uploaded")
+
+    total = sum(part["Size"] for part in parts)
+    if total > max_size:
+        abort_multipart_upload(key, upload_id)
+        raise ValueError(f"File too large: {total} bytes (max {max_size})")
+
+    get_s3_client().complete_multipart_upload(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Key=key,
+        UploadId=upload_id,
+        MultipartUpload={
+            "Parts": [{"PartNumber": p["PartNumber"], "ETag": p["ETag"]} for p in parts]
+        },
+    )
+    logger.info(f"Completed multipart upload {key} ({len(parts)} parts, {total} bytes)")
+    return _file_url(key)
+
+
+def abort_multipart_upload(key: str, upload_id: str) -> None:
+    """
+    Abort a multipart upload and discard its parts.
+
+    Raises:
+        ClientError: If S3 operation fails (NoSuchUpload if already finished)
+    """
+    get_s3_client().abort_multipart_upload(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key, UploadId=upload_id
+    )
+    logger.info(f"Aborted multipart upload {key}")
+
 
 def validate_s3_url(url: str) -> bool:
     """
@@ -169,6 +438,33 @@ def validate_s3_url(url: str) -> bool:
     return any(url.startswith(prefix) for prefix in valid_prefixes)
 
 
+def get_s3_key(url: str) -> Optional[str]:
+    """
+    Extract the object key from one of our bucket's URLs.
+
+    Args:
+        url: S3 URL (any format accepted by validate_s3_url)
+
+    Returns:
+        str: Object key, or None if the URL is not from our bucket
+
+    Example:
+        >>> get_s3_key("https://bucket.s3.amazonaws.com/candidate-photos/abc.jpg")
+        'candidate-photos/abc.jpg'
+    """
+    if not validate_s3_url(url):
+        return None
+
+    bucket_name = settings.AWS_STORAGE_BUCKET_NAME
+    if f"{bucket_name}.s3" in url:
+        # Format: https://bucket.s3.region.amazonaws.com/key
+        key = url.split(f"{bucket_name}.s3", 1)[1].split("/", 1)[-1]
+    else:
+        # Format: https://s3.region.amazonaws.com/bucket/key
+        key = url.split(f"{bucket_name}/", 1)[1]
+    return key or None
+
+
 def delete_s3_object(url: str) -> bool:
     """
     Delete object from S3 given its URL.
@@ -183,28 +479,19 @@ def delete_s3_object(url: str) -> bool:
         >>> delete_s3_object("https://bucket.s3.amazonaws.com/candidate-photos/abc.jpg")
         True
     """
-    if not validate_s3_url(url):
+    key = get_s3_key(url)
+    if key is None:
         logger.warning(f"Attempted to delete invalid S3 URL: {url}")
         return False
 
-    # Extract key from URL
-    bucket_name = settings.AWS_STORAGE_BUCKET_NAME
-
     try:
-        if f"{bucket_name}.s3" in url:
-            # Format: https://bucket.s3.region.amazonaws.com/key
-            key = url.split(f"{bucket_name}.s3", 1)[1].split("/", 2)[-1]
-        else:
-            # Format: https://s3.region.amazonaws.com/bucket/key
-            key = url.split(f"{bucket_name}/", 1)[1]
-
         s3_client = get_s3_client()
-        s3_client.delete_object(Bucket=bucket_name, Key=key)
+        s3_client.delete_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
 
         logger.info(f"Deleted S3 object: {key}")
         return True
 
-    except (IndexError, ClientError) as e:
+    except ClientError as e:
         logger.error(f"Error deleting S3 object from URL {url}: {e}")
         return False
 
@@ -223,23 +510,73 @@ def get_s3_file_size(url: str) -> Optional[int]:
         >>> size = get_s3_file_size("https://bucket.s3.amazonaws.com/photo.jpg")
         >>> print(f"File size: {size / 1024 / 1024:.2f} MB")
     """
-    if not validate_s3_url(url):
+    key = get_s3_key(url)
+    if key is None:
         return None
 
-    # Extract key from URL (same logic as delete_s3_object)
-    bucket_name = settings.AWS_STORAGE_BUCKET_NAME
-
     try:
-        if f"{bucket_name}.s3" in url:
-            key = url.split(f"{bucket_name}.s3", 1)[1].split("/", 2)[-1]
-        else:
-            key = url.split(f"{bucket_name}/", 1)[1]
-
         s3_client = get_s3_client()
-        response = s3_client.head_object(Bucket=bucket_name, Key=key)
+        response = s3_client.head_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
 
         return response["ContentLength"]
 
-    except (IndexError, ClientError) as e:
+    except ClientError as e:
         logger.error(f"Error getting S3 object metadata for URL {url}: {e}")
         return None
+
+
+def delete_s3_keys(keys: list[str]) -> dict[str, str]:
+    """
+    Delete objects in bulk with DeleteObjects (up to 1000 keys per request).
+
+    Missing keys count as deleted (S3 semantics).
+
+    Args:
+        keys: Object keys in our bucket
+
+    Returns:
+        dict: {key: error message} for keys S3 failed to delete
+
+    Raises:
+        ClientError: If a whole request fails (e.g. credentials, throttling)
+    """
+    s3_client = get_s3_client()
+    errors = {}
+
+    for start in range(0, len(keys), 1000):
+        chunk = keys[start : start + 1000]
+        response = s3_client.delete_objects(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Delete={"Objects": [{"Key": key} for key in chunk], "Quiet": True},
+        )
+        for error in response.get("Errors", []):
+            errors[error["Key"]] = f"{error.get('Code')}: {error.get('Message')}"
+
+    logger.info(f"Deleted {len(keys) - len(errors)} S3 objects ({len(errors)} failed)")
+    return errors
+
+
+def schedule_s3_deletion(*urls: Optional[str]) -> int:
+    """
+    Queue objects for deletion instead of deleting them inline.
+
+    Keys are written to the PendingS3Deletion outbox in the caller's database
+    transaction, so nothing is deleted if the surrounding update rolls back.
+    The drain_s3_deletions task removes them in batches.
+
+    Args:
+        urls: S3 URLs (None, empty and foreign URLs are ignored)
+
+    Returns:
+        int: Number of keys queued
+    """
+    from core.models import PendingS3Deletion
+
+    keys = {key for key in (get_s3_key(url) for url in urls if url) if key}
+    if not keys:
+        return 0
+
+    PendingS3Deletion.objects.bulk_create(
+        [PendingS3Deletion(key=key) for key in keys], ignore_conflicts=True
+    )
+    return len(keys)
@@ -0,0 +1,173 @@
+"""
+Video probing and transcoding with the ffmpeg command-line tools.
+
+ffprobe/ffmpeg are optional system binaries: workers without them skip
+video processing (ffmpeg_available() is False) and the original upload is
+served as before. Transcoding produces an H.264/AAC MP4 with the moov atom
+at the front (faststart), so browsers start playback after the first few
+kilobytes instead of downloading the whole file, plus a JPEG poster frame.
+"""
+
+import json
+import shutil
+import subprocess
+from typing import Optional
+
+from django.conf import settings
+
+
+class VideoProcessingError(Exception):
+    """ffprobe/ffmpeg failed or the input is not a usable video."""
+
+
+def ffmpeg_available() -> bool:
+    """True if both ffprobe and ffmpeg are on PATH."""
+    return bool(shutil.which("ffprobe") and shutil.which("ffmpeg"))
+
+
+def _run(args: list[str]) -> str:
+    """Run a command, returning stdout; raise VideoProcessingError on failure."""
+    try:
+        result = subprocess.run(
+            args,
+            capture_output=True,
+            check=True,
+            text=True,
+            timeout=settings.VIDEO_PROCESSING_TIMEOUT,
+        )
+    except subprocess.CalledProcessError as e:
+        raise VideoProcessingError(e.stderr.strip()[-500:] or str(e)) from e
+    except subprocess.TimeoutExpired as e:
+        raise VideoProcessingError(f"{args[0]} timed out") from e
+    return result.stdout
+
+
+def parse_probe(output: str) -> dict:
+    """
+    Extract duration and dimensions from ffprobe JSON output.
+
+    Args:
+        output: `ffprobe -print_format json -show_format -show_streams` stdout
+
+    Returns:
+        dict: {'duration': float, 'width': int, 'height': int, 'has_audio': bool}
+
+    Raises:
+        VideoProcessingError: If there is no video stream
+    """
+    try:
+        probe = json.loads(output)
+    except ValueError as e:
+        raise VideoProcessingError("Unreadable ffprobe output") from e
+
+    streams = probe.get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    if video is None:
+        raise VideoProcessingError("No video stream")
+
+    return {
+        "duration": round(float(probe.get("format", {}).get("duration") or 0), 2),
+        "width": int(video.get("width") or 0),
+        "height": int(video.get("height") or 0),
+        "has_audio": any(s.get("codec_type") == "audio" for s in streams),
+    }
+
+
+def probe_video(path: str) -> dict:
+    """
+    Probe a local video file.
+
+    Returns:
+        dict: See parse_probe
+
+    Raises:
+        VideoProcessingError: If ffprobe fails or there is no video stream
+    """
+    output = _run(
+        [
+            "ffprobe",
+            "-v",
+            "error",
+            "-print_format",
+            "json",
+            "-show_format",
+            "-show_streams",
+            path,
+        ]
+    )
+    return parse_probe(output)
+
+
+def transcode_faststart(source: str, target: str, max_height: Optional[int] = None) -> None:
+    """
+    Transcode to a streaming-ready H.264/AAC MP4 (never upscaled).
+
+    Args:
+        source: Input file path (.mp4/.mov/.avi)
+        target: Output .mp4 path
+        max_height: Maximum output height (default VIDEO_MAX_HEIGHT)
+
+    Raises:
+        VideoProcessingError: If ffmpeg fails
+    """
+    max_height = max_height or settings.VIDEO_MAX_HEIGHT
+    _run(
+        [
+            "ffmpeg",
+            "-y",
+            "-v",
+            "error",
+            "-i",
+            source,
+            "-vf",
+            f"scale=-2:'min({max_height},ih)'",
+            "-c:v",
+            "libx264",
+            "-preset",
+            "veryfast",
+            "-crf",
+            "23",
+            "-pix_fmt",
+            "yuv420p",
+            "-c:a",
+            "aac",
+            "-b:a",
+            "128k",
+            "-movflags",
+            "+faststart",
+            target,
+        ]
+    )
+
+
+def extract_poster(source: str, target: str, at: float = 1.0) -> None:
+    """
+    Save one frame as a JPEG poster image.
+
+    Args:
+        source: Input file path
+        target: Output .jpg path
+        at: Timestamp in seconds (clamped by the caller to the duration)
+
+    Raises:
+        VideoProcessingError: If ffmpeg fails
+    """
+    _run(
+        [
+            "ffmpeg",
+            "-y",
+            "-v",
+            "error",
+            "-ss",
+            f"{at:.2f}",
+            "-i",
+            source,
+            "-frames:v",
+            "1",
+            "-vf",
+            f"scale='min({settings.VIDEO_MAX_HEIGHT * 16 // 9},iw)':-2",
+            "-q:v",
+            "3",
+            target,
+        ]
+    )
@@ -0,0 +1,13 @@
+"""Matching services module."""
+
+from .leaderboard import LeaderboardService
+from .recommendations import RecommendationService
+from .scoring import MatchScoringService
+from .text_similarity import TextSimilarityService
+
+__all__ = [
+    "LeaderboardService",
+    "MatchScoringService",
+    "RecommendationService",
+    "TextSimilarityService",
+]
@@ -0,0 +1,265 @@
+"""
+Leaderboard service for candidate rankings.
+
+Mirrors Ranking.score into Redis sorted sets so leaderboard pages, rank lookups
+and "who is ranked around this candidate" queries never sort in Postgres.
+The database stays the source of truth: every segment can be rebuilt from it.
+"""
+
+import logging
+from decimal import Decimal
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from candidates.models import CandidateProfile
+from core.utils.redis_client import get_redis_client
+from matching.models import Ranking
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "leaderboard"
+OVERALL_SEGMENT = "overall"
+
+# rank_position is folded into the ZSET score as a tie-breaker, so Redis returns
+# the same order as Ranking.Meta.ordering (-score, rank_position NULLS LAST).
+RANK_POSITION_SLOTS = 1_000_000
+
+
+class LeaderboardService:
+    """Service for Redis-backed candidate leaderboards."""
+
+    @staticmethod
+    def segments_for(candidate: CandidateProfile) -> list[str]:
+        """
+        List the leaderboard segments a candidate belongs to.
+
+        Args:
+            candidate: CandidateProfile instance
+
+        Returns:
+            list: Segment names, e.g. ['overall', 'position:SDR/BDR', 'status:available']
+        """
+        segments = [OVERALL_SEGMENT, f"status:{candidate.status}"]
+        if candidate.current_position:
+            segments.append(f"position:{candidate.current_position}")
+        return segments
+
+    @staticmethod
+    def all_segments() -> list[str]:
+        """Return every segment a candidate can belong to."""
+        return (
+            [OVERALL_SEGMENT]
+            + [f"status:{value}" for value, _ in CandidateProfile.STATUS_CHOICES]
+            + [f"position:{value}" for value, _ in CandidateProfile.POSITION_CHOICES]
+        )
+
+    @staticmethod
+    def segment_key(segment: str) -> str:
+        """
+        Build the Redis key for a segment.
+
+        Raises:
+            ValueError: If segment is unknown
+        """
+        if segment not in LeaderboardService.all_segments():
+            raise ValueError(f"Invalid leaderboard segment: {segment}")
+        return f"{KEY_PREFIX}:{segment}"
+
+    @staticmethod
+    def encode_score(score: Decimal, rank_position: Optional[int]) -> int:
+        """
+        Encode score and rank_position into a single sortable ZSET score.
+
+        Higher scores sort first; among equal scores a lower rank_position
+        sorts first and rankings without a position sort last.
+
+        Args:
+            score: Ranking score (0.00 - 100.00)
+            rank_position: Optional admin-assigned position
+
+        Returns:
+            int: Composite score (fits in a double without precision loss)
+        """
+        cents = int(Decimal(score) * 100)
+        if rank_position is None:
+            tie_breaker = 0
+        else:
+            tie_breaker = RANK_POSITION_SLOTS - 1 - min(rank_position, RANK_POSITION_SLOTS - 1)
+        return cents * RANK_POSITION_SLOTS + tie_breaker
+
+    @staticmethod
+    def decode_score(value: float) -> Decimal:
+        """Recover the Ranking.score from a composite ZSET score."""
+        cents = int(value) // RANK_POSITION_SLOTS
+        return Decimal(cents) / 100
+
+    @staticmethod
+    def sync_ranking(ranking: Ranking) -> None:
+        """
+        Write a ranking into every segment of its candidate.
+
+        Removes the candidate from segments it no longer belongs to (e.g. after
+        a status change). Inactive rankings or candidates are removed entirely.
+
+        Args:
+            ranking: Ranking instance (candidate is loaded if needed)
+        """
+        candidate = ranking.candidate
+        if not (ranking.is_active and candidate.is_active):
+            LeaderboardService.remove_candidate(candidate.id)
+            return
+
+        member = str(candidate.id)
+        value = LeaderboardService.encode_score(ranking.score, ranking.rank_position)
+        current = set(LeaderboardService.segments_for(candidate))
+
+        pipe = get_redis_client().pipeline(transaction=True)
+        for segment in LeaderboardService.all_segments():
+            key = f"{KEY_PREFIX}:{segment}"
+            if segment in current:
+                pipe.zadd(key, {member: value})
+            else:
+                pipe.zrem(key, member)
+        pipe.execute()
+
+    @staticmethod
+    def remove_candidate(candidate_id) -> None:
+        """Remove a candidate from every segment."""
+        member = str(candidate_id)
+        pipe = get_redis_client().pipeline(transaction=True)
+        for segment in LeaderboardService.all_segments():
+            pipe.zrem(f"{KEY_PREFIX}:{segment}", member)
+        pipe.execute()
+
+    @staticmethod
+    def get_top(segment: str = OVERALL_SEGMENT, limit: int = 20, offset: int = 0) -> list[dict]:
+        """
+        Get a page of the leaderboard.
+
+        Args:
+            segment: Segment name (see all_segments())
+            limit: Page size
+            offset: Number of entries to skip
+
+        Returns:
+            list: [{'candidate_id': str, 'score': Decimal, 'rank': int}, ...]
+        """
+        key = LeaderboardService.segment_key(segment)
+        entries = get_redis_client().zrevrange(key, offset, offset + limit - 1, withscores=True)
+        return LeaderboardService._format_entries(entries, first_rank=offset + 1)
+
+    @staticmethod
+    def get_rank(candidate_id, segment: str = OVERALL_SEGMENT) -> Optional[int]:
+        """
+        Get a candidate's 1-based rank within a segment.
+
+        Returns:
+            int or None: Rank, or None if candidate is not in the segment
+        """
+        key = LeaderboardService.segment_key(segment)
+        rank = get_redis_client().zrevrank(key, str(candidate_id))
+        return None if rank is None else rank + 1
+
+    @staticmethod
+    def get_neighborhood(
+        candidate_id, segment: str = OVERALL_SEGMENT, radius: int = 5
+    ) -> list[dict]:
+        """
+        Get the candidates ranked around a candidate.
+
+        Args:
+            candidate_id: Candidate at the center of the window
+            segment: Segment name
+            radius: Number of entries above and below the candidate
+
+        Returns:
+            list: Entries (same format as get_top), empty if candidate is unranked
+        """
+        key = LeaderboardService.segment_key(segment)
+        client = get_redis_client()
+
+        rank = client.zrevrank(key, str(candidate_id))
+        if rank is None:
+            return []
+
+        start = max(rank - radius, 0)
+        entries = client.zrevrange(key, start, rank + radius, withscores=True)
+        return LeaderboardService._format_entries(entries, first_rank=start + 1)
+
+    @staticmethod
+    def get_size(segment: str = OVERALL_SEGMENT) -> int:
+        """Return number of ranked candidates in a segment."""
+        return get_redis_client().zcard(LeaderboardService.segment_key(segment))
+
+    @staticmethod
+    def rebuild() -> dict[str, int]:
+        """
+        Rebuild every segment from the database.
+
+        Segments are written to temporary keys and swapped in with RENAME, so
+        readers never see a partially built leaderboard.
+
+        Returns:
+            dict: Number of entries written per segment
+        """
+        members: dict[str, dict[str, int]] = {
+            segment: {} for segment in LeaderboardService.all_segments()
+        }
+
+        rankings = (
+            Ranking.objects.filter(is_active=True, candidate__is_active=True)
+            .select_related("candidate")
+            .only(
+                "score",
+                "rank_position",
+                "candidate__id",
+                "candidate__status",
+                "candidate__current_position",
+            )
+        )
+        for ranking in rankings.iterator(chunk_size=2000):
+            value = LeaderboardService.encode_score(ranking.score, ranking.rank_position)
+            for segment in LeaderboardService.segments_for(ranking.candidate):
+                members[segment][str(ranking.candidate_id)] = value
+
+        pipe = get_redis_client().pipeline(transaction=True)
+        for segment, mapping in members.items():
+            key = f"{KEY_PREFIX}:{segment}"
+            if not mapping:
+                pipe.delete(key)
+                continue
+            tmp_key = f"{key}:rebuild"
+            pipe.delete(tmp_key)
+            pipe.zadd(tmp_key, mapping)
+            pipe.rename(tmp_key, key)
+        pipe.execute()
+
+        counts = {segment: len(mapping) for segment, mapping in members.items()}
+        logger.info(f"Leaderboard rebuilt: {counts[OVERALL_SEGMENT]} ranked candidates")
+        return counts
+
+    @staticmethod
+    def _format_entries(entries: list[tuple[str, float]], first_rank: int) -> list[dict]:
+        """Convert ZSET (member, score) pairs into leaderboard entries."""
+        return [
+            {
+                "candidate_id": member,
+                "score": LeaderboardService.decode_score(value),
+                "rank": first_rank + index,
+            }
+            for index, (member, value) in enumerate(entries)
+        ]
+
+
+def safe_sync(func, *args) -> None:
+    """
+    Run a Redis write, logging instead of raising on Redis errors.
+
+    Used by model signals: a Redis outage must never fail a DB write, and the
+    leaderboard can always be recovered with LeaderboardService.rebuild().
+    """
+    try:
+        func(*args)
+    except RedisError as e:
+        logger.warning(f"Redis sync failed ({func.__name__}): {e}")
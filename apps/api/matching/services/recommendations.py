@@ -0,0 +1,135 @@
+"""
+Recommended jobs feed for candidates.
+
+Scores one candidate against every active job with the matching engine and
+keeps the top jobs as a ready-to-serve JSON list in Redis, so repeated
+requests neither scan job postings nor hit Postgres.
+
+Invalidation:
+    - Job saved or deleted: a global jobs generation counter is bumped; it is
+      part of every feed key, so all feeds miss at once and old keys expire.
+    - Candidate profile saved: that candidate's feed key is deleted.
+"""
+
+import json
+import logging
+from typing import Any
+
+import numpy as np
+from django.conf import settings
+from redis.exceptions import RedisError
+
+from candidates.models import CandidateProfile
+from core.utils.redis_client import get_redis_client
+from jobs.models import JobPosting
+from matching.services.scoring import CANDIDATE_FIELDS, JOB_FIELDS, MatchScoringService
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = "matching:recommended:jobs_generation"
+FEED_KEY = "matching:recommended:{generation}:{candidate_id}"
+
+# Jobs kept per cached feed; requests page within this list
+FEED_SIZE = 50
+
+JOB_DISPLAY_FIELDS = (
+    "title",
+    "company__company_name",
+    "position_type",
+    "location",
+    "salary_range",
+)
+
+
+class RecommendationService:
+    """Per-candidate recommended jobs, cached in Redis."""
+
+    @staticmethod
+    def feed_key(candidate_id, generation: int) -> str:
+        """Redis key of a candidate's feed for a jobs generation."""
+        return FEED_KEY.format(generation=generation, candidate_id=candidate_id)
+
+    @staticmethod
+    def compute_feed(candidate: CandidateProfile) -> list[dict[str, Any]]:
+        """
+        Score a candidate against every active job and keep the best FEED_SIZE.
+
+        Returns:
+            list: [{'job_id', 'title', 'company_name', ..., 'score', 'breakdown'}, ...]
+        """
+        jobs = list(
+            JobPosting.objects.filter(is_active=True).values(*JOB_FIELDS, *JOB_DISPLAY_FIELDS)
+        )
+        if not jobs:
+            return []
+
+        candidate_row = {field: getattr(candidate, field) for field in CANDIDATE_FIELDS}
+        scores = MatchScoringService.score(jobs, [candidate_row])[:, 0]
+        order = np.argsort(-scores[:, 0].astype(np.int32), kind="stable")[:FEED_SIZE]
+
+        feed = []
+        for index in order:
+            job = jobs[index]
+            total, breakdown = MatchScoringService.unpack_row(scores[index])
+            feed.append(
+                {
+                    "job_id": str(job["id"]),
+                    "title": job["title"],
+                    "company_name": job["company__company_name"],
+                    "position_type": job["position_type"],
+                    "seniority": job["seniority"],
+                    "location": job["location"],
+                    "is_remote": job["is_remote"],
+                    "salary_range": job["salary_range"],
+                    "score": total,
+                    "breakdown": breakdown,
+                }
+            )
+        return feed
+
+    @staticmethod
+    def get_recommended_jobs(candidate: CandidateProfile, limit: int = 20) -> list[dict[str, Any]]:
+        """
+        Get a candidate's best-matching active jobs.
+
+        Served from Redis when cached; otherwise computed and cached for
+        settings.MATCHING_RECOMMENDATIONS_TTL seconds. Falls back to computing
+        without cache if Redis is unavailable.
+
+        Args:
+            candidate: Candidate profile
+            limit: Maximum number of jobs (at most FEED_SIZE)
+
+        Returns:
+            list: Feed entries ordered by score
+        """
+        client = get_redis_client()
+        try:
+            generation = int(client.get(GENERATION_KEY) or 0)
+            key = RecommendationService.feed_key(candidate.id, generation)
+            cached = client.get(key)
+        except RedisError as e:
+            logger.warning(f"Recommendation cache unavailable: {e}")
+            return RecommendationService.compute_feed(candidate)[:limit]
+
+        if cached is not None:
+            return json.loads(cached)[:limit]
+
+        feed = RecommendationService.compute_feed(candidate)
+        try:
+            client.set(key, json.dumps(feed), ex=settings.MATCHING_RECOMMENDATIONS_TTL)
+        except RedisError as e:
+            logger.warning(f"Could not cache recommendations for {candidate.id}: {e}")
+        return feed[:limit]
+
+    @staticmethod
+    def invalidate_candidate(candidate_id) -> None:
+        """Drop one candidate's cached feed."""
+        client = get_redis_client()
+        generation = int(client.get(GENERATION_KEY) or 0)
+        client.delete(RecommendationService.feed_key(candidate_id, generation))
+
+    @staticmethod
+    def invalidate_all() -> None:
+        """Invalidate every cached feed by starting a new jobs generation."""
+        get_redis_client().incr(GENERATION_KEY)
@@ -0,0 +1,220 @@
+"""
+Match scoring engine.
+
+Scores candidates against jobs with NumPy: every component (skill overlap,
+tool overlap, seniority fit, remote fit) and the weighted total come out of one
+vectorized pass over the whole candidate pool. Results are packed into a
+fixed-width uint16 matrix (basis points) so the per-component breakdown is
+cached with the total and never needs a second computation.
+"""
+
+import logging
+from typing import Any, Optional
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+
+from candidates.models import CandidateProfile
+from jobs.models import JobPosting
+
+logger = logging.getLogger(__name__)
+
+COMPONENTS = ("skills", "tools", "seniority", "remote")
+COMPONENT_WEIGHTS = np.array([0.4, 0.3, 0.2, 0.1], dtype=np.float32)
+
+# Packed layout: column 0 is the total, then one column per component.
+# Values are basis points (0 - 10000) so two bytes hold a score exactly to 0.01.
+SCORE_SCALE = 10000
+
+SENIORITY_LEVELS = {"junior": 0, "pleno": 1, "senior": 2}
+# Years of experience at which a candidate reaches pleno and senior
+SENIORITY_YEARS = (2, 5)
+
+REMOTE_FIT = {
+    True: {"remote": 1.0, "hybrid": 0.75, "onsite": 0.25},
+    False: {"onsite": 1.0, "hybrid": 0.75, "remote": 0.25},
+}
+
+CANDIDATE_FIELDS = ("id", "top_skills", "tools_software", "years_of_experience", "work_model")
+JOB_FIELDS = ("id", "required_skills", "required_tools", "seniority", "is_remote")
+
+
+def _normalize_terms(values: Any) -> set[str]:
+    """Lowercase and strip a JSON list of skills/tools."""
+    if not isinstance(values, list):
+        return set()
+    return {str(value).strip().lower() for value in values if str(value).strip()}
+
+
+def _incidence(rows: list[set[str]], vocabulary: dict[str, int]) -> np.ndarray:
+    """Build a (rows x vocabulary) 0/1 matrix; terms outside the vocabulary are ignored."""
+    matrix = np.zeros((len(rows), len(vocabulary)), dtype=np.float32)
+    for row_index, terms in enumerate(rows):
+        columns = [vocabulary[term] for term in terms if term in vocabulary]
+        matrix[row_index, columns] = 1.0
+    return matrix
+
+
+def _overlap(required: list[set[str]], offered: list[set[str]]) -> np.ndarray:
+    """
+    Fraction of each job's required terms that each candidate has.
+
+    Returns:
+        np.ndarray: (jobs x candidates); jobs without requirements score 1.0
+    """
+    vocabulary = {term: index for index, term in enumerate(sorted(set().union(*required)))}
+    if not vocabulary:
+        return np.ones((len(required), len(offered)), dtype=np.float32)
+
+    required_matrix = _incidence(required, vocabulary)
+    offered_matrix = _incidence(offered, vocabulary)
+
+    hits = required_matrix @ offered_matrix.T
+    counts = required_matrix.sum(axis=1, keepdims=True)
+    return np.divide(hits, counts, out=np.ones_like(hits), where=counts > 0)
+
+
+def _candidate_seniority(years: Optional[int]) -> float:
+    """Map years of experience to a seniority level (NaN when unknown)."""
+    if years is None:
+        return np.nan
+    return float(np.searchsorted(SENIORITY_YEARS, years, side="right"))
+
+
+class MatchScoringService:
+    """Vectorized match scoring between jobs and candidates."""
+
+    @staticmethod
+    def score(jobs: list[dict], candidates: list[dict]) -> np.ndarray:
+        """
+        Score every candidate against every job in one pass.
+
+        Args:
+            jobs: Dicts with JOB_FIELDS
+            candidates: Dicts with CANDIDATE_FIELDS
+
+        Returns:
+            np.ndarray: uint16 array (jobs x candidates x 1 + len(COMPONENTS)),
+                basis points; [..., 0] is the weighted total
+        """
+        n_jobs, n_candidates = len(jobs), len(candidates)
+        components = np.empty((n_jobs, n_candidates, len(COMPONENTS)), dtype=np.float32)
+
+        components[..., 0] = _overlap(
+            [_normalize_terms(job["required_skills"]) for job in jobs],
+            [_normalize_terms(candidate["top_skills"]) for candidate in candidates],
+        )
+        components[..., 1] = _overlap(
+            [_normalize_terms(job["required_tools"]) for job in jobs],
+            [_normalize_terms(candidate["tools_software"]) for candidate in candidates],
+        )
+
+        job_levels = np.array(
+            [SENIORITY_LEVELS.get(job["seniority"], 1) for job in jobs], dtype=np.float32
+        )
+        candidate_levels = np.array(
+            [_candidate_seniority(c["years_of_experience"]) for c in candidates], dtype=np.float32
+        )
+        distance = np.abs(job_levels[:, None] - candidate_levels[None, :])
+        components[..., 2] = np.where(np.isnan(distance), 0.5, 1.0 - distance / 2.0)
+
+        remote_fit = np.array(
+            [
+                [REMOTE_FIT[True].get(c["work_model"], 0.5) for c in candidates],
+                [REMOTE_FIT[False].get(c["work_model"], 0.5) for c in candidates],
+            ],
+            dtype=np.float32,
+        ).reshape(2, n_candidates)
+        is_remote = np.array([bool(job["is_remote"]) for job in jobs])
+        components[..., 3] = np.where(is_remote[:, None], remote_fit[0], remote_fit[1])
+
+        totals = components @ COMPONENT_WEIGHTS
+        packed = np.concatenate([totals[..., None], components], axis=-1)
+        return np.rint(packed * SCORE_SCALE).astype(np.uint16)
+
+    @staticmethod
+    def unpack_row(row: np.ndarray) -> tuple[float, dict[str, float]]:
+        """
+        Decode one packed score row.
+
+        Returns:
+            tuple: (total, {'skills': 87.5, 'tools': 50.0, ...}) as percentages
+        """
+        values = row.astype(np.float64) / (SCORE_SCALE / 100)
+        return round(values[0], 2), {
+            name: round(values[index + 1], 2) for index, name in enumerate(COMPONENTS)
+        }
+
+    @staticmethod
+    def candidate_pool() -> list[dict]:
+        """Load the scoring fields of every available, active candidate."""
+        return list(
+            CandidateProfile.objects.filter(is_active=True, status="available").values(
+                *CANDIDATE_FIELDS
+            )
+        )
+
+    @staticmethod
+    def job_cache_key(job: JobPosting) -> str:
+        """Cache key for a job's scores; editing the job changes the key."""
+        return f"matching:job:{job.id}:{int(job.updated_at.timestamp() * 1_000_000)}"
+
+    @staticmethod
+    def get_job_scores(job: JobPosting) -> tuple[list[str], np.ndarray]:
+        """
+        Get packed scores of every candidate in the pool for a job.
+
+        Served from cache when available; otherwise computed in one pass and
+        cached for settings.MATCHING_CACHE_TTL seconds.
+
+        Returns:
+            tuple: (candidate ids, uint16 array (candidates x 1 + len(COMPONENTS)))
+        """
+        key = MatchScoringService.job_cache_key(job)
+        cached = cache.get(key)
+        if cached is not None:
+            candidate_ids, raw = cached
+            width = 1 + len(COMPONENTS)
+            return candidate_ids, np.frombuffer(raw, dtype=np.uint16).reshape(-1, width)
+
+        job_row = {field: getattr(job, field) for field in JOB_FIELDS}
+        candidates = MatchScoringService.candidate_pool()
+        scores = MatchScoringService.score([job_row], candidates)[0]
+        candidate_ids = [str(candidate["id"]) for candidate in candidates]
+
+        cache.set(key, (candidate_ids, scores.tobytes()), settings.MATCHING_CACHE_TTL)
+        logger.info(f"Scored {len(candidate_ids)} candidates for job {job.id}")
+        return candidate_ids, scores
+
+    @staticmethod
+    def top_matches(
+        job: JobPosting, limit: int = 20, min_score: float = 0.0
+    ) -> list[dict[str, Any]]:
+        """
+        Get the best-scoring candidates for a job with their score breakdown.
+
+        Args:
+            job: Job posting
+            limit: Maximum number of matches
+            min_score: Minimum total score (0 - 100)
+
+        Returns:
+            list: [{'candidate_id': str, 'score': float, 'breakdown': {...}}, ...]
+        """
+        candidate_ids, scores = MatchScoringService.get_job_scores(job)
+        if not candidate_ids:
+            return []
+
+        totals = scores[:, 0]
+        eligible = np.flatnonzero(totals >= int(min_score * SCORE_SCALE / 100))
+        # Stable sort keeps pool order for ties, so results are deterministic
+        order = eligible[np.argsort(-totals[eligible].astype(np.int32), kind="stable")][:limit]
+
+        matches = []
+        for index in order:
+            total, breakdown = MatchScoringService.unpack_row(scores[index])
+            matches.append(
+                {"candidate_id": candidate_ids[index], "score": total, "breakdown": breakdown}
+            )
+        return matches
@@ -0,0 +1,563 @@
+"""
+Text similarity index.
+
+Candidate bios and experience responsibilities are turned into hashed
+term-frequency vectors (NumPy only, no external service) and kept in a
+memory-mapped float32 matrix on disk. Jobs are matched at query time by
+TF-IDF cosine similarity between the job text and every indexed candidate.
+
+Layout of settings.MATCHING_TEXT_INDEX_DIR:
+    CURRENT              name of the active build directory
+    LOCK                 held (flock) while a build is written and published
+    <build>/vectors.npy  (rows x dimensions) log term frequencies
+    <build>/idf.npy      inverse document frequency per feature
+    <build>/norms.npy    TF-IDF L2 norm per row
+    <build>/meta.json    {'dimensions': int, 'rows': [[candidate_id, stamp], ...]}
+
+Refreshes are incremental: only candidates whose profile or experiences
+changed are re-tokenized, unchanged rows are copied from the previous build.
+Each build is written to a fresh directory and published by atomically
+replacing CURRENT, so readers never see a half-written index. Builds,
+downloads and cleanups of a directory are serialized by an exclusive lock
+on LOCK.
+
+Only the refresh task builds; queries never do, and find no index (None)
+until the first build is published. With settings.MATCHING_TEXT_INDEX_STORAGE
+= "s3" (production), the directory is a per-host cache: the task uploads
+each build to the uploads bucket under matching/text-index/<build>/ and
+then points the shared Redis key CURRENT_KEY at it. Web hosts compare that
+key with the build they have open and download a new build in the
+background, serving the previous one (or nothing) until it is on disk.
+"""
+
+import fcntl
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+from botocore.exceptions import BotoCoreError, ClientError
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max
+from redis.exceptions import RedisError
+
+from candidates.models import CandidateProfile, Experience
+from core.utils.redis_client import get_redis_client
+from core.utils.s3 import get_s3_client
+from jobs.models import JobPosting
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"\w{2,}")
+STOPWORDS = frozenset(
+    "a o as os de da do das dos e em no na nos nas um uma uns umas para por com como que "
+    "se ao aos mais mas ou sua seu suas seus the and of to in for on with at by an is are "
+    "be as or from".split()
+)
+
+CURRENT_FILE = "CURRENT"
+LOCK_FILE = "LOCK"
+# Build directories are named <time_ns>-<random>, so names sort by age
+BUILD_PATTERN = re.compile(r"\d{20}-[0-9a-f]{8}")
+CHUNK_ROWS = 4096
+
+# Debounce for signal-triggered refreshes (seconds)
+REFRESH_DELAY = 60
+REFRESH_PENDING_KEY = "matching:text_index:refresh_pending"
+
+# Shared index in S3: build files under STORAGE_PREFIX, published build in Redis
+STORAGE_PREFIX = "matching/text-index"
+CURRENT_KEY = "matching:text_index:current"
+
+_loaded: Optional["TextIndex"] = None
+_loaded_lock = threading.Lock()
+# Builds this process is downloading (guarded by _loaded_lock)
+_downloading: set[str] = set()
+
+
+@dataclass
+class TextIndex:
+    """A published, read-only build of the text index."""
+
+    build: str
+    dimensions: int
+    candidate_ids: list[str]
+    stamps: list[str]
+    vectors: np.ndarray
+    idf: np.ndarray
+    norms: np.ndarray
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercase word tokens without stopwords."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def _hash_vector(text: str, dimensions: int) -> np.ndarray:
+    """
+    Hash a text into a sublinear term-frequency vector.
+
+    crc32 is used instead of hash() because it is stable across processes.
+    """
+    tokens = _tokenize(text)
+    if not tokens:
+        return np.zeros(dimensions, dtype=np.float32)
+    features = np.fromiter(
+        (zlib.crc32(token.encode()) % dimensions for token in tokens),
+        dtype=np.int64,
+        count=len(tokens),
+    )
+    counts = np.bincount(features, minlength=dimensions).astype(np.float32)
+    return np.log1p(counts)
+
+
+def _job_text(job: JobPosting) -> str:
+    """Text a job is matched on."""
+    return "\n".join([job.title, job.description, job.responsibilities])
+
+
+def _index_dir() -> Path:
+    return Path(settings.MATCHING_TEXT_INDEX_DIR)
+
+
+def _new_build_name() -> str:
+    return f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+
+
+def _build_age(name: str) -> int:
+    """Creation time of a build (-1 for builds named before BUILD_PATTERN)."""
+    return int(name.split("-", 1)[0]) if BUILD_PATTERN.fullmatch(name) else -1
+
+
+def _shared_storage() -> bool:
+    return settings.MATCHING_TEXT_INDEX_STORAGE == "s3"
+
+
+def _published_build() -> Optional[str]:
+    """Build the index currently points at (None if nothing was published yet)."""
+    if _shared_storage():
+        return get_redis_client().get(CURRENT_KEY)
+    try:
+        return (_index_dir() / CURRENT_FILE).read_text().strip()
+    except FileNotFoundError:
+        return None
+
+
+def _local_build() -> Optional[str]:
+    """Build CURRENT points at in this host's index directory."""
+    try:
+        return (_index_dir() / CURRENT_FILE).read_text().strip()
+    except FileNotFoundError:
+        return None
+
+
+@contextmanager
+def _build_lock() -> Iterator[None]:
+    """Hold the exclusive build lock of the index directory."""
+    index_dir = _index_dir()
+    index_dir.mkdir(parents=True, exist_ok=True)
+    with open(index_dir / LOCK_FILE, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _candidate_stamps() -> list[tuple[str, str]]:
+    """
+    Version stamp of every indexable candidate.
+
+    The stamp changes whenever the profile or any of its experiences is
+    saved, or an experience is added or removed.
+    """
+    rows = (
+        CandidateProfile.objects.filter(is_active=True, status="available")
+        .annotate(
+            experiences_updated=Max("experiences__updated_at"),
+            experiences_count=Count("experiences"),
+        )
+        .order_by("id")
+        .values_list("id", "updated_at", "experiences_updated", "experiences_count")
+    )
+    return [
+        (
+            str(candidate_id),
+            f"{updated_at.isoformat()}|{experiences_updated and experiences_updated.isoformat()}"
+            f"|{experiences_count}",
+        )
+        for candidate_id, updated_at, experiences_updated, experiences_count in rows
+    ]
+
+
+def _candidate_documents(candidate_ids: list[str]) -> dict[str, str]:
+    """Bio plus experience responsibilities of the given candidates."""
+    documents = dict(CandidateProfile.objects.filter(id__in=candidate_ids).values_list("id", "bio"))
+    documents = {str(candidate_id): [bio or ""] for candidate_id, bio in documents.items()}
+    experiences = Experience.objects.filter(candidate_id__in=candidate_ids).values_list(
+        "candidate_id", "position", "responsibilities"
+    )
+    for candidate_id, position, responsibilities in experiences:
+        documents[str(candidate_id)].extend([position, responsibilities])
+    return {candidate_id: "\n".join(parts) for candidate_id, parts in documents.items()}
+
+
+class TextSimilarityService:
+    """Build and query the memory-mapped text similarity index."""
+
+    @staticmethod
+    def load(fetch: bool = True) -> Optional[TextIndex]:
+        """
+        Open the currently published build (memory-mapped, cached per process).
+
+        With shared storage, a published build missing from this host is
+        downloaded in a background thread (if `fetch`); until it is on disk
+        the build opened before, if any, is returned.
+
+        Args:
+            fetch: Start downloading a published build missing from this host
+
+        Returns:
+            TextIndex or None if no build was published yet, or its files are missing
+        """
+        global _loaded
+
+        try:
+            build = _published_build()
+        except RedisError as e:
+            logger.warning(f"Text index pointer unavailable: {e}")
+            return _loaded
+        if build is None:
+            return None
+
+        with _loaded_lock:
+            if _loaded is not None and _loaded.build == build:
+                return _loaded
+
+            path = _index_dir() / build
+            if _shared_storage() and not path.is_dir():
+                if fetch and build not in _downloading:
+                    _downloading.add(build)
+                    threading.Thread(
+                        target=TextSimilarityService.download, args=(build,), daemon=True
+                    ).start()
+                return _loaded
+            try:
+                meta = json.loads((path / "meta.json").read_text())
+                rows = meta["rows"]
+                vectors = (
+                    np.load(path / "vectors.npy", mmap_mode="r")
+                    if rows
+                    else np.zeros((0, meta["dimensions"]), dtype=np.float32)
+                )
+                idf = np.load(path / "idf.npy")
+                norms = np.load(path / "norms.npy")
+            except FileNotFoundError as e:
+                logger.warning(f"Text index build {build} is incomplete: {e}")
+                return None
+
+            _loaded = TextIndex(
+                build=build,
+                dimensions=meta["dimensions"],
+                candidate_ids=[row[0] for row in rows],
+                stamps=[row[1] for row in rows],
+                vectors=vectors,
+                idf=idf,
+                norms=norms,
+            )
+            return _loaded
+
+    @staticmethod
+    def refresh() -> dict[str, Any]:
+        """
+        Bring the index up to date with the database.
+
+        Only new or changed candidates are re-tokenized; a new build is
+        published only if something changed. Holds the build lock, so a
+        concurrent caller waits and then finds the index up to date.
+        Meant for the refresh task (matching.tasks.refresh_text_index).
+
+        Returns:
+            dict: {'build': str, 'rows': int, 'vectorized': int, 'reused': int}
+        """
+        with _build_lock():
+            return TextSimilarityService._refresh()
+
+    @staticmethod
+    def _refresh() -> dict[str, Any]:
+        dimensions = settings.MATCHING_TEXT_DIMENSIONS
+        # With shared storage, only a build this host has can be reused
+        current = TextSimilarityService.load(fetch=False)
+        stamps = _candidate_stamps()
+
+        previous_rows: dict[str, tuple[int, str]] = {}
+        if current is not None and current.dimensions == dimensions:
+            previous_rows = {
+                candidate_id: (row, stamp)
+                for row, (candidate_id, stamp) in enumerate(
+                    zip(current.candidate_ids, current.stamps, strict=True)
+                )
+            }
+
+        reused = [
+            (new_row, previous_rows[candidate_id][0])
+            for new_row, (candidate_id, stamp) in enumerate(stamps)
+            if previous_rows.get(candidate_id, (None, None))[1] == stamp
+        ]
+        if current is not None and len(reused) == len(stamps) == len(current.candidate_ids):
+            return {"build": current.build, "rows": len(stamps), "vectorized": 0, "reused": 0}
+
+        reused_rows = {new_row for new_row, _ in reused}
+        changed = [
+            (new_row, candidate_id)
+            for new_row, (candidate_id, _) in enumerate(stamps)
+            if new_row not in reused_rows
+        ]
+
+        build = _new_build_name()
+        path = _index_dir() / build
+        path.mkdir(parents=True)
+
+        vectors = TextSimilarityService._write_vectors(
+            path, len(stamps), dimensions, current, reused, changed
+        )
+        idf, norms = TextSimilarityService._weights(vectors, dimensions)
+        np.save(path / "idf.npy", idf)
+        np.save(path / "norms.npy", norms)
+        (path / "meta.json").write_text(
+            json.dumps({"dimensions": dimensions, "rows": [list(row) for row in stamps]})
+        )
+        previous = _local_build()
+        TextSimilarityService._publish(build, previous)
+        if _shared_storage():
+            TextSimilarityService._upload(build, previous)
+
+        logger.info(
+            f"Text index build {build}: {len(stamps)} rows, "
+            f"{len(changed)} vectorized, {len(reused)} reused"
+        )
+        return {
+            "build": build,
+            "rows": len(stamps),
+            "vectorized": len(changed),
+            "reused": len(reused),
+        }
+
+    @staticmethod
+    def _write_vectors(
+        path: Path,
+        n_rows: int,
+        dimensions: int,
+        current: Optional[TextIndex],
+        reused: list[tuple[int, int]],
+        changed: list[tuple[int, str]],
+    ) -> np.ndarray:
+        """Write the term-frequency matrix of a new build."""
+        if not n_rows:
+            return np.zeros((0, dimensions), dtype=np.float32)
+
+        vectors = np.lib.format.open_memmap(
+            path / "vectors.npy", mode="w+", dtype=np.float32, shape=(n_rows, dimensions)
+        )
+        for start in range(0, len(reused), CHUNK_ROWS):
+            new_rows, old_rows = zip(*reused[start : start + CHUNK_ROWS], strict=True)
+            vectors[list(new_rows)] = current.vectors[list(old_rows)]
+
+        for start in range(0, len(changed), CHUNK_ROWS):
+            chunk = changed[start : start + CHUNK_ROWS]
+            documents = _candidate_documents([candidate_id for _, candidate_id in chunk])
+            for new_row, candidate_id in chunk:
+                vectors[new_row] = _hash_vector(documents.get(candidate_id, ""), dimensions)
+
+        vectors.flush()
+        return vectors
+
+    @staticmethod
+    def _weights(vectors: np.ndarray, dimensions: int) -> tuple[np.ndarray, np.ndarray]:
+        """Smoothed IDF per feature and TF-IDF norm per row, computed in chunks."""
+        n_rows = vectors.shape[0]
+        document_frequency = np.zeros(dimensions, dtype=np.int64)
+        for start in range(0, n_rows, CHUNK_ROWS):
+            document_frequency += (vectors[start : start + CHUNK_ROWS] > 0).sum(axis=0)
+        idf = (np.log((1 + n_rows) / (1 + document_frequency)) + 1).astype(np.float32)
+
+        norms = np.empty(n_rows, dtype=np.float32)
+        for start in range(0, n_rows, CHUNK_ROWS):
+            norms[start : start + CHUNK_ROWS] = np.linalg.norm(
+                vectors[start : start + CHUNK_ROWS] * idf, axis=1
+            )
+        return idf, norms
+
+    @staticmethod
+    def _publish(build: str, previous: Optional[str]) -> None:
+        """
+        Point CURRENT at a new build and drop builds older than the previous one.
+
+        The previous build is kept so readers that just resolved CURRENT can
+        still open it. Called with the build lock held.
+        """
+        index_dir = _index_dir()
+        pointer = index_dir / f"{CURRENT_FILE}.{build}"
+        pointer.write_text(build)
+        os.replace(pointer, index_dir / CURRENT_FILE)
+
+        if previous is None:
+            return
+        for entry in index_dir.iterdir():
+            if (
+                entry.is_dir()
+                and entry.name not in (build, previous)
+                and _build_age(entry.name) < _build_age(previous)
+            ):
+                shutil.rmtree(entry, ignore_errors=True)
+
+    @staticmethod
+    def _upload(build: str, previous: Optional[str]) -> None:
+        """
+        Copy a build to the bucket, point CURRENT_KEY at it and drop builds older than `previous`.
+
+        The pointer moves only once every file is uploaded.
+        """
+        client = get_s3_client()
+        bucket = settings.AWS_STORAGE_BUCKET_NAME
+        for path in sorted((_index_dir() / build).iterdir()):
+            client.upload_file(str(path), bucket, f"{STORAGE_PREFIX}/{build}/{path.name}")
+        get_redis_client().set(CURRENT_KEY, build)
+
+        if previous is None:
+            return
+        listing = client.list_objects_v2(Bucket=bucket, Prefix=f"{STORAGE_PREFIX}/")
+        keys = [
+            obj["Key"]
+            for obj in listing.get("Contents", [])
+            if _build_age(obj["Key"].split("/")[-2]) < _build_age(previous)
+        ]
+        if keys:
+            client.delete_objects(
+                Bucket=bucket, Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True}
+            )
+
+    @staticmethod
+    def download(build: str) -> bool:
+        """
+        Fetch a published build from the bucket into this host's index directory.
+
+        Runs in the background thread started by load(). Holds the build lock,
+        so processes on the same host download a build once.
+
+        Returns:
+            bool: False if the build could not be downloaded (the next query retries)
+        """
+        try:
+            with _build_lock():
+                path = _index_dir() / build
+                if path.is_dir():
+                    return True
+                client = get_s3_client()
+                bucket = settings.AWS_STORAGE_BUCKET_NAME
+                listing = client.list_objects_v2(Bucket=bucket, Prefix=f"{STORAGE_PREFIX}/{build}/")
+                keys = [obj["Key"] for obj in listing.get("Contents", [])]
+                if not keys:
+                    logger.warning(f"Text index build {build} is not in storage")
+                    return False
+
+                partial = _index_dir() / f"{build}.download"
+                shutil.rmtree(partial, ignore_errors=True)
+                partial.mkdir()
+                for key in keys:
+                    client.download_file(bucket, key, str(partial / key.rsplit("/", 1)[1]))
+                os.replace(partial, path)
+                TextSimilarityService._publish(build, _local_build())
+                return True
+        except (BotoCoreError, ClientError, OSError) as e:
+            logger.error(f"Text index build {build} download failed: {e}")
+            return False
+        finally:
+            with _loaded_lock:
+                _downloading.discard(build)
+
+    @staticmethod
+    def similar_candidates(
+        job: JobPosting, limit: int = 20, min_similarity: float = 0.0
+    ) -> Optional[list[dict[str, Any]]]:
+        """
+        Rank indexed candidates by similarity to a job's title, description and responsibilities.
+
+        Never builds the index: if none was published yet a refresh is
+        scheduled and None is returned.
+
+        Args:
+            job: Job posting
+            limit: Maximum number of candidates
+            min_similarity: Minimum cosine similarity (0 - 100)
+
+        Returns:
+            list: [{'candidate_id': str, 'similarity': float (0 - 100)}, ...],
+            or None while the index is unavailable
+        """
+        index = TextSimilarityService.load()
+        if index is None:
+            try:
+                published = _published_build()
+            except RedisError:
+                published = None
+            if published is None:
+                TextSimilarityService.schedule_refresh()
+            return None
+        if not index.candidate_ids:
+            return []
+
+        query = _hash_vector(_job_text(job), index.dimensions) * index.idf
+        query_norm = np.linalg.norm(query)
+        if not query_norm:
+            return []
+        query /= query_norm
+
+        similarities = np.zeros(len(index.candidate_ids), dtype=np.float32)
+        np.divide(index.vectors @ query, index.norms, out=similarities, where=index.norms > 0)
+
+        eligible = np.flatnonzero(similarities >= min_similarity / 100)
+        if len(eligible) > limit:
+            eligible = eligible[np.argpartition(-similarities[eligible], limit - 1)[:limit]]
+        order = eligible[np.argsort(-similarities[eligible], kind="stable")]
+
+        return [
+            {
+                "candidate_id": index.candidate_ids[row],
+                "similarity": round(float(similarities[row]) * 100, 2),
+            }
+            for row in order
+        ]
+
+    @staticmethod
+    def schedule_refresh() -> None:
+        """
+        Enqueue an index refresh after the current transaction commits.
+
+        Debounced through Redis: bursts of profile edits within REFRESH_DELAY
+        seconds trigger a single refresh.
+        """
+        from matching.tasks import refresh_text_index
+
+        try:
+            scheduled = get_redis_client().set(
+                REFRESH_PENDING_KEY, 1, nx=True, ex=REFRESH_DELAY * 2
+            )
+        except RedisError as e:
+            logger.warning(f"Text index refresh not scheduled: {e}")
+            return
+
+        if scheduled:
+            transaction.on_commit(lambda: refresh_text_index.apply_async(countdown=REFRESH_DELAY))
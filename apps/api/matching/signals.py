@@ -0,0 +1,95 @@
+"""
+Matching signal handlers.
+
+Keeps the Redis leaderboard in sync with Ranking and CandidateProfile writes.
+Updates run after the transaction commits so Redis never shows rolled-back data.
+Profile and experience edits schedule a (debounced) text index refresh.
+Job and profile edits invalidate cached recommended-jobs feeds.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from candidates.models import CandidateProfile, Experience
+from jobs.models import JobPosting
+from matching.models import Ranking
+from matching.services.leaderboard import LeaderboardService, safe_sync
+from matching.services.recommendations import RecommendationService
+from matching.services.scoring import CANDIDATE_FIELDS
+from matching.services.text_similarity import TextSimilarityService
+
+# CandidateProfile fields that decide leaderboard segment membership
+SEGMENT_FIELDS = {"status", "current_position", "is_active"}
+
+# CandidateProfile fields that decide text index content and membership
+TEXT_INDEX_FIELDS = {"bio", "status", "is_active"}
+
+# CandidateProfile fields the match scores are computed from
+SCORING_FIELDS = set(CANDIDATE_FIELDS) - {"id"}
+
+
+@receiver(post_save, sender=Ranking)
+def sync_ranking_on_save(sender, instance: Ranking, **kwargs) -> None:
+    """Mirror a saved ranking into its leaderboard segments."""
+    transaction.on_commit(lambda: safe_sync(LeaderboardService.sync_ranking, instance))
+
+
+@receiver(post_delete, sender=Ranking)
+def remove_ranking_on_delete(sender, instance: Ranking, **kwargs) -> None:
+    """Drop a deleted ranking from every leaderboard segment."""
+    candidate_id = instance.candidate_id
+    transaction.on_commit(lambda: safe_sync(LeaderboardService.remove_candidate, candidate_id))
+
+
+@receiver(post_save, sender=CandidateProfile)
+def resegment_on_profile_save(sender, instance: CandidateProfile, **kwargs) -> None:
+    """Move a ranked candidate between segments when status or position change."""
+    update_fields = kwargs.get("update_fields")
+    if kwargs.get("created") or (update_fields and not SEGMENT_FIELDS & set(update_fields)):
+        return
+
+    ranking = Ranking.objects.filter(candidate=instance).first()
+    if ranking is None:
+        return
+
+    ranking.candidate = instance
+    transaction.on_commit(lambda: safe_sync(LeaderboardService.sync_ranking, ranking))
+
+
+@receiver(post_save, sender=CandidateProfile)
+def refresh_text_index_on_profile_save(sender, instance: CandidateProfile, **kwargs) -> None:
+    """Schedule a text index refresh when the bio or availability changes."""
+    update_fields = kwargs.get("update_fields")
+    if update_fields and not TEXT_INDEX_FIELDS & set(update_fields):
+        return
+    TextSimilarityService.schedule_refresh()
+
+
+@receiver(post_save, sender=Experience)
+@receiver(post_delete, sender=Experience)
+def refresh_text_index_on_experience_change(sender, instance: Experience, **kwargs) -> None:
+    """Schedule a text index refresh when a candidate's experiences change."""
+    TextSimilarityService.schedule_refresh()
+
+
+@receiver(post_save, sender=JobPosting)
+@receiver(post_delete, sender=JobPosting)
+def invalidate_recommendations_on_job_change(sender, instance: JobPosting, **kwargs) -> None:
+    """Invalidate every recommended-jobs feed when a job is published, edited or removed."""
+    transaction.on_commit(lambda: safe_sync(RecommendationService.invalidate_all))
+
+
+@receiver(post_save, sender=CandidateProfile)
+def invalidate_recommendations_on_profile_save(
+    sender, instance: CandidateProfile, **kwargs
+) -> None:
+    """Invalidate a candidate's recommended-jobs feed when scoring fields change."""
+    update_fields = kwargs.get("update_fields")
+    if kwargs.get("created") or (update_fields and not SCORING_FIELDS & set(update_fields)):
+        return
+
+    candidate_id = instance.id
+    transaction.on_commit(
+        lambda: safe_sync(RecommendationService.invalidate_candidate, candidate_id)
+    )
@@ -0,0 +1,56 @@
+"""
+Celery tasks for matching operations.
+
+Leaderboard maintenance: full rebuild of the Redis sorted sets from Postgres.
+Text index maintenance: incremental refresh of the on-disk similarity index.
+"""
+
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+from core.utils.redis_client import get_redis_client
+from matching.services.leaderboard import LeaderboardService
+from matching.services.text_similarity import REFRESH_PENDING_KEY, TextSimilarityService
+
+logger = get_task_logger(__name__)
+
+
+@shared_task(bind=True, max_retries=3)
+def rebuild_leaderboard(self) -> dict[str, int]:
+    """
+    Rebuild every leaderboard segment from the Ranking table.
+
+    Safe to run at any time (e.g. after a Redis flush or failover): segments
+    are swapped in atomically.
+
+    Returns:
+        dict: Number of entries written per segment
+    """
+    try:
+        return LeaderboardService.rebuild()
+    except Exception as e:
+        logger.error(f"Leaderboard rebuild failed: {e}")
+        raise self.retry(exc=e, countdown=60) from e
+
+
+@shared_task(bind=True, max_retries=3)
+def refresh_text_index(self) -> dict:
+    """
+    Re-vectorize changed candidates and publish a new text index build.
+
+    The debounce flag is cleared first so edits made while the refresh runs
+    schedule another one.
+
+    Returns:
+        dict: {'build': str, 'rows': int, 'vectorized': int, 'reused': int}
+    """
+    try:
+        get_redis_client().delete(REFRESH_PENDING_KEY)
+    except Exception as e:
+        logger.warning(f"Could not clear text index refresh flag: {e}")
+
+    try:
+        return TextSimilarityService.refresh()
+    except Exception as e:
+        logger.error(f"Text index refresh failed: {e}")
+        raise self.retry(exc=e, countdown=60 * (2**self.request.retries)) from e
@@ -0,0 +1,230 @@
+"""
+Tests for the Redis-backed candidate leaderboard.
+"""
+
+from decimal import Decimal
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from candidates.models import CandidateProfile
+from matching.models import Ranking
+from matching.services.leaderboard import LeaderboardService
+
+
+def make_candidate(index: int, position: str = "SDR/BDR", status: str = "available"):
+    """Create a candidate profile with its own user."""
+    user = User.objects.create_user(
+        email=f"candidate{index}@test.com", password="testpass123", role="candidate"
+    )
+    return CandidateProfile.objects.create(
+        user=user,
+        full_name=f"Candidate {index}",
+        phone="11999999999",
+        current_position=position,
+        status=status,
+    )
+
+
+@pytest.fixture
+def admin_user(db):
+    """Create an admin user."""
+    return User.objects.create_user(email="admin@test.com", password="testpass123", role="admin")
+
+
+@pytest.fixture
+def ranked_candidates(db, django_capture_on_commit_callbacks):
+    """Create five ranked candidates (scores 90, 80, 80, 70, 60)."""
+    specs = [
+        (Decimal("90.00"), None, "SDR/BDR", "available"),
+        (Decimal("80.00"), 2, "AE/Closer", "available"),
+        (Decimal("80.00"), 1, "SDR/BDR", "inactive"),
+        (Decimal("70.00"), None, "CSM", "available"),
+        (Decimal("60.00"), None, "SDR/BDR", "available"),
+    ]
+    candidates = []
+    with django_capture_on_commit_callbacks(execute=True):
+        for index, (score, position_rank, position, candidate_status) in enumerate(specs):
+            candidate = make_candidate(index, position, candidate_status)
+            Ranking.objects.create(candidate=candidate, score=score, rank_position=position_rank)
+            candidates.append(candidate)
+    return candidates
+
+
+@pytest.mark.django_db
+class TestLeaderboardService:
+    """Tests for LeaderboardService."""
+
+    def test_overall_order_matches_model_ordering(self, ranked_candidates):
+        """Test Redis order equals Ranking.Meta.ordering (-score, rank_position)."""
+        expected = [str(r.candidate_id) for r in Ranking.objects.all()]
+
+        entries = LeaderboardService.get_top(limit=10)
+
+        assert [e["candidate_id"] for e in entries] == expected
+        assert [e["rank"] for e in entries] == [1, 2, 3, 4, 5]
+        assert entries[0]["score"] == Decimal("90.00")
+
+    def test_equal_scores_ordered_by_rank_position(self, ranked_candidates):
+        """Test tie on score is broken by the lower rank_position."""
+        assert LeaderboardService.get_rank(ranked_candidates[2].id) == 2
+        assert LeaderboardService.get_rank(ranked_candidates[1].id) == 3
+
+    def test_segments(self, ranked_candidates):
+        """Test position and status segments only contain matching candidates."""
+        sdr = LeaderboardService.get_top("position:SDR/BDR")
+        inactive = LeaderboardService.get_top("status:inactive")
+
+        assert [e["candidate_id"] for e in sdr] == [
+            str(ranked_candidates[0].id),
+            str(ranked_candidates[2].id),
+            str(ranked_candidates[4].id),
+        ]
+        assert [e["candidate_id"] for e in inactive] == [str(ranked_candidates[2].id)]
+        assert LeaderboardService.get_rank(ranked_candidates[4].id, "position:SDR/BDR") == 3
+
+    def test_invalid_segment_raises(self, ranked_candidates):
+        """Test unknown segment names are rejected."""
+        with pytest.raises(ValueError):
+            LeaderboardService.get_top("position:CEO")
+
+    def test_neighborhood(self, ranked_candidates):
+        """Test neighborhood returns the window around a candidate."""
+        entries = LeaderboardService.get_neighborhood(ranked_candidates[1].id, radius=1)
+
+        assert [e["rank"] for e in entries] == [2, 3, 4]
+        assert entries[1]["candidate_id"] == str(ranked_candidates[1].id)
+
+    def test_neighborhood_clamped_at_top(self, ranked_candidates):
+        """Test neighborhood of the leader starts at rank 1."""
+        entries = LeaderboardService.get_neighborhood(ranked_candidates[0].id, radius=2)
+
+        assert [e["rank"] for e in entries] == [1, 2, 3]
+
+    def test_unranked_candidate(self, ranked_candidates):
+        """Test lookups for a candidate without ranking."""
+        candidate = make_candidate(99)
+
+        assert LeaderboardService.get_rank(candidate.id) is None
+        assert LeaderboardService.get_neighborhood(candidate.id) == []
+
+    def test_rebuild_restores_from_database(self, ranked_candidates, fake_redis):
+        """Test rebuild repopulates every segment after Redis loses data."""
+        fake_redis.flushall()
+
+        counts = LeaderboardService.rebuild()
+
+        assert counts["overall"] == 5
+        assert counts["position:SDR/BDR"] == 3
+        assert counts["status:no_contract"] == 0
+        assert LeaderboardService.get_rank(ranked_candidates[0].id) == 1
+
+    def test_rebuild_drops_stale_members(self, ranked_candidates, fake_redis):
+        """Test rebuild removes entries no longer backed by an active ranking."""
+        Ranking.objects.filter(candidate=ranked_candidates[0]).update(is_active=False)
+
+        LeaderboardService.rebuild()
+
+        assert LeaderboardService.get_rank(ranked_candidates[0].id) is None
+        assert LeaderboardService.get_size() == 4
+
+
+@pytest.mark.django_db
+class TestLeaderboardSignals:
+    """Tests for signal-driven leaderboard sync."""
+
+    def test_score_update_moves_candidate(
+        self, ranked_candidates, django_capture_on_commit_callbacks
+    ):
+        """Test saving a new score re-ranks the candidate."""
+        ranking = Ranking.objects.get(candidate=ranked_candidates[4])
+        ranking.score = Decimal("95.00")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ranking.save()
+
+        assert LeaderboardService.get_rank(ranked_candidates[4].id) == 1
+
+    def test_ranking_delete_removes_candidate(
+        self, ranked_candidates, django_capture_on_commit_callbacks
+    ):
+        """Test deleting a ranking removes it from all segments."""
+        with django_capture_on_commit_callbacks(execute=True):
+            Ranking.objects.get(candidate=ranked_candidates[0]).delete()
+
+        assert LeaderboardService.get_rank(ranked_candidates[0].id) is None
+        assert LeaderboardService.get_rank(ranked_candidates[0].id, "position:SDR/BDR") is None
+
+    def test_profile_status_change_resegments(
+        self, ranked_candidates, django_capture_on_commit_callbacks
+    ):
+        """Test a status change moves the candidate between status segments."""
+        candidate = ranked_candidates[0]
+        candidate.status = "no_contract"
+
+        with django_capture_on_commit_callbacks(execute=True):
+            candidate.save()
+
+        assert LeaderboardService.get_rank(candidate.id, "status:available") is None
+        assert LeaderboardService.get_rank(candidate.id, "status:no_contract") == 1
+
+    def test_nothing_written_before_commit(self, db, django_capture_on_commit_callbacks):
+        """Test Redis is only updated once the transaction commits."""
+        candidate = make_candidate(1)
+
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            Ranking.objects.create(candidate=candidate, score=Decimal("50.00"))
+
+        assert LeaderboardService.get_rank(candidate.id) is None
+        assert len(callbacks) == 1
+
+
+@pytest.mark.django_db
+class TestLeaderboardEndpoints:
+    """Tests for leaderboard API endpoints."""
+
+    def test_leaderboard_page(self, ranked_candidates, admin_user):
+        """Test admin can read a leaderboard page with candidate details."""
+        client = APIClient()
+        client.force_authenticate(user=admin_user)
+
+        response = client.get("/api/v1/matching/leaderboard", {"page_size": 2, "page": 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 5
+        assert [r["rank"] for r in response.data["results"]] == [3, 4]
+        assert response.data["results"][0]["full_name"] == "Candidate 1"
+
+    def test_leaderboard_invalid_segment(self, ranked_candidates, admin_user):
+        """Test unknown segment returns 400."""
+        client = APIClient()
+        client.force_authenticate(user=admin_user)
+
+        response = client.get("/api/v1/matching/leaderboard", {"segment": "bogus"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_neighborhood_endpoint(self, ranked_candidates, admin_user):
+        """Test neighborhood endpoint returns the candidate's rank and window."""
+        client = APIClient()
+        client.force_authenticate(user=admin_user)
+
+        response = client.get(
+            f"/api/v1/matching/leaderboard/{ranked_candidates[3].id}/neighborhood",
+            {"radius": 1},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["rank"] == 4
+        assert len(response.data["results"]) == 3
+
+    def test_leaderboard_requires_admin(self, ranked_candidates):
+        """Test candidates cannot read the leaderboard."""
+        client = APIClient()
+        client.force_authenticate(user=ranked_candidates[0].user)
+
+        response = client.get("/api/v1/matching/leaderboard")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,176 @@
+"""
+Tests for the cached candidate recommended-jobs feed.
+"""
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from candidates.models import CandidateProfile
+from companies.models import CompanyProfile
+from jobs.models import JobPosting
+from matching.services.recommendations import GENERATION_KEY, RecommendationService
+
+
+@pytest.fixture
+def company(db):
+    """Create a company."""
+    return CompanyProfile.objects.create(
+        company_name="Tech Company",
+        cnpj="12345678000190",
+        website="https://techcompany.com",
+        industry="SaaS",
+        size="11-50",
+        contact_person_name="John Doe",
+        contact_person_email="john@techcompany.com",
+        contact_person_phone="11988888888",
+    )
+
+
+def make_job(company, title: str, skills: list, is_remote: bool = True, **extra) -> JobPosting:
+    """Create an active job posting."""
+    return JobPosting.objects.create(
+        company=company,
+        title=title,
+        position_type="SDR/BDR",
+        seniority="junior",
+        description="Vaga",
+        responsibilities="Prospecção",
+        location="São Paulo",
+        is_remote=is_remote,
+        required_skills=skills,
+        **extra,
+    )
+
+
+@pytest.fixture
+def jobs(company):
+    """Create jobs with decreasing fit for the candidate."""
+    return [
+        make_job(company, "Best", ["Outbound", "Cold Call"]),
+        make_job(company, "Good", ["Outbound", "Inbound"]),
+        make_job(company, "Poor", ["Inbound"], is_remote=False),
+        make_job(company, "Closed", ["Outbound", "Cold Call"], is_active=False),
+    ]
+
+
+@pytest.fixture
+def candidate(db):
+    """Create a remote junior candidate."""
+    user = User.objects.create_user(email="candidate@test.com", password="pass", role="candidate")
+    return CandidateProfile.objects.create(
+        user=user,
+        full_name="Candidate",
+        phone="11999999999",
+        top_skills=["Outbound", "Cold Call"],
+        years_of_experience=1,
+        work_model="remote",
+    )
+
+
+@pytest.mark.django_db
+class TestRecommendationService:
+    """Tests for RecommendationService."""
+
+    def test_feed_ranks_active_jobs(self, jobs, candidate):
+        """Test active jobs are ranked by match score with a breakdown."""
+        feed = RecommendationService.get_recommended_jobs(candidate)
+
+        assert [entry["title"] for entry in feed] == ["Best", "Good", "Poor"]
+        assert feed[0]["company_name"] == "Tech Company"
+        assert feed[0]["score"] == 100.0
+        assert feed[1]["breakdown"]["skills"] == 50.0
+
+    def test_cache_hit_skips_database(self, jobs, candidate, django_assert_num_queries):
+        """Test a cached feed is served without queries."""
+        RecommendationService.get_recommended_jobs(candidate)
+
+        with django_assert_num_queries(0):
+            feed = RecommendationService.get_recommended_jobs(candidate, limit=2)
+
+        assert len(feed) == 2
+
+    def test_cached_with_ttl(self, jobs, candidate, fake_redis, settings):
+        """Test the feed is stored with the configured TTL."""
+        settings.MATCHING_RECOMMENDATIONS_TTL = 120
+        RecommendationService.get_recommended_jobs(candidate)
+
+        key = RecommendationService.feed_key(candidate.id, 0)
+        assert 0 < fake_redis.ttl(key) <= 120
+
+    def test_new_job_invalidates_feeds(
+        self, jobs, candidate, company, fake_redis, django_capture_on_commit_callbacks
+    ):
+        """Test publishing a job makes every feed recompute."""
+        RecommendationService.get_recommended_jobs(candidate)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            make_job(company, "New", ["Outbound", "Cold Call"])
+
+        assert int(fake_redis.get(GENERATION_KEY)) == 1
+        titles = [entry["title"] for entry in RecommendationService.get_recommended_jobs(candidate)]
+        assert "New" in titles
+
+    def test_profile_change_invalidates_feed(
+        self, jobs, candidate, django_capture_on_commit_callbacks
+    ):
+        """Test editing scoring fields invalidates the candidate's feed."""
+        RecommendationService.get_recommended_jobs(candidate)
+
+        candidate.top_skills = ["Inbound"]
+        with django_capture_on_commit_callbacks(execute=True):
+            candidate.save()
+
+        feed = RecommendationService.get_recommended_jobs(candidate)
+        assert feed[0]["breakdown"]["skills"] == 100.0
+        assert feed[0]["title"] in ("Good", "Poor")
+
+    def test_unrelated_profile_update_keeps_feed(
+        self, jobs, candidate, fake_redis, django_capture_on_commit_callbacks
+    ):
+        """Test saves limited to non-scoring fields keep the cached feed."""
+        RecommendationService.get_recommended_jobs(candidate)
+
+        candidate.bio = "Nova bio"
+        with django_capture_on_commit_callbacks(execute=True):
+            candidate.save(update_fields=["bio"])
+
+        assert fake_redis.exists(RecommendationService.feed_key(candidate.id, 0))
+
+
+@pytest.mark.django_db
+class TestRecommendedJobsEndpoint:
+    """Tests for GET /api/v1/matching/recommended-jobs"""
+
+    url = "/api/v1/matching/recommended-jobs"
+
+    def test_candidate_gets_feed(self, jobs, candidate):
+        """Test candidate receives recommended jobs."""
+        client = APIClient()
+        client.force_authenticate(user=candidate.user)
+
+        response = client.get(self.url, {"limit": 1})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [r["job_id"] for r in response.data["results"]] == [str(jobs[0].id)]
+
+    def test_candidate_without_profile(self, db):
+        """Test candidate without profile gets 404."""
+        user = User.objects.create_user(email="new@test.com", password="pass", role="candidate")
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(self.url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_requires_candidate_role(self, db):
+        """Test non-candidates cannot read the feed."""
+        admin = User.objects.create_user(email="admin@test.com", password="pass", role="admin")
+        client = APIClient()
+        client.force_authenticate(user=admin)
+
+        response = client.get(self.url)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,240 @@
+"""
+Tests for the vectorized match scoring engine.
+"""
+
+import numpy as np
+import pytest
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from candidates.models import CandidateProfile
+from companies.models import CompanyProfile
+from jobs.models import JobPosting
+from matching.services.scoring import COMPONENTS, MatchScoringService
+
+
+def job_row(**overrides) -> dict:
+    """Build a job scoring row."""
+    row = {
+        "id": "job",
+        "required_skills": ["Outbound", "Negociação"],
+        "required_tools": ["Salesforce"],
+        "seniority": "pleno",
+        "is_remote": True,
+    }
+    row.update(overrides)
+    return row
+
+
+def candidate_row(**overrides) -> dict:
+    """Build a candidate scoring row."""
+    row = {
+        "id": "candidate",
+        "top_skills": ["outbound ", "Negociação"],
+        "tools_software": ["Salesforce", "HubSpot"],
+        "years_of_experience": 3,
+        "work_model": "remote",
+    }
+    row.update(overrides)
+    return row
+
+
+class TestMatchScoringEngine:
+    """Tests for MatchScoringService.score."""
+
+    def test_perfect_match(self):
+        """Test a candidate covering every requirement scores 100 on all components."""
+        scores = MatchScoringService.score([job_row()], [candidate_row()])
+
+        total, breakdown = MatchScoringService.unpack_row(scores[0, 0])
+
+        assert total == 100.0
+        assert breakdown == {"skills": 100.0, "tools": 100.0, "seniority": 100.0, "remote": 100.0}
+
+    def test_components(self):
+        """Test each component is computed independently."""
+        candidate = candidate_row(
+            top_skills=["Outbound"],
+            tools_software=[],
+            years_of_experience=10,
+            work_model="hybrid",
+        )
+
+        total, breakdown = MatchScoringService.unpack_row(
+            MatchScoringService.score([job_row()], [candidate])[0, 0]
+        )
+
+        assert breakdown == {"skills": 50.0, "tools": 0.0, "seniority": 50.0, "remote": 75.0}
+        assert total == pytest.approx(0.4 * 50 + 0.3 * 0 + 0.2 * 50 + 0.1 * 75)
+
+    def test_job_without_requirements(self):
+        """Test jobs without required skills/tools do not penalize candidates."""
+        scores = MatchScoringService.score(
+            [job_row(required_skills=[], required_tools=[])], [candidate_row(top_skills=[])]
+        )
+
+        _, breakdown = MatchScoringService.unpack_row(scores[0, 0])
+
+        assert breakdown["skills"] == 100.0
+        assert breakdown["tools"] == 100.0
+
+    def test_unknown_experience_is_neutral(self):
+        """Test candidates without years of experience get a neutral seniority fit."""
+        scores = MatchScoringService.score([job_row()], [candidate_row(years_of_experience=None)])
+
+        _, breakdown = MatchScoringService.unpack_row(scores[0, 0])
+
+        assert breakdown["seniority"] == 50.0
+
+    def test_matrix_shape_and_width(self):
+        """Test all jobs x candidates are scored in one pass into a fixed-width array."""
+        jobs = [job_row(), job_row(is_remote=False, seniority="senior")]
+        candidates = [candidate_row(), candidate_row(work_model="onsite"), candidate_row()]
+
+        scores = MatchScoringService.score(jobs, candidates)
+
+        assert scores.shape == (2, 3, 1 + len(COMPONENTS))
+        assert scores.dtype == np.uint16
+
+    def test_empty_pool(self):
+        """Test scoring an empty candidate pool."""
+        scores = MatchScoringService.score([job_row()], [])
+
+        assert scores.shape == (1, 0, 1 + len(COMPONENTS))
+
+
+@pytest.fixture
+def job(db):
+    """Create an active remote job posting."""
+    cache.clear()
+    company = CompanyProfile.objects.create(
+        company_name="Tech Company",
+        cnpj="12345678000190",
+        website="https://techcompany.com",
+        industry="SaaS",
+        size="11-50",
+        contact_person_name="John Doe",
+        contact_person_email="john@techcompany.com",
+        contact_person_phone="11988888888",
+    )
+    return JobPosting.objects.create(
+        company=company,
+        title="SDR Position",
+        position_type="SDR/BDR",
+        seniority="junior",
+        description="Sales Development Representative role",
+        responsibilities="Cold calling",
+        location="São Paulo",
+        is_remote=True,
+        required_skills=["Outbound", "Cold Call"],
+        required_tools=["HubSpot"],
+    )
+
+
+@pytest.fixture
+def candidates(db):
+    """Create candidates with decreasing fit for the job."""
+    specs = [
+        (["Outbound", "Cold Call"], ["HubSpot"], 1, "remote", "available"),
+        (["Outbound"], ["HubSpot"], 1, "hybrid", "available"),
+        ([], [], 8, "onsite", "available"),
+        (["Outbound", "Cold Call"], ["HubSpot"], 1, "remote", "inactive"),
+    ]
+    profiles = []
+    for index, (skills, tools, years, work_model, candidate_status) in enumerate(specs):
+        user = User.objects.create_user(
+            email=f"candidate{index}@test.com", password="pass", role="candidate"
+        )
+        profiles.append(
+            CandidateProfile.objects.create(
+                user=user,
+                full_name=f"Candidate {index}",
+                phone="11999999999",
+                top_skills=skills,
+                tools_software=tools,
+                years_of_experience=years,
+                work_model=work_model,
+                status=candidate_status,
+            )
+        )
+    return profiles
+
+
+@pytest.mark.django_db
+class TestJobMatches:
+    """Tests for job match ranking, caching and the endpoint."""
+
+    def test_top_matches_ordered_with_breakdown(self, job, candidates):
+        """Test matches are ranked by total and exclude unavailable candidates."""
+        matches = MatchScoringService.top_matches(job)
+
+        assert [m["candidate_id"] for m in matches] == [str(c.id) for c in candidates[:3]]
+        assert matches[0]["score"] == 100.0
+        assert set(matches[1]["breakdown"]) == set(COMPONENTS)
+
+    def test_min_score_and_limit(self, job, candidates):
+        """Test min_score and limit filters."""
+        assert len(MatchScoringService.top_matches(job, min_score=50)) == 2
+        assert len(MatchScoringService.top_matches(job, limit=1)) == 1
+
+    def test_scores_served_from_cache(self, job, candidates, django_assert_num_queries):
+        """Test a second read reuses the packed scores without hitting the DB."""
+        MatchScoringService.get_job_scores(job)
+
+        with django_assert_num_queries(0):
+            candidate_ids, scores = MatchScoringService.get_job_scores(job)
+
+        assert len(candidate_ids) == 3
+        assert scores.shape == (3, 1 + len(COMPONENTS))
+
+    def test_job_edit_invalidates_cache(self, job, candidates):
+        """Test editing the job produces fresh scores."""
+        MatchScoringService.get_job_scores(job)
+
+        job.required_tools = []
+        job.save()
+
+        matches = MatchScoringService.top_matches(job)
+        assert all(m["breakdown"]["tools"] == 100.0 for m in matches)
+
+    def test_endpoint(self, job, candidates):
+        """Test admin job-matches endpoint exposes score breakdown."""
+        admin = User.objects.create_user(email="admin@test.com", password="pass", role="admin")
+        client = APIClient()
+        client.force_authenticate(user=admin)
+
+        response = client.get(f"/api/v1/matching/jobs/{job.id}/matches", {"limit": 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert len(results) == 2
+        assert results[0]["full_name"] == "Candidate 0"
+        assert results[0]["breakdown"] == {
+            "skills": 100.0,
+            "tools": 100.0,
+            "seniority": 100.0,
+            "remote": 100.0,
+        }
+
+    @pytest.mark.parametrize("min_score", ["nan", "inf", "-inf", "abc"])
+    def test_endpoint_rejects_invalid_min_score(self, job, min_score):
+        """Test non-numeric and non-finite min_score return 400."""
+        admin = User.objects.create_user(email="admin@test.com", password="pass", role="admin")
+        client = APIClient()
+        client.force_authenticate(user=admin)
+
+        response = client.get(f"/api/v1/matching/jobs/{job.id}/matches", {"min_score": min_score})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_endpoint_unknown_job(self, db):
+        """Test unknown job returns 404."""
+        admin = User.objects.create_user(email="admin@test.com", password="pass", role="admin")
+        client = APIClient()
+        client.force_authenticate(user=admin)
+
+        response = client.get("/api/v1/matching/jobs/00000000-0000-0000-0000-000000000000/matches")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,381 @@
+"""
+Tests for the memory-mapped text similarity index.
+"""
+
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from candidates.models import CandidateProfile, Experience
+from companies.models import CompanyProfile
+from jobs.models import JobPosting
+from matching.services import text_similarity
+from matching.services.text_similarity import (
+    CURRENT_KEY,
+    REFRESH_PENDING_KEY,
+    TextSimilarityService,
+    _build_lock,
+    _hash_vector,
+    _new_build_name,
+    _tokenize,
+)
+
+
+def make_candidate(index: int, bio: str, candidate_status: str = "available"):
+    """Create a candidate profile with its own user."""
+    user = User.objects.create_user(
+        email=f"candidate{index}@test.com", password="pass", role="candidate"
+    )
+    return CandidateProfile.objects.create(
+        user=user,
+        full_name=f"Candidate {index}",
+        phone="11999999999",
+        bio=bio,
+        status=candidate_status,
+    )
+
+
+@pytest.fixture
+def job(db):
+    """Create an active job about outbound prospecting."""
+    company = CompanyProfile.objects.create(
+        company_name="Tech Company",
+        cnpj="12345678000190",
+        website="https://techcompany.com",
+        industry="SaaS",
+        size="11-50",
+        contact_person_name="John Doe",
+        contact_person_email="john@techcompany.com",
+        contact_person_phone="11988888888",
+    )
+    return JobPosting.objects.create(
+        company=company,
+        title="SDR Outbound",
+        position_type="SDR/BDR",
+        seniority="junior",
+        description="Prospecção outbound de contas enterprise com cold call e cadências",
+        responsibilities="Qualificar leads e agendar reuniões",
+        location="São Paulo",
+    )
+
+
+@pytest.fixture
+def candidates(db):
+    """Create candidates with decreasing textual similarity to the job."""
+    return [
+        make_candidate(0, "Prospecção outbound enterprise, cold call, cadências e leads"),
+        make_candidate(1, "Experiência com cold call"),
+        make_candidate(2, "Gestão de carteira e renovação de contratos"),
+        make_candidate(3, "Prospecção outbound enterprise, cold call", "inactive"),
+    ]
+
+
+class FakeBucket:
+    """In-memory stand-in for the S3 calls the shared index makes."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def upload_file(self, filename, bucket, key):
+        self.objects[key] = Path(filename).read_bytes()
+
+    def download_file(self, bucket, key, filename):
+        Path(filename).write_bytes(self.objects[key])
+
+    def list_objects_v2(self, Bucket, Prefix):
+        return {
+            "Contents": [{"Key": key} for key in sorted(self.objects) if key.startswith(Prefix)]
+        }
+
+    def delete_objects(self, Bucket, Delete):
+        for obj in Delete["Objects"]:
+            self.objects.pop(obj["Key"], None)
+
+
+class TestTextVectors:
+    """Tests for tokenization and hashing."""
+
+    def test_tokenize_lowercases_and_drops_stopwords(self):
+        """Test tokens are lowercased, accents kept and stopwords removed."""
+        assert _tokenize("Prospecção de Leads e Cold-Call") == [
+            "prospecção",
+            "leads",
+            "cold",
+            "call",
+        ]
+
+    def test_hash_vector_is_stable_and_sublinear(self):
+        """Test hashing is deterministic and repeated terms grow logarithmically."""
+        vector = _hash_vector("leads leads leads", 64)
+
+        assert np.array_equal(vector, _hash_vector("leads leads leads", 64))
+        assert vector.max() == pytest.approx(np.log1p(3))
+        assert np.count_nonzero(vector) == 1
+
+
+@pytest.mark.django_db
+class TestTextSimilarityService:
+    """Tests for index builds and queries."""
+
+    def test_ranks_by_description_similarity(self, job, candidates):
+        """Test candidates closest to the job text come first; unavailable are excluded."""
+        TextSimilarityService.refresh()
+        results = TextSimilarityService.similar_candidates(job)
+
+        ids = [r["candidate_id"] for r in results]
+        assert ids[:2] == [str(candidates[0].id), str(candidates[1].id)]
+        assert str(candidates[3].id) not in ids
+        assert 0 < results[0]["similarity"] <= 100
+        assert results[0]["similarity"] > results[1]["similarity"]
+
+    def test_experiences_are_indexed(self, job, candidates):
+        """Test experience responsibilities contribute to similarity."""
+        Experience.objects.create(
+            candidate=candidates[2],
+            company_name="Acme",
+            position="SDR",
+            start_date=date(2020, 1, 1),
+            responsibilities="Prospecção outbound enterprise, qualificar leads, agendar reuniões",
+        )
+
+        TextSimilarityService.refresh()
+        ids = [r["candidate_id"] for r in TextSimilarityService.similar_candidates(job)]
+
+        assert ids.index(str(candidates[2].id)) < ids.index(str(candidates[1].id))
+
+    def test_limit_and_min_similarity(self, job, candidates):
+        """Test limit and min_similarity filters."""
+        TextSimilarityService.refresh()
+        assert len(TextSimilarityService.similar_candidates(job, limit=1)) == 1
+        assert TextSimilarityService.similar_candidates(job, min_similarity=100) == []
+
+    def test_index_is_memory_mapped(self, job, candidates):
+        """Test the published build is read through a memory map."""
+        TextSimilarityService.refresh()
+
+        index = TextSimilarityService.load()
+
+        assert isinstance(index.vectors, np.memmap)
+        assert index.vectors.shape == (3, index.dimensions)
+
+    def test_refresh_is_incremental(self, job, candidates):
+        """Test only changed candidates are re-vectorized."""
+        first = TextSimilarityService.refresh()
+        assert first["vectorized"] == 3
+
+        unchanged = TextSimilarityService.refresh()
+        assert unchanged["build"] == first["build"]
+
+        candidates[1].bio = "Renovação de contratos"
+        candidates[1].save()
+        make_candidate(4, "Cold call outbound")
+
+        second = TextSimilarityService.refresh()
+        assert second["build"] != first["build"]
+        assert second["vectorized"] == 2
+        assert second["reused"] == 2
+
+    def test_refresh_drops_removed_candidates(self, job, candidates):
+        """Test candidates that stop being available leave the index."""
+        TextSimilarityService.refresh()
+        candidates[0].status = "inactive"
+        candidates[0].save()
+
+        result = TextSimilarityService.refresh()
+
+        assert result["rows"] == 2
+        ids = [r["candidate_id"] for r in TextSimilarityService.similar_candidates(job)]
+        assert str(candidates[0].id) not in ids
+
+    def test_old_builds_are_removed(self, job, candidates, text_index_dir):
+        """Test only the current and previous builds stay on disk."""
+        for index in range(3):
+            candidates[0].bio = f"Outbound {index}"
+            candidates[0].save()
+            TextSimilarityService.refresh()
+
+        assert len([p for p in text_index_dir.iterdir() if p.is_dir()]) == 2
+
+    def test_newer_builds_are_kept(self, job, candidates, text_index_dir):
+        """Test cleanup only drops builds older than the one being replaced."""
+        TextSimilarityService.refresh()
+        legacy = text_index_dir / "0f2c9a1b4e5d4c3b8a7f6e5d4c3b2a19"
+        legacy.mkdir()
+        in_progress = text_index_dir / _new_build_name()
+        in_progress.mkdir()
+
+        candidates[0].bio = "Outbound"
+        candidates[0].save()
+        TextSimilarityService.refresh()
+
+        assert in_progress.exists()
+        assert not legacy.exists()
+
+    def test_refresh_waits_for_running_build(self):
+        """Test builds are serialized by the index lock."""
+        with patch.object(TextSimilarityService, "_refresh") as build:
+            with _build_lock():
+                thread = threading.Thread(target=TextSimilarityService.refresh)
+                thread.start()
+                thread.join(0.2)
+                assert thread.is_alive()
+                build.assert_not_called()
+            thread.join(5)
+
+        build.assert_called_once()
+
+    def test_incomplete_build_is_unavailable(self, job, candidates, text_index_dir, monkeypatch):
+        """Test a build with missing files loads as None instead of failing."""
+        build = TextSimilarityService.refresh()["build"]
+        (text_index_dir / build / "meta.json").unlink()
+        monkeypatch.setattr(text_similarity, "_loaded", None)
+
+        assert TextSimilarityService.load() is None
+        assert TextSimilarityService.similar_candidates(job) is None
+
+    def test_queries_never_build(
+        self, job, candidates, text_index_dir, fake_redis, django_capture_on_commit_callbacks
+    ):
+        """Test a query on an unbuilt index schedules a refresh instead of building."""
+        fake_redis.delete(REFRESH_PENDING_KEY)
+
+        with patch.object(TextSimilarityService, "refresh") as refresh:
+            with django_capture_on_commit_callbacks(execute=False) as callbacks:
+                assert TextSimilarityService.similar_candidates(job) is None
+
+        refresh.assert_not_called()
+        assert len(callbacks) == 1
+        assert not text_index_dir.exists()
+
+    def test_empty_pool(self, job):
+        """Test an empty pool builds an empty index."""
+        assert TextSimilarityService.refresh()["rows"] == 0
+        assert TextSimilarityService.similar_candidates(job) == []
+
+    def test_profile_edits_schedule_one_refresh(
+        self, candidates, fake_redis, django_capture_on_commit_callbacks
+    ):
+        """Test a burst of edits enqueues a single debounced refresh."""
+        fake_redis.delete(REFRESH_PENDING_KEY)
+
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            candidates[0].bio = "Nova bio"
+            candidates[0].save()
+            candidates[1].bio = "Outra bio"
+            candidates[1].save()
+
+        refreshes = [c for c in callbacks if "schedule_refresh" in c.__qualname__]
+        assert len(refreshes) == 1
+        assert fake_redis.exists(REFRESH_PENDING_KEY)
+
+    def test_unrelated_update_does_not_schedule(self, candidates, fake_redis):
+        """Test saves limited to unrelated fields do not schedule a refresh."""
+        fake_redis.delete(REFRESH_PENDING_KEY)
+
+        candidates[0].phone = "11888888888"
+        candidates[0].save(update_fields=["phone"])
+
+        assert not fake_redis.exists(REFRESH_PENDING_KEY)
+
+
+class TestSharedIndex:
+    """Tests for an index built by a worker and read by other hosts (S3 storage)."""
+
+    @pytest.fixture
+    def bucket(self, settings, s3_settings, monkeypatch):
+        settings.MATCHING_TEXT_INDEX_STORAGE = "s3"
+        fake = FakeBucket()
+        monkeypatch.setattr(text_similarity, "get_s3_client", lambda: fake)
+        return fake
+
+    def test_web_host_downloads_published_build(
+        self, job, candidates, bucket, settings, tmp_path, fake_redis, monkeypatch
+    ):
+        """Test another host serves nothing until the published build is downloaded."""
+        settings.MATCHING_TEXT_INDEX_DIR = str(tmp_path / "worker")
+        build = TextSimilarityService.refresh()["build"]
+        assert fake_redis.get(CURRENT_KEY) == build
+        assert f"matching/text-index/{build}/meta.json" in bucket.objects
+
+        settings.MATCHING_TEXT_INDEX_DIR = str(tmp_path / "web")
+        monkeypatch.setattr(text_similarity, "_loaded", None)
+        with patch.object(TextSimilarityService, "refresh") as refresh:
+            assert TextSimilarityService.similar_candidates(job) is None
+            for _ in range(100):
+                if not text_similarity._downloading:
+                    break
+                time.sleep(0.05)
+            results = TextSimilarityService.similar_candidates(job)
+
+        refresh.assert_not_called()
+        assert results[0]["candidate_id"] == str(candidates[0].id)
+        assert (tmp_path / "web" / "CURRENT").read_text() == build
+
+    def test_old_builds_are_removed_from_storage(self, job, candidates, bucket):
+        """Test only the current and previous builds stay in the bucket."""
+        for index in range(3):
+            candidates[0].bio = f"Outbound {index}"
+            candidates[0].save()
+            TextSimilarityService.refresh()
+
+        assert len({key.split("/")[-2] for key in bucket.objects}) == 2
+
+
+@pytest.mark.django_db
+class TestSimilarCandidatesEndpoint:
+    """Tests for GET /api/v1/matching/jobs/<id>/similar-candidates"""
+
+    def test_admin_gets_similar_candidates(self, job, candidates):
+        """Test admin receives hydrated, ordered results."""
+        admin = User.objects.create_user(email="admin@test.com", password="pass", role="admin")
+        client = APIClient()
+        client.force_authenticate(user=admin)
+        TextSimilarityService.refresh()
+
+        response = client.get(f"/api/v1/matching/jobs/{job.id}/similar-candidates", {"limit": 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert [r["full_name"] for r in results] == ["Candidate 0", "Candidate 1"]
+        assert "similarity" in results[0]
+
+    def test_requires_admin(self, job, candidates):
+        """Test candidates cannot query similar candidates."""
+        client = APIClient()
+        client.force_authenticate(user=candidates[0].user)
+
+        response = client.get(f"/api/v1/matching/jobs/{job.id}/similar-candidates")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_unavailable_until_built(self, job, candidates):
+        """Test the endpoint answers 503 instead of building the index."""
+        admin = User.objects.create_user(email="admin@test.com", password="pass", role="admin")
+        client = APIClient()
+        client.force_authenticate(user=admin)
+
+        response = client.get(f"/api/v1/matching/jobs/{job.id}/similar-candidates")
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+    @pytest.mark.parametrize("min_similarity", ["nan", "inf", "-inf", "abc"])
+    def test_rejects_invalid_min_similarity(self, job, min_similarity):
+        """Test non-numeric and non-finite min_similarity return 400."""
+        admin = User.objects.create_user(email="admin@test.com", password="pass", role="admin")
+        client = APIClient()
+        client.force_authenticate(user=admin)
+
+        response = client.get(
+            f"/api/v1/matching/jobs/{job.id}/similar-candidates",
+            {"min_similarity": min_similarity},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
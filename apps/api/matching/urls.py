@@ -0,0 +1,30 @@
+"""
+URL configuration for matching app.
+Admin leaderboard endpoints backed by Redis sorted sets.
+Admin job matches with explainable score breakdown.
+Admin similar candidates by job description (text index).
+Candidate recommended-jobs feed.
+"""
+
+from django.urls import path
+
+from . import views
+
+app_name = "matching"
+
+urlpatterns = [
+    path("leaderboard", views.leaderboard, name="leaderboard"),
+    path("leaderboard/rebuild", views.rebuild_leaderboard, name="leaderboard-rebuild"),
+    path(
+        "leaderboard/<uuid:candidate_id>/neighborhood",
+        views.leaderboard_neighborhood,
+        name="leaderboard-neighborhood",
+    ),
+    path("jobs/<uuid:job_id>/matches", views.job_matches, name="job-matches"),
+    path(
+        "jobs/<uuid:job_id>/similar-candidates",
+        views.job_similar_candidates,
+        name="job-similar-candidates",
+    ),
+    path("recommended-jobs", views.recommended_jobs, name="recommended-jobs"),
+]
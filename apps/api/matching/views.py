@@ -1 +1,341 @@
-# Create your views here.
+"""
+Matching views module.
+API endpoints for admin candidate matching.
+Leaderboard pages are served from Redis sorted sets (see LeaderboardService).
+Job matches come from the vectorized scoring engine (see MatchScoringService).
+Similar candidates come from the on-disk text index (see TextSimilarityService).
+Candidates get a recommended-jobs feed cached in Redis (see RecommendationService).
+"""
+
+import logging
+import math
+
+from redis.exceptions import RedisError
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from candidates.models import CandidateProfile
+from candidates.services.media_processing import responsive_variants
+from core.permissions import IsAdmin, IsCandidate
+from core.utils.read_urls import sign_media_payload
+from jobs.models import JobPosting
+from matching.services.leaderboard import OVERALL_SEGMENT, LeaderboardService
+from matching.services.recommendations import FEED_SIZE, RecommendationService
+from matching.services.scoring import MatchScoringService
+from matching.services.text_similarity import TextSimilarityService
+
+logger = logging.getLogger(__name__)
+
+
+def _hydrate_entries(entries: list[dict]) -> list[dict]:
+    """
+    Attach candidate display data to leaderboard entries.
+
+    One primary-key lookup for the whole page; order comes from Redis.
+    """
+    candidates = CandidateProfile.objects.filter(
+        id__in=[entry["candidate_id"] for entry in entries]
+    ).only(
+        "id",
+        "full_name",
+        "current_position",
+        "status",
+        "profile_photo_url",
+        "profile_photo_variants",
+    )
+    by_id = {str(candidate.id): candidate for candidate in candidates}
+
+    results = []
+    for entry in entries:
+        candidate = by_id.get(entry["candidate_id"])
+        if candidate is None:
+            continue
+        results.append(
+            {
+                "rank": entry["rank"],
+                "score": str(entry["score"]),
+                "candidate_id": entry["candidate_id"],
+                "full_name": candidate.full_name,
+                "current_position": candidate.current_position,
+                "status": candidate.status,
+                "profile_photo_url": candidate.profile_photo_url,
+                "profile_photo_variants": responsive_variants(
+                    candidate.profile_photo_url, candidate.profile_photo_variants
+                ),
+            }
+        )
+    return sign_media_payload(results)
+
+
+def _hydrate_matches(matches: list[dict]) -> list[dict]:
+    """
+    Attach candidate display data to job matches, keeping their order.
+
+    Match keys other than 'candidate_id' (score, breakdown, similarity) are passed through.
+    """
+    candidates = CandidateProfile.objects.filter(
+        id__in=[match["candidate_id"] for match in matches]
+    ).only("id", "full_name", "current_position", "profile_photo_url", "profile_photo_variants")
+    by_id = {str(candidate.id): candidate for candidate in candidates}
+
+    results = []
+    for match in matches:
+        candidate = by_id.get(match["candidate_id"])
+        if candidate is None:
+            continue
+        results.append(
+            {
+                "candidate_id": match["candidate_id"],
+                "full_name": candidate.full_name,
+                "current_position": candidate.current_position,
+                "profile_photo_url": candidate.profile_photo_url,
+                "profile_photo_variants": responsive_variants(
+                    candidate.profile_photo_url, candidate.profile_photo_variants
+                ),
+                **{key: value for key, value in match.items() if key != "candidate_id"},
+            }
+        )
+    return sign_media_payload(results)
+
+
+@api_view(["GET"])
+@permission_classes([IsAdmin])
+def leaderboard(request):
+    """
+    Get a page of the candidate leaderboard (admin only).
+
+    Query params:
+        segment (str): 'overall', 'position:<position>' or 'status:<status>'
+        page (int): Page number (default: 1)
+        page_size (int): Items per page (default: 20, max: 100)
+
+    Returns:
+        200: { 'segment': str, 'count': int, 'results': [...] }
+        400: { 'error': 'message' }
+        503: { 'error': 'Leaderboard unavailable' }
+
+    Example:
+        GET /api/v1/matching/leaderboard?segment=position:SDR/BDR&page=2
+    """
+    segment = request.query_params.get("segment", OVERALL_SEGMENT)
+
+    try:
+        page = max(int(request.query_params.get("page", 1)), 1)
+        page_size = min(max(int(request.query_params.get("page_size", 20)), 1), 100)
+        entries = LeaderboardService.get_top(
+            segment, limit=page_size, offset=(page - 1) * page_size
+        )
+        count = LeaderboardService.get_size(segment)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except RedisError as e:
+        logger.error(f"Leaderboard read failed: {e}")
+        return Response(
+            {"error": "Leaderboard unavailable"}, status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+    return Response(
+        {"segment": segment, "count": count, "results": _hydrate_entries(entries)},
+        status=status.HTTP_200_OK,
+    )
+
+
+@api_view(["GET"])
+@permission_classes([IsAdmin])
+def leaderboard_neighborhood(request, candidate_id):
+    """
+    Get the candidates ranked around a candidate (admin only).
+
+    Query params:
+        segment (str): Segment name (default: 'overall')
+        radius (int): Entries above and below the candidate (default: 5, max: 50)
+
+    Returns:
+        200: { 'segment': str, 'rank': int, 'results': [...] }
+        400: { 'error': 'message' }
+        404: { 'error': 'Candidate is not ranked in this segment' }
+        503: { 'error': 'Leaderboard unavailable' }
+    """
+    segment = request.query_params.get("segment", OVERALL_SEGMENT)
+
+    try:
+        radius = min(max(int(request.query_params.get("radius", 5)), 0), 50)
+        entries = LeaderboardService.get_neighborhood(candidate_id, segment, radius=radius)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except RedisError as e:
+        logger.error(f"Leaderboard read failed: {e}")
+        return Response(
+            {"error": "Leaderboard unavailable"}, status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+    if not entries:
+        return Response(
+            {"error": "Candidate is not ranked in this segment"}, status=status.HTTP_404_NOT_FOUND
+        )
+
+    rank = next(e["rank"] for e in entries if e["candidate_id"] == str(candidate_id))
+    return Response(
+        {"segment": segment, "rank": rank, "results": _hydrate_entries(entries)},
+        status=status.HTTP_200_OK,
+    )
+
+
+@api_view(["POST"])
+@permission_classes([IsAdmin])
+def rebuild_leaderboard(request):
+    """
+    Trigger a full leaderboard rebuild from the database (admin only).
+
+    Returns:
+        202: { 'task_id': str }
+    """
+    from matching.tasks import rebuild_leaderboard as rebuild_leaderboard_task
+
+    task = rebuild_leaderboard_task.delay()
+    logger.info(f"Leaderboard rebuild {task.id} requested by admin {request.user.id}")
+
+    return Response({"task_id": task.id}, status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(["GET"])
+@permission_classes([IsAdmin])
+def job_matches(request, job_id):
+    """
+    Get the best-matching candidates for a job with a score breakdown (admin only).
+
+    Each match carries the total score and the components it was computed
+    from (skill overlap, tool overlap, seniority fit, remote fit), all 0-100.
+
+    Query params:
+        limit (int): Maximum number of matches (default: 20, max: 100)
+        min_score (float): Minimum total score (default: 0)
+
+    Returns:
+        200: {
+            'job_id': str,
+            'results': [{
+                'candidate_id', 'full_name', 'current_position', 'profile_photo_url',
+                'score': 82.5,
+                'breakdown': {'skills': 100.0, 'tools': 50.0, 'seniority': 100.0, 'remote': 75.0}
+            }, ...]
+        }
+        400: { 'error': 'Parâmetros inválidos' }
+        404: { 'error': 'Job not found' }
+
+    Example:
+        GET /api/v1/matching/jobs/<job_id>/matches?limit=10&min_score=60
+    """
+    try:
+        job = JobPosting.objects.get(id=job_id, is_active=True)
+    except JobPosting.DoesNotExist:
+        return Response({"error": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    try:
+        limit = min(max(int(request.query_params.get("limit", 20)), 1), 100)
+        min_score = float(request.query_params.get("min_score", 0))
+    except ValueError:
+        return Response({"error": "Parâmetros inválidos"}, status=status.HTTP_400_BAD_REQUEST)
+    if not math.isfinite(min_score):
+        return Response({"error": "Parâmetros inválidos"}, status=status.HTTP_400_BAD_REQUEST)
+
+    matches = MatchScoringService.top_matches(job, limit=limit, min_score=min_score)
+
+    return Response(
+        {"job_id": str(job.id), "results": _hydrate_matches(matches)}, status=status.HTTP_200_OK
+    )
+
+
+@api_view(["GET"])
+@permission_classes([IsAdmin])
+def job_similar_candidates(request, job_id):
+    """
+    Get candidates whose bio and experiences read most like a job (admin only).
+
+    Similarity is TF-IDF cosine between the job's title, description and
+    responsibilities and each candidate's bio and experience responsibilities.
+
+    Query params:
+        limit (int): Maximum number of candidates (default: 20, max: 100)
+        min_similarity (float): Minimum similarity, 0-100 (default: 0)
+
+    Returns:
+        200: {
+            'job_id': str,
+            'results': [{
+                'candidate_id', 'full_name', 'current_position', 'profile_photo_url',
+                'similarity': 41.3
+            }, ...]
+        }
+        400: { 'error': 'Parâmetros inválidos' }
+        404: { 'error': 'Job not found' }
+        503: { 'error': 'Similarity index unavailable' } (not built or downloaded yet)
+
+    Example:
+        GET /api/v1/matching/jobs/<job_id>/similar-candidates?limit=10
+    """
+    try:
+        job = JobPosting.objects.get(id=job_id, is_active=True)
+    except JobPosting.DoesNotExist:
+        return Response({"error": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    try:
+        limit = min(max(int(request.query_params.get("limit", 20)), 1), 100)
+        min_similarity = float(request.query_params.get("min_similarity", 0))
+    except ValueError:
+        return Response({"error": "Parâmetros inválidos"}, status=status.HTTP_400_BAD_REQUEST)
+    if not math.isfinite(min_similarity):
+        return Response({"error": "Parâmetros inválidos"}, status=status.HTTP_400_BAD_REQUEST)
+
+    matches = TextSimilarityService.similar_candidates(
+        job, limit=limit, min_similarity=min_similarity
+    )
+    if matches is None:
+        return Response(
+            {"error": "Similarity index unavailable"}, status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+    return Response(
+        {"job_id": str(job.id), "results": _hydrate_matches(matches)}, status=status.HTTP_200_OK
+    )
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated, IsCandidate])
+def recommended_jobs(request):
+    """
+    Get the active jobs that best match the authenticated candidate.
+
+    Scores come from the matching engine; the feed is cached per candidate and
+    refreshed when jobs are published or edited, or the profile changes.
+
+    Query params:
+        limit (int): Maximum number of jobs (default: 20, max: 50)
+
+    Returns:
+        200: {
+            'results': [{
+                'job_id', 'title', 'company_name', 'position_type', 'seniority',
+                'location', 'is_remote', 'salary_range', 'score', 'breakdown'
+            }, ...]
+        }
+        400: { 'error': 'Parâmetros inválidos' }
+        404: { 'error': 'Profile not found' }
+
+    Example:
+        GET /api/v1/matching/recommended-jobs?limit=10
+    """
+    try:
+        limit = min(max(int(request.query_params.get("limit", 20)), 1), FEED_SIZE)
+    except ValueError:
+        return Response({"error": "Parâmetros inválidos"}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        candidate = CandidateProfile.objects.get(user=request.user, is_active=True)
+    except CandidateProfile.DoesNotExist:
+        return Response({"error": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    jobs = RecommendationService.get_recommended_jobs(candidate, limit=limit)
+    return Response({"results": jobs}, status=status.HTTP_200_OK)
@@ -7,6 +7,7 @@ This module initializes the Celery app and configures it to work with Django.
 import os
 
 from celery import Celery
+from celery.signals import worker_process_init
 
 # Set default Django settings module
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "talentbase.settings.development")
@@ -20,6 +21,14 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 
 
+@worker_process_init.connect
+def load_email_templates(**kwargs):
+    """Compile email templates once per worker process, before the first task."""
+    from core.utils.email_templates import load_email_templates
+
+    load_email_templates()
+
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     """Debug task for testing Celery configuration."""
@@ -178,17 +178,54 @@ SIMPLE_JWT = {
     "USER_ID_CLAIM": "user_id",
 }
 
+# Redis (cache, Celery broker and raw data structures such as leaderboards)
+REDIS_URL = config("REDIS_URL", default="redis://localhost:6379/0")
+
 # Redis Cache
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.redis.RedisCache",
-        "LOCATION": config("REDIS_URL", default="redis://localhost:6379/0"),
+        "LOCATION": REDIS_URL,
     }
 }
 
 # Celery Configuration
-CELERY_BROKER_URL = config("REDIS_URL", default="redis://localhost:6379/0")
-CELERY_RESULT_BACKEND = config("REDIS_URL", default="redis://localhost:6379/0")
+CELERY_BROKER_URL = REDIS_URL
+CELERY_RESULT_BACKEND = REDIS_URL
+
+# Periodic tasks (celery beat)
+CELERY_BEAT_SCHEDULE = {
+    "flush-profile-analytics": {
+        "task": "candidates.tasks.flush_profile_analytics",
+        "schedule": 300.0,  # every 5 minutes
+    },
+    "rebuild-public-token-filter": {
+        "task": "candidates.tasks.rebuild_public_token_filter",
+        "schedule": 86400.0,  # daily; drops tokens that were disabled or regenerated
+    },
+    "drain-s3-deletions": {
+        "task": "core.tasks.drain_s3_deletions",
+        "schedule": 60.0,
+    },
+    "collect-orphaned-media": {
+        "task": "candidates.tasks.collect_orphaned_media",
+        "schedule": 86400.0,
+    },
+    # Safety net: queue_email schedules its own flush, this catches lost ones
+    # and resends batches left unsent by a crashed flush
+    "flush-email-outbox": {
+        "task": "core.tasks.flush_email_outbox",
+        "schedule": 60.0,
+    },
+    "prune-email-logs": {
+        "task": "core.tasks.prune_email_logs",
+        "schedule": 86400.0,  # daily; creates upcoming partitions, drops expired ones
+    },
+}
+
+# Number of our own proxies in front of the app (ALB = 1); decides which
+# X-Forwarded-For entry is the real client IP
+TRUSTED_PROXY_COUNT = config("TRUSTED_PROXY_COUNT", default=0, cast=int)
 
 # Custom User Model
 AUTH_USER_MODEL = "authentication.User"
@@ -223,6 +260,20 @@ AWS_S3_SIGNATURE_VERSION = "s3v4"
 AWS_S3_FILE_OVERWRITE = False  # Prevent accidental overwrites
 AWS_DEFAULT_ACL = None  # Use bucket ACL (private)
 AWS_S3_ENCRYPTION = "AES256"  # Server-side encryption
+# Serve media as presigned GETs (private objects); signatures are cached per window
+AWS_S3_SIGNED_READS = config("AWS_S3_SIGNED_READS", default=False, cast=bool)
+AWS_S3_READ_URL_TTL = config("AWS_S3_READ_URL_TTL", default=3600, cast=int)
+AWS_S3_READ_URL_CACHE_SIZE = config("AWS_S3_READ_URL_CACHE_SIZE", default=4096, cast=int)
+# Shared S3 client connection pool size (per process; >= web/worker threads)
+AWS_S3_MAX_POOL_CONNECTIONS = config("AWS_S3_MAX_POOL_CONNECTIONS", default=50, cast=int)
+# Failed attempts before a queued S3 deletion is left for manual review
+S3_DELETION_MAX_ATTEMPTS = config("S3_DELETION_MAX_ATTEMPTS", default=8, cast=int)
+# Unreferenced uploads younger than this are kept (the form may still be open)
+MEDIA_ORPHAN_GRACE_HOURS = config("MEDIA_ORPHAN_GRACE_HOURS", default=24, cast=int)
+# Widths (px) of the WebP/JPEG variants rendered for profile photos and company logos
+MEDIA_IMAGE_WIDTHS = (96, 256, 640)
+# Threads encoding variants of one image (per worker process)
+MEDIA_PROCESSING_THREADS = config("MEDIA_PROCESSING_THREADS", default=4, cast=int)
 
 # Presigned URL Configuration
 AWS_PRESIGNED_EXPIRY = 300  # 5 minutes (in seconds)
@@ -237,6 +288,13 @@ MAX_VIDEO_SIZE = 50 * 1024 * 1024  # 50MB in bytes
 ALLOWED_VIDEO_TYPES = ["video/mp4", "video/quicktime", "video/x-msvideo"]
 ALLOWED_VIDEO_EXTENSIONS = [".mp4", ".mov", ".avi"]
 VIDEO_PRESIGNED_EXPIRY = 600  # 10 minutes (in seconds) - videos take longer to upload
+PRESIGNED_BATCH_MAX_FILES = 20  # Files per batch presigned URL request
+# Multipart uploads: part size (S3 minimum 5MB) and how long an upload can be resumed
+S3_MULTIPART_PART_SIZE = config("S3_MULTIPART_PART_SIZE", default=8 * 1024 * 1024, cast=int)
+S3_MULTIPART_MAX_AGE = config("S3_MULTIPART_MAX_AGE", default=24 * 60 * 60, cast=int)
+# Streaming renditions of uploaded pitch videos (needs ffmpeg on the worker)
+VIDEO_MAX_HEIGHT = config("VIDEO_MAX_HEIGHT", default=720, cast=int)
+VIDEO_PROCESSING_TIMEOUT = config("VIDEO_PROCESSING_TIMEOUT", default=600, cast=int)
 
 # Story 3.2: Public Profile Sharing Configuration
 BASE_URL = config("BASE_URL", default="http://localhost:8000")  # Backend URL
@@ -244,3 +302,52 @@ FRONTEND_URL = config(
     "FRONTEND_URL", default="http://localhost:3000"
 )  # Frontend URL for share links
 ADMIN_EMAIL = config("ADMIN_EMAIL", default="admin@localhost")  # Admin email for contact requests
+# Email sending: pooled SMTP connection per worker and batched bulk sends
+EMAIL_CONNECTION_MAX_IDLE = config("EMAIL_CONNECTION_MAX_IDLE", default=30, cast=int)
+EMAIL_BATCH_SIZE = config("EMAIL_BATCH_SIZE", default=100, cast=int)
+EMAIL_BATCH_DELAY = config("EMAIL_BATCH_DELAY", default=2, cast=int)  # seconds to accumulate
+# Provider sending rate shared by all workers (SES default quota: 14/s)
+EMAIL_RATE_LIMIT_PER_SECOND = config("EMAIL_RATE_LIMIT_PER_SECOND", default=14, cast=int)
+EMAIL_CAMPAIGN_CHUNK_SIZE = config("EMAIL_CAMPAIGN_CHUNK_SIZE", default=250, cast=int)
+# EmailLog keeps this many months before the current one (older partitions are dropped)
+EMAIL_LOG_RETENTION_MONTHS = config("EMAIL_LOG_RETENTION_MONTHS", default=12, cast=int)
+EMAIL_LOG_PARTITIONS_AHEAD = 3  # monthly partitions created in advance
+# Dead-letter emails re-enqueued per admin request (sent in EMAIL_BATCH_SIZE batches)
+DEAD_LETTER_REQUEUE_MAX = config("DEAD_LETTER_REQUEUE_MAX", default=5000, cast=int)
+# Public profile snapshots: pre-rendered JSON written on publish/edit ('local' or 's3';
+# production defaults to 's3', local disk only works with a single web host)
+PUBLIC_PROFILE_SNAPSHOT_STORAGE = config("PUBLIC_PROFILE_SNAPSHOT_STORAGE", default="local")
+PUBLIC_PROFILE_SNAPSHOT_DIR = config(
+    "PUBLIC_PROFILE_SNAPSHOT_DIR", default=str(BASE_DIR / "var" / "profile_snapshots")
+)
+# Lifetime of the Redis pointer to a token's current snapshot (seconds); re-published on miss
+PUBLIC_PROFILE_CACHE_TTL = config("PUBLIC_PROFILE_CACHE_TTL", default=86400, cast=int)
+# How long CDNs/shared caches may serve a public profile without revalidating (s-maxage)
+PUBLIC_PROFILE_CDN_MAX_AGE = config("PUBLIC_PROFILE_CDN_MAX_AGE", default=60, cast=int)
+# Public contact requests (per hour): hard limits per client IP and per profile,
+# and how many per profile are e-mailed immediately before batching into a digest
+PUBLIC_CONTACT_IP_LIMIT = config("PUBLIC_CONTACT_IP_LIMIT", default=5, cast=int)
+PUBLIC_CONTACT_PROFILE_LIMIT = config("PUBLIC_CONTACT_PROFILE_LIMIT", default=30, cast=int)
+PUBLIC_CONTACT_IMMEDIATE_LIMIT = config("PUBLIC_CONTACT_IMMEDIATE_LIMIT", default=3, cast=int)
+# Seconds a burst is collected before the digest e-mail goes out
+PUBLIC_CONTACT_DIGEST_DELAY = config("PUBLIC_CONTACT_DIGEST_DELAY", default=900, cast=int)
+# Seconds an identical contact request (same sender and message) is suppressed
+PUBLIC_CONTACT_DEDUPE_TTL = config("PUBLIC_CONTACT_DEDUPE_TTL", default=86400, cast=int)
+# Bloom filter of shared public tokens (bits; 2**23 = 1 MB, ~1% false positives at 870k tokens)
+PUBLIC_TOKEN_BLOOM_BITS = config("PUBLIC_TOKEN_BLOOM_BITS", default=2**23, cast=int)
+# Seconds a token confirmed missing/disabled is rejected without a database query
+PUBLIC_TOKEN_MISS_TTL = config("PUBLIC_TOKEN_MISS_TTL", default=300, cast=int)
+
+# Matching engine: how long per-job candidate scores stay cached (seconds)
+MATCHING_CACHE_TTL = config("MATCHING_CACHE_TTL", default=600, cast=int)
+# Matching engine: how long a candidate's recommended-jobs feed stays cached (seconds)
+MATCHING_RECOMMENDATIONS_TTL = config("MATCHING_RECOMMENDATIONS_TTL", default=3600, cast=int)
+
+# Matching engine: on-disk text similarity index (memory-mapped TF-IDF vectors)
+MATCHING_TEXT_INDEX_DIR = config(
+    "MATCHING_TEXT_INDEX_DIR", default=str(BASE_DIR / "var" / "text_index")
+)
+# "local": the index directory is the index (single host); "s3": builds are
+# shared through the uploads bucket and MATCHING_TEXT_INDEX_DIR is a per-host cache
+MATCHING_TEXT_INDEX_STORAGE = config("MATCHING_TEXT_INDEX_STORAGE", default="local")
+MATCHING_TEXT_DIMENSIONS = config("MATCHING_TEXT_DIMENSIONS", default=2048, cast=int)
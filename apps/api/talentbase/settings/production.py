@@ -70,6 +70,12 @@ elif EMAIL_PROVIDER == "ses":
 else:
     raise ValueError(f"Invalid EMAIL_PROVIDER: {EMAIL_PROVIDER}. Must be 'sendgrid' or 'ses'")
 
+# Public profile snapshots must be readable from every web host (the Redis pointer is shared)
+PUBLIC_PROFILE_SNAPSHOT_STORAGE = config("PUBLIC_PROFILE_SNAPSHOT_STORAGE", default="s3")
+
+# The text index is built by Celery workers and read by every web host
+MATCHING_TEXT_INDEX_STORAGE = config("MATCHING_TEXT_INDEX_STORAGE", default="s3")
+
 # Celery Configuration - Production
 # Don't use EAGER mode in production (emails should be truly async)
 CELERY_TASK_ALWAYS_EAGER = False
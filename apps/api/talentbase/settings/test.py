@@ -2,6 +2,8 @@
 Test settings for talentbase project.
 """
 
+from decouple import config
+
 from .base import *
 
 DEBUG = False
@@ -14,6 +16,18 @@ DATABASES = {
     }
 }
 
+# Optional PostgreSQL database for tests of PostgreSQL-only features
+# (core/tests/test_partitions_postgres.py); those tests are skipped without it
+if config("TEST_POSTGRES_DB", default=""):
+    DATABASES["postgres"] = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": config("TEST_POSTGRES_DB"),
+        "USER": config("TEST_POSTGRES_USER", default="postgres"),
+        "PASSWORD": config("TEST_POSTGRES_PASSWORD", default="postgres"),
+        "HOST": config("TEST_POSTGRES_HOST", default="localhost"),
+        "PORT": config("TEST_POSTGRES_PORT", default="5432"),
+    }
+
 # Use local memory cache instead of Redis for tests
 CACHES = {
     "default": {
@@ -44,6 +44,10 @@ urlpatterns = [
     path("api/v1/admin/", include("user_management.urls")),
     # Candidate endpoints (Story 3.1)
     path("api/v1/candidates/", include("candidates.urls")),
+    # Matching endpoints (leaderboard)
+    path("api/v1/matching/", include("matching.urls")),
+    # Application endpoints (admin batch matching)
+    path("api/v1/applications/", include("applications.urls")),
 ]
 
 # Serve static files in development
@@ -4,6 +4,8 @@ Serializers for admin user management.
 Handles data validation and representation for admin endpoints.
 """
 
+import uuid
+
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
@@ -121,3 +123,76 @@ class UserDetailSerializer(serializers.Serializer):
                 "contact_person_phone": profile.contact_person_phone,
             }
         return {}
+
+
+class EmailCampaignSerializer(serializers.Serializer):
+    """
+    Serializer for email campaigns (list, detail and creation).
+
+    Write fields:
+    - name, subject: Campaign definition
+    - template_name: Email template (default: generic 'campaign' template)
+    - audience: {'role', 'status', 'search'} or {'job_id', 'application_status'}
+    - context: Template variables shared by every recipient (optional)
+
+    Read-only fields report progress: status, total_recipients, sent_count,
+    failed_count, started_at, completed_at. Emails being retried count as
+    neither sent nor failed until their retries settle.
+    """
+
+    id = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(max_length=200)
+    template_name = serializers.CharField(max_length=100, required=False, default="campaign")
+    subject = serializers.CharField(max_length=200)
+    audience = serializers.DictField()
+    context = serializers.DictField(required=False, default=dict)
+    status = serializers.CharField(read_only=True)
+    total_recipients = serializers.IntegerField(read_only=True)
+    sent_count = serializers.IntegerField(read_only=True)
+    failed_count = serializers.IntegerField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    started_at = serializers.DateTimeField(read_only=True)
+    completed_at = serializers.DateTimeField(read_only=True)
+
+    def validate_audience(self, value: dict) -> dict:
+        """Validate that a job audience names a job by UUID."""
+        if "job_id" in value:
+            try:
+                value = {**value, "job_id": str(uuid.UUID(str(value["job_id"])))}
+            except ValueError as e:
+                raise serializers.ValidationError("Campo 'job_id' deve ser um UUID válido.") from e
+        return value
+
+
+class FailedEmailSerializer(serializers.Serializer):
+    """
+    Serializer for email dead letters (admin review).
+
+    The template context is included so admins can see what would be resent.
+    """
+
+    id = serializers.UUIDField(read_only=True)
+    recipient = serializers.EmailField(read_only=True)
+    subject = serializers.CharField(read_only=True)
+    template_name = serializers.CharField(read_only=True)
+    context = serializers.DictField(read_only=True)
+    error_message = serializers.CharField(read_only=True)
+    attempts = serializers.IntegerField(read_only=True)
+    status = serializers.CharField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    requeued_at = serializers.DateTimeField(read_only=True)
+
+
+class FailedEmailFilterSerializer(serializers.Serializer):
+    """
+    Filters for listing and requeueing dead letters.
+
+    - template_name: Exact template name
+    - since / until: Failure time range (until is exclusive)
+    - error: Text contained in the error message
+    """
+
+    template_name = serializers.CharField(required=False, allow_blank=True)
+    since = serializers.DateTimeField(required=False)
+    until = serializers.DateTimeField(required=False)
+    error = serializers.CharField(required=False, allow_blank=True)
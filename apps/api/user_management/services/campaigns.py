@@ -0,0 +1,169 @@
+"""
+Email campaign service layer.
+
+Bulk emails from the admin panel: an audience (a JSON filter over users) and
+a template, fanned out to Celery in chunks of recipients (see
+user_management.tasks).
+"""
+
+import logging
+from typing import Optional
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F, QuerySet
+from django.utils import timezone
+
+from core.models import EmailCampaign
+from core.utils.email_templates import email_template_exists
+from user_management.services.user_management import UserManagementService
+
+User = get_user_model()
+logger = logging.getLogger(__name__)
+
+AUDIENCE_USER_FILTERS = {"role", "status", "search"}
+AUDIENCE_JOB_FILTERS = {"job_id", "application_status"}
+
+
+class CampaignService:
+    """
+    Service class for bulk email campaigns.
+
+    Handles:
+    - Audience validation and resolution to users
+    - Campaign creation and fan-out scheduling
+    - Per-recipient message building and progress counters
+    """
+
+    @staticmethod
+    def validate_audience(audience: dict) -> None:
+        """
+        Check an audience description.
+
+        Args:
+            audience: {'role', 'status', 'search'} (admin user list filters)
+                or {'job_id', 'application_status'} (candidates of a job)
+
+        Raises:
+            ValueError: If the audience mixes or contains unknown filters
+        """
+        keys = set(audience)
+        if not keys:
+            raise ValueError("Público da campanha é obrigatório.")
+        if not (keys <= AUDIENCE_USER_FILTERS or keys <= AUDIENCE_JOB_FILTERS):
+            raise ValueError("Filtros de público inválidos.")
+        if keys <= AUDIENCE_JOB_FILTERS and "job_id" not in keys:
+            raise ValueError("Campo 'job_id' é obrigatório para público de vaga.")
+
+    @staticmethod
+    def resolve_recipients(audience: dict) -> QuerySet:
+        """
+        Active users matching an audience description.
+
+        Args:
+            audience: See validate_audience
+
+        Returns:
+            QuerySet: Users, ordered by id so chunks are stable
+        """
+        if "job_id" in audience:
+            filters = {"candidate_profile__applications__job_id": audience["job_id"]}
+            if audience.get("application_status"):
+                filters["candidate_profile__applications__status"] = audience["application_status"]
+            queryset = User.objects.filter(**filters).distinct()
+        else:
+            queryset = UserManagementService.get_users_queryset(
+                role_filter=audience.get("role"),
+                status_filter=audience.get("status"),
+                search=audience.get("search"),
+            )
+        return queryset.filter(is_active=True).order_by("id")
+
+    @staticmethod
+    def create_campaign(
+        admin_user: User,
+        name: str,
+        template_name: str,
+        subject: str,
+        audience: dict,
+        context: Optional[dict] = None,
+    ) -> EmailCampaign:
+        """
+        Create a campaign and schedule its fan-out once the transaction commits.
+
+        Args:
+            admin_user: Admin creating the campaign
+            name: Internal campaign name
+            template_name: Email template (emails/<name>.html and .txt must exist)
+            subject: Email subject line
+            audience: See validate_audience
+            context: Template variables shared by every recipient
+
+        Returns:
+            EmailCampaign: The queued campaign
+
+        Raises:
+            ValueError: If the template does not exist or the audience is invalid
+        """
+        from user_management.tasks import send_campaign
+
+        CampaignService.validate_audience(audience)
+        if not email_template_exists(template_name):
+            raise ValueError(f"Template de email '{template_name}' não encontrado.")
+
+        campaign = EmailCampaign.objects.create(
+            name=name,
+            template_name=template_name,
+            subject=subject,
+            context=context or {},
+            audience=audience,
+            created_by=admin_user,
+        )
+        transaction.on_commit(lambda: send_campaign.delay(str(campaign.id)))
+        logger.info(f"Email campaign {campaign.id} queued by {admin_user.email}")
+        return campaign
+
+    @staticmethod
+    def build_messages(campaign: EmailCampaign, users) -> list[dict]:
+        """
+        Messages for send_email_batch, one per recipient.
+
+        Each recipient gets the campaign context plus 'recipient_name',
+        'recipient_email' and 'subject' (used by the generic 'campaign'
+        template together with 'message', 'headline', 'action_url' and
+        'action_label').
+        """
+        return [
+            {
+                "template_name": campaign.template_name,
+                "context": {
+                    **campaign.context,
+                    "recipient_name": UserManagementService.get_user_display_name(user),
+                    "recipient_email": user.email,
+                    "subject": campaign.subject,
+                },
+                "recipient_email": user.email,
+                "subject": campaign.subject,
+            }
+            for user in users
+        ]
+
+    @staticmethod
+    def record_chunk(campaign_id: str, sent: int, failed: int) -> None:
+        """
+        Add results to the campaign counters.
+
+        Called for each chunk (with the emails sent at once) and for each
+        email retried on its own by send_email_task once it is finally sent
+        or has failed for good. Counters are incremented in the database, so
+        results recorded concurrently do not overwrite each other; the one
+        that reaches the total marks the campaign completed.
+        """
+        EmailCampaign.objects.filter(id=campaign_id).update(
+            sent_count=F("sent_count") + sent, failed_count=F("failed_count") + failed
+        )
+        EmailCampaign.objects.filter(
+            id=campaign_id,
+            status="sending",
+            total_recipients__lte=F("sent_count") + F("failed_count"),
+        ).update(status="completed", completed_at=timezone.now())
@@ -0,0 +1,111 @@
+"""
+Email dead-letter service layer.
+
+Admin review and bulk requeue of emails that failed after all retries
+(core.models.FailedEmail).
+"""
+
+import logging
+import math
+from datetime import datetime
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from core.models import FailedEmail
+
+logger = logging.getLogger(__name__)
+
+
+class DeadLetterService:
+    """
+    Service class for failed email dead letters.
+
+    Handles:
+    - Filtering dead letters by template, date and error
+    - Requeueing them in batches paced to the provider rate
+    """
+
+    @staticmethod
+    def get_queryset(
+        template_name: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        error: Optional[str] = None,
+        status: str = "dead",
+    ) -> QuerySet:
+        """
+        Get dead letters matching the filters, newest first.
+
+        Args:
+            template_name: Exact template name
+            since: Failed at or after this time
+            until: Failed before this time
+            error: Text contained in the error message
+            status: dead (default) or requeued
+
+        Returns:
+            QuerySet: Filtered FailedEmail rows
+        """
+        queryset = FailedEmail.objects.filter(status=status)
+        if template_name:
+            queryset = queryset.filter(template_name=template_name)
+        if since:
+            queryset = queryset.filter(created_at__gte=since)
+        if until:
+            queryset = queryset.filter(created_at__lt=until)
+        if error:
+            queryset = queryset.filter(error_message__icontains=error)
+        return queryset.order_by("-created_at")
+
+    @staticmethod
+    def requeue(
+        template_name: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        error: Optional[str] = None,
+    ) -> dict:
+        """
+        Re-enqueue the dead letters matching the filters.
+
+        At most DEAD_LETTER_REQUEUE_MAX letters per call (oldest first) are
+        claimed with SELECT ... FOR UPDATE SKIP LOCKED and marked requeued,
+        so concurrent requests never resend the same email. They are sent by
+        resend_dead_letters in batches of EMAIL_BATCH_SIZE, each scheduled
+        one batch's worth of EMAIL_RATE_LIMIT_PER_SECOND after the previous
+        one, so a large requeue does not hold every worker in the rate limiter.
+
+        Returns:
+            dict: {'requeued': int, 'batches': int}
+        """
+        from core.tasks import resend_dead_letters
+
+        with transaction.atomic():
+            ids = [
+                str(letter_id)
+                for letter_id in DeadLetterService.get_queryset(
+                    template_name=template_name, since=since, until=until, error=error
+                )
+                .select_for_update(skip_locked=True)
+                .order_by("created_at")
+                .values_list("id", flat=True)[: settings.DEAD_LETTER_REQUEUE_MAX]
+            ]
+            FailedEmail.objects.filter(id__in=ids).update(
+                status="requeued", requeued_at=timezone.now(), updated_at=timezone.now()
+            )
+
+        batch_size = settings.EMAIL_BATCH_SIZE
+        spacing = math.ceil(batch_size / settings.EMAIL_RATE_LIMIT_PER_SECOND)
+        batches = [ids[start : start + batch_size] for start in range(0, len(ids), batch_size)]
+        for index, batch in enumerate(batches):
+            transaction.on_commit(
+                lambda batch=batch, index=index: resend_dead_letters.apply_async(
+                    args=[batch], countdown=index * spacing
+                )
+            )
+
+        logger.info(f"Requeued {len(ids)} dead-letter emails in {len(batches)} batches")
+        return {"requeued": len(ids), "batches": len(batches)}
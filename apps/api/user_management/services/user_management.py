@@ -131,11 +131,12 @@ class UserManagementService:
             ValueError: If status transition is invalid
 
         AC7: Admin can change status (activate, deactivate, approve company)
-        AC8: Status change triggers email notification
+        AC8: Status change triggers email notification (batched through the
+             email outbox, as admins approve companies in bursts)
         AC9: Log de auditoria registra aprovação/rejeição
         """
         from authentication.models import UserStatusAudit
-        from core.tasks import send_email_task
+        from core.utils.mail import queue_email
 
         old_status = user.is_active
 
@@ -178,7 +179,7 @@ class UserManagementService:
             if user.role == "company":
                 # Company approved - Story 2.7 template
                 company_name = getattr(user.company_profile, "company_name", user.email)
-                send_email_task.delay(
+                queue_email(
                     template_name="company_approved",
                     context={
                         "contact_name": user_display_name,
@@ -191,7 +192,7 @@ class UserManagementService:
             else:
                 # TODO: Create candidate/generic activation template
                 # For now, using plain text fallback
-                send_email_task.delay(
+                queue_email(
                     template_name="candidate_registration",  # Temporary reuse
                     context={
                         "candidate_name": user_display_name,
@@ -206,7 +207,7 @@ class UserManagementService:
             if user.role == "company" and old_status and not is_active:
                 # Company rejected - Story 2.7 template
                 company_name = getattr(user.company_profile, "company_name", user.email)
-                send_email_task.delay(
+                queue_email(
                     template_name="company_rejected",
                     context={
                         "contact_name": user_display_name,
@@ -0,0 +1,265 @@
+"""
+Tests for bulk email campaigns.
+"""
+
+import smtplib
+from unittest.mock import patch
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from applications.models import Application
+from authentication.models import User
+from candidates.models import CandidateProfile
+from companies.models import CompanyProfile
+from core.models import EmailCampaign, EmailLog
+from core.tasks import send_email_task
+from core.utils import mail
+from jobs.models import JobPosting
+from user_management.services.campaigns import CampaignService
+from user_management.tasks import send_campaign
+
+
+@pytest.fixture(autouse=True)
+def locmem_email(settings):
+    """Send over the in-memory backend with a fresh pooled connection."""
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    mail.reset_mail_connection()
+    yield
+    mail.reset_mail_connection()
+
+
+@pytest.fixture
+def admin_user(db):
+    """Create an admin user."""
+    return User.objects.create_user(email="admin@test.com", password="admin123", role="admin")
+
+
+@pytest.fixture
+def candidates(db):
+    """Create five active candidates."""
+    profiles = []
+    for i in range(5):
+        user = User.objects.create_user(
+            email=f"candidate{i}@test.com", password="pass123", role="candidate"
+        )
+        profiles.append(
+            CandidateProfile.objects.create(
+                user=user, full_name=f"Candidate {i}", phone="11999999999"
+            )
+        )
+    return profiles
+
+
+def make_campaign(admin_user, audience) -> EmailCampaign:
+    return EmailCampaign.objects.create(
+        name="Novidades",
+        template_name="campaign",
+        subject="Novidades do TalentBase",
+        context={"message": "Temos novas vagas para você."},
+        audience=audience,
+        created_by=admin_user,
+    )
+
+
+@pytest.mark.django_db
+class TestCampaignSending:
+    """Tests for send_campaign and send_campaign_chunk."""
+
+    def test_recipients_fanned_out_in_chunks(self, settings, admin_user, candidates, mailoutbox):
+        """Test recipients are split into chunk tasks and logged against the campaign."""
+        settings.EMAIL_CAMPAIGN_CHUNK_SIZE = 2
+        campaign = make_campaign(admin_user, {"role": "candidate"})
+
+        with patch.object(
+            EmailLog.objects, "bulk_create", wraps=EmailLog.objects.bulk_create
+        ) as bulk_create:
+            assert send_campaign(str(campaign.id)) == 3
+
+        assert bulk_create.call_count == 3
+        assert sorted(m.to[0] for m in mailoutbox) == [f"candidate{i}@test.com" for i in range(5)]
+        assert "Candidate 0" in next(m.body for m in mailoutbox if m.to[0] == "candidate0@test.com")
+        assert EmailLog.objects.filter(campaign=campaign, status="sent").count() == 5
+
+        campaign.refresh_from_db()
+        assert campaign.status == "completed"
+        assert (campaign.total_recipients, campaign.sent_count, campaign.failed_count) == (5, 5, 0)
+        assert campaign.completed_at is not None
+
+    def test_started_campaign_is_not_sent_again(self, admin_user, candidates, mailoutbox):
+        """Test a redelivered fan-out task does not resend the campaign."""
+        campaign = make_campaign(admin_user, {"role": "candidate"})
+        send_campaign(str(campaign.id))
+
+        assert send_campaign(str(campaign.id)) == 0
+        assert len(mailoutbox) == 5
+
+    def test_failed_email_retried_within_campaign(self, admin_user, candidates, mailoutbox):
+        """Test a chunk failure is retried under the rate limit and counted once settled."""
+        campaign = make_campaign(admin_user, {"role": "candidate"})
+        original = mail.send_message
+        failures = []
+
+        def send(email):
+            if email.to == ["candidate0@test.com"] and not failures:
+                failures.append(email)
+                raise smtplib.SMTPServerDisconnected("dropped")
+            original(email)
+
+        with (
+            patch("core.utils.mail.send_message", side_effect=send),
+            patch("core.tasks.send_message", side_effect=send),
+            patch("core.tasks.throttle_sending") as throttle,
+        ):
+            send_campaign(str(campaign.id))
+
+        throttle.assert_called_once_with(1)
+        assert len(mailoutbox) == 5
+        assert EmailLog.objects.filter(campaign=campaign, status="sent").count() == 5
+        campaign.refresh_from_db()
+        assert campaign.status == "completed"
+        assert (campaign.sent_count, campaign.failed_count) == (5, 0)
+
+    def test_failed_retry_counted_as_failed(self, admin_user, candidates):
+        """Test a campaign email counts as failed only once its retries are exhausted."""
+        campaign = make_campaign(admin_user, {"role": "candidate"})
+        EmailCampaign.objects.filter(id=campaign.id).update(status="sending", total_recipients=1)
+        kwargs = {
+            **CampaignService.build_messages(campaign, [candidates[0].user])[0],
+            "campaign_id": str(campaign.id),
+        }
+
+        with patch("core.tasks.send_message", side_effect=smtplib.SMTPDataError(550, "rejected")):
+            with pytest.raises(smtplib.SMTPDataError):
+                send_email_task.apply(kwargs=kwargs, retries=send_email_task.max_retries)
+
+        assert EmailLog.objects.get(campaign=campaign).status == "failed"
+        campaign.refresh_from_db()
+        assert (campaign.sent_count, campaign.failed_count) == (0, 1)
+        assert campaign.status == "completed"
+
+    def test_empty_audience_completes(self, admin_user, mailoutbox):
+        """Test a campaign without recipients is completed right away."""
+        campaign = make_campaign(admin_user, {"role": "company"})
+
+        assert send_campaign(str(campaign.id)) == 0
+
+        campaign.refresh_from_db()
+        assert campaign.status == "completed"
+        assert mailoutbox == []
+
+
+@pytest.mark.django_db
+class TestAudienceResolution:
+    """Tests for CampaignService.resolve_recipients."""
+
+    def test_user_filters_skip_inactive_users(self, admin_user, candidates):
+        """Test admin list filters are reused and inactive users never receive emails."""
+        candidates[0].user.is_active = False
+        candidates[0].user.save()
+
+        recipients = CampaignService.resolve_recipients({"role": "candidate"})
+
+        assert {u.email for u in recipients} == {f"candidate{i}@test.com" for i in range(1, 5)}
+
+    def test_job_audience(self, candidates):
+        """Test a job audience targets candidates by application status."""
+        company = CompanyProfile.objects.create(
+            company_name="Tech Company",
+            cnpj="12345678000190",
+            contact_person_name="John Doe",
+            contact_person_email="john@techcompany.com",
+            contact_person_phone="11988888888",
+        )
+        job = JobPosting.objects.create(
+            company=company,
+            title="SDR Position",
+            position_type="SDR/BDR",
+            seniority="junior",
+            description="Sales Development Representative role",
+            responsibilities="Cold calling",
+            location="São Paulo",
+        )
+        Application.objects.create(job=job, candidate=candidates[0], status="matched")
+        Application.objects.create(job=job, candidate=candidates[1], status="pending")
+
+        audience = {"job_id": str(job.id), "application_status": "matched"}
+        recipients = CampaignService.resolve_recipients(audience)
+
+        assert [u.email for u in recipients] == ["candidate0@test.com"]
+
+    def test_mixed_filters_rejected(self):
+        """Test audiences cannot mix user and job filters."""
+        with pytest.raises(ValueError):
+            CampaignService.validate_audience({"role": "candidate", "job_id": "x"})
+
+
+@pytest.mark.django_db
+class TestCampaignEndpoints:
+    """Tests for /api/v1/admin/campaigns."""
+
+    URL = "/api/v1/admin/campaigns"
+
+    @pytest.fixture
+    def client(self, admin_user):
+        client = APIClient()
+        client.force_authenticate(user=admin_user)
+        return client
+
+    def test_create_starts_campaign_on_commit(self, client, django_capture_on_commit_callbacks):
+        """Test creating a campaign queues its fan-out after the transaction commits."""
+        payload = {
+            "name": "Novidades",
+            "subject": "Novidades do TalentBase",
+            "audience": {"role": "candidate"},
+            "context": {"message": "Temos novas vagas para você."},
+        }
+        with patch("user_management.tasks.send_campaign.delay") as delay:
+            with django_capture_on_commit_callbacks(execute=True):
+                response = self.client_post(client, payload)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["status"] == "queued"
+        assert response.data["template_name"] == "campaign"
+        delay.assert_called_once_with(response.data["id"])
+
+        detail = client.get(f"{self.URL}/{response.data['id']}")
+        assert detail.data["name"] == "Novidades"
+        assert client.get(self.URL).data["count"] == 1
+
+    def test_unknown_template_rejected(self, client):
+        """Test a campaign needs an existing email template."""
+        response = self.client_post(
+            client,
+            {
+                "name": "Novidades",
+                "template_name": "missing",
+                "subject": "Novidades",
+                "audience": {"role": "candidate"},
+            },
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not EmailCampaign.objects.exists()
+
+    def test_invalid_job_id_rejected(self, client):
+        """Test a job audience must name the job by UUID."""
+        response = self.client_post(
+            client,
+            {"name": "Vaga", "subject": "Vaga", "audience": {"job_id": "not-a-uuid"}},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "audience" in response.data
+        assert not EmailCampaign.objects.exists()
+
+    def test_requires_admin(self, candidates):
+        """Test non-admin users cannot list campaigns."""
+        client = APIClient()
+        client.force_authenticate(user=candidates[0].user)
+
+        assert client.get(self.URL).status_code == status.HTTP_403_FORBIDDEN
+
+    def client_post(self, client, payload):
+        return client.post(self.URL, payload, format="json")
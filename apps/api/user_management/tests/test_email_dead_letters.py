@@ -0,0 +1,141 @@
+"""
+Tests for email dead letters and their bulk requeue.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from core.models import EmailLog, FailedEmail
+from core.tasks import resend_dead_letters
+from user_management.services.email_dead_letters import DeadLetterService
+
+URL = "/api/v1/admin/failed-emails"
+
+
+@pytest.fixture(autouse=True)
+def locmem_email(settings):
+    """Send over the in-memory backend with a fresh pooled connection."""
+    from core.utils import mail
+
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    mail.reset_mail_connection()
+    yield
+    mail.reset_mail_connection()
+
+
+def dead_letter(recipient, template_name="candidate_registration", error="SMTP 421 throttled"):
+    return FailedEmail.objects.create(
+        recipient=recipient,
+        subject="Bem-vindo ao TalentBase!",
+        template_name=template_name,
+        context={"candidate_name": "João", "email": recipient},
+        error_message=error,
+        attempts=4,
+    )
+
+
+@pytest.fixture
+def letters(db):
+    """Five provider-outage failures and one unrelated failure."""
+    outage = [dead_letter(f"user{i}@example.com") for i in range(5)]
+    other = dead_letter("bounce@example.com", "company_approved", "550 mailbox unavailable")
+    return outage, other
+
+
+@pytest.mark.django_db
+class TestDeadLetterService:
+    """Tests for DeadLetterService."""
+
+    def test_filters(self, letters):
+        """Test dead letters filter by template, error and date."""
+        outage, other = letters
+        FailedEmail.objects.filter(id=other.id).update(created_at=datetime(2026, 1, 1, tzinfo=UTC))
+
+        assert DeadLetterService.get_queryset(template_name="company_approved").get() == other
+        assert DeadLetterService.get_queryset(error="421").count() == 5
+        since = datetime(2026, 2, 1, tzinfo=UTC)
+        assert other not in DeadLetterService.get_queryset(since=since)
+
+    def test_requeue_in_paced_batches(self, settings, letters, django_capture_on_commit_callbacks):
+        """Test matching letters are claimed once and scheduled batch after batch."""
+        settings.EMAIL_BATCH_SIZE = 2
+        settings.EMAIL_RATE_LIMIT_PER_SECOND = 1
+
+        with (
+            patch("core.tasks.resend_dead_letters.apply_async") as schedule,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            assert DeadLetterService.requeue(error="421") == {"requeued": 5, "batches": 3}
+
+        assert [c.kwargs["countdown"] for c in schedule.call_args_list] == [0, 2, 4]
+        assert sum(len(c.kwargs["args"][0]) for c in schedule.call_args_list) == 5
+        assert FailedEmail.objects.filter(status="requeued").count() == 5
+        assert FailedEmail.objects.get(status="dead") == letters[1]
+
+        with patch("core.tasks.resend_dead_letters.apply_async") as schedule:
+            assert DeadLetterService.requeue(error="421")["requeued"] == 0
+        schedule.assert_not_called()
+
+    def test_resend_dead_letters(self, letters, mailoutbox):
+        """Test requeued letters are sent with their original payload."""
+        outage, _ = letters
+        FailedEmail.objects.filter(id__in=[outage[0].id, outage[1].id]).update(status="requeued")
+
+        result = resend_dead_letters([str(letter.id) for letter in outage])
+
+        assert result == {"sent": 2, "failed": 0}
+        assert sorted(m.to[0] for m in mailoutbox) == ["user0@example.com", "user1@example.com"]
+        assert "João" in mailoutbox[0].body
+        assert EmailLog.objects.filter(status="sent").count() == 2
+
+
+@pytest.mark.django_db
+class TestFailedEmailEndpoints:
+    """Tests for /api/v1/admin/failed-emails."""
+
+    @pytest.fixture
+    def client(self):
+        admin = User.objects.create_user(email="admin@test.com", password="admin123", role="admin")
+        client = APIClient()
+        client.force_authenticate(user=admin)
+        return client
+
+    def test_list_filtered(self, client, letters):
+        """Test admins can review dead letters with their payload."""
+        response = client.get(URL, {"template_name": "company_approved"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 1
+        assert response.data["results"][0]["context"]["email"] == "bounce@example.com"
+
+    def test_requeue(self, client, letters, django_capture_on_commit_callbacks):
+        """Test a filtered bulk requeue is accepted and reported."""
+        with (
+            patch("core.tasks.resend_dead_letters.apply_async") as schedule,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            response = client.post(f"{URL}/requeue", {"error": "421"}, format="json")
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data == {"requeued": 5, "batches": 1}
+        schedule.assert_called_once()
+
+    def test_requeue_requires_a_filter(self, client, letters):
+        """Test an unfiltered requeue of every failure is refused."""
+        response = client.post(f"{URL}/requeue", {}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not FailedEmail.objects.filter(status="requeued").exists()
+
+    def test_requires_admin(self, letters):
+        """Test non-admin users cannot see dead letters."""
+        user = User.objects.create_user(email="c@test.com", password="pass123", role="candidate")
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        assert client.get(URL).status_code == status.HTTP_403_FORBIDDEN
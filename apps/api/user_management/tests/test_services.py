@@ -4,11 +4,15 @@ Tests for admin user management service layer.
 Story 2.4 - Task 1: Service layer business logic
 """
 
+import json
+from unittest.mock import patch
+
 import pytest
 from django.contrib.auth import get_user_model
 
 from candidates.models import CandidateProfile
 from companies.models import CompanyProfile
+from core.utils.mail import OUTBOX_KEY
 from user_management.services.user_management import UserManagementService
 
 User = get_user_model()
@@ -265,6 +269,20 @@ class TestUserManagementService:
         assert audit_log.action_type == "reject"
         assert audit_log.reason == "Invalid CNPJ"
 
+    def test_update_user_status_email_goes_through_outbox(
+        self, pending_company, admin_user, fake_redis
+    ):
+        """Test approval emails are queued for a batched flush, not sent one by one."""
+        with patch("core.tasks.flush_email_outbox.apply_async") as flush:
+            UserManagementService.update_user_status(
+                user=pending_company, is_active=True, admin_user=admin_user
+            )
+
+        flush.assert_called_once()
+        message = json.loads(fake_redis.lindex(OUTBOX_KEY, 0))
+        assert message["template_name"] == "company_approved"
+        assert message["recipient_email"] == pending_company.email
+
     def test_get_pending_approvals_count(self, pending_company, company_user, candidate_user, db):
         """
         Test getting count of pending company approvals.
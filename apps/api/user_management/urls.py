@@ -7,6 +7,10 @@ Routes for admin user management endpoints.
 from django.urls import path
 
 from user_management.views import (
+    AdminEmailCampaignDetailView,
+    AdminEmailCampaignListView,
+    AdminFailedEmailListView,
+    AdminFailedEmailRequeueView,
     AdminPendingCountView,
     AdminStatsView,
     AdminUserDetailView,
@@ -23,4 +27,18 @@ urlpatterns = [
     path("pending-count", AdminPendingCountView.as_view(), name="pending-count"),
     # Admin dashboard stats (Story 2.5.1)
     path("stats", AdminStatsView.as_view(), name="admin-stats"),
+    # Bulk email campaigns
+    path("campaigns", AdminEmailCampaignListView.as_view(), name="campaign-list"),
+    path(
+        "campaigns/<uuid:campaign_id>",
+        AdminEmailCampaignDetailView.as_view(),
+        name="campaign-detail",
+    ),
+    # Email dead letters
+    path("failed-emails", AdminFailedEmailListView.as_view(), name="failed-email-list"),
+    path(
+        "failed-emails/requeue",
+        AdminFailedEmailRequeueView.as_view(),
+        name="failed-email-requeue",
+    ),
 ]
@@ -13,12 +13,18 @@ from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.models import EmailCampaign
 from core.permissions import IsAdmin
 from user_management.serializers import (
     AdminStatsSerializer,
+    EmailCampaignSerializer,
+    FailedEmailFilterSerializer,
+    FailedEmailSerializer,
     UserDetailSerializer,
     UserListSerializer,
 )
+from user_management.services.campaigns import CampaignService
+from user_management.services.email_dead_letters import DeadLetterService
 from user_management.services.user_management import UserManagementService
 
 User = get_user_model()
@@ -257,3 +263,159 @@ class AdminStatsView(APIView):
 
         serializer = AdminStatsSerializer(stats_data)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class AdminEmailCampaignListView(APIView):
+    """
+    Admin endpoint for bulk email campaigns.
+
+    GET /api/v1/admin/campaigns - List campaigns with progress
+    POST /api/v1/admin/campaigns - Create and start a campaign
+
+    Permissions:
+    - IsAdmin
+    """
+
+    permission_classes = [IsAdmin]
+    pagination_class = UserListPagination
+
+    def get(self, request):
+        """
+        List campaigns, newest first.
+
+        Returns paginated campaigns with their sending progress.
+        """
+        paginator = self.pagination_class()
+        campaigns = paginator.paginate_queryset(EmailCampaign.objects.all(), request)
+        serializer = EmailCampaignSerializer(campaigns, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    def post(self, request):
+        """
+        Create a campaign; sending starts in the background.
+
+        Args:
+            request.data: {
+                "name": str, "template_name": str, "subject": str,
+                "audience": dict, "context": dict (optional)
+            }
+
+        Returns:
+            The queued campaign (201), or 400 on invalid data
+        """
+        serializer = EmailCampaignSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            campaign = CampaignService.create_campaign(
+                admin_user=request.user, **serializer.validated_data
+            )
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(EmailCampaignSerializer(campaign).data, status=status.HTTP_201_CREATED)
+
+
+class AdminEmailCampaignDetailView(APIView):
+    """
+    Admin endpoint for one campaign's progress.
+
+    GET /api/v1/admin/campaigns/:id
+
+    Permissions:
+    - IsAdmin
+    """
+
+    permission_classes = [IsAdmin]
+
+    def get(self, request, campaign_id):
+        """
+        Get a campaign with its sending progress.
+
+        Args:
+            campaign_id: UUID of the campaign
+
+        Returns:
+            Campaign details, or 404 if not found
+        """
+        campaign = EmailCampaign.objects.filter(id=campaign_id).first()
+        if not campaign:
+            return Response(
+                {"detail": "Campanha não encontrada."}, status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(EmailCampaignSerializer(campaign).data, status=status.HTTP_200_OK)
+
+
+class AdminFailedEmailListView(APIView):
+    """
+    Admin endpoint for reviewing emails that failed after all retries.
+
+    GET /api/v1/admin/failed-emails
+
+    Query Parameters:
+    - template_name: Filter by template
+    - since, until: Filter by failure time (ISO 8601; until is exclusive)
+    - error: Search in the error message
+    - page: Page number for pagination
+
+    Permissions:
+    - IsAdmin
+    """
+
+    permission_classes = [IsAdmin]
+    pagination_class = UserListPagination
+
+    def get(self, request):
+        """
+        List dead letters waiting for review, newest first.
+
+        Returns paginated dead letters matching the filters.
+        """
+        filters = FailedEmailFilterSerializer(data=request.query_params)
+        if not filters.is_valid():
+            return Response(filters.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = DeadLetterService.get_queryset(**filters.validated_data)
+        paginator = self.pagination_class()
+        letters = paginator.paginate_queryset(queryset, request)
+        serializer = FailedEmailSerializer(letters, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+
+class AdminFailedEmailRequeueView(APIView):
+    """
+    Admin endpoint for bulk resending failed emails.
+
+    POST /api/v1/admin/failed-emails/requeue
+
+    Permissions:
+    - IsAdmin
+    """
+
+    permission_classes = [IsAdmin]
+
+    def post(self, request):
+        """
+        Re-enqueue the dead letters matching the filters.
+
+        Args:
+            request.data: {
+                "template_name": str, "since": datetime, "until": datetime,
+                "error": str  (all optional; at least one required)
+            }
+
+        Returns:
+            {"requeued": int, "batches": int} (202), or 400 without filters
+        """
+        filters = FailedEmailFilterSerializer(data=request.data)
+        if not filters.is_valid():
+            return Response(filters.errors, status=status.HTTP_400_BAD_REQUEST)
+        if not any(filters.validated_data.values()):
+            return Response(
+                {"detail": "Informe ao menos um filtro (template_name, since, until ou error)."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        result = DeadLetterService.requeue(**filters.validated_data)
+        return Response(result, status=status.HTTP_202_ACCEPTED)